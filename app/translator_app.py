@@ -2,26 +2,57 @@ import os
 import sys
 from typing import cast
 
-from PySide6.QtCore import QFile
+from PySide6.QtCore import QFile, QThread, QTimer
+from PySide6.QtGui import QTextCursor
 from PySide6.QtUiTools import QUiLoader
 from PySide6.QtWidgets import (
+    QCheckBox,
     QComboBox,
+    QFileDialog,
+    QLabel,
     QMainWindow,
     QMessageBox,
+    QPlainTextEdit,
     QProgressBar,
     QPushButton,
-    QTextEdit,
     QWidget,
 )
 
 from translator import (
     Translator,
+    TranslatorHybrid,
     TranslatorOffline,
     TranslatorOnline,
 )
+from translator.documents import DOCUMENT_FILTER
+from translator.engine import PROFILE_TITLES
+from translator.segmenter import join_segments, split_segments
+from translator.stage_timing import TIMING_PROMETHEUS_ENV, get_stage_metrics
 
 # Импортируем наш класс рабочего потока
-from translator.worker import TranslatorWorker
+from translator.worker import (
+    TranslationScheduler,
+    TranslatorWorker,
+    WarmupWorker,
+    get_scheduler,
+)
+
+# Пауза после последнего нажатия клавиши до перевода при вводе (мс)
+LIVE_DEBOUNCE_MS: int = int(os.environ.get("TRANSLATOR_LIVE_DEBOUNCE_MS", "500"))
+# Вид планировщика для упреждающего перевода законченных предложений
+LIVE_PREFIX_VIEW: str = "live-prefix"
+# Вид планировщика для перевода файлов (не мешает переводу текста)
+DOCUMENT_VIEW: str = "document"
+# Начиная с какого размера (символов) текст в поле ввода считается большим
+# документом: перевод при вводе выключается, а загруженный файл поток
+# перевода читает сам, без копии текста из поля
+LARGE_DOCUMENT_CHARS: int = int(
+    os.environ.get("TRANSLATOR_LARGE_DOCUMENT_CHARS", "1000000")
+)
+# Сколько символов файла добавляется в поле ввода за один проход цикла событий
+LOAD_CHUNK_CHARS: int = 256 * 1024
+# Файлы, которые можно загрузить в поле ввода
+TEXT_FILTER: str = "Текст (*.txt);;Все файлы (*)"
 
 
 def get_resource_path(relative_path: str) -> str:
@@ -38,12 +69,16 @@ def get_resource_path(relative_path: str) -> str:
 
 # Аннотация типов для виджетов из interface.ui (нужно для подсказок в IDE)
 class InterfaceUI(QWidget):
-    textInput: QTextEdit
-    textOutput: QTextEdit
+    textInput: QPlainTextEdit
+    textOutput: QPlainTextEdit
     comboSource: QComboBox
     comboTarget: QComboBox
     comboMode: QComboBox
+    comboProfile: QComboBox
+    checkLive: QCheckBox
     btnTranslate: QPushButton
+    btnOpen: QPushButton
+    btnDocument: QPushButton
     progressBar: QProgressBar
 
 
@@ -66,12 +101,40 @@ class TranslatorApp(QMainWindow):
         self.translators: list[Translator] = [
             TranslatorOnline(),
             TranslatorOffline(),
+            TranslatorHybrid(),
         ]
+        # Пул потоков для заданий перевода и текущее задание окна
+        self.scheduler: TranslationScheduler = get_scheduler()
+        self.worker: TranslatorWorker | None = None
+        # Задание перевода документа (ссылка держит его до сигнала finished)
+        self.document_worker: TranslatorWorker | None = None
+        # Текущее задание запущено переводом при вводе, а не кнопкой
+        self.worker_live: bool = False
+
+        # Перевод при вводе: последний запрос (чтобы не повторять его),
+        # последнее отправленное начало текста из законченных предложений
+        # (и его часть до последнего предложения, которую не нужно резать
+        # заново) и признак, что переводчик уже готов (пакеты установлены)
+        self.live_request: tuple[str, str, str, str] | None = None
+        self.live_prefix: str = ""
+        self.live_base: str = ""
+        self.live_ready: bool = False
+
+        # Большой документ: файл, загруженный в поле ввода (пока текст
+        # не правили), и признак, что он ещё загружается
+        self.input_path: str | None = None
+        self.input_loading: bool = False
+        # Готовые куски перевода, ждущие добавления в поле
+        self.pending_output: list[str] = []
 
         # Вызываем методы настройки
         self.init_ui()
         self.setup_connections()
 
+        # Тяжёлые библиотеки грузим в фоне, когда окно уже показано
+        self.warmup_worker: WarmupWorker | None = None
+        QTimer.singleShot(0, self.start_warmup)
+
     def get_current_translator(self) -> Translator:
         index: int = self.ui.comboMode.currentData()
         return self.translators[index]
@@ -129,6 +192,16 @@ class TranslatorApp(QMainWindow):
         self.ui.comboTarget.blockSignals(False)
         self.ui.comboSource.blockSignals(False)
 
+        # Выбор профиля есть только у offline-переводчика
+        is_offline: bool = isinstance(translator, TranslatorOffline)
+        self.ui.comboProfile.setVisible(is_offline)
+        if is_offline:
+            self.ui.comboProfile.blockSignals(True)
+            self.ui.comboProfile.setCurrentIndex(
+                self.ui.comboProfile.findData(translator.profile)
+            )
+            self.ui.comboProfile.blockSignals(False)
+
     def init_ui(self) -> None:
         """
         Настройка внешнего вида приложения.
@@ -141,19 +214,80 @@ class TranslatorApp(QMainWindow):
             self.ui.comboMode.addItem(translator.name, index)
         self.ui.comboMode.setCurrentIndex(0)
 
+        # Профили offline-движка (видны только в режиме Offline)
+        for profile, title in PROFILE_TITLES.items():
+            self.ui.comboProfile.addItem(title, profile)
+
         self._fillup_combo_boxes()
         self.ui.progressBar.hide()
         self.statusBar().addPermanentWidget(self.ui.progressBar)
 
+        # Индикатор фоновой загрузки движков перевода
+        self.warmup_label: QLabel = QLabel("Загрузка движков...")
+        self.statusBar().addPermanentWidget(self.warmup_label)
+
+        # Таймер задержки перевода при вводе: перезапускается каждым нажатием
+        self.live_timer: QTimer = QTimer(self)
+        self.live_timer.setSingleShot(True)
+        self.live_timer.setInterval(LIVE_DEBOUNCE_MS)
+
+        # Поле перевода только для чтения: история правок ему не нужна
+        self.ui.textOutput.setUndoRedoEnabled(False)
+        # Куски перевода добавляются в поле одной вставкой за проход цикла
+        # событий, а не по одному предложению
+        self.output_timer: QTimer = QTimer(self)
+        self.output_timer.setSingleShot(True)
+        self.output_timer.setInterval(0)
+        # Загрузка файла в поле ввода по частям, не блокируя окно
+        self.load_timer: QTimer = QTimer(self)
+        self.load_timer.setInterval(0)
+
     def setup_connections(self) -> None:
         """
         Подключение сигналов к слотам (обработчикам событий).
         """
-        self.ui.btnTranslate.clicked.connect(self.start_translation)
+        self.ui.btnTranslate.clicked.connect(self.on_translate_clicked)
+        self.ui.btnOpen.clicked.connect(self.on_open_clicked)
+        self.ui.btnDocument.clicked.connect(self.on_document_clicked)
         # Подключаем сигналы изменения индекса в комбобоксах
         self.ui.comboSource.currentIndexChanged.connect(self.on_source_changed)
         self.ui.comboTarget.currentIndexChanged.connect(self.on_target_changed)
         self.ui.comboMode.currentIndexChanged.connect(self.on_mode_changed)
+        self.ui.comboProfile.currentIndexChanged.connect(self.on_profile_changed)
+        # Перевод при вводе
+        self.ui.checkLive.toggled.connect(self.on_live_toggled)
+        self.ui.textInput.textChanged.connect(self.on_input_changed)
+        self.live_timer.timeout.connect(self.on_live_timeout)
+        self.output_timer.timeout.connect(self.flush_output)
+        self.load_timer.timeout.connect(self.on_load_tick)
+
+    def start_warmup(self) -> None:
+        """
+        Запуск фонового прогрева переводчиков.
+        """
+        self.warmup_pending: set[str] = {t.name for t in self.translators}
+        self.warmup_worker = WarmupWorker(self.translators)
+        self.warmup_worker.ready.connect(self.on_warmup_ready)
+        self.warmup_worker.failed.connect(self.on_warmup_failed)
+        self.warmup_worker.start(QThread.Priority.LowPriority)
+
+    def on_warmup_ready(self, name: str) -> None:
+        """
+        Слот, вызываемый когда переводчик прогрет.
+        """
+        self.warmup_pending.discard(name)
+        # Прячем индикатор, когда всё загружено и ошибок не было
+        if not self.warmup_pending and not self.warmup_label.toolTip():
+            self.warmup_label.hide()
+
+    def on_warmup_failed(self, name: str, err: str) -> None:
+        """
+        Слот, вызываемый если переводчик не удалось подготовить.
+        Ошибка не критична: при переводе она повторится с подробностями.
+        """
+        self.warmup_pending.discard(name)
+        self.warmup_label.setText(f"{name}: недоступен")
+        self.warmup_label.setToolTip(err)
 
     def _resolve_lang_conflict(
         self,
@@ -215,6 +349,7 @@ class TranslatorApp(QMainWindow):
         self._resolve_lang_conflict(self.ui.comboSource, self.ui.comboTarget)
         # Запоминаем текущий выбор
         self.get_current_translator().source_index = index
+        self.on_settings_changed()
 
     def on_target_changed(self, index: int) -> None:
         """
@@ -223,6 +358,7 @@ class TranslatorApp(QMainWindow):
         self._resolve_lang_conflict(self.ui.comboTarget, self.ui.comboSource)
         # Запоминаем текущий выбор
         self.get_current_translator().target_index = index
+        self.on_settings_changed()
 
     def on_mode_changed(self, index: int) -> None:
         """
@@ -230,48 +366,372 @@ class TranslatorApp(QMainWindow):
         """
         self._fillup_combo_boxes()
         self._resolve_lang_conflict(self.ui.comboSource, self.ui.comboTarget)
+        self.on_settings_changed()
+
+    def on_profile_changed(self, index: int) -> None:
+        """
+        Слот, вызываемый при выборе профиля offline-перевода.
+        """
+        translator: Translator = self.get_current_translator()
+        if isinstance(translator, TranslatorOffline):
+            translator.set_profile(self.ui.comboProfile.itemData(index))
+        self.on_settings_changed()
+
+    def on_settings_changed(self) -> None:
+        """
+        Сменились языки или режим: при переводе при вводе переводим заново.
+        """
+        self.live_ready = False
+        self.live_prefix = ""
+        self.live_base = ""
+        if self.ui.checkLive.isChecked():
+            self.live_timer.start()
+
+    def on_live_toggled(self, checked: bool) -> None:
+        """
+        Включение/выключение перевода при вводе.
+        """
+        if checked:
+            self.live_request = None
+            self.live_timer.start()
+        else:
+            self.live_timer.stop()
+            self.scheduler.cancel(LIVE_PREFIX_VIEW)
+
+    def is_large_document(self) -> bool:
+        """
+        В поле ввода большой документ (загруженный файл или длинный текст).
+        Размер документа известен без копирования текста из поля.
+        """
+        return (
+            self.input_path is not None
+            or self.ui.textInput.document().characterCount() > LARGE_DOCUMENT_CHARS
+        )
 
-    def start_translation(self) -> None:
+    def on_input_changed(self) -> None:
+        """
+        Слот, вызываемый при каждом изменении исходного текста.
+        """
+        if self.input_loading:
+            return
+        # Текст правят — переводить нужно поле, а не загруженный файл
+        self.input_path = None
+        # Большой документ при вводе не переводим: каждая пауза
+        # копировала бы и резала на предложения весь текст
+        if not self.ui.checkLive.isChecked() or self.is_large_document():
+            return
+        # Текст изменился — начатый перевод при вводе уже не нужен
+        if self.worker is not None and self.worker_live:
+            self.scheduler.cancel()
+            self.reset_ui()
+        self._translate_finished_sentences()
+        self.live_timer.start()
+
+    def _translate_finished_sentences(self) -> None:
+        """
+        Упреждающий перевод законченных предложений, пока пользователь
+        ещё печатает. Их переводы попадают в память предложений, поэтому
+        после паузы в переводчик уходит только последнее предложение.
+        """
+        # Пока переводчик не готов (например, пакет не скачан),
+        # фоновые задания не запускаем — этим займётся основной перевод
+        if not self.live_ready:
+            return
+        text: str = self.ui.textInput.toPlainText()
+        # Текст дописывают в конец: законченные предложения до последнего
+        # не разбираем заново (иначе каждое нажатие резало бы весь текст
+        # в потоке GUI). Последнее режем вместе с новым текстом — следующий
+        # символ может показать, что оно не закончено ("Mr." + " Smith")
+        base: str = self.live_base if text.startswith(self.live_base) else ""
+        segments = split_segments(text[len(base) :], self.ui.comboSource.currentData())
+        if segments[-1][1] == "":
+            segments = segments[:-1]
+        self.live_base = base + join_segments(segments[:-1])
+        prefix: str = base + join_segments(segments)
+        # Новое предложение ещё не закончено
+        if not prefix.strip() or prefix == self.live_prefix:
+            return
+        self.live_prefix = prefix
+        worker: TranslatorWorker = self.get_current_translator().run_translator_worker(
+            prefix,
+            self.ui.comboSource.currentData(),
+            self.ui.comboTarget.currentData(),
+            live=True,
+        )
+        # Предыдущее упреждающее задание отменяется, уже переведённые
+        # им предложения остаются в памяти
+        self.scheduler.submit(worker, view=LIVE_PREFIX_VIEW)
+
+    def on_live_timeout(self) -> None:
+        """
+        Пользователь сделал паузу в наборе — переводим текст.
+        """
+        if self.is_large_document():
+            return
+        request: tuple[str, str, str, str] = (
+            self.ui.textInput.toPlainText(),
+            self.ui.comboSource.currentData(),
+            self.ui.comboTarget.currentData(),
+            self.get_current_translator().cache_name,
+        )
+        # Такой текст уже переведён или переводится
+        if request == self.live_request:
+            return
+        self.live_request = request
+        self.start_translation(live=True)
+
+    def on_translate_clicked(self) -> None:
+        """
+        Кнопка запускает перевод, а во время перевода — отменяет его.
+        Перевод при вводе кнопкой не отменяется: она запускает полный перевод.
+        """
+        if self.worker is not None and not self.worker_live:
+            self.cancel_translation()
+        else:
+            self.start_translation()
+
+    def cancel_translation(self) -> None:
+        """
+        Отмена текущего перевода. Поток остановится между пакетами предложений.
+        """
+        self.scheduler.cancel()
+        self.statusBar().showMessage("Перевод отменён")
+        self.reset_ui()
+
+    def start_translation(self, live: bool = False) -> None:
         """
         Метод запуска процесса перевода.
         Считывает данные, блокирует интерфейс и запускает рабочий поток.
+        live — перевод при вводе (запущен таймером, а не кнопкой).
         """
-        text = self.ui.textInput.toPlainText()
         src_code: str = self.ui.comboSource.currentData()
         tgt_code: str = self.ui.comboTarget.currentData()
         translator: Translator = self.get_current_translator()
 
-        # text пустой, нечего переводить
-        if not text:
-            self.statusBar().showMessage("Введите текст")
-            return
-
-        # Визуальная индикация работы
-        self.ui.btnTranslate.setEnabled(False)
-        self.ui.btnTranslate.setText("...")
-
-        # Создаем экземпляр потока (Worker)
-        self.worker: TranslatorWorker = translator.run_translator_worker(
-            text,
-            src_code,
-            tgt_code,
-        )
+        if self.input_path is not None:
+            # Большой документ: поток читает загруженный файл сам
+            if live:
+                return
+            self.worker = translator.run_text_file_worker(
+                self.input_path, src_code, tgt_code
+            )
+        else:
+            text = self.ui.textInput.toPlainText()
+
+            # text пустой, нечего переводить
+            if not text:
+                if live:
+                    self.ui.textOutput.clear()
+                else:
+                    self.statusBar().showMessage("Введите текст")
+                return
+
+            # Если этот текст уже переводили — берём результат из кэша без потока
+            cached: str | None = translator.get_cached(text, src_code, tgt_code)
+            if cached is not None:
+                self.ui.textOutput.setPlainText(cached)
+                self.statusBar().showMessage("Готово (из кэша)")
+                return
+
+            # Создаем задание (Worker)
+            self.worker = translator.run_translator_worker(
+                text,
+                src_code,
+                tgt_code,
+                live=live,
+            )
+        self.worker_live = live
+
+        # Визуальная индикация работы: пока идёт перевод, кнопка его отменяет.
+        # При переводе при вводе кнопку не трогаем, чтобы она не мигала
+        if not live:
+            self.ui.btnTranslate.setText("ОТМЕНА")
+            # Перевод появляется в поле по мере готовности предложений.
+            # При вводе старый перевод остаётся на месте до готовности нового
+            self.ui.textOutput.clear()
+            self.pending_output.clear()
+            self.streamed_segments: int = 0
+            self.worker.partial.connect(self.on_partial)
 
         # Подписываемся на сигналы от потока
         self.worker.finished.connect(self.on_finished)
         self.worker.error.connect(self.on_error)
+        self.worker.cancelled.connect(self.on_cancelled)
         self.worker.status.connect(self.statusBar().showMessage)
         self.worker.progress_val.connect(self.ui.progressBar.setValue)
         self.worker.progress_visible.connect(self.ui.progressBar.setVisible)
 
-        # Запускаем поток
-        self.worker.start()
+        # Ставим задание в пул; предыдущее задание окна (если было) отменяется
+        self.scheduler.submit(self.worker)
+
+    def on_open_clicked(self) -> None:
+        """
+        Загрузка текстового файла в поле ввода. Файл добавляется по
+        частям за несколько проходов цикла событий, окно не замирает.
+        """
+        path, _ = QFileDialog.getOpenFileName(self, "Открыть текст", "", TEXT_FILTER)
+        if not path:
+            return
+        self._stop_loading()
+        if self.worker is not None:
+            self.scheduler.cancel()
+            self.reset_ui()
+
+        self.load_path: str = path
+        self.load_size: int = max(1, os.path.getsize(path))
+        self.load_file = open(path, encoding="utf-8", errors="replace")
+        self.input_loading = True
+        self.input_path = None
+        # История правок хранила бы копию всего файла
+        self.ui.textInput.setUndoRedoEnabled(False)
+        self.ui.textInput.clear()
+        self.ui.textOutput.clear()
+        self.ui.btnTranslate.setEnabled(False)
+        self.ui.progressBar.setValue(0)
+        self.ui.progressBar.setVisible(True)
+        self.statusBar().showMessage("Загрузка файла...")
+        self.load_timer.start()
+
+    def on_load_tick(self) -> None:
+        """
+        Добавление очередной части загружаемого файла в поле ввода.
+        """
+        chunk: str = self.load_file.read(LOAD_CHUNK_CHARS)
+        if chunk:
+            cursor: QTextCursor = self.ui.textInput.textCursor()
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.insertText(chunk)
+            self.ui.progressBar.setValue(
+                self.load_file.buffer.tell() * 100 // self.load_size
+            )
+            return
+
+        self._stop_loading()
+        chars: int = self.ui.textInput.document().characterCount()
+        if chars > LARGE_DOCUMENT_CHARS:
+            self.input_path = self.load_path
+            self.statusBar().showMessage(
+                f"Большой документ: {chars} символов, перевод при вводе выключен"
+            )
+        else:
+            self.ui.textInput.setUndoRedoEnabled(True)
+            self.statusBar().showMessage("Файл загружен")
+            self.on_input_changed()
+
+    def _stop_loading(self) -> None:
+        """
+        Прекращение загрузки файла в поле ввода (если она идёт).
+        """
+        if not self.input_loading:
+            return
+        self.load_timer.stop()
+        self.load_file.close()
+        self.input_loading = False
+        self.ui.btnTranslate.setEnabled(True)
+        self.ui.progressBar.setVisible(False)
+
+    def on_document_clicked(self) -> None:
+        """
+        Перевод файла документа: выбор входного и выходного файла
+        и запуск задания в фоне.
+        """
+        input_path, _ = QFileDialog.getOpenFileName(
+            self, "Файл для перевода", "", DOCUMENT_FILTER
+        )
+        if not input_path:
+            return
+        src_code: str = self.ui.comboSource.currentData()
+        tgt_code: str = self.ui.comboTarget.currentData()
+        root, extension = os.path.splitext(input_path)
+        output_path, _ = QFileDialog.getSaveFileName(
+            self, "Сохранить перевод", f"{root}.{tgt_code}{extension}", DOCUMENT_FILTER
+        )
+        if not output_path:
+            return
+
+        worker: TranslatorWorker = self.get_current_translator().run_document_worker(
+            input_path, output_path, src_code, tgt_code
+        )
+        worker.finished.connect(self.on_document_finished)
+        worker.error.connect(self.on_document_error)
+        worker.cancelled.connect(self.on_document_cancelled)
+        worker.status.connect(self.statusBar().showMessage)
+        worker.progress_val.connect(self.ui.progressBar.setValue)
+        worker.progress_visible.connect(self.ui.progressBar.setVisible)
+        self.ui.btnDocument.setEnabled(False)
+        self.document_worker = worker
+        self.scheduler.submit(worker, view=DOCUMENT_VIEW)
+
+    def on_document_finished(self, output_path: str) -> None:
+        """
+        Файл переведён и сохранён.
+        """
+        self.ui.btnDocument.setEnabled(True)
+        worker: TranslatorWorker | None = self.document_worker
+        self.document_worker = None
+        stats: dict[str, int] = worker.document_stats if worker is not None else {}
+        self.statusBar().showMessage(
+            f"Документ сохранён: {output_path} "
+            f"(текстов {stats.get('texts', 0)}, уникальных {stats.get('unique', 0)})"
+        )
+
+    def on_document_error(self, err: str) -> None:
+        self.ui.btnDocument.setEnabled(True)
+        self.document_worker = None
+        QMessageBox.warning(self, "Ошибка", str(err))
+
+    def on_document_cancelled(self) -> None:
+        self.ui.btnDocument.setEnabled(True)
+        self.document_worker = None
+
+    def _is_stale(self) -> bool:
+        """
+        Сигнал пришёл от устаревшего (отменённого или заменённого) задания.
+        """
+        return self.sender() is not self.worker
+
+    def on_partial(self, index: int, text: str) -> None:
+        """
+        Вызывается для каждого готового предложения (по порядку).
+        Дописывает его в конец поля перевода.
+        """
+        if self._is_stale() or index != self.streamed_segments:
+            return
+        self.streamed_segments += 1
+        self.pending_output.append(text)
+        if not self.output_timer.isActive():
+            self.output_timer.start()
+
+    def flush_output(self) -> None:
+        """
+        Добавление накопленных кусков перевода в конец поля одной вставкой.
+        """
+        if not self.pending_output:
+            return
+        text: str = "".join(self.pending_output)
+        self.pending_output.clear()
+        cursor: QTextCursor = self.ui.textOutput.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(text)
 
     def on_finished(self, result):
         """
         Вызывается, когда перевод успешно завершен.
         """
-        self.ui.textOutput.setPlainText(result)
+        if self._is_stale():
+            return
+        self.flush_output()
+        # Обычно текст уже собран из partial; перерисовываем только при
+        # расхождении. Большой документ не сравниваем: это копия всего поля,
+        # а перевод файла приходит только через partial
+        if (
+            self.worker.text_path is None
+            and len(result) <= LARGE_DOCUMENT_CHARS
+            and self.ui.textOutput.toPlainText() != result
+        ):
+            self.ui.textOutput.setPlainText(result)
+        # Переводчик работает — можно переводить законченные предложения заранее
+        self.live_ready = True
         self.reset_ui()
 
     def on_error(self, err):
@@ -279,13 +739,52 @@ class TranslatorApp(QMainWindow):
         Вызывается, если в потоке произошла ошибка.
         Показывает всплывающее окно.
         """
+        if self._is_stale():
+            return
+        live: bool = self.worker_live
+        self.reset_ui()
+        if live:
+            # Тот же текст после паузы можно будет перевести снова
+            self.live_request = None
+            # Не перебиваем набор всплывающим окном
+            self.statusBar().showMessage(f"Ошибка: {err}")
+            return
         QMessageBox.warning(self, "Ошибка", str(err))
+
+    def on_cancelled(self):
+        """
+        Вызывается, если задание было отменено не из этого окна.
+        """
+        if self._is_stale():
+            return
         self.reset_ui()
 
     def reset_ui(self):
         """
         Возвращает элементы интерфейса в исходное состояние.
         """
+        self.worker = None
+        self.worker_live = False
         self.ui.btnTranslate.setEnabled(True)
         self.ui.btnTranslate.setText("ПЕРЕВЕСТИ")
         self.ui.progressBar.setVisible(False)
+
+    def closeEvent(self, event):
+        """
+        При закрытии окна отменяем задания и дожидаемся потоков.
+        """
+        self._stop_loading()
+        self.scheduler.shutdown()
+        # Поток прогрева принадлежит окну: его нельзя уничтожить работающим.
+        # Оставшиеся переводчики пропускаются, текущий догружается
+        if self.warmup_worker is not None and self.warmup_worker.isRunning():
+            self.warmup_worker.requestInterruption()
+            self.warmup_worker.wait()
+        # Сводка времени стадий за сессию (для textfile-коллектора Prometheus)
+        prometheus_path: str | None = os.environ.get(TIMING_PROMETHEUS_ENV)
+        if prometheus_path:
+            get_stage_metrics().write_prometheus(
+                prometheus_path,
+                extra="".join(translator.to_prometheus() for translator in self.translators),
+            )
+        super().closeEvent(event)
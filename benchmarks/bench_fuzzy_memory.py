@@ -0,0 +1,106 @@
+"""
+Замер нечёткой памяти переводов на большом числе предложений.
+
+Память заполняется шаблонными предложениями (одинаковый текст, разные
+имена и номера) вперемешку с обычными, после чего ищутся новые варианты
+шаблонов и незнакомые предложения. Меряется скорость записи, задержка
+поиска (p50/p95) и доля предложений, которым не понадобилась модель.
+Запуск из корня проекта:
+    python benchmarks/bench_fuzzy_memory.py --segments 1000000 --runs 1
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+from common import make_report, measure, peak_rss_mb, percentile, write_report
+from tiny_model import TinyEngine, make_corpus
+
+from translator.fuzzy_memory import FuzzyMemory
+
+NAMES: list[str] = ["Anna", "John", "Maria", "Peter", "Olga", "Hans", "Lucia", "Kenji"]
+
+# Число записей в память одной транзакцией (как пакет предложений воркера)
+ADD_BATCH: int = 256
+
+
+def make_template_segments(count: int, seed: int) -> list[str]:
+    """
+    Предложения-шаблоны: текст из корпуса с подставленным именем и номером.
+    """
+    rng: random.Random = random.Random(seed)
+    templates: list[str] = make_corpus(max(1, count // 50), seed=seed)
+    return [
+        f"Dear {rng.choice(NAMES)}, order {rng.randint(1, 10**6)}: "
+        f"{rng.choice(templates)}"
+        for _ in range(count)
+    ]
+
+
+def run_once(args: argparse.Namespace, run_index: int) -> dict:
+    engine: TinyEngine = TinyEngine()
+    # Половина памяти — шаблоны, половина — обычные предложения
+    stored: list[str] = make_template_segments(args.segments // 2, seed=run_index)
+    stored += [
+        f"{sentence} #{index}"
+        for index, sentence in enumerate(make_corpus(args.segments - len(stored)))
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path: str = os.path.join(tmp_dir, "fuzzy_memory.sqlite3")
+        memory: FuzzyMemory = FuzzyMemory(
+            db_path, threshold=args.threshold, max_segments=args.segments
+        )
+
+        started: float = time.perf_counter()
+        for start in range(0, len(stored), ADD_BATCH):
+            batch: list[str] = stored[start : start + ADD_BATCH]
+            memory.add("en", "ru", dict(zip(batch, engine.translate_batch(batch))))
+        add_seconds: float = time.perf_counter() - started
+
+        # Те же шаблоны с другими именами и номерами и незнакомые предложения
+        queries: list[str] = make_template_segments(args.queries // 2, seed=run_index)
+        queries += make_corpus(args.queries - len(queries), seed=run_index + 7)
+        random.Random(run_index).shuffle(queries)
+        query_iter = iter(queries)
+        latencies: list[float] = measure(
+            lambda: memory.lookup("en", "ru", [next(query_iter)]), len(queries)
+        )
+        stats: dict[str, int] = memory.stats()
+        db_size: int = os.path.getsize(db_path)
+
+    return {
+        "add_segments_per_second": len(stored) / add_seconds,
+        "lookup_seconds": percentile(latencies, 0.5),
+        "lookup_p95_seconds": percentile(latencies, 0.95),
+        "saved_model_calls": stats["saved_model_calls"],
+        "saved_fraction": stats["saved_model_calls"] / len(queries),
+        "db_mb": db_size / (1024 * 1024),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--segments", type=int, default=100_000, help="размер памяти")
+    parser.add_argument("--queries", type=int, default=2000, help="число поисков")
+    parser.add_argument("--threshold", type=float, default=0.8, help="порог сходства")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--output", help="файл для сохранения результатов (JSON)")
+    args = parser.parse_args(argv)
+
+    runs: list[dict] = [run_once(args, index) for index in range(args.runs)]
+    params: dict = {
+        "segments": args.segments,
+        "queries": args.queries,
+        "threshold": args.threshold,
+    }
+    write_report(make_report("fuzzy_memory", params, runs), args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
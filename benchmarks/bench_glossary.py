@@ -0,0 +1,132 @@
+"""
+Замер глоссария на большом словаре терминов.
+
+Генерируется глоссарий из --terms синтетических терминов (одно-три
+слова, часть с фиксированным переводом) и текст из обычных слов,
+в который вставлены случайные термины. Меряется построение автомата,
+загрузка из кэша на диске, скорость поиска и защиты с восстановлением
+(символов в секунду). Время поиска не должно зависеть от размера
+глоссария — для сравнения тот же текст ищется глоссарием из 100 терминов.
+Запуск из корня проекта:
+    python benchmarks/bench_glossary.py --terms 100000 --chars 1000000
+"""
+
+import argparse
+import random
+import string
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from common import make_report, peak_rss_mb, write_report
+
+from translator.glossary import Glossary, ProtectedBatch, load_glossary
+
+WORDS: list[str] = (
+    "the of and to in is that for it as was with be by on not he this are or "
+    "his from at which but have an they you were her she there been one all "
+    "would their we him when who will more no if out so said what up its about"
+).split()
+
+
+def make_word(rng: random.Random) -> str:
+    length: int = rng.randint(4, 10)
+    return rng.choice(string.ascii_uppercase) + "".join(
+        rng.choice(string.ascii_lowercase) for _ in range(length - 1)
+    )
+
+
+def make_terms(count: int, rng: random.Random) -> dict[str, str]:
+    """
+    count терминов; каждый пятый переводится фиксированно, остальные
+    остаются как есть.
+    """
+    terms: dict[str, str] = {}
+    while len(terms) < count:
+        source: str = " ".join(make_word(rng) for _ in range(rng.randint(1, 3)))
+        terms[source] = f"<{source}>" if len(terms) % 5 == 0 else source
+    return terms
+
+
+def make_segments(terms: list[str], chars: int, rng: random.Random) -> list[str]:
+    """
+    Предложения по ~100 символов общей длиной chars; примерно в каждом
+    втором есть термин.
+    """
+    segments: list[str] = []
+    total: int = 0
+    while total < chars:
+        words: list[str] = [rng.choice(WORDS) for _ in range(rng.randint(12, 20))]
+        if rng.random() < 0.5:
+            words.insert(rng.randrange(len(words)), rng.choice(terms))
+        segment: str = " ".join(words) + "."
+        segments.append(segment)
+        total += len(segment) + 1
+    return segments
+
+
+def write_terms(path: Path, terms: dict[str, str]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for source, target in terms.items():
+            f.write(f"{source}\t{target}\n" if target != source else f"{source}\n")
+
+
+def run_once(args: argparse.Namespace, run_index: int) -> dict:
+    rng: random.Random = random.Random(run_index)
+    terms: dict[str, str] = make_terms(args.terms, rng)
+    segments: list[str] = make_segments(list(terms), args.chars, rng)
+    chars: int = sum(len(segment) for segment in segments)
+
+    result: dict = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path: Path = Path(tmp_dir) / "terms.tsv"
+        write_terms(path, terms)
+
+        started: float = time.perf_counter()
+        glossary: Glossary = load_glossary(path, tmp_dir)
+        result["build_seconds"] = time.perf_counter() - started
+
+        # Новый процесс: кэша в памяти нет, автомат читается с диска
+        cache_path: Path = next(Path(tmp_dir).glob("glossary-*.bin"))
+        result["cache_mb"] = cache_path.stat().st_size / 2**20
+        started = time.perf_counter()
+        glossary = Glossary.load(cache_path, glossary.digest)
+        result["load_seconds"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    found: int = sum(len(glossary.find(segment)) for segment in segments)
+    result["find_chars_per_second"] = chars / (time.perf_counter() - started)
+    result["matches"] = found
+
+    small: Glossary = Glossary.build(dict(list(terms.items())[:100]))
+    started = time.perf_counter()
+    for segment in segments:
+        small.find(segment)
+    result["small_find_chars_per_second"] = chars / (time.perf_counter() - started)
+
+    started = time.perf_counter()
+    batch: ProtectedBatch = glossary.protect_batch(segments)
+    batch.restore(batch.texts)
+    result["protect_restore_chars_per_second"] = chars / (time.perf_counter() - started)
+    result["skipped_segments"] = len(segments) - len(batch.texts)
+    result["peak_rss_mb"] = peak_rss_mb()
+    return result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--terms", type=int, default=100_000, help="терминов в глоссарии")
+    parser.add_argument("--chars", type=int, default=1_000_000, help="символов текста")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--output", help="файл для сохранения результатов (JSON)")
+    args = parser.parse_args(argv)
+
+    runs: list[dict] = [run_once(args, index) for index in range(args.runs)]
+    params: dict = {"terms": args.terms, "chars": args.chars}
+    write_report(make_report("glossary", params, runs), args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
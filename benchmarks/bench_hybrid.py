@@ -0,0 +1,139 @@
+"""
+Замер гонки online и offline (гибридный перевод) против локальной заглушки.
+
+Заглушка online-сервера обычно отвечает за --delay, но доля ответов
+--slow-fraction задерживается до --slow-delay (плохая сеть). Offline —
+крошечная встроенная модель с задержкой --offline-delay на пакет.
+Сравниваются задержки только online и гонки с подстраховкой по p90,
+а также доля запросов, в которых понадобилась подстраховка.
+Запуск из корня проекта:
+    python benchmarks/bench_hybrid.py --runs 3 --slow-fraction 0.2
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+from bench_online import StubHandler
+from common import make_report, measure, peak_rss_mb, percentile, write_report
+from tiny_model import TinyEngine, make_corpus
+
+from translator.engine import OnlineEngine
+from translator.hedging import Hedger
+from translator.worker.cancellation import CancellationToken
+
+
+class JitterHandler(StubHandler):
+    fast_delay: float = 0.0
+    slow_delay: float = 0.0
+    slow_fraction: float = 0.0
+
+    @property
+    def delay(self) -> float:
+        if random.random() < self.slow_fraction:
+            return self.slow_delay
+        return self.fast_delay
+
+
+def start_stub(args: argparse.Namespace) -> ThreadingHTTPServer:
+    JitterHandler.fast_delay = args.delay
+    JitterHandler.slow_delay = args.slow_delay
+    JitterHandler.slow_fraction = args.slow_fraction
+    server = ThreadingHTTPServer(("127.0.0.1", 0), JitterHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_once(
+    online: OnlineEngine,
+    args: argparse.Namespace,
+    batches: list[list[str]],
+) -> dict:
+    offline: TinyEngine = TinyEngine()
+
+    def translate_offline(segments: list[str], token: CancellationToken) -> list[str]:
+        token.raise_if_cancelled()
+        time.sleep(args.offline_delay)
+        return offline.translate_batch(segments)
+
+    def translate_online(segments: list[str], token: CancellationToken) -> list[str]:
+        token.raise_if_cancelled()
+        return online.translate_batch(segments)
+
+    online_latencies: list[float] = []
+    for batch in batches:
+        online_latencies += measure(lambda: online.translate_batch(batch), 1)
+
+    hedger: Hedger = Hedger(quantile=args.quantile)
+    hedged_latencies: list[float] = []
+    for batch in batches:
+        hedged_latencies += measure(
+            lambda: hedger.run(
+                {
+                    "online": lambda token: translate_online(batch, token),
+                    "offline": lambda token: translate_offline(batch, token),
+                }
+            ),
+            1,
+        )
+
+    stats: dict = hedger.stats()
+    return {
+        "online_latency_seconds": percentile(online_latencies, 0.5),
+        "online_latency_p95_seconds": percentile(online_latencies, 0.95),
+        "online_latency_p99_seconds": percentile(online_latencies, 0.99),
+        "hedged_latency_seconds": percentile(hedged_latencies, 0.5),
+        "hedged_latency_p95_seconds": percentile(hedged_latencies, 0.95),
+        "hedged_latency_p99_seconds": percentile(hedged_latencies, 0.99),
+        "hedged_fraction": stats["hedged"] / stats["requests"],
+        "offline_wins": stats["wins"].get("offline", 0),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--delay", type=float, default=0.02, help="обычная задержка заглушки, с")
+    parser.add_argument("--slow-delay", type=float, default=1.0, help="задержка медленного ответа, с")
+    parser.add_argument("--slow-fraction", type=float, default=0.1, help="доля медленных ответов")
+    parser.add_argument("--offline-delay", type=float, default=0.1, help="время offline-пакета, с")
+    parser.add_argument("--quantile", type=float, default=0.9, help="порог подстраховки")
+    parser.add_argument("--requests", type=int, default=100, help="запросов за прогон")
+    parser.add_argument("--segments", type=int, default=4, help="предложений в запросе")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--output", help="файл для сохранения результатов (JSON)")
+    args = parser.parse_args(argv)
+
+    random.seed(1351)
+    corpus: list[str] = make_corpus(args.requests * args.segments)
+    batches: list[list[str]] = [
+        corpus[start : start + args.segments]
+        for start in range(0, len(corpus), args.segments)
+    ]
+    server: ThreadingHTTPServer = start_stub(args)
+    try:
+        host, port = server.server_address[:2]
+        online = OnlineEngine("en", "ru", base_url=f"http://{host}:{port}/m", retries=0)
+        runs: list[dict] = [run_once(online, args, batches) for _ in range(args.runs)]
+    finally:
+        server.shutdown()
+
+    params: dict = {
+        "delay": args.delay,
+        "slow_delay": args.slow_delay,
+        "slow_fraction": args.slow_fraction,
+        "offline_delay": args.offline_delay,
+        "quantile": args.quantile,
+        "requests": args.requests,
+        "segments": args.segments,
+    }
+    write_report(make_report("hybrid", params, runs), args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""
+Замер локального определения языка на коротких предложениях.
+
+Предложения на восьми языках латиницы и кириллицы (их нет в текстах,
+из которых собраны профили) и несколько предложений других письменностей
+перемешиваются и размножаются до --segments. Меряется скорость без кэша,
+с кэшем (все предложения уже встречались) и доля верных ответов.
+Запуск из корня проекта:
+    python benchmarks/bench_langid.py --segments 100000 --runs 3
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from common import make_report, peak_rss_mb, write_report
+
+from translator.langid import LanguageIdentifier
+
+SAMPLES: dict[str, list[str]] = {
+    "en": [
+        "I will call you tomorrow after work.",
+        "The cat is sleeping on the sofa.",
+        "Could you please open the door?",
+        "Our flight was delayed by two hours.",
+        "He doesn't like coffee at all.",
+    ],
+    "de": [
+        "Ich rufe dich morgen nach der Arbeit an.",
+        "Die Katze schläft auf dem Sofa.",
+        "Könnten Sie bitte die Tür öffnen?",
+        "Unser Flug hatte zwei Stunden Verspätung.",
+        "Er mag überhaupt keinen Kaffee.",
+    ],
+    "fr": [
+        "Je t'appellerai demain après le travail.",
+        "Le chat dort sur le canapé.",
+        "Pourriez-vous ouvrir la porte, s'il vous plaît ?",
+        "Notre vol a été retardé de deux heures.",
+        "Il n'aime pas du tout le café.",
+    ],
+    "es": [
+        "Te llamaré mañana después del trabajo.",
+        "El gato está durmiendo en el sofá.",
+        "¿Podría abrir la puerta, por favor?",
+        "Nuestro vuelo se retrasó dos horas.",
+        "No le gusta nada el café.",
+    ],
+    "it": [
+        "Ti chiamerò domani dopo il lavoro.",
+        "Il gatto dorme sul divano.",
+        "Potrebbe aprire la porta, per favore?",
+        "Il nostro volo è stato ritardato di due ore.",
+        "Non gli piace per niente il caffè.",
+    ],
+    "pt": [
+        "Vou ligar para você amanhã depois do trabalho.",
+        "O gato está dormindo no sofá.",
+        "Você poderia abrir a porta, por favor?",
+        "O nosso voo atrasou duas horas.",
+        "Ele não gosta nada de café.",
+    ],
+    "ru": [
+        "Я позвоню тебе завтра после работы.",
+        "Кошка спит на диване.",
+        "Не могли бы вы открыть дверь?",
+        "Наш рейс задержали на два часа.",
+        "Он совсем не любит кофе.",
+    ],
+    "uk": [
+        "Я зателефоную тобі завтра після роботи.",
+        "Кішка спить на дивані.",
+        "Чи не могли б ви відчинити двері?",
+        "Наш рейс затримали на дві години.",
+        "Він зовсім не любить каву.",
+    ],
+    "zh": ["我明天下班后给你打电话。"],
+    "ja": ["明日仕事の後で電話します。"],
+    "ko": ["내일 퇴근 후에 전화할게요."],
+}
+
+
+def make_segments(count: int, seed: int) -> list[tuple[str, str]]:
+    """
+    count пар (предложение, язык); к предложениям добавляется номер,
+    чтобы без кэша каждое из них разбиралось заново.
+    """
+    rng: random.Random = random.Random(seed)
+    pairs: list[tuple[str, str]] = [
+        (sentence, lang) for lang, sentences in SAMPLES.items() for sentence in sentences
+    ]
+    return [
+        (f"{sentence} {index}", lang)
+        for index, (sentence, lang) in enumerate(rng.choice(pairs) for _ in range(count))
+    ]
+
+
+def run_once(args: argparse.Namespace, run_index: int) -> dict:
+    segments: list[tuple[str, str]] = make_segments(args.segments, run_index)
+    texts: list[str] = [text for text, _ in segments]
+
+    started: float = time.perf_counter()
+    identifier: LanguageIdentifier = LanguageIdentifier(cache_size=len(texts))
+    compile_seconds: float = time.perf_counter() - started
+
+    started = time.perf_counter()
+    detected: list[str | None] = [identifier.detect(text) for text in texts]
+    cold_seconds: float = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for text in texts:
+        identifier.detect(text)
+    cached_seconds: float = time.perf_counter() - started
+
+    correct: int = sum(lang == got for (_, lang), got in zip(segments, detected))
+    unknown: int = sum(got is None for got in detected)
+    return {
+        "compile_seconds": compile_seconds,
+        "segments_per_second": len(texts) / cold_seconds,
+        "cached_segments_per_second": len(texts) / cached_seconds,
+        "accuracy": correct / len(texts),
+        "unknown_fraction": unknown / len(texts),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--segments", type=int, default=50_000, help="предложений за прогон")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--output", help="файл для сохранения результатов (JSON)")
+    args = parser.parse_args(argv)
+
+    runs: list[dict] = [run_once(args, index) for index in range(args.runs)]
+    write_report(make_report("langid", {"segments": args.segments}, runs), args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
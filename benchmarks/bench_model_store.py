@@ -0,0 +1,122 @@
+"""
+Замер установки языковых пакетов через хранилище по содержимому.
+
+Создаются синтетические пакеты argostranslate: у каждой пары своя
+модель (--model-mb) и общие для всех пар файлы sentencepiece и stanza
+(--shared-mb). Сравниваются обычная распаковка архива (как в
+argostranslate), хранилище с немедленной распаковкой и с отложенной:
+время установки, место на диске и время первой распаковки модели.
+Запуск из корня проекта:
+    python benchmarks/bench_model_store.py --pairs 8 --model-mb 50
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+from common import make_report, peak_rss_mb, write_report
+
+from translator.model_store import ModelStore
+
+
+def make_packages(
+    directory: Path,
+    pairs: int,
+    model_mb: float,
+    shared_mb: float,
+) -> list[Path]:
+    """
+    Архивы пакетов en->xx. Содержимое случайное (не сжимается), как веса.
+    """
+    shared: bytes = os.urandom(int(shared_mb * 2**20))
+    tokenizer: bytes = shared[: len(shared) // 4]
+    archives: list[Path] = []
+    for index in range(pairs):
+        root: str = f"translate-en_x{index}-1_0"
+        path: Path = directory / f"{root}.argosmodel"
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(
+                f"{root}/metadata.json",
+                json.dumps({"from_code": "en", "to_code": f"x{index}"}),
+            )
+            archive.writestr(f"{root}/sentencepiece.model", tokenizer)
+            archive.writestr(f"{root}/stanza/en/tokenize/ewt.pt", shared)
+            archive.writestr(f"{root}/model/config.json", "{}")
+            archive.writestr(f"{root}/model/model.bin", os.urandom(int(model_mb * 2**20)))
+        archives.append(path)
+    return archives
+
+
+def disk_bytes(directory: Path) -> int:
+    """
+    Занятое место: жёсткие ссылки на один файл считаются один раз.
+    """
+    seen: set[tuple[int, int]] = set()
+    total: int = 0
+    for path in directory.rglob("*"):
+        if not path.is_file():
+            continue
+        stat: os.stat_result = path.stat()
+        if (stat.st_dev, stat.st_ino) not in seen:
+            seen.add((stat.st_dev, stat.st_ino))
+            total += stat.st_size
+    return total
+
+
+def run_once(args: argparse.Namespace) -> dict:
+    result: dict = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        archives: list[Path] = make_packages(
+            Path(tmp_dir), args.pairs, args.model_mb, args.shared_mb
+        )
+        for mode in ("plain", "eager", "lazy"):
+            data_dir: Path = Path(tmp_dir) / mode
+            data_dir.mkdir()
+            store: ModelStore = ModelStore(data_dir)
+            started: float = time.perf_counter()
+            for archive in archives:
+                if mode == "plain":
+                    with zipfile.ZipFile(archive) as f:
+                        f.extractall(data_dir)
+                else:
+                    store.install(archive, lazy=mode == "lazy")
+            result[f"{mode}_install_seconds"] = time.perf_counter() - started
+            result[f"{mode}_disk_mb"] = disk_bytes(data_dir) / 2**20
+
+            if mode == "lazy":
+                started = time.perf_counter()
+                store.ensure_extracted(data_dir / "translate-en_x0-1_0")
+                result["lazy_first_load_seconds"] = time.perf_counter() - started
+                started = time.perf_counter()
+                store.ensure_extracted(data_dir / "translate-en_x0-1_0")
+                result["lazy_next_load_seconds"] = time.perf_counter() - started
+    result["peak_rss_mb"] = peak_rss_mb()
+    return result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pairs", type=int, default=6, help="число пакетов")
+    parser.add_argument("--model-mb", type=float, default=20, help="модель пары, МБ")
+    parser.add_argument("--shared-mb", type=float, default=4, help="общие файлы, МБ")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--output", help="файл для сохранения результатов (JSON)")
+    args = parser.parse_args(argv)
+
+    runs: list[dict] = [run_once(args) for _ in range(args.runs)]
+    params: dict = {
+        "pairs": args.pairs,
+        "model_mb": args.model_mb,
+        "shared_mb": args.shared_mb,
+    }
+    write_report(make_report("model_store", params, runs), args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+Замер offline-перевода: задержка одного предложения и пропускная способность.
+
+Без --package используется крошечная встроенная модель (tiny_model.py),
+и замер показывает накладные расходы конвейера. С --package — настоящий
+пакет argostranslate (папка с model/ и sentencepiece.model).
+Запуск из корня проекта:
+    python benchmarks/bench_offline.py --runs 5
+    python benchmarks/bench_offline.py --package translation_data/translate-en_ru-1_9
+"""
+
+import argparse
+import sys
+import time
+
+from common import make_report, measure, peak_rss_mb, percentile, write_report
+from tiny_model import TinyEngine, make_corpus
+
+from translator.engine.translator_engine import TranslatorEngine
+from translator.fuzzy_memory import FuzzyMemory
+from translator.segment_memory import SegmentMemory
+from translator.worker import TranslatorWorker
+
+# Одно короткое предложение для замера задержки
+LATENCY_SENTENCE: str = "The small cat sees a big dog in the garden."
+
+
+class EngineWorker(TranslatorWorker):
+    """
+    Рабочий GUI-конвейера поверх заданного движка (без установки пакетов).
+    """
+
+    def __init__(self, text: str, engine: TranslatorEngine):
+        super().__init__(text, "en", "ru", segment_memory=SegmentMemory())
+        self.engine: TranslatorEngine = engine
+        # Без памяти переводов: прогоны не должны находить переводы предыдущих
+        self.fuzzy_memory = FuzzyMemory(threshold=0)
+
+    def _translate_segments(self, segments: list[str]) -> list[str]:
+        return self.engine.translate_batch(segments)
+
+
+def load_engine(package: str | None, profile: str | None) -> TranslatorEngine:
+    if package is None:
+        return TinyEngine()
+    from translator.engine import OfflineEngine, get_profile
+
+    return OfflineEngine(package, get_profile(profile))
+
+
+def run_once(engine: TranslatorEngine, corpus: list[str], iterations: int) -> dict:
+    latencies: list[float] = measure(
+        lambda: engine.translate_batch([LATENCY_SENTENCE]), iterations
+    )
+
+    started: float = time.perf_counter()
+    engine.translate_batch(corpus)
+    batch_seconds: float = time.perf_counter() - started
+
+    # Тот же корпус одним текстом через конвейер рабочего потока GUI
+    worker = EngineWorker(" ".join(corpus), engine)
+    first_partial: list[float] = []
+    worker.partial.connect(
+        lambda index, text: first_partial or first_partial.append(time.perf_counter())
+    )
+    started = time.perf_counter()
+    worker.run()
+    pipeline_seconds: float = time.perf_counter() - started
+
+    chars: int = sum(len(sentence) for sentence in corpus)
+    return {
+        "latency_seconds": percentile(latencies, 0.5),
+        "latency_p95_seconds": percentile(latencies, 0.95),
+        "throughput_segments_per_second": len(corpus) / batch_seconds,
+        "throughput_chars_per_second": chars / batch_seconds,
+        "pipeline_seconds": pipeline_seconds,
+        "pipeline_first_output_seconds": (
+            first_partial[0] - started if first_partial else pipeline_seconds
+        ),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--package", help="папка пакета argostranslate (по умолчанию tiny-модель)")
+    parser.add_argument("--profile", help="профиль offline-движка (fast, quality, ...)")
+    parser.add_argument("--sentences", type=int, default=500, help="размер корпуса")
+    parser.add_argument("--iterations", type=int, default=20, help="замеров задержки за прогон")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", help="файл для сохранения результатов (JSON)")
+    args = parser.parse_args(argv)
+
+    started: float = time.perf_counter()
+    engine: TranslatorEngine = load_engine(args.package, args.profile)
+    load_seconds: float = time.perf_counter() - started
+
+    corpus: list[str] = make_corpus(args.sentences)
+    runs: list[dict] = [
+        run_once(engine, corpus, args.iterations) for _ in range(args.runs)
+    ]
+    for run in runs:
+        run["model_load_seconds"] = load_seconds
+        run["peak_rss_mb"] = peak_rss_mb()
+
+    params: dict = {
+        "model": args.package or "tiny",
+        "profile": args.profile,
+        "sentences": args.sentences,
+        "iterations": args.iterations,
+    }
+    write_report(make_report("offline", params, runs), args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
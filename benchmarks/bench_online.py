@@ -0,0 +1,125 @@
+"""
+Замер online-перевода против локального сервера-заглушки (без интернета).
+
+Заглушка отвечает разметкой мобильной версии Google Translate с заданной
+задержкой, поэтому замер показывает накладные расходы клиента: разбиение
+на куски, параллельные запросы, keep-alive, разбор HTML.
+Запуск из корня проекта:
+    python benchmarks/bench_online.py --runs 5 --delay 0.05
+"""
+
+import argparse
+import html
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from common import make_report, measure, peak_rss_mb, percentile, write_report
+from tiny_model import TinyEngine, make_corpus
+
+from translator.engine import OnlineEngine
+
+LATENCY_SENTENCE: str = "The small cat sees a big dog in the garden."
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    # Ответы с keep-alive, как у настоящего сервера
+    protocol_version: str = "HTTP/1.1"
+    # Заголовки и тело уходят разными пакетами: без этого Nagle добавляет ~40 мс
+    disable_nagle_algorithm: bool = True
+    delay: float = 0.0
+    requests_served: int = 0
+
+    def do_GET(self) -> None:
+        query: dict[str, list[str]] = parse_qs(urlparse(self.path).query)
+        text: str = query.get("q", [""])[0]
+        time.sleep(self.delay)
+        translated: str = "\n".join(
+            TinyEngine().translate_batch(text.split("\n"))
+        )
+        body: bytes = (
+            '<html><body><div class="result-container">'
+            f"{html.escape(translated)}</div></body></html>"
+        ).encode("utf-8")
+        type(self).requests_served += 1
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def start_stub(delay: float) -> ThreadingHTTPServer:
+    StubHandler.delay = delay
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_once(engine: OnlineEngine, corpus: list[str], iterations: int) -> dict:
+    latencies: list[float] = measure(
+        lambda: engine.translate_batch([LATENCY_SENTENCE]), iterations
+    )
+
+    served_before: int = StubHandler.requests_served
+    started: float = time.perf_counter()
+    engine.translate_batch(corpus)
+    batch_seconds: float = time.perf_counter() - started
+
+    chars: int = sum(len(sentence) for sentence in corpus)
+    return {
+        "latency_seconds": percentile(latencies, 0.5),
+        "latency_p95_seconds": percentile(latencies, 0.95),
+        "throughput_segments_per_second": len(corpus) / batch_seconds,
+        "throughput_chars_per_second": chars / batch_seconds,
+        "requests_per_batch": StubHandler.requests_served - served_before,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--delay", type=float, default=0.05, help="задержка ответа заглушки, с")
+    parser.add_argument("--sentences", type=int, default=500, help="размер корпуса")
+    parser.add_argument("--iterations", type=int, default=20, help="замеров задержки за прогон")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", help="файл для сохранения результатов (JSON)")
+    args = parser.parse_args(argv)
+
+    server: ThreadingHTTPServer = start_stub(args.delay)
+    try:
+        host, port = server.server_address[:2]
+        engine = OnlineEngine(
+            "en",
+            "ru",
+            base_url=f"http://{host}:{port}/m",
+            concurrency=args.concurrency,
+        )
+        corpus: list[str] = make_corpus(args.sentences)
+        runs: list[dict] = [
+            run_once(engine, corpus, args.iterations) for _ in range(args.runs)
+        ]
+    finally:
+        server.shutdown()
+    for run in runs:
+        run["peak_rss_mb"] = peak_rss_mb()
+
+    params: dict = {
+        "delay": args.delay,
+        "sentences": args.sentences,
+        "iterations": args.iterations,
+        "concurrency": args.concurrency,
+    }
+    write_report(make_report("online", params, runs), args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""
+Замер проверки установленных пакетов перед offline-переводом.
+
+Меряется проверка через реестр пакетов (горячая — из кэша, холодная —
+с повторным сканированием папки) и _install_package рабочего потока.
+Пакеты не скачиваются: если пары нет, _install_package не замеряется.
+Запуск из корня проекта:
+    python benchmarks/bench_package_check.py --src en --target ru
+"""
+
+import argparse
+import sys
+
+from common import make_report, measure, peak_rss_mb, percentile, write_report
+
+from translator.package_registry import get_package_registry
+from translator.worker import TranslatorWorkerOffline
+
+
+def run_once(src: str, target: str, iterations: int) -> dict:
+    registry = get_package_registry()
+
+    def cold_check() -> None:
+        registry.invalidate()
+        registry.is_installed(src, target)
+
+    cold: list[float] = measure(cold_check, iterations)
+    hot: list[float] = measure(lambda: registry.is_installed(src, target), iterations)
+
+    result: dict = {
+        "registry_cold_seconds": percentile(cold, 0.5),
+        "registry_hot_seconds": percentile(hot, 0.5),
+    }
+    if registry.is_installed(src, target):
+        worker = TranslatorWorkerOffline("", src, target)
+        timings: list[float] = measure(lambda: worker._install_package(src), iterations)
+        result["install_package_seconds"] = percentile(timings, 0.5)
+    return result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--src", default="en")
+    parser.add_argument("--target", default="ru")
+    parser.add_argument("--iterations", type=int, default=200, help="проверок за прогон")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", help="файл для сохранения результатов (JSON)")
+    args = parser.parse_args(argv)
+
+    runs: list[dict] = [
+        run_once(args.src, args.target, args.iterations) for _ in range(args.runs)
+    ]
+    for run in runs:
+        run["peak_rss_mb"] = peak_rss_mb()
+
+    params: dict = {
+        "src": args.src,
+        "target": args.target,
+        "iterations": args.iterations,
+        "installed": get_package_registry().is_installed(args.src, args.target),
+    }
+    write_report(make_report("package_check", params, runs), args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""
+Замер сегментаторов: регулярного (по умолчанию) и stanza (по выбору).
+
+Для каждого меряется загрузка, скорость разбиения большого текста и
+полная задержка перевода короткого текста (разбиение, перевод, сборка):
+первого — вместе с загрузкой сегментатора, и повторного.
+Перевод — крошечная встроенная модель, чтобы была видна именно цена
+разбиения. Для stanza нужен установленный пакет argostranslate с моделью
+stanza для исходного языка; если его нет, stanza пропускается.
+Запуск из корня проекта:
+    python benchmarks/bench_segmenter.py --runs 5
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+
+from common import make_report, measure, peak_rss_mb, percentile, write_report
+from tiny_model import TinyEngine, make_corpus
+
+from translator.engine.translator_engine import TranslatorEngine
+from translator.segmenter import (
+    RegexSegmenter,
+    Segmenter,
+    StanzaSegmenter,
+    join_segments,
+)
+
+# Короткий запрос из нескольких предложений с сокращениями
+LATENCY_TEXT: str = (
+    "Mr. Smith sees a big dog in the garden. "
+    "The small cat likes the house, e.g. the garden! Today it is quiet."
+)
+
+SEGMENTERS: dict[str, Callable[[str], Segmenter]] = {
+    "regex": RegexSegmenter,
+    "stanza": StanzaSegmenter,
+}
+
+
+def translate(segmenter: Segmenter, engine: TranslatorEngine, text: str) -> str:
+    """
+    То же, что TranslatorEngine.translate_texts, но с заданным сегментатором.
+    """
+    segments = segmenter.split(text)
+    bodies: list[str] = [body for body, _ in segments if body.strip()]
+    translated: dict[str, str] = dict(zip(bodies, engine.translate_batch(bodies)))
+    return join_segments(
+        [(translated.get(body, body), separator) for body, separator in segments]
+    )
+
+
+def run_once(
+    name: str,
+    lang: str,
+    engine: TranslatorEngine,
+    text: str,
+    iterations: int,
+) -> dict:
+    started: float = time.perf_counter()
+    segmenter: Segmenter = SEGMENTERS[name](lang)
+    load_seconds: float = time.perf_counter() - started
+    translate(segmenter, engine, LATENCY_TEXT)
+    first_seconds: float = time.perf_counter() - started
+
+    latencies: list[float] = measure(
+        lambda: translate(segmenter, engine, LATENCY_TEXT), iterations
+    )
+
+    started = time.perf_counter()
+    segments: int = len(segmenter.split(text))
+    split_seconds: float = time.perf_counter() - started
+
+    return {
+        f"{name}_load_seconds": load_seconds,
+        f"{name}_first_request_seconds": first_seconds,
+        f"{name}_latency_seconds": percentile(latencies, 0.5),
+        f"{name}_latency_p95_seconds": percentile(latencies, 0.95),
+        f"{name}_split_chars_per_second": len(text) / split_seconds,
+        f"{name}_segments": segments,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lang", default="en", help="язык текста")
+    parser.add_argument(
+        "--segmenters",
+        nargs="+",
+        choices=list(SEGMENTERS),
+        default=list(SEGMENTERS),
+        help="какие сегментаторы мерить",
+    )
+    parser.add_argument("--sentences", type=int, default=5000, help="размер текста")
+    parser.add_argument("--iterations", type=int, default=50, help="замеров задержки за прогон")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", help="файл для сохранения результатов (JSON)")
+    args = parser.parse_args(argv)
+
+    engine: TranslatorEngine = TinyEngine()
+    text: str = " ".join(make_corpus(args.sentences))
+    skipped: dict[str, str] = {}
+    runs: list[dict] = []
+    for _ in range(args.runs):
+        run: dict = {}
+        for name in args.segmenters:
+            if name in skipped:
+                continue
+            try:
+                run.update(run_once(name, args.lang, engine, text, args.iterations))
+            except (ImportError, FileNotFoundError) as e:
+                skipped[name] = str(e)
+        run["peak_rss_mb"] = peak_rss_mb()
+        runs.append(run)
+
+    params: dict = {
+        "lang": args.lang,
+        "sentences": args.sentences,
+        "iterations": args.iterations,
+        "skipped": skipped,
+    }
+    write_report(make_report("segmenter", params, runs), args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
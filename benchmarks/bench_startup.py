@@ -0,0 +1,151 @@
+"""
+Замер скорости запуска GUI: время до показа окна и до первого перевода.
+
+Каждый прогон — отдельный процесс: первое окно и первый перевод — холодный
+старт (импорт модулей, загрузка модели), второе окно в том же процессе
+и перевод другого текста — тёплый старт.
+Запуск из корня проекта:
+    python benchmarks/bench_startup.py --mode Online --runs 3
+    python benchmarks/bench_startup.py --mode Offline --output startup.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from common import ROOT_DIR, make_report, write_report
+
+# Код дочернего процесса: печатает JSON с замерами последней строкой
+CHILD_CODE: str = r"""
+import json, sys, time
+sys.path.insert(0, "benchmarks")
+from common import peak_rss_mb
+
+t_start = time.perf_counter()
+
+from PySide6.QtWidgets import QApplication
+from app import TranslatorApp
+from translator.translation_cache import TranslationCache
+
+t_import = time.perf_counter()
+app = QApplication(sys.argv[:1])
+window = TranslatorApp()
+window.show()
+app.processEvents()
+t_window = time.perf_counter()
+
+# Какие тяжёлые модули уже загружены к моменту показа окна
+heavy = [
+    name
+    for name in ("argostranslate", "torch", "stanza", "spacy", "ctranslate2", "requests")
+    if name in sys.modules
+]
+print("WINDOW", flush=True)
+
+mode, src, target, text, warm_text = sys.argv[1:6]
+result = {
+    "import_seconds": t_import - t_start,
+    "first_window_seconds": t_window - t_start,
+    "heavy_modules_at_window": heavy,
+}
+
+def translate(window, text):
+    # Кэш только в памяти, чтобы замерять настоящий перевод
+    for translator in window.translators:
+        translator.cache = TranslationCache(None)
+    window.ui.comboMode.setCurrentIndex(window.ui.comboMode.findText(mode))
+    window.ui.comboSource.setCurrentIndex(window.ui.comboSource.findData(src))
+    window.ui.comboTarget.setCurrentIndex(window.ui.comboTarget.findData(target))
+    window.ui.textInput.setPlainText(text)
+
+    t_request = time.perf_counter()
+    window.start_translation()
+    # Задание окна сброшено — перевод закончился (успешно или с ошибкой)
+    while window.worker is not None:
+        app.processEvents()
+        time.sleep(0.005)
+    return time.perf_counter() - t_request
+
+if text:
+    result["first_translation_seconds"] = translate(window, text)
+    result["first_translation_from_start_seconds"] = time.perf_counter() - t_start
+    result["output_chars"] = len(window.ui.textOutput.toPlainText())
+
+# Тёплый старт: модули уже загружены, модель — в пуле движков
+t_warm = time.perf_counter()
+warm_window = TranslatorApp()
+warm_window.show()
+app.processEvents()
+result["warm_window_seconds"] = time.perf_counter() - t_warm
+if text:
+    result["warm_translation_seconds"] = translate(warm_window, warm_text)
+
+result["peak_rss_mb"] = peak_rss_mb()
+print(json.dumps(result), flush=True)
+"""
+
+
+def run_once(mode: str, src: str, target: str, text: str, warm_text: str) -> dict:
+    env: dict[str, str] = dict(os.environ)
+    # Окно создаётся без дисплея
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    started: float = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-c", CHILD_CODE, mode, src, target, text, warm_text],
+        cwd=ROOT_DIR,
+        env=env,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    assert process.stdout is not None
+
+    result: dict = {}
+    window_wall: float | None = None
+    for line in process.stdout:
+        if line.startswith("WINDOW"):
+            window_wall = time.perf_counter() - started
+        elif line.startswith("{"):
+            result = json.loads(line)
+    process.wait()
+    if process.returncode != 0 or not result:
+        raise RuntimeError(f"Процесс замера завершился с кодом {process.returncode}")
+
+    # Время с учётом запуска интерпретатора
+    result["first_window_wall_seconds"] = window_wall
+    return result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--mode", default="Online", help="Online или Offline")
+    parser.add_argument("--src", default="en")
+    parser.add_argument("--target", default="ru")
+    parser.add_argument(
+        "--text",
+        default="Hello world. This is a startup benchmark.",
+        help="текст первого перевода (пустой — только замер окна)",
+    )
+    parser.add_argument(
+        "--warm-text",
+        default="The second translation reuses the loaded model.",
+        help="текст перевода в тёплом процессе",
+    )
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--output", help="файл для сохранения результатов (JSON)")
+    args = parser.parse_args(argv)
+
+    runs: list[dict] = [
+        run_once(args.mode, args.src, args.target, args.text, args.warm_text)
+        for _ in range(args.runs)
+    ]
+    params: dict = {"mode": args.mode, "src": args.src, "target": args.target}
+    write_report(make_report("startup", params, runs), args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+Общие функции скриптов замеров: сводка, пиковая память, формат отчёта.
+
+Отчёт каждого замера — JSON вида
+    {"benchmark": имя, "environment": {...}, "params": {...},
+     "summary": {метрика: {"median": ..., "min": ..., "max": ...}}, "runs": [...]}
+По полю summary отчёты сравниваются скриптом compare.py.
+"""
+
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+
+ROOT_DIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Скрипты запускаются как `python benchmarks/xxx.py`, пакет translator
+# лежит в корне проекта
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+
+def peak_rss_mb() -> float | None:
+    """
+    Пиковый объём памяти процесса (МБ) или None, если узнать его нельзя.
+    """
+    try:
+        import resource
+    except ImportError:
+        # Windows: модуля resource нет
+        return None
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # В Linux ru_maxrss в килобайтах, в macOS — в байтах
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """
+    Перцентиль (fraction от 0 до 1) по ближайшему рангу.
+    """
+    ordered: list[float] = sorted(values)
+    index: int = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def measure(func: Callable[[], object], iterations: int) -> list[float]:
+    """
+    Время (секунды) каждого из iterations вызовов func.
+    """
+    timings: list[float] = []
+    for _ in range(iterations):
+        started: float = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def summarize(runs: list[dict]) -> dict:
+    """
+    Медиана, минимум и максимум каждой числовой метрики по прогонам.
+    """
+    summary: dict = {}
+    for key, value in runs[0].items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            values: list[float] = [run[key] for run in runs if run.get(key) is not None]
+            summary[key] = {
+                "median": statistics.median(values),
+                "min": min(values),
+                "max": max(values),
+            }
+    return summary
+
+
+def environment() -> dict:
+    """
+    Описание машины: без него отчёты разных компьютеров сравнивать нельзя.
+    """
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def make_report(name: str, params: dict, runs: list[dict]) -> dict:
+    return {
+        "benchmark": name,
+        "environment": environment(),
+        "params": params,
+        "runs": runs,
+        "summary": summarize(runs),
+    }
+
+
+def write_report(report: dict, output: str | None) -> None:
+    """
+    Печать отчёта и (если указан файл) сохранение в JSON.
+    """
+    text: str = json.dumps(report, ensure_ascii=False, indent=2)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(text)
+    print(text)
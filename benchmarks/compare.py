@@ -0,0 +1,107 @@
+"""
+Сравнение двух отчётов замеров и поиск регрессий.
+
+Сравниваются медианы метрик из поля summary. Время (*_seconds) и память
+(*_mb) должны не расти, скорость (*_per_second) — не падать. Отклонение
+хуже порога (--threshold, в процентах) считается регрессией, и скрипт
+завершается с кодом 1. Разница меньше шумового порога (1 мс, 1 МБ)
+регрессией не считается, как бы велика она ни была в процентах.
+Запуск из корня проекта:
+    python benchmarks/compare.py baseline.json current.json --threshold 10
+"""
+
+import argparse
+import json
+import sys
+
+# Абсолютная разница, которую считаем шумом измерения
+NOISE_FLOOR: dict[str, float] = {"_seconds": 0.001, "_mb": 1.0}
+
+
+def load_reports(path: str) -> dict[str, dict]:
+    """
+    Отчёты из файла по имени замера (файл run_all.py содержит несколько).
+    """
+    with open(path, encoding="utf-8") as f:
+        data: dict = json.load(f)
+    reports: list[dict] = data.get("benchmarks", [data])
+    return {report["benchmark"]: report for report in reports}
+
+
+def higher_is_better(metric: str) -> bool | None:
+    """
+    Направление метрики; None — метрика не сравнивается (например, счётчики).
+    """
+    if metric.endswith("_per_second"):
+        return True
+    if metric.endswith("_seconds") or metric.endswith("_mb"):
+        return False
+    return None
+
+
+def compare(
+    baseline: dict[str, dict],
+    current: dict[str, dict],
+    threshold: float,
+) -> list[dict]:
+    """
+    Строки сравнения: изменение в процентах (плюс — стало лучше) и признак регрессии.
+    """
+    rows: list[dict] = []
+    for name, report in current.items():
+        if name not in baseline:
+            continue
+        old_summary: dict = baseline[name]["summary"]
+        for metric, stats in report["summary"].items():
+            direction: bool | None = higher_is_better(metric)
+            if direction is None or metric not in old_summary:
+                continue
+            old: float = old_summary[metric]["median"]
+            new: float = stats["median"]
+            if old == 0:
+                continue
+            change: float = (new - old) / old * 100
+            if not direction:
+                change = -change
+            noise: float = next(
+                (floor for suffix, floor in NOISE_FLOOR.items() if metric.endswith(suffix)),
+                0.0,
+            )
+            rows.append(
+                {
+                    "benchmark": name,
+                    "metric": metric,
+                    "baseline": old,
+                    "current": new,
+                    "change_percent": change,
+                    "regression": change < -threshold and abs(new - old) >= noise,
+                }
+            )
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("baseline", help="отчёт предыдущего прогона")
+    parser.add_argument("current", help="отчёт нового прогона")
+    parser.add_argument("--threshold", type=float, default=10.0, help="допуск, %%")
+    args = parser.parse_args(argv)
+
+    rows: list[dict] = compare(
+        load_reports(args.baseline), load_reports(args.current), args.threshold
+    )
+    for row in rows:
+        mark: str = "РЕГРЕССИЯ" if row["regression"] else "ok"
+        print(
+            f"{row['benchmark']:<14} {row['metric']:<36} "
+            f"{row['baseline']:>12.6g} -> {row['current']:<12.6g} "
+            f"{row['change_percent']:+7.1f}%  {mark}"
+        )
+
+    regressions: int = sum(row["regression"] for row in rows)
+    print(f"Сравнено метрик: {len(rows)}, регрессий: {regressions}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
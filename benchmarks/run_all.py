@@ -0,0 +1,113 @@
+"""
+Запуск всех замеров и сохранение общего отчёта для compare.py.
+
+Каждый замер идёт в отдельном процессе, чтобы пиковая память одного
+не влияла на другой. Сеть не нужна: online-перевод меряется против
+локальной заглушки, offline — на крошечной встроенной модели (или на
+пакете из --package), запуск GUI — без перевода.
+Запуск из корня проекта:
+    python benchmarks/run_all.py --output baseline.json
+    python benchmarks/run_all.py --output current.json
+    python benchmarks/compare.py baseline.json current.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from common import ROOT_DIR, environment
+
+BENCHMARKS_DIR: str = os.path.join(ROOT_DIR, "benchmarks")
+
+
+def benchmark_commands(args: argparse.Namespace) -> dict[str, list[str]]:
+    runs: list[str] = ["--runs", str(args.runs)]
+    offline: list[str] = ["bench_offline.py", *runs]
+    if args.package:
+        offline += ["--package", args.package]
+    return {
+        "offline": offline,
+        "online": ["bench_online.py", *runs],
+        "hybrid": ["bench_hybrid.py", *runs],
+        "package_check": ["bench_package_check.py", *runs],
+        "model_store": ["bench_model_store.py", *runs],
+        "fuzzy_memory": ["bench_fuzzy_memory.py", *runs],
+        "langid": ["bench_langid.py", *runs],
+        "glossary": ["bench_glossary.py", *runs],
+        "segmenter": ["bench_segmenter.py", *runs],
+        # Пустой текст — только окно: первый перевод мог бы пойти в сеть
+        "startup": ["bench_startup.py", "--mode", "Offline", "--text", "", *runs],
+    }
+
+
+def run_benchmark(command: list[str]) -> dict:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output: str = os.path.join(tmp_dir, "report.json")
+        completed = subprocess.run(
+            [sys.executable, os.path.join(BENCHMARKS_DIR, command[0]), *command[1:]]
+            + ["--output", output],
+            cwd=ROOT_DIR,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+        with open(output, encoding="utf-8") as f:
+            return json.load(f)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--package", help="папка пакета argostranslate для offline-замера")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=[
+            "offline",
+            "online",
+            "hybrid",
+            "package_check",
+            "model_store",
+            "fuzzy_memory",
+            "langid",
+            "glossary",
+            "segmenter",
+            "startup",
+        ],
+        help="запустить только указанные замеры",
+    )
+    parser.add_argument("--output", help="файл для сохранения результатов (JSON)")
+    args = parser.parse_args(argv)
+
+    reports: list[dict] = []
+    failed: dict[str, str] = {}
+    for name, command in benchmark_commands(args).items():
+        if args.only and name not in args.only:
+            continue
+        print(f"{name}...", file=sys.stderr, flush=True)
+        try:
+            reports.append(run_benchmark(command))
+        except RuntimeError as e:
+            failed[name] = str(e)
+            print(f"{name}: ошибка: {e}", file=sys.stderr)
+
+    result: dict = {
+        "environment": environment(),
+        "benchmarks": reports,
+        "failed": failed,
+    }
+    text: str = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    print(text)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+"""
+Крошечная встроенная "модель" для замеров без скачанных языковых пакетов.
+
+Перевод — детерминированная замена слов по маленькому словарю, поэтому
+замер показывает накладные расходы конвейера (разбиение на предложения,
+память предложений, пакеты, сигналы), а не скорость нейросети.
+Для замера настоящего инференса передайте скриптам --package.
+"""
+
+import random
+
+from translator.engine.translator_engine import TranslatorEngine
+
+# Словарь "модели"
+VOCABULARY: dict[str, str] = {
+    "the": "этот",
+    "cat": "кот",
+    "dog": "пёс",
+    "sees": "видит",
+    "likes": "любит",
+    "small": "маленький",
+    "big": "большой",
+    "house": "дом",
+    "garden": "сад",
+    "in": "в",
+    "a": "",
+    "and": "и",
+    "today": "сегодня",
+    "quickly": "быстро",
+}
+
+_WORDS: list[str] = sorted(VOCABULARY)
+
+
+class TinyEngine(TranslatorEngine):
+    def translate_batch(self, segments: list[str]) -> list[str]:
+        return [
+            " ".join(VOCABULARY.get(word.lower(), word) for word in segment.split())
+            for segment in segments
+        ]
+
+
+def make_corpus(sentences: int, seed: int = 1351) -> list[str]:
+    """
+    Воспроизводимый набор предложений длиной от 4 до 20 слов.
+    """
+    rng: random.Random = random.Random(seed)
+    corpus: list[str] = []
+    for _ in range(sentences):
+        words: list[str] = [rng.choice(_WORDS) for _ in range(rng.randint(4, 20))]
+        corpus.append(" ".join(words).capitalize() + ".")
+    return corpus
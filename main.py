@@ -1,5 +1,11 @@
 import sys
 
+if __name__ == "__main__" and sys.argv[1:2] == ["--inference-host"]:
+    # Собранный EXE в роли процесса offline-инференса (см. translator/inference_host.py)
+    from translator.inference_host import main as inference_host_main
+
+    sys.exit(inference_host_main(sys.argv[2:]))
+
 from PySide6.QtWidgets import QApplication
 
 from app import TranslatorApp
@@ -0,0 +1,35 @@
+from translator.engine import AutoEngine, TranslatorEngine
+
+
+class TaggingEngine(TranslatorEngine):
+    """
+    Движок-заглушка: помечает предложения исходным языком пары.
+    """
+
+    def __init__(self, src_lang: str):
+        self.src = src_lang
+
+    def translate_batch(self, segments: list[str]) -> list[str]:
+        return [f"[{self.src}] {segment}" for segment in segments]
+
+
+def test_routes_each_segment_to_its_language():
+    engine = AutoEngine("ru", TaggingEngine)
+    [result] = engine.translate_texts(
+        ["The cat is sleeping on the sofa. Die Katze schläft auf dem Sofa."]
+    )
+    assert result == (
+        "[en] The cat is sleeping on the sofa. [de] Die Katze schläft auf dem Sofa."
+    )
+
+
+def test_target_language_and_missing_models_are_left_as_is():
+    def factory(lang: str) -> TranslatorEngine:
+        if lang == "fr":
+            raise FileNotFoundError(lang)
+        return TaggingEngine(lang)
+
+    engine = AutoEngine("ru", factory)
+    segments = ["Кошка спит на диване.", "Le chat dort sur le canapé."]
+    assert engine.translate_batch(segments) == segments
+    assert engine.engines == {"fr": None}
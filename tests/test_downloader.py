@@ -0,0 +1,160 @@
+import io
+import os
+import re
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from translator.downloader import Downloader, DownloadError
+
+ETAG: str = '"v1"'
+PART_SIZE: int = 64 * 1024
+
+
+def make_archive(size: int) -> bytes:
+    """
+    Zip-архив (как .argosmodel) с несжимаемым содержимым около size байт.
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+        archive.writestr("translate-en_ru/model/model.bin", os.urandom(size))
+    return buffer.getvalue()
+
+
+class ModelServer(ThreadingHTTPServer):
+    """
+    Локальный сервер файла модели. ranges — поддержка Range-запросов,
+    cut_after — сколько байт отдать в первом ответе перед обрывом соединения.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, payload: bytes):
+        super().__init__(("127.0.0.1", 0), ModelHandler)
+        self.payload: bytes = payload
+        self.ranges: bool = True
+        self.cut_after: int | None = None
+        self.requests: list[dict[str, str]] = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/model.argosmodel"
+
+
+class ModelHandler(BaseHTTPRequestHandler):
+    server: ModelServer
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def _headers(self, status: int, length: int) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", str(length))
+        self.send_header("ETag", ETAG)
+        if self.server.ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+
+    def do_HEAD(self) -> None:
+        self._headers(200, len(self.server.payload))
+
+    def do_GET(self) -> None:
+        payload: bytes = self.server.payload
+        with self.server.lock:
+            self.server.requests.append(dict(self.headers))
+            cut_after: int | None = self.server.cut_after
+            self.server.cut_after = None
+
+        match = re.fullmatch(r"bytes=(\d+)-(\d+)", self.headers.get("Range", ""))
+        if self.server.ranges and match and self.headers.get("If-Range", ETAG) == ETAG:
+            start, end = int(match.group(1)), int(match.group(2))
+            self._headers(206, end - start + 1)
+            body: bytes = payload[start : end + 1]
+        else:
+            self._headers(200, len(payload))
+            body = payload
+
+        if cut_after is not None:
+            # Обрыв: заголовки обещают весь диапазон, приходит только начало
+            self.wfile.write(body[:cut_after])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    server = ModelServer(make_archive(4 * PART_SIZE))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_downloader(parts: int = 4) -> Downloader:
+    return Downloader(parts=parts, buffer_size=4096, min_part_size=PART_SIZE)
+
+
+def test_parallel_ranges(server, tmp_path):
+    dest = tmp_path / "model.argosmodel"
+    make_downloader().download(server.url, dest)
+
+    assert dest.read_bytes() == server.payload
+    ranges = sorted(request["Range"] for request in server.requests)
+    assert len(ranges) == 4
+    assert all(request["If-Range"] == ETAG for request in server.requests)
+    assert not (tmp_path / "model.argosmodel.part").exists()
+    assert not (tmp_path / "model.argosmodel.part.json").exists()
+
+
+def test_resume_after_interruption(server, tmp_path):
+    dest = tmp_path / "model.argosmodel"
+    server.cut_after = PART_SIZE // 2
+    with pytest.raises((requests.RequestException, DownloadError)):
+        make_downloader(parts=1).download(server.url, dest)
+    assert (tmp_path / "model.argosmodel.part.json").exists()
+
+    server.requests.clear()
+    make_downloader(parts=1).download(server.url, dest)
+
+    assert dest.read_bytes() == server.payload
+    [request] = server.requests
+    start = int(re.match(r"bytes=(\d+)-", request["Range"]).group(1))
+    # Докачка продолжается с оборванного места, а не с нуля
+    assert start > 0
+    assert request["If-Range"] == ETAG
+
+
+def test_server_without_ranges(server, tmp_path):
+    server.ranges = False
+    dest = tmp_path / "model.argosmodel"
+    progress: list[int] = []
+    make_downloader().download(server.url, dest, progress.append)
+
+    assert dest.read_bytes() == server.payload
+    assert [request.get("Range") for request in server.requests] == [None]
+    assert progress[-1] == 100
+
+
+def test_corrupt_archive_is_deleted(server, tmp_path):
+    server.payload = os.urandom(4 * PART_SIZE)
+    dest = tmp_path / "model.argosmodel"
+    with pytest.raises(DownloadError):
+        make_downloader().download(server.url, dest)
+
+    assert not dest.exists()
+    assert not (tmp_path / "model.argosmodel.part").exists()
+    assert not (tmp_path / "model.argosmodel.part.json").exists()
+
+
+def test_checksum_mismatch_is_deleted(server, tmp_path):
+    dest = tmp_path / "model.argosmodel"
+    with pytest.raises(DownloadError):
+        make_downloader().download(server.url, dest, expected_sha256="0" * 64)
+    assert not (tmp_path / "model.argosmodel.part").exists()
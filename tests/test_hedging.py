@@ -0,0 +1,60 @@
+import random
+import time
+
+from translator.hedging import Hedger
+from translator.worker.cancellation import CancellationToken, TranslationCancelled
+
+
+def make_attempt(name: str, seconds: float, launched: list[str]):
+    """
+    Бэкенд-заглушка: отвечает через seconds, проверяя отмену.
+    """
+
+    def attempt(token: CancellationToken) -> str:
+        launched.append(name)
+        deadline: float = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            if token.cancelled:
+                raise TranslationCancelled()
+            time.sleep(0.002)
+        return name
+
+    return attempt
+
+
+def test_faster_backend_ends_up_first():
+    hedger = Hedger(default_delay=0.05, min_delay=0.005, explore_every=0)
+    rng = random.Random(0)
+    first: list[str] = []
+    for _ in range(40):
+        launched: list[str] = []
+        # Разброс задержки быстрого бэкенда: подстраховка иногда стартует
+        # и проигрывает, её время не должно делать медленный бэкенд первым
+        hedger.run(
+            {
+                "slow": make_attempt("slow", 0.2, launched),
+                "fast": make_attempt("fast", rng.uniform(0.01, 0.05), launched),
+            }
+        )
+        first.append(launched[0])
+
+    # Медленный бэкенд идёт первым, только пока набирает статистику
+    assert first.count("slow") <= hedger.min_samples
+    assert set(first[-20:]) == {"fast"}
+    stats = hedger.stats()
+    assert stats["p50"]["slow"] > stats["p50"]["fast"]
+
+
+def test_losing_hedge_is_not_recorded():
+    hedger = Hedger(default_delay=0.01, min_delay=0.005, explore_every=0)
+    launched: list[str] = []
+    name, _ = hedger.run(
+        {
+            "fast": make_attempt("fast", 0.05, launched),
+            "slow": make_attempt("slow", 0.5, launched),
+        }
+    )
+    assert name == "fast"
+    assert launched == ["fast", "slow"]
+    assert len(hedger.histograms["fast"].recent) == 1
+    assert not hedger.histograms["slow"].recent
@@ -0,0 +1,127 @@
+import asyncio
+import threading
+
+from translator.engine import TranslatorEngine
+from translator.server import TranslationServer
+
+
+class StubEngine(TranslatorEngine):
+    """
+    Движок-заглушка: запоминает пакеты и может ждать разрешения перевести.
+    """
+
+    def __init__(self):
+        self.batches: list[list[str]] = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def translate_batch(self, segments: list[str]) -> list[str]:
+        self.release.wait(5)
+        self.batches.append(list(segments))
+        return [segment.upper() for segment in segments]
+
+
+def make_server(engine: StubEngine, **kwargs) -> TranslationServer:
+    return TranslationServer(lambda mode, src, target: engine, window=0.05, **kwargs)
+
+
+def test_concurrent_requests_are_coalesced_and_deduplicated():
+    engine = StubEngine()
+    server = make_server(engine)
+
+    async def run():
+        return await asyncio.gather(
+            server.translate({"text": "One."}),
+            server.translate({"texts": ["Two.", "One."]}),
+            server.translate({"text": "Two."}),
+        )
+
+    results = asyncio.run(run())
+    assert results == [
+        (200, {"translation": "ONE."}),
+        (200, {"translations": ["TWO.", "ONE."]}),
+        (200, {"translation": "TWO."}),
+    ]
+    # Одно окно — один вызов движка, повторы в работе не переводятся
+    assert engine.batches == [["One.", "Two."]]
+    assert server.metrics.batches == 1
+    assert server.metrics.deduplicated == 2
+
+
+def test_overload_returns_503():
+    engine = StubEngine()
+    engine.release.clear()
+    server = make_server(engine, max_pending=2)
+
+    async def run():
+        first = asyncio.ensure_future(server.translate({"texts": ["One.", "Two."]}))
+        await asyncio.sleep(0.01)
+        rejected = await server.translate({"text": "Three."})
+        engine.release.set()
+        return rejected, await first
+
+    rejected, first = asyncio.run(run())
+    assert rejected[0] == 503
+    assert first == (200, {"translations": ["ONE.", "TWO."]})
+    assert server.metrics.rejected == 1
+
+
+def test_request_larger_than_queue_returns_413():
+    engine = StubEngine()
+    server = make_server(engine, max_pending=2)
+
+    status, _ = asyncio.run(server.translate({"texts": ["One.", "Two.", "Three."]}))
+    assert status == 413
+    assert engine.batches == []
+
+
+def test_http_status_and_retry_after():
+    engine = StubEngine()
+    server = make_server(engine, max_pending=1)
+
+    async def request(body: bytes) -> bytes:
+        listener = await server.start("127.0.0.1", 0)
+        port: int = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(
+            b"POST /translate HTTP/1.1\r\nConnection: close\r\n"
+            + f"Content-Length: {len(body)}\r\n\r\n".encode()
+            + body
+        )
+        response: bytes = await reader.read()
+        writer.close()
+        listener.close()
+        return response
+
+    response = asyncio.run(request(b'{"texts": ["One.", "Two."]}'))
+    assert response.startswith(b"HTTP/1.1 413 ")
+    assert b"Retry-After" not in response
+
+
+def test_full_batch_is_taken_at_once():
+    engine = StubEngine()
+    server = make_server(engine, max_batch=2)
+
+    status, response = asyncio.run(
+        server.translate({"texts": ["One.", "Two.", "Three.", "Four.", "Five."]})
+    )
+    assert status == 200
+    assert response == {"translations": ["ONE.", "TWO.", "THREE.", "FOUR.", "FIVE."]}
+    assert sorted(map(len, engine.batches)) == [1, 2, 2]
+
+
+def test_invalid_content_length_returns_400():
+    server = make_server(StubEngine())
+
+    async def request(length: bytes) -> bytes:
+        listener = await server.start("127.0.0.1", 0)
+        port: int = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"POST /translate HTTP/1.1\r\nContent-Length: " + length + b"\r\n\r\n")
+        response: bytes = await reader.read()
+        writer.close()
+        listener.close()
+        return response
+
+    for length in (b"abc", b"-5"):
+        assert asyncio.run(request(length)).startswith(b"HTTP/1.1 400 ")
@@ -0,0 +1,14 @@
+from translator.translation_cache import make_cache_key, restore_edges
+
+
+def test_edges_do_not_change_the_key():
+    assert make_cache_key("t", "en", "ru", "Hello.\r\n") == make_cache_key(
+        "t", "en", "ru", "\n  Hello.\n"
+    )
+
+
+def test_cached_translation_gets_the_request_edges():
+    cached = "\n\nПривет.\n"
+    assert restore_edges("Hello.", cached) == "Привет."
+    assert restore_edges("\n  Hello.\n\n", cached) == "\n  Привет.\n\n"
+    assert restore_edges("   ", cached) == "   "
@@ -1,9 +1,11 @@
 from .translator import Translator
+from .translator_hybrid import TranslatorHybrid
 from .translator_offline import TranslatorOffline
 from .translator_online import TranslatorOnline
 
 __all__ = [
     "Translator",
+    "TranslatorHybrid",
     "TranslatorOffline",
     "TranslatorOnline",
 ]
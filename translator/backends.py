@@ -0,0 +1,22 @@
+from types import ModuleType
+
+from .paths import configure_argos
+
+
+def import_argos() -> ModuleType:
+    """
+    Ленивый импорт argostranslate (вместе с ним грузятся torch, stanza и
+    spacy — это секунды). Вызывается при первом offline-переводе или при
+    фоновом прогреве, а не при старте программы.
+    """
+    # Пути нужно настроить ДО импорта: argostranslate читает переменные
+    # окружения в момент инициализации
+    configure_argos()
+    try:
+        import argostranslate.package
+        import argostranslate.translate
+    except ImportError:
+        raise ImportError(
+            "Ошибка: Не установлены библиотеки! Выполните:\npip install torch --index-url https://download.pytorch.org/whl/cpu\npip install pyside6 requests argostranslate"
+        )
+    return argostranslate
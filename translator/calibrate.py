@@ -0,0 +1,194 @@
+"""
+Калибровка offline-движка на текущей машине.
+
+Для каждого типа вычислений (int8, int8_float32, float32) и нескольких
+раскладок потоков (inter_threads x intra_threads) меряется задержка
+перевода одного предложения и пропускная способность на пакете.
+С --save лучшие настройки сохраняются и используются профилем "auto".
+
+Примеры:
+    python -m translator.calibrate --src en --target ru
+    python -m translator.calibrate --optimize latency --save
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+from .engine import OfflineEngine, OfflineEngineSettings
+from .engine.offline_engine import COMPUTE_TYPES
+from .engine.offline_profiles import CALIBRATION_FILE, save_calibration
+from .package_registry import get_package_registry
+
+# Предложения для замеров; повторяются до нужного размера пакета
+SAMPLE_SENTENCES: list[str] = [
+    "The weather was unusually warm for the middle of October.",
+    "Please send me the report before the meeting on Monday.",
+    "She opened the window and listened to the rain.",
+    "Our team released a new version of the application yesterday.",
+    "If you have any questions, do not hesitate to contact us.",
+    "The museum is closed for renovation until next spring.",
+    "He has been learning to play the piano for three years.",
+    "This road leads to a small village near the lake.",
+]
+
+
+def thread_layouts(cores: int) -> list[tuple[int, int]]:
+    """
+    Раскладки (inter_threads, intra_threads), использующие все ядра.
+    """
+    layouts: list[tuple[int, int]] = []
+    for inter in (1, 2, 4, cores // 4, cores // 2):
+        if inter >= 1 and cores // inter >= 1:
+            layout: tuple[int, int] = (inter, cores // inter)
+            if layout not in layouts:
+                layouts.append(layout)
+    return layouts
+
+
+def measure(
+    package_path: str,
+    settings: OfflineEngineSettings,
+    target_prefix: str,
+    batch_sentences: int,
+    repeats: int,
+) -> dict[str, float]:
+    started: float = time.perf_counter()
+    engine = OfflineEngine(package_path, settings, target_prefix)
+    load_seconds: float = time.perf_counter() - started
+
+    # Первый вызов прогревает кэши и не учитывается
+    engine.translate_batch(SAMPLE_SENTENCES[:1])
+
+    latencies: list[float] = []
+    for index in range(repeats):
+        sentence: str = SAMPLE_SENTENCES[index % len(SAMPLE_SENTENCES)]
+        started = time.perf_counter()
+        engine.translate_batch([sentence])
+        latencies.append(time.perf_counter() - started)
+
+    batch: list[str] = [
+        SAMPLE_SENTENCES[i % len(SAMPLE_SENTENCES)] for i in range(batch_sentences)
+    ]
+    started = time.perf_counter()
+    engine.translate_batch(batch)
+    batch_seconds: float = time.perf_counter() - started
+
+    return {
+        "load_seconds": load_seconds,
+        "latency_seconds": statistics.median(latencies),
+        "segments_per_second": len(batch) / batch_seconds,
+    }
+
+
+def calibrate(args: argparse.Namespace) -> list[dict]:
+    pkg = get_package_registry().get_installed(args.src, args.target)
+    if pkg is None or not os.path.exists(
+        os.path.join(pkg.package_path, "sentencepiece.model")
+    ):
+        raise FileNotFoundError(
+            f"Для пары {args.src}->{args.target} нет установленного пакета "
+            "с моделью ctranslate2. Выполните один перевод в программе."
+        )
+    target_prefix: str = getattr(pkg, "target_prefix", "") or ""
+    cores: int = os.cpu_count() or 1
+
+    results: list[dict] = []
+    for compute_type in args.compute_types:
+        for inter, intra in thread_layouts(cores):
+            settings = OfflineEngineSettings(
+                beam_size=args.beam_size,
+                inter_threads=inter,
+                intra_threads=intra,
+                compute_type=compute_type,
+            )
+            try:
+                metrics: dict[str, float] = measure(
+                    str(pkg.package_path),
+                    settings,
+                    target_prefix,
+                    args.sentences,
+                    args.repeats,
+                )
+            except ValueError as e:
+                # Тип вычислений не поддерживается этим процессором
+                print(f"{compute_type}: пропущен ({e})", file=sys.stderr)
+                break
+            results.append({"settings": settings.to_dict(), **metrics})
+            print(
+                f"{compute_type:<13} {inter:>2} x {intra:<2} "
+                f"задержка {metrics['latency_seconds'] * 1000:8.1f} мс  "
+                f"{metrics['segments_per_second']:8.1f} предл./с",
+                file=sys.stderr,
+            )
+    return results
+
+
+def pick_best(results: list[dict], optimize: str) -> dict:
+    if optimize == "latency":
+        return min(results, key=lambda result: result["latency_seconds"])
+    return max(results, key=lambda result: result["segments_per_second"])
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m translator.calibrate",
+        description="Подбор типа вычислений и потоков offline-движка на этой машине.",
+    )
+    parser.add_argument("--src", default="en", help="исходный язык")
+    parser.add_argument("--target", default="ru", help="целевой язык")
+    parser.add_argument(
+        "--compute-types",
+        nargs="+",
+        choices=COMPUTE_TYPES,
+        default=list(COMPUTE_TYPES),
+        help="какие типы вычислений проверять",
+    )
+    parser.add_argument("--beam-size", type=int, default=2)
+    parser.add_argument("--sentences", type=int, default=128, help="размер пакета")
+    parser.add_argument("--repeats", type=int, default=10, help="замеров задержки")
+    parser.add_argument(
+        "--optimize",
+        choices=["throughput", "latency"],
+        default="throughput",
+        help="что важнее при выборе лучших настроек",
+    )
+    parser.add_argument(
+        "--save",
+        action="store_true",
+        help=f"сохранить лучшие настройки для профиля auto ({CALIBRATION_FILE})",
+    )
+    parser.add_argument("--output", help="файл для сохранения всех замеров (JSON)")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        results: list[dict] = calibrate(args)
+    except Exception as e:
+        print(e, file=sys.stderr)
+        return 1
+    if not results:
+        print("Ни одна из настроек не поддерживается.", file=sys.stderr)
+        return 1
+
+    best: dict = pick_best(results, args.optimize)
+    report: dict = {"optimize": args.optimize, "best": best, "results": results}
+    text: str = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    print(text)
+
+    if args.save:
+        save_calibration(OfflineEngineSettings.from_dict(best["settings"]))
+        print(f"Настройки сохранены в {CALIBRATION_FILE}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,394 @@
+"""
+Пакетный перевод файлов без графического интерфейса.
+
+Примеры:
+    python -m translator.cli corpus.txt -o corpus.ru.txt --src en --target ru
+    python -m translator.cli data.jsonl -o out.jsonl --format jsonl --field text
+    python -m translator.cli table.csv -o out.csv --format csv --columns title,body
+    python -m translator.cli corpus.txt -o corpus.ru.txt --resume
+    python -m translator.cli corpus.txt -o corpus.ru.txt --glossary terms.tsv
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, TextIO
+
+from .glossary import GLOSSARY_ENV, Glossary, load_glossary
+from .engine import (
+    PROFILE_TITLES,
+    OfflineEngineSettings,
+    TranslatorEngine,
+    get_profile,
+    load_engine,
+)
+from .segmenter import SEGMENTER_ENV, SEGMENTER_MODES
+from .stage_timing import TIMING_LOG_ENV, StageTimer, get_stage_metrics
+
+# Движок, загруженный один раз в каждом процессе пула
+_engine: TranslatorEngine | None = None
+# Глоссарий процесса пула (автомат читается из кэша на диске)
+_glossary: Glossary | None = None
+# Метки замеров стадий этого процесса (режим и пара языков)
+_labels: dict[str, str] = {}
+
+
+def _init_process(
+    mode: str,
+    src_lang: str,
+    target_lang: str,
+    settings: OfflineEngineSettings | None,
+    glossary_path: str | None = None,
+) -> None:
+    global _engine, _glossary
+    _labels.update(mode=mode, src=src_lang, target=target_lang)
+    timer = StageTimer("cli", **_labels)
+    with timer.span("model_load"):
+        _engine = load_engine(mode, src_lang, target_lang, settings)
+    if glossary_path:
+        with timer.span("glossary"):
+            _glossary = load_glossary(glossary_path)
+    get_stage_metrics().record(timer)
+
+
+def _translate_chunk(texts: list[str]) -> tuple[list[str], int]:
+    """
+    Перевод пакета в процессе пула. Вместе с переводами возвращается
+    число предложений, найденных при разбиении (для статистики), чтобы
+    родительскому процессу не приходилось разбивать тексты ещё раз.
+    """
+    assert _engine is not None
+    timer = StageTimer("cli", **_labels)
+    try:
+        translations: list[str] = _engine.translate_texts(texts, timer, _glossary)
+        return translations, timer.totals()["split"].segments
+    finally:
+        get_stage_metrics().record(timer)
+
+
+class RecordFormat:
+    """
+    Формат входного файла: как читать записи, какие тексты в них
+    переводить и как записывать результат.
+    """
+
+    def __init__(self, args: argparse.Namespace):
+        self.args: argparse.Namespace = args
+
+    def read(self, stream: TextIO) -> Iterator[Any]:
+        for line in stream:
+            yield line.rstrip("\r\n")
+
+    def header(self) -> str:
+        return ""
+
+    def texts(self, record: Any) -> list[str]:
+        return [record]
+
+    def format(self, records: list[Any], translations: list[list[str]]) -> str:
+        return "".join(f"{texts[0]}\n" for texts in translations)
+
+
+class JsonlFormat(RecordFormat):
+    def read(self, stream: TextIO) -> Iterator[Any]:
+        for line in stream:
+            yield json.loads(line) if line.strip() else None
+
+    def texts(self, record: Any) -> list[str]:
+        # Пустые строки, массивы и скаляры переписываются как есть
+        if not isinstance(record, dict):
+            return []
+        value = record.get(self.args.field)
+        return [value] if isinstance(value, str) else []
+
+    def format(self, records: list[Any], translations: list[list[str]]) -> str:
+        lines: list[str] = []
+        for record, texts in zip(records, translations):
+            if record is None:
+                lines.append("\n")
+                continue
+            if texts:
+                record[self.args.field] = texts[0]
+            lines.append(json.dumps(record, ensure_ascii=False) + "\n")
+        return "".join(lines)
+
+
+class CsvFormat(RecordFormat):
+    def __init__(self, args: argparse.Namespace):
+        super().__init__(args)
+        self.columns: list[str] = [
+            column.strip() for column in args.columns.split(",") if column.strip()
+        ]
+        self.fieldnames: list[str] = []
+
+    def read(self, stream: TextIO) -> Iterator[Any]:
+        # Не генератор: заголовок нужно прочитать сразу, до записи header()
+        reader = csv.DictReader(stream)
+        self.fieldnames = list(reader.fieldnames or [])
+        missing: list[str] = [c for c in self.columns if c not in self.fieldnames]
+        if missing:
+            raise ValueError(f"В CSV нет колонок: {', '.join(missing)}")
+        return reader
+
+    def _write(self, rows: list[dict[str, str]], header: bool) -> str:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=self.fieldnames)
+        if header:
+            writer.writeheader()
+        writer.writerows(rows)
+        return buffer.getvalue()
+
+    def header(self) -> str:
+        return self._write([], header=True)
+
+    def texts(self, record: Any) -> list[str]:
+        return [record.get(column) or "" for column in self.columns]
+
+    def format(self, records: list[Any], translations: list[list[str]]) -> str:
+        for record, texts in zip(records, translations):
+            record.update(zip(self.columns, texts))
+        return self._write(records, header=False)
+
+
+FORMATS: dict[str, type[RecordFormat]] = {
+    "txt": RecordFormat,
+    "jsonl": JsonlFormat,
+    "csv": CsvFormat,
+}
+
+
+class Progress:
+    """
+    Контрольная точка для продолжения после сбоя:
+    сколько записей уже переведено и где в выходном файле они заканчиваются.
+    """
+
+    def __init__(self, path: str):
+        self.path: str = path
+        self.records: int = 0
+        self.offset: int = 0
+
+    def load(self) -> bool:
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path, encoding="utf-8") as f:
+            data: dict[str, int] = json.load(f)
+        self.records = data["records"]
+        self.offset = data["offset"]
+        return True
+
+    def save(self) -> None:
+        # Пишем во временный файл и подменяем, чтобы не оставить битый JSON
+        tmp_path: str = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"records": self.records, "offset": self.offset}, f)
+        os.replace(tmp_path, self.path)
+
+    def remove(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def _chunks(records: Iterator[Any], size: int) -> Iterator[list[Any]]:
+    chunk: list[Any] = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def run_batch(args: argparse.Namespace) -> dict[str, float]:
+    """
+    Потоковый перевод файла пулом процессов.
+    Результаты пишутся строго в исходном порядке по мере готовности.
+    """
+    record_format: RecordFormat = FORMATS[args.format](args)
+    progress = Progress(args.output + ".progress")
+    resumed: bool = args.resume and progress.load()
+    if resumed and (
+        not os.path.exists(args.output) or os.path.getsize(args.output) < progress.offset
+    ):
+        # Контрольная точка осталась, а результата нет (или он обрезан) —
+        # начинаем заново
+        resumed = False
+
+    workers: int = max(1, args.workers)
+    cores: int = os.cpu_count() or 1
+    # Тип вычислений и beam берём из профиля, а ядра делим между
+    # процессами, чтобы модели не дрались за CPU
+    settings: OfflineEngineSettings = get_profile(args.profile)
+    settings.max_batch_size = args.batch_size
+    settings.inter_threads = 1
+    settings.intra_threads = max(1, cores // workers)
+
+    stats: dict[str, float] = {"records": 0, "segments": 0, "chars": 0}
+    started: float = time.perf_counter()
+    if args.glossary:
+        # Автомат строится один раз здесь, процессы пула читают его с диска
+        load_glossary(args.glossary)
+
+    with (
+        open(args.input, encoding="utf-8", newline="") as src,
+        open(args.output, "r+b" if resumed else "wb") as out,
+        ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_process,
+            initargs=(args.mode, args.src, args.target, settings, args.glossary),
+        ) as pool,
+    ):
+        records: Iterator[Any] = record_format.read(src)
+
+        if resumed:
+            # Отбрасываем недописанный хвост и пропускаем готовые записи
+            out.truncate(progress.offset)
+            out.seek(progress.offset)
+            for _ in range(progress.records):
+                next(records, None)
+        else:
+            out.write(record_format.header().encode("utf-8"))
+            progress.records = 0
+            progress.offset = out.tell()
+
+        pending: deque[
+            tuple[Future[tuple[list[str], int]], list[Any], list[int]]
+        ] = deque()
+
+        def flush_head() -> None:
+            future, chunk, counts = pending.popleft()
+            flat, segments = future.result()
+            stats["segments"] += segments
+            translations: list[list[str]] = []
+            pos: int = 0
+            for count in counts:
+                translations.append(flat[pos : pos + count])
+                pos += count
+
+            out.write(record_format.format(chunk, translations).encode("utf-8"))
+            out.flush()
+            progress.records += len(chunk)
+            progress.offset = out.tell()
+            progress.save()
+
+        for chunk in _chunks(records, args.chunk_size):
+            texts_per_record: list[list[str]] = [
+                record_format.texts(record) for record in chunk
+            ]
+            flat_texts: list[str] = [t for texts in texts_per_record for t in texts]
+
+            stats["records"] += len(chunk)
+            stats["chars"] += sum(len(text) for text in flat_texts)
+
+            pending.append(
+                (
+                    pool.submit(_translate_chunk, flat_texts),
+                    chunk,
+                    [len(texts) for texts in texts_per_record],
+                )
+            )
+            # Ограничиваем число пакетов в работе, чтобы не читать весь файл в память
+            while len(pending) > workers * 2:
+                flush_head()
+
+        while pending:
+            flush_head()
+
+    progress.remove()
+
+    elapsed: float = max(time.perf_counter() - started, 1e-9)
+    stats["seconds"] = elapsed
+    stats["segments_per_second"] = stats["segments"] / elapsed
+    stats["chars_per_second"] = stats["chars"] / elapsed
+    return stats
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m translator.cli",
+        description="Пакетный перевод файлов (txt, jsonl, csv) без GUI.",
+    )
+    parser.add_argument("input", help="входной файл")
+    parser.add_argument("-o", "--output", required=True, help="выходной файл")
+    parser.add_argument("--mode", choices=["offline", "online"], default="offline")
+    parser.add_argument("--src", default="en", help="исходный язык")
+    parser.add_argument("--target", default="ru", help="целевой язык")
+    parser.add_argument("--format", choices=list(FORMATS), default="txt")
+    parser.add_argument("--field", default="text", help="поле JSONL для перевода")
+    parser.add_argument("--columns", default="text", help="колонки CSV через запятую")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=max(1, (os.cpu_count() or 1) // 4),
+        help="число процессов перевода",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=64, help="записей в одном задании"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=32, help="max_batch_size для ctranslate2"
+    )
+    parser.add_argument(
+        "--profile",
+        choices=list(PROFILE_TITLES),
+        default=None,
+        help="профиль offline-движка (тип вычислений и beam)",
+    )
+    parser.add_argument(
+        "--segmenter",
+        choices=SEGMENTER_MODES,
+        default=None,
+        help="разбиение на предложения: regex (быстро) или stanza (точнее, медленно)",
+    )
+    parser.add_argument(
+        "--glossary",
+        default=os.environ.get(GLOSSARY_ENV),
+        help="файл терминов, которые не переводятся или переводятся фиксированно",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="продолжить с места остановки (по файлу OUTPUT.progress)",
+    )
+    parser.add_argument(
+        "--timing-log",
+        help="дописывать время стадий каждого задания в файл (JSON lines)",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.timing_log:
+        # Процессы пула наследуют окружение и пишут в общий журнал
+        os.environ[TIMING_LOG_ENV] = args.timing_log
+    if args.segmenter:
+        os.environ[SEGMENTER_ENV] = args.segmenter
+    try:
+        stats = run_batch(args)
+    except Exception as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    print(
+        f"Записей: {int(stats['records'])}, "
+        f"предложений: {int(stats['segments'])}, "
+        f"символов: {int(stats['chars'])}, "
+        f"время: {stats['seconds']:.2f} с, "
+        f"{stats['segments_per_second']:.1f} предл./с, "
+        f"{stats['chars_per_second']:.0f} симв./с",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,484 @@
+"""
+Перевод документов с разметкой: HTML, субтитры SRT и Markdown.
+
+Из документа извлекаются только переводимые тексты (узлы HTML, строки
+субтитров, текст Markdown без кода, ссылок и таблиц), одинаковые тексты
+переводятся один раз, уникальные уходят в переводчик пакетами, а
+документ собирается обратно с исходной разметкой.
+SRT и Markdown читаются и пишутся по частям, поэтому большой файл не
+загружается в память целиком. HTML разбирается целиком (для сборки
+нужно дерево), но переводится тоже пакетами.
+
+Пример:
+    python -m translator.documents page.html -o page.ru.html --src en --target ru
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from typing import Any, TextIO
+
+# Перевод списка текстов (порядок результата совпадает с входным)
+TranslateFunc = Callable[[list[str]], list[str]]
+
+# Пробелы по краям текста не переводятся, а переносятся как есть
+_EDGES_RE: re.Pattern[str] = re.compile(r"^(\s*)(.*?)(\s*)$", re.DOTALL)
+_LETTER_RE: re.Pattern[str] = re.compile(r"[^\W\d_]")
+
+
+def _has_letters(text: str) -> bool:
+    # Числа, время, знаки препинания и разделители не переводятся
+    return _LETTER_RE.search(text) is not None
+
+
+class DocumentTranslator:
+    """
+    Перевод текстов документа с устранением повторов.
+
+    Одинаковые тексты (пункты меню, имена говорящих, подписи) переводятся
+    один раз: переводы хранятся в памяти (последние memo_size текстов) и
+    переиспользуются во всех следующих частях документа.
+    """
+
+    def __init__(
+        self,
+        translate: TranslateFunc,
+        batch_size: int = 256,
+        memo_size: int = 100_000,
+    ):
+        self.translate: TranslateFunc = translate
+        self.batch_size: int = batch_size
+        self.memo_size: int = memo_size
+
+        self._memo: OrderedDict[str, str] = OrderedDict()
+        # texts — все тексты документа, unique — сколько из них ушло в переводчик
+        self.stats: dict[str, int] = {"texts": 0, "unique": 0}
+
+    def translate_texts(self, texts: list[str]) -> list[str]:
+        edges: list[tuple[str, str, str]] = [
+            _EDGES_RE.match(text).groups() for text in texts  # type: ignore[union-attr]
+        ]
+        known: dict[str, str] = {}
+        missing: list[str] = []
+        for _, core, _ in edges:
+            if core in known or not _has_letters(core):
+                continue
+            translation: str | None = self._memo.get(core)
+            if translation is None:
+                missing.append(core)
+                known[core] = core
+            else:
+                self._memo.move_to_end(core)
+                known[core] = translation
+
+        for start in range(0, len(missing), self.batch_size):
+            batch: list[str] = missing[start : start + self.batch_size]
+            known.update(zip(batch, self.translate(batch)))
+        for core in missing:
+            self._memo[core] = known[core]
+        while len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
+
+        self.stats["texts"] += len(texts)
+        self.stats["unique"] += len(missing)
+        return [lead + known.get(core, core) + trail for lead, core, trail in edges]
+
+    def translate_stream(
+        self,
+        document_format: "DocumentFormat",
+        src: TextIO,
+        out: TextIO,
+        on_chunk: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        Перевод документа из src в out частями примерно по batch_size текстов.
+        on_chunk вызывается после записи каждой части.
+        """
+        units: list[Any] = []
+        pending: int = 0
+
+        def flush() -> None:
+            if not units:
+                return
+            texts_per_unit: list[list[str]] = [
+                document_format.texts(unit) for unit in units
+            ]
+            flat: list[str] = self.translate_texts(
+                [text for texts in texts_per_unit for text in texts]
+            )
+            pos: int = 0
+            for unit, texts in zip(units, texts_per_unit):
+                out.write(document_format.render(unit, flat[pos : pos + len(texts)]))
+                pos += len(texts)
+            units.clear()
+            if on_chunk is not None:
+                on_chunk()
+
+        for unit in document_format.read(src):
+            units.append(unit)
+            pending += len(document_format.texts(unit))
+            if pending >= self.batch_size:
+                flush()
+                pending = 0
+        flush()
+
+
+class DocumentFormat(ABC):
+    """
+    Формат документа: чтение по частям, переводимые тексты части
+    и сборка части из переводов.
+    """
+
+    # Расширения файлов формата
+    extensions: tuple[str, ...] = ()
+
+    @abstractmethod
+    def read(self, stream: TextIO) -> Iterator[Any]:
+        pass
+
+    @abstractmethod
+    def texts(self, unit: Any) -> list[str]:
+        pass
+
+    @abstractmethod
+    def render(self, unit: Any, translations: list[str]) -> str:
+        pass
+
+
+class HtmlFormat(DocumentFormat):
+    """
+    HTML: текстовые узлы и атрибуты alt, title, placeholder, aria-label.
+    Код, скрипты, стили и элементы с translate="no" или классом
+    notranslate не переводятся.
+    """
+
+    extensions = (".html", ".htm", ".xhtml")
+
+    # Теги, содержимое которых не переводится
+    SKIP_TAGS: frozenset[str] = frozenset(
+        {
+            "script", "style", "code", "pre", "kbd", "samp", "var",
+            "noscript", "template", "textarea", "svg", "math",
+        }
+    )
+    ATTRIBUTES: tuple[str, ...] = ("alt", "title", "placeholder", "aria-label")
+
+    def _skipped(self, tag: Any) -> bool:
+        for parent in (tag, *tag.parents):
+            if parent.name in self.SKIP_TAGS or parent.get("translate") == "no":
+                return True
+            if "notranslate" in (parent.get("class") or []):
+                return True
+        return False
+
+    def read(self, stream: TextIO) -> Iterator[Any]:
+        from bs4 import BeautifulSoup, NavigableString
+
+        soup = BeautifulSoup(stream.read(), "html.parser")
+        # (узел или тег, атрибут) — что заменить переводом
+        slots: list[tuple[Any, str | None]] = []
+        for node in soup.find_all(string=True):
+            # Комментарии, doctype, CDATA — подклассы NavigableString
+            if type(node) is not NavigableString or not node.strip():
+                continue
+            if not self._skipped(node.parent):
+                slots.append((node, None))
+        for tag in soup.find_all(True):
+            if self._skipped(tag):
+                continue
+            for attribute in self.ATTRIBUTES:
+                if isinstance(tag.get(attribute), str) and tag[attribute].strip():
+                    slots.append((tag, attribute))
+            is_description: bool = tag.name == "meta" and tag.get("name") == "description"
+            if is_description and tag.get("content"):
+                slots.append((tag, "content"))
+        yield soup, slots
+
+    def texts(self, unit: Any) -> list[str]:
+        _, slots = unit
+        return [
+            str(node) if attribute is None else node[attribute]
+            for node, attribute in slots
+        ]
+
+    def render(self, unit: Any, translations: list[str]) -> str:
+        soup, slots = unit
+        for (node, attribute), translation in zip(slots, translations):
+            if attribute is None:
+                node.replace_with(translation)
+            else:
+                node[attribute] = translation
+        return str(soup)
+
+
+class _SrtBlock:
+    def __init__(self, head: list[str], groups: list[tuple[str, str, str, list[str]]]):
+        # Номер и время субтитра
+        self.head: list[str] = head
+        # Реплики: (префикс, текст, суффикс, концы исходных строк)
+        self.groups: list[tuple[str, str, str, list[str]]] = groups
+
+
+def _wrap(text: str, lines: int) -> list[str]:
+    """
+    Разбиение перевода на lines строк примерно равной длины (по словам).
+    """
+    if lines <= 1:
+        return [text]
+    width: float = len(text) / lines
+    result: list[str] = []
+    current: list[str] = []
+    for word in text.split():
+        if current and len(result) < lines - 1 and len(" ".join(current + [word])) > width:
+            result.append(" ".join(current))
+            current = []
+        current.append(word)
+    result.append(" ".join(current))
+    return result
+
+
+class SrtFormat(DocumentFormat):
+    """
+    Субтитры SRT. Строки одной реплики переводятся вместе и после перевода
+    снова разбиваются на столько же строк; реплики диалога ("- ...")
+    и теги оформления (<i>, {\\an8}) по краям сохраняются.
+    """
+
+    extensions = (".srt",)
+
+    _TAGS_RE: re.Pattern[str] = re.compile(
+        r"^((?:\s*-\s*)?(?:<[^>]+>|\{[^}]*\})*)(.*?)((?:<[^>]+>)*)$", re.DOTALL
+    )
+
+    def _parse(self, lines: list[str]) -> _SrtBlock:
+        timing: int = next(
+            (index for index, line in enumerate(lines) if "-->" in line), len(lines)
+        )
+        groups: list[tuple[str, str, str, list[str]]] = []
+        group: list[str] = []
+        for line in lines[timing + 1 :] + [""]:
+            if group and (not line or line.lstrip().startswith("-")):
+                endings: list[str] = [item[len(item.rstrip("\r\n")) :] for item in group]
+                joined: str = " ".join(item.strip() for item in group)
+                prefix, text, suffix = self._TAGS_RE.match(joined).groups()  # type: ignore[union-attr]
+                groups.append((prefix, text, suffix, endings))
+                group = []
+            if line:
+                group.append(line)
+        return _SrtBlock(lines[: timing + 1], groups)
+
+    def read(self, stream: TextIO) -> Iterator[Any]:
+        block: list[str] = []
+        for line in stream:
+            if line.strip():
+                block.append(line)
+                continue
+            if block:
+                yield self._parse(block)
+                block = []
+            yield _SrtBlock([line], [])
+        if block:
+            yield self._parse(block)
+
+    def texts(self, unit: Any) -> list[str]:
+        return [text for _, text, _, _ in unit.groups]
+
+    def render(self, unit: Any, translations: list[str]) -> str:
+        parts: list[str] = list(unit.head)
+        for (prefix, _, suffix, endings), translation in zip(unit.groups, translations):
+            wrapped: list[str] = _wrap(translation, len(endings))
+            wrapped[0] = prefix + wrapped[0]
+            wrapped[-1] += suffix
+            parts.extend(line + ending for line, ending in zip(wrapped, endings))
+        return "".join(parts)
+
+
+class MarkdownFormat(DocumentFormat):
+    """
+    Markdown построчно. Не переводятся блоки кода, front matter,
+    определения ссылок, встроенный код, адреса ссылок, HTML-теги и
+    разделители таблиц; маркеры заголовков, списков и цитат сохраняются.
+    Текст между ними переводится отдельными кусками.
+    """
+
+    extensions = (".md", ".markdown")
+
+    _FENCE_RE: re.Pattern[str] = re.compile(r"^\s*(```|~~~)")
+    _REFERENCE_RE: re.Pattern[str] = re.compile(r"^\s*\[[^\]]+\]:\s*\S")
+    _PREFIX_RE: re.Pattern[str] = re.compile(
+        r"^\s*(?:>\s*)*(?:#{1,6}\s+|[-*+]\s+(?:\[[ xX]\]\s+)?|\d+[.)]\s+)?"
+    )
+    _PROTECTED_RE: re.Pattern[str] = re.compile(
+        r"`+[^`]*`+"
+        r"|!?\[|\]\([^)]*\)|\]\[[^\]]*\]|\]"
+        r"|<[^>]+>"
+        r"|https?://\S+"
+        r"|\s*\|\s*"
+    )
+
+    def __init__(self):
+        self._fence: str | None = None
+        self._front_matter: bool = False
+        self._previous_blank: bool = True
+
+    def _parts(self, line: str) -> list[tuple[str, bool]]:
+        """
+        Куски строки: (текст, переводить ли его).
+        """
+        body: str = line.rstrip("\r\n")
+        ending: str = line[len(body) :]
+        previous_blank: bool = self._previous_blank
+        self._previous_blank = True
+        fence = self._FENCE_RE.match(body)
+        if self._fence is not None:
+            if fence is not None and fence.group(1) == self._fence:
+                self._fence = None
+            return [(line, False)]
+        if fence is not None:
+            self._fence = fence.group(1)
+            return [(line, False)]
+        if self._front_matter:
+            self._front_matter = body.strip() not in ("---", "...")
+            return [(line, False)]
+        if previous_blank and (body.startswith("    ") or body.startswith("\t")):
+            # Блок кода с отступом (продолжается до первой строки без отступа)
+            return [(line, False)]
+        self._previous_blank = not body.strip()
+        if self._REFERENCE_RE.match(body):
+            return [(line, False)]
+
+        prefix_end: int = self._PREFIX_RE.match(body).end()  # type: ignore[union-attr]
+        parts: list[tuple[str, bool]] = [(body[:prefix_end], False)]
+        pos: int = prefix_end
+        for match in self._PROTECTED_RE.finditer(body, prefix_end):
+            parts.append((body[pos : match.start()], True))
+            parts.append((match.group(), False))
+            pos = match.end()
+        parts.append((body[pos:], True))
+        parts.append((ending, False))
+        return [(text, translate) for text, translate in parts if text]
+
+    def read(self, stream: TextIO) -> Iterator[Any]:
+        for index, line in enumerate(stream):
+            if index == 0 and line.strip() == "---":
+                self._front_matter = True
+                yield [(line, False)]
+                continue
+            yield self._parts(line)
+
+    def texts(self, unit: Any) -> list[str]:
+        return [text for text, translate in unit if translate]
+
+    def render(self, unit: Any, translations: list[str]) -> str:
+        values: Iterator[str] = iter(translations)
+        return "".join(next(values) if translate else text for text, translate in unit)
+
+
+FORMATS: dict[str, type[DocumentFormat]] = {
+    "html": HtmlFormat,
+    "srt": SrtFormat,
+    "md": MarkdownFormat,
+}
+
+# Фильтр для диалога выбора файла
+DOCUMENT_FILTER: str = "Документы ({})".format(
+    " ".join(f"*{ext}" for cls in FORMATS.values() for ext in cls.extensions)
+)
+
+
+def detect_format(path: str) -> str:
+    """
+    Формат документа по расширению файла.
+    """
+    extension: str = os.path.splitext(path)[1].lower()
+    for name, cls in FORMATS.items():
+        if extension in cls.extensions:
+            return name
+    raise ValueError(f"Неизвестный формат документа: {extension or path}")
+
+
+def translate_file(
+    input_path: str,
+    output_path: str,
+    translator: DocumentTranslator,
+    format_name: str | None = None,
+    progress: Callable[[int], None] | None = None,
+) -> dict[str, int]:
+    """
+    Перевод файла документа. Результат пишется во временный файл и
+    подменяет output_path только после успешного перевода.
+    progress получает процент прочитанного файла.
+    """
+    document_format: DocumentFormat = FORMATS[format_name or detect_format(input_path)]()
+    size: int = max(1, os.path.getsize(input_path))
+    tmp_path: str = output_path + ".part"
+    try:
+        with (
+            open(input_path, encoding="utf-8-sig", newline="") as src,
+            open(tmp_path, "w", encoding="utf-8", newline="") as out,
+        ):
+
+            def on_chunk() -> None:
+                # Позиция в байтах — у буфера под текстовым потоком
+                if progress is not None:
+                    progress(min(100, src.buffer.tell() * 100 // size))
+
+            translator.translate_stream(document_format, src, out, on_chunk)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return translator.stats
+
+
+def main(argv: list[str] | None = None) -> int:
+    from .engine import PROFILE_TITLES, get_profile, load_engine
+    from .stage_timing import StageTimer, get_stage_metrics
+
+    parser = argparse.ArgumentParser(
+        prog="python -m translator.documents",
+        description="Перевод HTML, SRT и Markdown с сохранением разметки.",
+    )
+    parser.add_argument("input", help="входной файл")
+    parser.add_argument("-o", "--output", required=True, help="выходной файл")
+    parser.add_argument("--format", choices=list(FORMATS), help="по умолчанию — по расширению")
+    parser.add_argument("--mode", choices=["offline", "online"], default="offline")
+    parser.add_argument("--src", default="en", help="исходный язык")
+    parser.add_argument("--target", default="ru", help="целевой язык")
+    parser.add_argument("--profile", choices=list(PROFILE_TITLES), default=None)
+    parser.add_argument("--batch-size", type=int, default=256, help="текстов в одном пакете")
+    args = parser.parse_args(argv)
+
+    timer = StageTimer("document", mode=args.mode, src=args.src, target=args.target)
+    started: float = time.perf_counter()
+    try:
+        with timer.span("model_load"):
+            engine = load_engine(args.mode, args.src, args.target, get_profile(args.profile))
+        translator = DocumentTranslator(
+            lambda texts: engine.translate_texts(texts, timer), args.batch_size
+        )
+        stats: dict[str, int] = translate_file(
+            args.input, args.output, translator, args.format
+        )
+    except Exception as e:
+        print(e, file=sys.stderr)
+        return 1
+    finally:
+        get_stage_metrics().record(timer)
+
+    print(
+        f"Текстов: {stats['texts']}, уникальных переведено: {stats['unique']}, "
+        f"время: {time.perf_counter() - started:.2f} с",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
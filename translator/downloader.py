@@ -0,0 +1,271 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import zipfile
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import requests
+
+ProgressCallback = Callable[[int], None]
+
+
+class DownloadError(Exception):
+    pass
+
+
+class _Part:
+    def __init__(self, start: int, end: int, done: int = 0):
+        # Диапазон байт [start, end] включительно и сколько из него уже скачано
+        self.start: int = start
+        self.end: int = end
+        self.done: int = done
+
+    @property
+    def size(self) -> int:
+        return self.end - self.start + 1
+
+    @property
+    def finished(self) -> bool:
+        return self.done >= self.size
+
+
+class Downloader:
+    """
+    Докачиваемая загрузка больших файлов (языковых моделей).
+
+    Файл качается в DEST.part несколькими HTTP Range-запросами параллельно,
+    большими блоками. Состояние (какие диапазоны уже скачаны) хранится
+    в DEST.part.json, поэтому прерванная загрузка продолжается с места
+    остановки, а не с нуля. Прогресс сообщается не чаще нескольких раз
+    в секунду, чтобы не заваливать GUI сигналами.
+    """
+
+    def __init__(
+        self,
+        parts: int = 4,
+        buffer_size: int = 1024 * 1024,
+        min_part_size: int = 8 * 1024 * 1024,
+        progress_interval: float = 0.25,
+        timeout: tuple[float, float] = (5, 30),
+        session: requests.Session | None = None,
+    ):
+        self.parts: int = max(1, parts)
+        self.buffer_size: int = buffer_size
+        self.min_part_size: int = min_part_size
+        self.progress_interval: float = progress_interval
+        self.timeout: tuple[float, float] = timeout
+        self.session: requests.Session = (
+            session if session is not None else requests.Session()
+        )
+
+        self._lock: threading.Lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Состояние докачки
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _load_state(
+        state_path: Path,
+        url: str,
+        size: int,
+        etag: str,
+    ) -> list[_Part] | None:
+        if not state_path.exists():
+            return None
+        try:
+            state: dict[str, Any] = json.loads(state_path.read_text(encoding="utf-8"))
+        except ValueError:
+            return None
+        # Файл на сервере мог поменяться — тогда начинаем заново
+        if (state.get("url"), state.get("size"), state.get("etag")) != (url, size, etag):
+            return None
+        return [_Part(*part) for part in state["parts"]]
+
+    @staticmethod
+    def _save_state(
+        state_path: Path,
+        url: str,
+        size: int,
+        etag: str,
+        parts: list[_Part],
+    ) -> None:
+        state: dict[str, Any] = {
+            "url": url,
+            "size": size,
+            "etag": etag,
+            "parts": [[part.start, part.end, part.done] for part in parts],
+        }
+        tmp_path: Path = state_path.with_name(state_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(tmp_path, state_path)
+
+    def _split(self, size: int) -> list[_Part]:
+        count: int = max(1, min(self.parts, size // self.min_part_size))
+        step: int = size // count
+        return [
+            _Part(i * step, size - 1 if i == count - 1 else (i + 1) * step - 1)
+            for i in range(count)
+        ]
+
+    # ------------------------------------------------------------------
+    # Загрузка
+    # ------------------------------------------------------------------
+
+    def _probe(self, url: str) -> tuple[int | None, str, bool]:
+        """
+        Узнаём размер файла, ETag и поддержку Range-запросов.
+        """
+        response = self.session.head(url, allow_redirects=True, timeout=self.timeout)
+        response.raise_for_status()
+        length: str | None = response.headers.get("Content-Length")
+        accept_ranges: bool = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+        return (
+            int(length) if length else None,
+            response.headers.get("ETag", ""),
+            accept_ranges,
+        )
+
+    def _fetch_part(
+        self,
+        url: str,
+        etag: str,
+        part: _Part,
+        part_path: Path,
+        on_chunk: Callable[[], None],
+    ) -> None:
+        if part.finished:
+            return
+        headers: dict[str, str] = {"Range": f"bytes={part.start + part.done}-{part.end}"}
+        if etag:
+            # Если файл на сервере изменился, придёт 200 вместо 206
+            headers["If-Range"] = etag
+        with self.session.get(
+            url, headers=headers, stream=True, timeout=self.timeout
+        ) as response:
+            if response.status_code != 206:
+                raise DownloadError("Сервер не поддерживает докачку или файл изменился.")
+            with open(part_path, "r+b") as f:
+                f.seek(part.start + part.done)
+                for data in response.iter_content(chunk_size=self.buffer_size):
+                    f.write(data)
+                    with self._lock:
+                        part.done += len(data)
+                    on_chunk()
+        if not part.finished:
+            raise DownloadError("Соединение оборвалось до конца диапазона.")
+
+    def _fetch_whole(
+        self,
+        url: str,
+        part_path: Path,
+        progress: ProgressCallback | None,
+    ) -> None:
+        """
+        Загрузка без Range (сервер не сообщил размер или не умеет докачку).
+        """
+        with self.session.get(url, stream=True, timeout=self.timeout) as response:
+            response.raise_for_status()
+            total: int = int(response.headers.get("Content-Length") or 0)
+            downloaded: int = 0
+            last_report: float = 0.0
+            with open(part_path, "wb") as f:
+                for data in response.iter_content(chunk_size=self.buffer_size):
+                    f.write(data)
+                    downloaded += len(data)
+                    now: float = time.monotonic()
+                    if progress and total and now - last_report >= self.progress_interval:
+                        last_report = now
+                        progress(int(downloaded * 100 / total))
+
+    def download(
+        self,
+        url: str,
+        dest: str | Path,
+        progress: ProgressCallback | None = None,
+        expected_sha256: str | None = None,
+    ) -> Path:
+        """
+        Скачивает url в dest (с докачкой) и проверяет целостность файла.
+        progress получает процент 0-100.
+        """
+        dest = Path(dest)
+        part_path: Path = dest.with_name(dest.name + ".part")
+        state_path: Path = dest.with_name(dest.name + ".part.json")
+
+        size, etag, accept_ranges = self._probe(url)
+        if not size or not accept_ranges:
+            self._fetch_whole(url, part_path, progress)
+        else:
+            parts: list[_Part] | None = self._load_state(state_path, url, size, etag)
+            if parts is None or not part_path.exists():
+                parts = self._split(size)
+                with open(part_path, "wb") as f:
+                    f.truncate(size)
+            self._save_state(state_path, url, size, etag, parts)
+
+            last_report: list[float] = [0.0]
+
+            def on_chunk() -> None:
+                now: float = time.monotonic()
+                with self._lock:
+                    if now - last_report[0] < self.progress_interval:
+                        return
+                    last_report[0] = now
+                    done: int = sum(part.done for part in parts)
+                    # Заодно сохраняем состояние для докачки
+                    self._save_state(state_path, url, size, etag, parts)
+                if progress:
+                    progress(int(done * 100 / size))
+
+            try:
+                with ThreadPoolExecutor(max_workers=len(parts)) as executor:
+                    futures = [
+                        executor.submit(
+                            self._fetch_part, url, etag, part, part_path, on_chunk
+                        )
+                        for part in parts
+                    ]
+                    for future in futures:
+                        future.result()
+            finally:
+                with self._lock:
+                    self._save_state(state_path, url, size, etag, parts)
+
+        if progress:
+            progress(100)
+
+        self._verify(part_path, expected_sha256)
+        os.replace(part_path, dest)
+        if state_path.exists():
+            state_path.unlink()
+        return dest
+
+    def _verify(self, path: Path, expected_sha256: str | None) -> None:
+        """
+        Проверка файла: SHA-256 (если известен) и CRC всех файлов архива.
+        Испорченный файл удаляется, чтобы следующая попытка качала заново.
+        """
+        try:
+            if expected_sha256:
+                digest = hashlib.sha256()
+                with open(path, "rb") as f:
+                    for block in iter(lambda: f.read(self.buffer_size), b""):
+                        digest.update(block)
+                if digest.hexdigest().lower() != expected_sha256.lower():
+                    raise DownloadError("Контрольная сумма файла не совпадает.")
+
+            # .argosmodel — это zip-архив, testzip проверяет CRC32 каждого файла
+            with zipfile.ZipFile(path) as archive:
+                broken: str | None = archive.testzip()
+            if broken is not None:
+                raise DownloadError(f"Архив повреждён: {broken}")
+        except (DownloadError, zipfile.BadZipFile) as e:
+            path.unlink(missing_ok=True)
+            path.with_name(path.name + ".json").unlink(missing_ok=True)
+            raise DownloadError(f"Скачанный файл повреждён: {e}")
@@ -0,0 +1,89 @@
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .auto_engine import AutoEngine
+    from .engine_pool import EnginePool, get_engine_pool
+    from .offline_engine import (
+        ArgosEngine,
+        OfflineEngine,
+        OfflineEngineSettings,
+        PivotEngine,
+        load_offline_engine,
+    )
+    from .offline_profiles import PROFILE_TITLES, get_profile
+    from .online_engine import OnlineEngine
+    from .translator_engine import TranslatorEngine
+
+# Модули движков импортируются лениво (при первом обращении к имени),
+# чтобы импорт пакета не тянул requests, bs4 и ctranslate2 при старте GUI
+_LAZY_NAMES: dict[str, str] = {
+    "ArgosEngine": ".offline_engine",
+    "AutoEngine": ".auto_engine",
+    "EnginePool": ".engine_pool",
+    "OfflineEngine": ".offline_engine",
+    "OfflineEngineSettings": ".offline_engine",
+    "OnlineEngine": ".online_engine",
+    "PivotEngine": ".offline_engine",
+    "PROFILE_TITLES": ".offline_profiles",
+    "TranslatorEngine": ".translator_engine",
+    "get_engine_pool": ".engine_pool",
+    "get_profile": ".offline_profiles",
+    "load_offline_engine": ".offline_engine",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name: str | None = _LAZY_NAMES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
+
+
+def load_engine(
+    mode: str,
+    src_lang: str,
+    target_lang: str,
+    settings: "OfflineEngineSettings | None" = None,
+) -> "TranslatorEngine":
+    """
+    Создание движка по имени режима ("online" или "offline").
+    settings применяются только к offline-движку. Исходный язык "auto" —
+    движок, переводящий каждое предложение движком его языка.
+    """
+    mode = mode.lower()
+    if src_lang == "auto" and mode in ("online", "offline"):
+        from .auto_engine import AutoEngine
+
+        return AutoEngine(
+            target_lang,
+            lambda lang: load_engine(mode, lang, target_lang, settings),
+            fallback="auto" if mode == "online" else None,
+            stage="http" if mode == "online" else "inference",
+        )
+    if mode == "online":
+        from .online_engine import OnlineEngine
+
+        return OnlineEngine(src_lang, target_lang)
+    if mode == "offline":
+        from .offline_engine import load_offline_engine
+
+        return load_offline_engine(src_lang, target_lang, settings)
+    raise ValueError(f"Неизвестный режим перевода: {mode}")
+
+
+__all__ = [
+    "ArgosEngine",
+    "AutoEngine",
+    "EnginePool",
+    "OfflineEngine",
+    "OfflineEngineSettings",
+    "OnlineEngine",
+    "PROFILE_TITLES",
+    "PivotEngine",
+    "TranslatorEngine",
+    "get_engine_pool",
+    "get_profile",
+    "load_engine",
+    "load_offline_engine",
+]
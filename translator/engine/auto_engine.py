@@ -0,0 +1,76 @@
+from collections.abc import Callable
+
+from ..langid import get_language_identifier
+from .translator_engine import TranslatorEngine
+
+
+class AutoEngine(TranslatorEngine):
+    """
+    Движок для исходного языка "auto": язык каждого предложения
+    определяется локально, и каждая группа предложений одного языка
+    переводится движком своей пары (движки создаются по первому запросу).
+
+    Предложения уже на языке перевода остаются как есть. Предложения,
+    язык которых не определился, переводятся движком fallback (у online —
+    "auto", то есть определение языка остаётся Google), а без него
+    остаются без перевода — как и предложения языков без установленной
+    модели (FileNotFoundError при создании движка или первом переводе).
+    """
+
+    def __init__(
+        self,
+        target_lang: str,
+        factory: Callable[[str], TranslatorEngine],
+        fallback: str | None = None,
+        stage: str = "inference",
+    ):
+        self.src: str = "auto"
+        self.stage: str = stage
+        self.target: str = target_lang
+        self.factory: Callable[[str], TranslatorEngine] = factory
+        self.fallback: str | None = fallback
+        # Движки пар по исходному языку (None — модели для языка нет)
+        self.engines: dict[str, TranslatorEngine | None] = {}
+        # Самый частый язык уже переведённых предложений (для коротких)
+        self.main_language: str | None = None
+
+    def _engine(self, lang: str) -> TranslatorEngine | None:
+        if lang not in self.engines:
+            try:
+                self.engines[lang] = self.factory(lang)
+            except FileNotFoundError:
+                self.engines[lang] = None
+        return self.engines[lang]
+
+    def translate_batch(self, segments: list[str]) -> list[str]:
+        # Короткие предложения без явного языка (например, "OK.")
+        # относятся к основному языку текста
+        languages: list[str | None] = get_language_identifier().detect_segments(
+            segments, default=self.main_language
+        )
+        detected: list[str] = [lang for lang in languages if lang is not None]
+        if detected:
+            self.main_language = max(set(detected), key=detected.count)
+
+        groups: dict[str | None, list[int]] = {}
+        for index, lang in enumerate(languages):
+            groups.setdefault(lang or self.fallback, []).append(index)
+
+        results: list[str] = list(segments)
+        for lang, indices in groups.items():
+            if lang is None or lang == self.target:
+                continue
+            engine: TranslatorEngine | None = self._engine(lang)
+            if engine is None:
+                continue
+            try:
+                translated: list[str] = engine.translate_batch(
+                    [segments[i] for i in indices]
+                )
+            except FileNotFoundError:
+                # Движок из пула загружает модель только при первом переводе
+                self.engines[lang] = None
+                continue
+            for index, translation in zip(indices, translated):
+                results[index] = translation
+        return results
@@ -0,0 +1,184 @@
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from .offline_engine import OfflineEngineSettings, load_offline_engine
+from .offline_profiles import DEFAULT_PROFILE, get_profile
+
+# Лимиты пула по умолчанию (можно переопределить переменными окружения)
+DEFAULT_MAX_ENGINES: int = int(os.environ.get("TRANSLATOR_POOL_MAX_ENGINES", "2"))
+DEFAULT_MAX_MEMORY_MB: int = int(os.environ.get("TRANSLATOR_POOL_MAX_MEMORY_MB", "0"))
+
+# (исходный язык, целевой язык, профиль offline-движка)
+EngineKey = tuple[str, str, str]
+EngineLoader = Callable[[str, str, OfflineEngineSettings], Any]
+
+
+def _estimate_size(engine: Any) -> int:
+    """
+    Оценка объёма памяти движка (по размеру файлов модели на диске).
+    """
+    model_size: Callable[[], int] | None = getattr(engine, "model_size", None)
+    return model_size() if model_size is not None else 0
+
+
+class _PoolEntry:
+    def __init__(self, engine: Any, size: int):
+        self.engine: Any = engine
+        self.size: int = size
+        self.borrowed: int = 0
+
+
+class EnginePool:
+    """
+    Общий на процесс пул загруженных offline-движков перевода.
+
+    Держит в памяти ctranslate2-переводчики и токенизаторы недавно
+    использованных языковых пар, чтобы повторный перевод не тратил время
+    на загрузку модели. При превышении лимита по количеству пар или по
+    объёму памяти выгружаются давно не используемые пары (LRU).
+    Занятые (одолженные) движки не выгружаются. Одна пара с разными
+    профилями (fast, quality, ...) — это разные движки.
+    """
+
+    def __init__(
+        self,
+        loader: EngineLoader = load_offline_engine,
+        max_engines: int = DEFAULT_MAX_ENGINES,
+        max_memory_mb: int = DEFAULT_MAX_MEMORY_MB,
+        size_estimator: Callable[[Any], int] = _estimate_size,
+    ):
+        """
+        max_engines — сколько языковых пар держать загруженными (0 — без лимита).
+        max_memory_mb — суммарный бюджет памяти под модели (0 — без лимита).
+        """
+        self.loader: EngineLoader = loader
+        self.max_engines: int = max_engines
+        self.max_memory: int = max_memory_mb * 1024 * 1024
+        self.size_estimator: Callable[[Any], int] = size_estimator
+
+        self._entries: OrderedDict[EngineKey, _PoolEntry] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+        # Отдельные блокировки на загрузку, чтобы одна пара не грузилась дважды
+        self._load_locks: dict[EngineKey, threading.Lock] = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: EngineKey) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    @property
+    def memory_usage(self) -> int:
+        """
+        Суммарная оценка памяти всех загруженных движков (в байтах).
+        """
+        with self._lock:
+            return sum(entry.size for entry in self._entries.values())
+
+    def _acquire(self, key: EngineKey) -> _PoolEntry:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.borrowed += 1
+                self._entries.move_to_end(key)
+                return entry
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            # Пока ждали блокировку, пару мог загрузить другой поток
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.borrowed += 1
+                    self._entries.move_to_end(key)
+                    return entry
+
+            src_lang, target_lang, profile = key
+            engine = self.loader(src_lang, target_lang, get_profile(profile))
+            entry = _PoolEntry(engine, self.size_estimator(engine))
+            entry.borrowed += 1
+
+            with self._lock:
+                self._entries[key] = entry
+                self._load_locks.pop(key, None)
+                self._evict()
+            return entry
+
+    def _release(self, entry: _PoolEntry) -> None:
+        with self._lock:
+            entry.borrowed -= 1
+            self._evict()
+
+    def _is_over_budget(self) -> bool:
+        if self.max_engines and len(self._entries) > self.max_engines:
+            return True
+        if self.max_memory:
+            used: int = sum(entry.size for entry in self._entries.values())
+            return used > self.max_memory
+        return False
+
+    def _evict(self) -> None:
+        """
+        Выгрузка самых старых свободных движков, пока пул не уложится в лимиты.
+        Вызывается под self._lock.
+        """
+        for key in list(self._entries):
+            if not self._is_over_budget():
+                return
+            if self._entries[key].borrowed == 0:
+                del self._entries[key]
+
+    @contextmanager
+    def borrow(
+        self,
+        src_lang: str,
+        target_lang: str,
+        profile: str | None = None,
+    ) -> Iterator[Any]:
+        """
+        Одалживает движок для пары языков на время блока with.
+        Если пара ещё не загружена — загружает её с настройками профиля.
+        """
+        entry = self._acquire((src_lang, target_lang, profile or DEFAULT_PROFILE))
+        try:
+            yield entry.engine
+        finally:
+            self._release(entry)
+
+    def discard(self, src_lang: str, target_lang: str) -> None:
+        """
+        Удаление пары из пула (например, после переустановки пакета)
+        во всех профилях.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if key[:2] == (src_lang, target_lang):
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        """
+        Выгрузка всех движков.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+_pool: EnginePool | None = None
+_pool_lock: threading.Lock = threading.Lock()
+
+
+def get_engine_pool() -> EnginePool:
+    """
+    Возвращает общий на процесс пул движков (создаётся при первом обращении).
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = EnginePool()
+        return _pool
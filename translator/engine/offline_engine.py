@@ -0,0 +1,281 @@
+import os
+from pathlib import Path
+from typing import Any
+
+from ..backends import import_argos
+from ..model_store import ensure_extracted
+from ..package_registry import get_package_registry
+from .translator_engine import TranslatorEngine
+
+
+def _directory_size(path: Path) -> int:
+    return sum(item.stat().st_size for item in path.rglob("*") if item.is_file())
+
+
+# Типы вычислений ctranslate2, между которыми имеет смысл выбирать на CPU
+COMPUTE_TYPES: tuple[str, ...] = ("int8", "int8_float32", "float32")
+
+
+class OfflineEngineSettings:
+    """
+    Параметры пакетного инференса ctranslate2.
+    Число потоков по умолчанию подбирается по количеству ядер машины,
+    веса по умолчанию квантуются в int8 (быстрее всего на CPU).
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = 32,
+        beam_size: int = 2,
+        inter_threads: int | None = None,
+        intra_threads: int | None = None,
+        device: str = "cpu",
+        compute_type: str = "int8",
+    ):
+        cores: int = os.cpu_count() or 1
+        # inter_threads — сколько пакетов считается параллельно,
+        # intra_threads — сколько ядер отдаётся каждому пакету
+        if inter_threads is None:
+            inter_threads = max(1, cores // 4)
+        if intra_threads is None:
+            intra_threads = max(1, cores // inter_threads)
+
+        self.max_batch_size: int = max_batch_size
+        self.beam_size: int = beam_size
+        self.inter_threads: int = inter_threads
+        self.intra_threads: int = intra_threads
+        self.device: str = device
+        self.compute_type: str = compute_type
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "max_batch_size": self.max_batch_size,
+            "beam_size": self.beam_size,
+            "inter_threads": self.inter_threads,
+            "intra_threads": self.intra_threads,
+            "device": self.device,
+            "compute_type": self.compute_type,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "OfflineEngineSettings":
+        return cls(**{key: data[key] for key in cls().to_dict() if key in data})
+
+    def __repr__(self) -> str:
+        params: str = ", ".join(f"{key}={value!r}" for key, value in self.to_dict().items())
+        return f"OfflineEngineSettings({params})"
+
+
+class OfflineEngine(TranslatorEngine):
+    """
+    Пакетный offline-движок поверх ctranslate2 и sentencepiece.
+
+    Все предложения токенизируются заранее, сортируются по длине
+    и отправляются в translate_batch пакетами, которые ctranslate2
+    считает параллельно на нескольких ядрах.
+    """
+
+    def __init__(
+        self,
+        package_path: str | Path,
+        settings: OfflineEngineSettings | None = None,
+        target_prefix: str = "",
+    ):
+        import ctranslate2
+        import sentencepiece
+
+        self.package_path: Path = Path(package_path)
+        self.settings: OfflineEngineSettings = (
+            settings if settings is not None else OfflineEngineSettings()
+        )
+        self.target_prefix: str = target_prefix
+
+        # Модель пакета могла быть отложена при установке
+        ensure_extracted(self.package_path)
+        self.translator = ctranslate2.Translator(
+            str(self.package_path / "model"),
+            device=self.settings.device,
+            compute_type=self.settings.compute_type,
+            inter_threads=self.settings.inter_threads,
+            intra_threads=self.settings.intra_threads,
+        )
+        self.tokenizer = sentencepiece.SentencePieceProcessor(
+            model_file=str(self.package_path / "sentencepiece.model")
+        )
+
+    def model_size(self) -> int:
+        """
+        Оценка занимаемой памяти по размеру файлов модели.
+        """
+        return _directory_size(self.package_path)
+
+    def translate_batch(self, segments: list[str]) -> list[str]:
+        """
+        Перевод списка предложений. Порядок результата совпадает с входным.
+        """
+        if not segments:
+            return []
+
+        tokens: list[list[str]] = [
+            self.tokenizer.encode(segment, out_type=str) for segment in segments
+        ]
+        # Сортируем по длине, чтобы в пакет попадали предложения
+        # близкой длины и не тратилось время на padding
+        order: list[int] = sorted(range(len(tokens)), key=lambda i: len(tokens[i]))
+        sorted_tokens: list[list[str]] = [tokens[i] for i in order]
+
+        target_prefix: list[list[str]] | None = None
+        if self.target_prefix:
+            target_prefix = [[self.target_prefix]] * len(sorted_tokens)
+
+        results = self.translator.translate_batch(
+            sorted_tokens,
+            target_prefix=target_prefix,
+            max_batch_size=self.settings.max_batch_size,
+            beam_size=self.settings.beam_size,
+        )
+
+        translations: list[str] = [""] * len(segments)
+        for index, result in zip(order, results):
+            hypothesis: list[str] = result.hypotheses[0]
+            if self.target_prefix:
+                hypothesis = hypothesis[1:]
+            translations[index] = self.tokenizer.decode(hypothesis)
+        return translations
+
+
+class PivotEngine(TranslatorEngine):
+    """
+    Перевод через промежуточный язык двумя offline-движками подряд.
+    Заменяет составной перевод argostranslate для пар без прямого пакета:
+    текст уже разбит на предложения, поэтому stanza не загружается.
+    """
+
+    def __init__(self, first: OfflineEngine, second: OfflineEngine):
+        self.first: OfflineEngine = first
+        self.second: OfflineEngine = second
+
+    def model_size(self) -> int:
+        return self.first.model_size() + self.second.model_size()
+
+    def translate_batch(self, segments: list[str]) -> list[str]:
+        return self.second.translate_batch(self.first.translate_batch(segments))
+
+
+class ArgosEngine(TranslatorEngine):
+    """
+    Обёртка над переводом argostranslate с тем же интерфейсом, что и у
+    OfflineEngine. Используется для пакетов без sentencepiece-модели.
+    argostranslate сам разбивает каждый сегмент на предложения (stanza).
+    """
+
+    def __init__(self, translation: Any):
+        self.translation: Any = translation
+
+    def model_size(self) -> int:
+        size: int = 0
+        stack: list[Any] = [self.translation]
+        while stack:
+            item = stack.pop()
+            pkg = getattr(item, "pkg", None)
+            package_path = getattr(pkg, "package_path", None)
+            if package_path is not None:
+                size += _directory_size(Path(package_path))
+            # CompositeTranslation хранит вложенные переводы в t1/t2
+            stack.extend(
+                child
+                for child in (getattr(item, "t1", None), getattr(item, "t2", None))
+                if child is not None
+            )
+        return size
+
+    def translate_batch(self, segments: list[str]) -> list[str]:
+        return [self.translation.translate(segment) for segment in segments]
+
+
+def _load_package_engine(
+    src_lang: str,
+    target_lang: str,
+    settings: OfflineEngineSettings | None,
+) -> OfflineEngine | None:
+    """
+    Движок ctranslate2 прямого пакета пары или None, если его нет.
+    """
+    pkg = get_package_registry().get_installed(src_lang, target_lang)
+    if pkg is None:
+        return None
+    package_path = Path(pkg.package_path)
+    if not (package_path / "sentencepiece.model").exists():
+        return None
+    engine = OfflineEngine(
+        package_path,
+        settings,
+        target_prefix=getattr(pkg, "target_prefix", "") or "",
+    )
+    engine.src = src_lang
+    return engine
+
+
+def _load_pivot_engine(
+    src_lang: str,
+    target_lang: str,
+    settings: OfflineEngineSettings | None,
+) -> PivotEngine | None:
+    """
+    Перевод через промежуточный язык из двух установленных пакетов
+    (как и в argostranslate, сначала пробуется английский).
+    """
+    registry = get_package_registry()
+    pairs: list[tuple[str, str]] = registry.installed_pairs()
+    pivots: list[str] = sorted(
+        {to_code for from_code, to_code in pairs if from_code == src_lang},
+        key=lambda lang: lang != "en",
+    )
+    for pivot in pivots:
+        if (pivot, target_lang) not in pairs:
+            continue
+        first: OfflineEngine | None = _load_package_engine(src_lang, pivot, settings)
+        second: OfflineEngine | None = _load_package_engine(pivot, target_lang, settings)
+        if first is not None and second is not None:
+            engine = PivotEngine(first, second)
+            engine.src = src_lang
+            return engine
+    return None
+
+
+def load_offline_engine(
+    src_lang: str,
+    target_lang: str,
+    settings: OfflineEngineSettings | None = None,
+) -> OfflineEngine | PivotEngine | ArgosEngine:
+    """
+    Загрузка движка для пары языков из установленных пакетов argostranslate.
+    Составной перевод argostranslate (ArgosEngine) — только если
+    у пакетов нет sentencepiece-модели.
+    """
+    engine: OfflineEngine | PivotEngine | None = _load_package_engine(
+        src_lang, target_lang, settings
+    ) or _load_pivot_engine(src_lang, target_lang, settings)
+    if engine is not None:
+        return engine
+
+    # argostranslate загрузит модели сам: распаковываем все пакеты, через
+    # которые может пойти перевод (включая промежуточный язык)
+    registry = get_package_registry()
+    for from_code, to_code in registry.installed_pairs():
+        if from_code == src_lang or to_code == target_lang:
+            pkg = registry.get_installed(from_code, to_code)
+            if pkg is not None:
+                ensure_extracted(pkg.package_path)
+
+    argostranslate = import_argos()
+    translation = argostranslate.translate.get_translation_from_codes(
+        src_lang, target_lang
+    )
+    if translation is None:
+        raise FileNotFoundError(
+            f"Не найдена установленная модель для пары {src_lang}->{target_lang}."
+        )
+    engine = ArgosEngine(translation)
+    engine.src = src_lang
+    return engine
@@ -0,0 +1,58 @@
+import json
+import os
+
+from ..paths import DATA_DIR, ensure_data_dir
+from .offline_engine import OfflineEngineSettings
+
+# Файл с настройками, подобранными командой калибровки (см. translator.calibrate)
+CALIBRATION_FILE: str = os.path.join(DATA_DIR, "offline_profile.json")
+
+# Профиль по умолчанию (можно переопределить переменной окружения)
+DEFAULT_PROFILE: str = os.environ.get("TRANSLATOR_OFFLINE_PROFILE", "auto")
+
+# Названия профилей для интерфейса
+PROFILE_TITLES: dict[str, str] = {
+    "auto": "Авто",
+    "fast": "Быстро",
+    "balanced": "Баланс",
+    "quality": "Качество",
+}
+
+
+def load_calibration() -> OfflineEngineSettings | None:
+    """
+    Настройки, сохранённые калибровкой на этой машине, или None.
+    """
+    try:
+        with open(CALIBRATION_FILE, encoding="utf-8") as f:
+            return OfflineEngineSettings.from_dict(json.load(f))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def save_calibration(settings: OfflineEngineSettings) -> None:
+    ensure_data_dir()
+    with open(CALIBRATION_FILE, "w", encoding="utf-8") as f:
+        json.dump(settings.to_dict(), f, indent=2)
+
+
+def get_profile(name: str | None = None) -> OfflineEngineSettings:
+    """
+    Настройки offline-движка по имени профиля.
+
+    fast — int8 и жадный поиск (beam 1), минимальная задержка;
+    balanced — int8 и beam 2 (прежнее поведение);
+    quality — float32 и beam 4, лучший перевод ценой скорости;
+    auto — результат калибровки, а если её не было — balanced.
+    Потоки во всех профилях подбираются по числу ядер.
+    """
+    name = name or DEFAULT_PROFILE
+    if name == "auto":
+        return load_calibration() or OfflineEngineSettings()
+    if name == "fast":
+        return OfflineEngineSettings(beam_size=1, max_batch_size=64, compute_type="int8")
+    if name == "balanced":
+        return OfflineEngineSettings()
+    if name == "quality":
+        return OfflineEngineSettings(beam_size=4, compute_type="float32")
+    raise ValueError(f"Неизвестный профиль offline-перевода: {name}")
@@ -0,0 +1,184 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from .translator_engine import TranslatorEngine
+
+# Адрес мобильной версии Google Translate (его же использует deep_translator)
+GOOGLE_TRANSLATE_URL: str = "https://translate.google.com/m"
+# Лимит символов в одном запросе к Google
+MAX_CHUNK_CHARS: int = 5000
+# Коды ответа, при которых запрос имеет смысл повторить
+RETRY_STATUSES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+# Больше кусков одного перевода параллельно не отправляется
+MAX_CONCURRENCY: int = 8
+# Соединений с одним сервером в общей сессии: одновременно переводят
+# до четырёх движков (гонка гибридного режима, потоки HTTP-сервиса),
+# каждый — до MAX_CONCURRENCY кусков
+HTTP_POOL_SIZE: int = 4 * MAX_CONCURRENCY
+
+_session: requests.Session | None = None
+_session_lock: threading.Lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """
+    Общая на процесс HTTP-сессия с keep-alive: соединение с сервером
+    переиспользуется между запросами и между переводами. Пул соединений
+    рассчитан сразу на HTTP_POOL_SIZE одновременных запросов.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE)
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+
+def split_long_segment(segment: str, max_chars: int) -> list[str]:
+    """
+    Разбиение слишком длинного предложения по пробелам на куски не длиннее max_chars.
+    """
+    pieces: list[str] = []
+    while len(segment) > max_chars:
+        cut: int = segment.rfind(" ", 0, max_chars)
+        if cut <= 0:
+            cut = max_chars
+        pieces.append(segment[:cut])
+        segment = segment[cut:].lstrip(" ")
+    pieces.append(segment)
+    return pieces
+
+
+def make_chunks(segments: list[str], max_chars: int) -> list[list[str]]:
+    """
+    Группировка предложений в куски, которые укладываются в лимит запроса
+    (предложения в куске разделяются переводом строки).
+    """
+    chunks: list[list[str]] = []
+    current: list[str] = []
+    size: int = 0
+    for segment in segments:
+        extra: int = len(segment) + (1 if current else 0)
+        if current and size + extra > max_chars:
+            chunks.append(current)
+            current, size = [], 0
+            extra = len(segment)
+        current.append(segment)
+        size += extra
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class OnlineEngine(TranslatorEngine):
+    """
+    Online-движок поверх Google Translate.
+
+    Предложения группируются в куски не длиннее лимита запроса, куски
+    отправляются параллельно (не больше concurrency, но и не больше
+    MAX_CONCURRENCY одновременно) через
+    общую keep-alive сессию, с повтором и экспоненциальной задержкой при
+    временных ошибках. Результат собирается в исходном порядке.
+    """
+
+    stage: str = "http"
+
+    def __init__(
+        self,
+        src_lang: str,
+        target_lang: str,
+        base_url: str = GOOGLE_TRANSLATE_URL,
+        max_chunk_chars: int = MAX_CHUNK_CHARS,
+        concurrency: int = 4,
+        retries: int = 3,
+        backoff: float = 0.5,
+        timeout: tuple[float, float] = (5, 10),
+        session: requests.Session | None = None,
+    ):
+        self.src: str = src_lang
+        self.target: str = target_lang
+        self.base_url: str = base_url
+        self.max_chunk_chars: int = max_chunk_chars
+        self.concurrency: int = min(MAX_CONCURRENCY, max(1, concurrency))
+        self.retries: int = retries
+        self.backoff: float = backoff
+        self.timeout: tuple[float, float] = timeout
+        self.session: requests.Session = (
+            session if session is not None else get_http_session()
+        )
+
+    def _request(self, text: str) -> str:
+        """
+        Один запрос к серверу перевода с повторами.
+        """
+        params: dict[str, str] = {"sl": self.src, "tl": self.target, "q": text}
+        attempt: int = 0
+        while True:
+            try:
+                response = self.session.get(
+                    self.base_url, params=params, timeout=self.timeout
+                )
+                if response.status_code not in RETRY_STATUSES:
+                    response.raise_for_status()
+                    return self._parse(response.text)
+                error: Exception = requests.HTTPError(
+                    f"Сервер перевода ответил {response.status_code}"
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+
+            if attempt >= self.retries:
+                raise error
+            time.sleep(self.backoff * (2**attempt))
+            attempt += 1
+
+    @staticmethod
+    def _parse(html: str) -> str:
+        soup = BeautifulSoup(html, "html.parser")
+        element = soup.find("div", {"class": "result-container"}) or soup.find(
+            "div", {"class": "t0"}
+        )
+        if element is None:
+            raise ValueError("Не удалось разобрать ответ сервера перевода.")
+        return element.get_text()
+
+    def _translate_segment(self, segment: str) -> str:
+        if len(segment) <= self.max_chunk_chars:
+            return self._request(segment)
+        return " ".join(
+            self._request(piece)
+            for piece in split_long_segment(segment, self.max_chunk_chars)
+        )
+
+    def _translate_chunk(self, chunk: list[str]) -> list[str]:
+        if len(chunk) == 1:
+            return [self._translate_segment(chunk[0])]
+
+        # Отправляем предложения куска одним запросом, по одному на строку
+        lines: list[str] = self._request("\n".join(chunk)).split("\n")
+        if len(lines) == len(chunk):
+            return lines
+
+        # Google склеил или разбил строки — переводим по одному предложению
+        return [self._translate_segment(segment) for segment in chunk]
+
+    def translate_batch(self, segments: list[str]) -> list[str]:
+        if not segments:
+            return []
+
+        chunks: list[list[str]] = make_chunks(segments, self.max_chunk_chars)
+        if len(chunks) == 1:
+            return self._translate_chunk(chunks[0])
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.concurrency, len(chunks))
+        ) as executor:
+            results = executor.map(self._translate_chunk, chunks)
+            return [line for lines in results for line in lines]
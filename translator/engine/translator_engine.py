@@ -0,0 +1,86 @@
+from abc import ABC, abstractmethod
+
+from ..glossary import Glossary, ProtectedBatch
+from ..segmenter import Segment, join_segments, split_segments
+from ..stage_timing import StageTimer
+
+
+class TranslatorEngine(ABC):
+    """
+    Движок перевода для одной пары языков без привязки к Qt.
+    Используется рабочими потоками GUI и пакетным режимом.
+    """
+
+    @abstractmethod
+    def translate_batch(self, segments: list[str]) -> list[str]:
+        """
+        Перевод списка предложений. Порядок результата совпадает с входным.
+        """
+        pass
+
+    # Стадия перевода в замерах (у online-движка — запрос к Google)
+    stage: str = "inference"
+    # Исходный язык: от него зависят правила разбиения на предложения
+    src: str | None = None
+
+    def translate_texts(
+        self,
+        texts: list[str],
+        timer: StageTimer | None = None,
+        glossary: Glossary | None = None,
+    ) -> list[str]:
+        """
+        Перевод нескольких текстов одним пакетом: все непустые предложения
+        всех текстов переводятся за один вызов translate_batch,
+        после чего каждый текст собирается с исходными разделителями.
+        timer — куда записать время стадий (разбиение, перевод, сборка).
+        glossary — термины, защищаемые от перевода метками.
+        """
+        if timer is None:
+            timer = StageTimer()
+
+        with timer.span("split", chars=sum(len(text) for text in texts)) as span:
+            split: list[list[Segment]] = [split_segments(text, self.src) for text in texts]
+            bodies: list[str] = list(
+                dict.fromkeys(
+                    body for segments in split for body, _ in segments if body.strip()
+                )
+            )
+            span.segments = len(bodies)
+
+        batch: ProtectedBatch | None = None
+        sources: list[str] = bodies
+        if glossary is not None:
+            with timer.span("glossary", chars=sum(len(body) for body in bodies)) as span:
+                batch = glossary.protect_batch(bodies)
+                sources = batch.texts
+                span.segments = sum(len(values) for values in batch.replacements)
+
+        with timer.span(
+            self.stage,
+            chars=sum(len(source) for source in sources),
+            segments=len(sources),
+        ):
+            results: list[str] = self.translate_batch(sources)
+
+        if batch is not None:
+            with timer.span("glossary"):
+                results = batch.restore(results)
+        translated: dict[str, str] = dict(zip(bodies, results))
+
+        with timer.span("join"):
+            return [
+                join_segments(
+                    [
+                        (translated.get(body, body), separator)
+                        for body, separator in segments
+                    ]
+                )
+                for segments in split
+            ]
+
+    def translate(self, text: str) -> str:
+        """
+        Перевод произвольного текста с сохранением разметки пробелов.
+        """
+        return self.translate_texts([text])[0]
@@ -0,0 +1,393 @@
+"""
+Нечёткая память переводов.
+
+Хранит все переведённые предложения (в SQLite в DATA_DIR) и перед
+отправкой нового предложения в модель ищет среди них очень похожие:
+шаблонные письма и уведомления, в которых отличаются только имена,
+номера и суммы. Найденный перевод используется как есть (совпадение
+с точностью до пробелов) или исправляется: отличающиеся слова заменяются
+в переводе, если они были перенесены в него без изменений (числа, имена,
+коды). Если исправить перевод так нельзя, предложение уходит в модель.
+
+Поиск — MinHash по символьным триграммам с LSH-бакетами: на каждое
+предложение несколько запросов по индексу, поэтому он быстрый и на
+миллионах записей. Кандидаты проверяются точным сравнением строк.
+"""
+
+import difflib
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import unicodedata
+import zlib
+from collections import Counter
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from .paths import DATA_DIR, ensure_data_dir
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Имя файла базы внутри DATA_DIR
+FUZZY_DB_NAME: str = "fuzzy_memory.sqlite3"
+# Минимальное сходство (0..1) с сохранённым предложением; 0 — память
+# выключена (по умолчанию: поиск заметно замедляет первый перевод)
+FUZZY_THRESHOLD: float = float(os.environ.get("TRANSLATOR_FUZZY_THRESHOLD", "0"))
+
+# Параметры MinHash: NUM_BANDS бакетов по ROWS_PER_BAND значений подписи
+NUM_BANDS: int = 8
+ROWS_PER_BAND: int = 4
+# Сколько последних записей брать из одного бакета (частые шаблоны
+# дают огромные бакеты, а нужны только свежие совпадения)
+MAX_BUCKET_ROWS: int = 64
+# Сколько кандидатов с наибольшим числом общих бакетов проверять точно
+MAX_CANDIDATES: int = 16
+
+_MASK_64: int = (1 << 64) - 1
+_WHITESPACE_RE: re.Pattern[str] = re.compile(r"\s+")
+_DIGIT_RE: re.Pattern[str] = re.compile(r"\d")
+_TOKEN_RE: re.Pattern[str] = re.compile(r"\w+|[^\w\s]")
+_WORD_RE: re.Pattern[str] = re.compile(r"\w")
+
+
+@lru_cache(maxsize=None)
+def _permutations(count: int) -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    Коэффициенты хеш-функций MinHash h(x) = (a * x + b) mod 2^64 (старшие
+    32 бита). Детерминированные: индекс в базе не зависит от запуска.
+    Считаются при первом обращении: numpy не нужен, пока память выключена.
+    """
+    import numpy as np
+
+    a: list[int] = []
+    b: list[int] = []
+    for index in range(count):
+        digest: bytes = hashlib.sha256(f"minhash-{index}".encode()).digest()
+        a.append(int.from_bytes(digest[:8], "little") | 1)
+        b.append(int.from_bytes(digest[8:16], "little"))
+    return (
+        np.array(a, dtype=np.uint64)[:, np.newaxis],
+        np.array(b, dtype=np.uint64)[:, np.newaxis],
+    )
+
+
+def normalize_segment(text: str) -> str:
+    """
+    Нормализация для точного сравнения: форма Unicode и пробелы.
+    """
+    text = unicodedata.normalize("NFC", text)
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def _index_text(text: str) -> str:
+    # Для индекса цифры неважны: "заказ 123" и "заказ 456" — один шаблон
+    return _DIGIT_RE.sub("0", normalize_segment(text).casefold())
+
+
+def _signed(value: int) -> int:
+    # SQLite хранит знаковые 64-битные целые
+    value &= _MASK_64
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def band_keys(src_lang: str, target_lang: str, text: str) -> list[int]:
+    """
+    Ключи LSH-бакетов предложения (MinHash по символьным триграммам).
+    """
+    import numpy as np
+
+    index_text: str = f"  {_index_text(text)} "
+    perm_a, perm_b = _permutations(NUM_BANDS * ROWS_PER_BAND)
+    shingles: np.ndarray = np.fromiter(
+        {
+            zlib.crc32(index_text[i : i + 3].encode("utf-8"))
+            for i in range(len(index_text) - 2)
+        },
+        dtype=np.uint64,
+    )
+    # Все хеш-функции сразу: матрица (функции x триграммы), переполнение
+    # uint64 и есть взятие по модулю 2^64
+    signature: np.ndarray = ((perm_a * shingles + perm_b) >> np.uint64(32)).min(axis=1)
+    prefix: bytes = f"{src_lang}|{target_lang}|".encode()
+    keys: list[int] = []
+    for band, rows in enumerate(signature.reshape(NUM_BANDS, ROWS_PER_BAND)):
+        digest: bytes = hashlib.blake2b(
+            prefix + bytes([band]) + rows.tobytes(), digest_size=8
+        ).digest()
+        keys.append(_signed(int.from_bytes(digest, "little")))
+    return keys
+
+
+def exact_key(src_lang: str, target_lang: str, text: str) -> int:
+    digest: bytes = hashlib.blake2b(
+        f"{src_lang}|{target_lang}|{normalize_segment(text)}".encode("utf-8"),
+        digest_size=8,
+    ).digest()
+    return _signed(int.from_bytes(digest, "little"))
+
+
+def _words(text: str) -> list[str]:
+    return _TOKEN_RE.findall(_index_text(text))
+
+
+def similarity(first: str, second: str) -> float:
+    """
+    Сходство предложений от 0 до 1 по словам (цифры не различаются).
+    """
+    return difflib.SequenceMatcher(
+        None, _words(first), _words(second), autojunk=False
+    ).ratio()
+
+
+def patch_translation(source: str, translation: str, new_source: str) -> str | None:
+    """
+    Перевод new_source, полученный из перевода похожего предложения source.
+
+    Отличающиеся слова заменяются в переводе, только если каждое старое
+    слово встречается в нём ровно один раз без изменений (числа, имена,
+    коды обычно переносятся в перевод как есть). Иначе — None.
+    """
+    old_tokens: list[str] = _TOKEN_RE.findall(source)
+    new_tokens: list[str] = _TOKEN_RE.findall(new_source)
+    matcher = difflib.SequenceMatcher(None, old_tokens, new_tokens, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        # Вставки и удаления слов исправить нельзя: их нужно переводить
+        if tag != "replace" or i2 - i1 != j2 - j1:
+            return None
+        for old, new in zip(old_tokens[i1:i2], new_tokens[j1:j2]):
+            # Замена знака препинания меняет смысл (вопрос, восклицание)
+            if not _WORD_RE.match(old) or not _WORD_RE.match(new):
+                return None
+            pattern: re.Pattern[str] = re.compile(rf"(?<!\w){re.escape(old)}(?!\w)")
+            if len(pattern.findall(translation)) != 1:
+                return None
+            translation = pattern.sub(lambda _: new, translation)
+    return translation
+
+
+class FuzzyMemory:
+    """
+    Нечёткая память переводов предложений (общая для всех переводчиков).
+
+    Счётчики: lookups — сколько предложений проверено, exact — найдено
+    совпадений с точностью до пробелов, patched — переводов исправлено
+    заменой слов. exact + patched — сэкономленные вызовы модели.
+    """
+
+    def __init__(
+        self,
+        db_path: str = ":memory:",
+        threshold: float = FUZZY_THRESHOLD,
+        max_segments: int = 1_000_000,
+    ):
+        self.threshold: float = threshold
+        self.max_segments: int = max_segments
+        self.lookups: int = 0
+        self.exact: int = 0
+        self.patched: int = 0
+
+        self._lock: threading.Lock = threading.Lock()
+        self._adds_since_prune: int = 0
+        # Поиск идёт из рабочих потоков перевода
+        self._db: sqlite3.Connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS segments ("
+            " id INTEGER PRIMARY KEY,"
+            " exact_key INTEGER NOT NULL UNIQUE,"
+            " source TEXT NOT NULL,"
+            " translation TEXT NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS bands ("
+            " key INTEGER NOT NULL,"
+            " segment_id INTEGER NOT NULL,"
+            " PRIMARY KEY (key, segment_id)) WITHOUT ROWID"
+        )
+        # Для удаления старых предложений: иначе DELETE по segment_id
+        # просматривает всю таблицу бакетов
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS bands_segment ON bands (segment_id)"
+        )
+        self._db.commit()
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold > 0
+
+    def _best_match(
+        self,
+        src_lang: str,
+        target_lang: str,
+        segment: str,
+    ) -> tuple[str, str] | None:
+        """
+        Самое похожее сохранённое предложение (источник, перевод) не ниже порога.
+        """
+        hits: Counter[int] = Counter()
+        for key in band_keys(src_lang, target_lang, segment):
+            hits.update(
+                segment_id
+                for (segment_id,) in self._db.execute(
+                    "SELECT segment_id FROM bands WHERE key = ?"
+                    " ORDER BY segment_id DESC LIMIT ?",
+                    (key, MAX_BUCKET_ROWS),
+                )
+            )
+        if not hits:
+            return None
+        candidates: list[int] = [
+            segment_id for segment_id, _ in hits.most_common(MAX_CANDIDATES)
+        ]
+        rows = self._db.execute(
+            "SELECT source, translation FROM segments"
+            f" WHERE id IN ({', '.join('?' * len(candidates))})",
+            candidates,
+        ).fetchall()
+
+        # Разбор искомого предложения SequenceMatcher кэширует для второй
+        # последовательности, поэтому кандидаты подставляются первыми
+        matcher = difflib.SequenceMatcher(None, autojunk=False)
+        matcher.set_seq2(_words(segment))
+        best: tuple[str, str] | None = None
+        best_score: float = self.threshold
+        for source, translation in rows:
+            matcher.set_seq1(_words(source))
+            # Дешёвые верхние оценки отсекают большинство кандидатов
+            if matcher.real_quick_ratio() < best_score or matcher.quick_ratio() < best_score:
+                continue
+            score: float = matcher.ratio()
+            if score >= best_score:
+                best, best_score = (source, translation), score
+        return best
+
+    def lookup(
+        self,
+        src_lang: str,
+        target_lang: str,
+        segments: list[str],
+    ) -> dict[str, str]:
+        """
+        Переводы предложений, найденные в памяти (точно или с исправлением).
+        """
+        if not self.enabled or not segments:
+            return {}
+        found: dict[str, str] = {}
+        with self._lock:
+            self.lookups += len(segments)
+            for segment in segments:
+                row = self._db.execute(
+                    "SELECT translation FROM segments WHERE exact_key = ?",
+                    (exact_key(src_lang, target_lang, segment),),
+                ).fetchone()
+                if row is not None:
+                    found[segment] = row[0]
+                    self.exact += 1
+                    continue
+
+                match: tuple[str, str] | None = self._best_match(
+                    src_lang, target_lang, segment
+                )
+                if match is None:
+                    continue
+                patched: str | None = patch_translation(match[0], match[1], segment)
+                if patched is not None:
+                    found[segment] = patched
+                    self.patched += 1
+        return found
+
+    def add(self, src_lang: str, target_lang: str, translations: dict[str, str]) -> None:
+        """
+        Сохранение переводов предложений одной транзакцией.
+        """
+        if not self.enabled or not translations:
+            return
+        with self._lock:
+            for source, translation in translations.items():
+                key: int = exact_key(src_lang, target_lang, source)
+                row = self._db.execute(
+                    "SELECT id FROM segments WHERE exact_key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    # Бакеты зависят только от источника — обновляем перевод
+                    self._db.execute(
+                        "UPDATE segments SET translation = ? WHERE id = ?",
+                        (translation, row[0]),
+                    )
+                    continue
+                cursor = self._db.execute(
+                    "INSERT INTO segments (exact_key, source, translation)"
+                    " VALUES (?, ?, ?)",
+                    (key, source, translation),
+                )
+                self._db.executemany(
+                    "INSERT OR IGNORE INTO bands (key, segment_id) VALUES (?, ?)",
+                    [
+                        (band_key, cursor.lastrowid)
+                        for band_key in band_keys(src_lang, target_lang, source)
+                    ],
+                )
+            self._db.commit()
+
+            # Чистим базу не на каждую запись, а пачками
+            self._adds_since_prune += len(translations)
+            if self._adds_since_prune >= 1000:
+                self._adds_since_prune = 0
+                self._prune()
+
+    def _prune(self) -> None:
+        """
+        Удаление самых старых предложений сверх лимита (и их бакетов).
+        """
+        (count,) = self._db.execute("SELECT COUNT(*) FROM segments").fetchone()
+        excess: int = count - self.max_segments
+        if excess <= 0:
+            return
+        (last_id,) = self._db.execute(
+            "SELECT id FROM segments ORDER BY id LIMIT 1 OFFSET ?", (excess - 1,)
+        ).fetchone()
+        self._db.execute("DELETE FROM segments WHERE id <= ?", (last_id,))
+        self._db.execute("DELETE FROM bands WHERE segment_id <= ?", (last_id,))
+        self._db.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM segments")
+            self._db.execute("DELETE FROM bands")
+            self._db.commit()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            (count,) = self._db.execute("SELECT COUNT(*) FROM segments").fetchone()
+            return {
+                "segments": count,
+                "lookups": self.lookups,
+                "exact": self.exact,
+                "patched": self.patched,
+                "saved_model_calls": self.exact + self.patched,
+            }
+
+
+_memory: FuzzyMemory | None = None
+_memory_lock: threading.Lock = threading.Lock()
+
+
+def get_fuzzy_memory() -> FuzzyMemory:
+    """
+    Возвращает общую нечёткую память переводов (база в DATA_DIR).
+    Выключенная память базу на диске не создаёт.
+    """
+    global _memory
+    with _memory_lock:
+        if _memory is None:
+            if FUZZY_THRESHOLD > 0:
+                ensure_data_dir()
+                _memory = FuzzyMemory(os.path.join(DATA_DIR, FUZZY_DB_NAME))
+            else:
+                _memory = FuzzyMemory(threshold=0)
+        return _memory
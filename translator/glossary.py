@@ -0,0 +1,413 @@
+"""
+Глоссарий: термины, которые не переводятся или переводятся только так,
+как указано (названия продуктов, бренды).
+
+Файл глоссария — текст UTF-8, по термину в строке:
+    ACME Cloud              — не переводить
+    Smart Folder<TAB>Умная папка — всегда переводить так
+Пустые строки и строки с # в начале пропускаются. Термины ищутся
+с учётом регистра и только целыми словами.
+
+Перед переводом найденные термины заменяются метками GLS0, GLS1, ...
+(модель и Google переносят такие метки без изменений), после перевода
+метки заменяются на перевод термина. Поиск — автомат Ахо — Корасик:
+один проход по тексту, время не зависит от размера глоссария.
+Автомат строится один раз и сохраняется в папке данных
+(glossary-<хэш>.bin), следующие запуски только читают его с диска.
+
+Проверка без перевода:
+    python -m translator.glossary terms.tsv "Try ACME Cloud today"
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable
+from pathlib import Path
+
+from .paths import DATA_DIR, ensure_data_dir
+
+# Файл глоссария по умолчанию для всех переводчиков
+GLOSSARY_ENV: str = "TRANSLATOR_GLOSSARY"
+
+GLOSSARY_CACHE_PREFIX: str = "glossary-"
+# Меняется вместе с форматом файла автомата (старые файлы пересобираются)
+_FORMAT_VERSION: int = 1
+_MAGIC: bytes = b"GLOSSARY"
+
+PLACEHOLDER: str = "GLS{index}"
+# Метка в переводе: модель могла сменить регистр или вставить пробел
+_PLACEHOLDER_RE: re.Pattern[str] = re.compile(r"GLS ?(\d+)", re.IGNORECASE)
+
+# Массивы автомата (int32) в порядке записи в файл
+_ARRAYS: tuple[str, ...] = ("first", "chars", "fail", "out", "link")
+
+# Совпадение в тексте: (начало, конец, номер термина)
+Match = tuple[int, int, int]
+
+
+def read_terms(path: str | Path) -> dict[str, str]:
+    """
+    Термины файла глоссария: исходный текст -> перевод (сам термин,
+    если его нельзя переводить).
+    """
+    terms: dict[str, str] = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\r\n")
+            if not line.strip() or line.startswith("#"):
+                continue
+            source, _, target = line.partition("\t")
+            source = source.strip()
+            if source:
+                terms[source] = target.strip() or source
+    return terms
+
+
+class ProtectedBatch:
+    """
+    Пакет предложений с терминами, заменёнными на метки.
+    texts — что отправить в модель (предложения, состоящие только
+    из терминов, в модель не уходят), restore — сборка переводов.
+    """
+
+    def __init__(self, protected: list[str], replacements: list[list[str]]):
+        self.protected: list[str] = protected
+        self.replacements: list[list[str]] = replacements
+        # Номера предложений, которым нужна модель
+        self.indices: list[int] = [
+            index
+            for index, (text, values) in enumerate(zip(protected, replacements))
+            if not values or any(ch.isalpha() for ch in _PLACEHOLDER_RE.sub("", text))
+        ]
+        self.texts: list[str] = [protected[index] for index in self.indices]
+
+    @staticmethod
+    def _restore(text: str, values: list[str]) -> str:
+        if not values:
+            return text
+
+        def replace(match: re.Match[str]) -> str:
+            index: int = int(match.group(1))
+            return values[index] if index < len(values) else match.group(0)
+
+        return _PLACEHOLDER_RE.sub(replace, text)
+
+    def restore(self, translations: list[str]) -> list[str]:
+        """
+        Переводы всех предложений пакета (translations — переводы texts).
+        """
+        results: list[str] = list(self.protected)
+        for index, translation in zip(self.indices, translations):
+            results[index] = translation
+        return [
+            self._restore(text, values)
+            for text, values in zip(results, self.replacements)
+        ]
+
+
+class Glossary:
+    """
+    Скомпилированный глоссарий: автомат Ахо — Корасик в плоских массивах.
+
+    Состояния пронумерованы в порядке обхода в ширину, дети каждого
+    состояния идут подряд и отсортированы по символу: переход — двоичный
+    поиск в chars[first[s]:first[s + 1]]. fail — суффиксная ссылка,
+    out — номер термина, оканчивающегося в состоянии (или -1), link —
+    ближайшее по суффиксным ссылкам состояние с термином (0 — нет).
+    """
+
+    def __init__(
+        self,
+        sources: list[str],
+        targets: list[str],
+        arrays: dict[str, array],
+        digest: str = "",
+    ):
+        self.sources: list[str] = sources
+        self.targets: list[str] = targets
+        self.first: array = arrays["first"]
+        self.chars: array = arrays["chars"]
+        self.fail: array = arrays["fail"]
+        self.out: array = arrays["out"]
+        self.link: array = arrays["link"]
+        # Хэш содержимого глоссария: переводы с разными глоссариями
+        # не смешиваются в кэше и памяти предложений
+        self.digest: str = digest
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+    # ------------------------------------------------------------------
+    # Построение
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, terms: dict[str, str], digest: str = "") -> "Glossary":
+        """
+        Автомат по словарю терминов (исходный текст -> перевод).
+        Время и память линейны по суммарной длине терминов.
+        """
+        sources: list[str] = sorted(source for source in terms if source)
+        first: array = array("i")
+        chars: array = array("i", [0])
+        parent: array = array("i", [0])
+        out: array = array("i", [-1])
+
+        # Бор строится по уровням: у отсортированных терминов с общим
+        # префиксом длины depth дети каждого узла — подряд идущие группы
+        level: list[tuple[int, int, int]] = [(0, 0, len(sources))]
+        depth: int = 0
+        while level:
+            next_level: list[tuple[int, int, int]] = []
+            for node, lo, hi in level:
+                first.append(len(chars))
+                if lo < hi and len(sources[lo]) == depth:
+                    out[node] = lo
+                    lo += 1
+                while lo < hi:
+                    char: str = sources[lo][depth]
+                    end: int = lo + 1
+                    while end < hi and sources[end][depth] == char:
+                        end += 1
+                    next_level.append((len(chars), lo, end))
+                    chars.append(ord(char))
+                    parent.append(node)
+                    out.append(-1)
+                    lo = end
+            level = next_level
+            depth += 1
+        first.append(len(chars))
+
+        count: int = len(chars)
+        fail: array = array("i", bytes(4 * count))
+        link: array = array("i", bytes(4 * count))
+        glossary = cls(
+            sources,
+            [terms[source] for source in sources],
+            {"first": first, "chars": chars, "fail": fail, "out": out, "link": link},
+            digest,
+        )
+        # Номера состояний уже идут в порядке обхода в ширину
+        for state in range(1, count):
+            up: int = parent[state]
+            target: int = 0
+            if up:
+                code: int = chars[state]
+                suffix: int = fail[up]
+                while True:
+                    child: int = glossary._child(suffix, code)
+                    if child:
+                        target = child
+                        break
+                    if not suffix:
+                        break
+                    suffix = fail[suffix]
+            fail[state] = target
+            link[state] = target if out[target] >= 0 else link[target]
+        return glossary
+
+    def _child(self, state: int, code: int) -> int:
+        lo: int = self.first[state]
+        hi: int = self.first[state + 1]
+        index: int = bisect_left(self.chars, code, lo, hi)
+        if index < hi and self.chars[index] == code:
+            return index
+        return 0
+
+    # ------------------------------------------------------------------
+    # Файл автомата
+    # ------------------------------------------------------------------
+
+    def save(self, path: str | Path) -> None:
+        header: dict[str, int] = {
+            "version": _FORMAT_VERSION,
+            "terms": len(self.sources),
+            "states": len(self.chars),
+        }
+        words: bytes = "\0".join(self.sources + self.targets).encode("utf-8")
+        tmp_path: str = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_MAGIC + json.dumps(header).encode("ascii") + b"\n")
+            for name in _ARRAYS:
+                getattr(self, name).tofile(f)
+            f.write(words)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str | Path, digest: str = "") -> "Glossary":
+        with open(path, "rb") as f:
+            line: bytes = f.readline()
+            if not line.startswith(_MAGIC):
+                raise ValueError(f"{path}: это не файл глоссария.")
+            header: dict[str, int] = json.loads(line[len(_MAGIC) :])
+            if header["version"] != _FORMAT_VERSION:
+                raise ValueError(f"{path}: устаревший формат глоссария.")
+            states: int = header["states"]
+            arrays: dict[str, array] = {}
+            for name in _ARRAYS:
+                arrays[name] = array("i")
+                arrays[name].fromfile(f, states + 1 if name == "first" else states)
+            words: list[str] = f.read().decode("utf-8").split("\0") if header["terms"] else []
+        terms: int = header["terms"]
+        return cls(words[:terms], words[terms:], arrays, digest)
+
+    # ------------------------------------------------------------------
+    # Поиск и замена
+    # ------------------------------------------------------------------
+
+    def find(self, text: str) -> list[Match]:
+        """
+        Вхождения терминов целыми словами, без пересечений: из
+        перекрывающихся берётся самое левое, из равных по началу — самое
+        длинное ("ACME Cloud Pro" раньше "ACME Cloud").
+        """
+        first, chars, fail, out, link = self.first, self.chars, self.fail, self.out, self.link
+        sources: list[str] = self.sources
+        found: list[Match] = []
+        state: int = 0
+        for pos, char in enumerate(text):
+            code: int = ord(char)
+            while True:
+                lo: int = first[state]
+                hi: int = first[state + 1]
+                index: int = bisect_left(chars, code, lo, hi)
+                if index < hi and chars[index] == code:
+                    state = index
+                    break
+                if not state:
+                    break
+                state = fail[state]
+
+            match: int = state if out[state] >= 0 else link[state]
+            while match:
+                term: int = out[match]
+                end: int = pos + 1
+                start: int = end - len(sources[term])
+                # Только целые слова: "Apple" не ищется внутри "Pineapple"
+                if (
+                    start == 0
+                    or not text[start - 1].isalnum()
+                    or not text[start].isalnum()
+                ) and (end == len(text) or not text[end].isalnum() or not char.isalnum()):
+                    found.append((start, end, term))
+                match = link[match]
+
+        found.sort(key=lambda item: (item[0], -item[1]))
+        chosen: list[Match] = []
+        pos = 0
+        for start, end, term in found:
+            if start >= pos:
+                chosen.append((start, end, term))
+                pos = end
+        return chosen
+
+    def protect(self, text: str) -> tuple[str, list[str]]:
+        """
+        Текст с терминами, заменёнными на метки, и переводы терминов
+        по номерам меток.
+        """
+        # Текст уже содержит что-то похожее на метку — не трогаем его,
+        # иначе при восстановлении её было бы не отличить от нашей
+        if not self.sources or _PLACEHOLDER_RE.search(text):
+            return text, []
+        matches: list[Match] = self.find(text)
+        if not matches:
+            return text, []
+        parts: list[str] = []
+        values: list[str] = []
+        pos: int = 0
+        for start, end, term in matches:
+            parts.append(text[pos:start])
+            parts.append(PLACEHOLDER.format(index=len(values)))
+            values.append(self.targets[term])
+            pos = end
+        parts.append(text[pos:])
+        return "".join(parts), values
+
+    def protect_batch(self, segments: list[str]) -> ProtectedBatch:
+        protected: list[tuple[str, list[str]]] = [self.protect(text) for text in segments]
+        return ProtectedBatch(
+            [text for text, _ in protected],
+            [values for _, values in protected],
+        )
+
+    def translate_batch(
+        self,
+        segments: list[str],
+        translate: Callable[[list[str]], list[str]],
+    ) -> list[str]:
+        """
+        Перевод предложений функцией translate с защитой терминов.
+        """
+        batch: ProtectedBatch = self.protect_batch(segments)
+        return batch.restore(translate(batch.texts) if batch.texts else [])
+
+
+_glossaries: dict[tuple[str, int, int], Glossary] = {}
+_glossaries_lock: threading.Lock = threading.Lock()
+
+
+def load_glossary(path: str | Path, cache_dir: str | None = None) -> Glossary:
+    """
+    Глоссарий из файла терминов. Автомат берётся из кэша процесса, затем
+    из папки данных (по хэшу содержимого файла), и только если его там
+    нет — строится и сохраняется.
+    """
+    stat: os.stat_result = os.stat(path)
+    key: tuple[str, int, int] = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    with _glossaries_lock:
+        glossary: Glossary | None = _glossaries.get(key)
+        if glossary is not None:
+            return glossary
+
+        with open(path, "rb") as f:
+            digest: str = hashlib.sha256(f.read()).hexdigest()
+        cache_path: Path = Path(cache_dir or ensure_data_dir()) / (
+            f"{GLOSSARY_CACHE_PREFIX}{digest[:32]}.bin"
+        )
+        try:
+            glossary = Glossary.load(cache_path, digest)
+        except (OSError, ValueError):
+            glossary = Glossary.build(read_terms(path), digest)
+            try:
+                glossary.save(cache_path)
+            except OSError:
+                # Нет прав на запись: автомат просто соберётся заново в следующий раз
+                pass
+        _glossaries[key] = glossary
+        return glossary
+
+
+def default_glossary() -> Glossary | None:
+    """
+    Глоссарий из TRANSLATOR_GLOSSARY (или None, если он не задан).
+    """
+    path: str | None = os.environ.get(GLOSSARY_ENV)
+    return load_glossary(path) if path else None
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Проверка глоссария")
+    parser.add_argument("glossary", help="файл терминов")
+    parser.add_argument("text", nargs="?", help="текст (по умолчанию — stdin)")
+    parser.add_argument("--data-dir", default=DATA_DIR, help="где хранить автомат")
+    args = parser.parse_args(argv)
+
+    glossary: Glossary = load_glossary(args.glossary, args.data_dir)
+    text: str = args.text if args.text is not None else sys.stdin.read()
+    protected, values = glossary.protect(text)
+    print(protected)
+    for index, value in enumerate(values):
+        print(f"{PLACEHOLDER.format(index=index)}\t{value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
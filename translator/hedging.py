@@ -0,0 +1,274 @@
+"""
+Гонка бэкендов перевода с подстраховкой (hedged requests).
+
+Запрос уходит в один бэкенд; если он не ответил за порог задержки
+(по умолчанию p90 его последних ответов), тот же запрос отправляется
+во второй. Берётся ответ, пришедший первым, проигравший отменяется.
+Задержки каждого бэкенда копятся в гистограммах, поэтому порог и выбор
+первого бэкенда подстраиваются под текущую сеть и нагрузку.
+"""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TypeVar
+
+from .worker.cancellation import CancellationToken, TranslationCancelled
+
+T = TypeVar("T")
+
+# Попытка получает свой флаг отмены и должна проверять его между частями работы
+Attempt = Callable[[CancellationToken], T]
+
+# Границы корзин гистограммы задержек (секунды), как у Prometheus
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+# Как часто ожидающий поток проверяет отмену всего перевода (секунды)
+_POLL_SECONDS: float = 0.05
+
+
+class LatencyHistogram:
+    """
+    Задержки одного бэкенда: корзины за всё время (для метрик) и окно
+    последних замеров (для перцентилей).
+    """
+
+    def __init__(self, window: int = 200):
+        self.buckets: list[int] = [0] * len(LATENCY_BUCKETS)
+        self.count: int = 0
+        self.sum: float = 0.0
+        self.recent: deque[float] = deque(maxlen=window)
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.sum += seconds
+        self.recent.append(seconds)
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.buckets[index] += 1
+
+    def quantile(self, fraction: float) -> float | None:
+        """
+        Перцентиль последних замеров (по ближайшему рангу) или None.
+        """
+        if not self.recent:
+            return None
+        ordered: list[float] = sorted(self.recent)
+        index: int = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+        return ordered[index]
+
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock: threading.Lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Общие потоки для попыток гонки (ожидающий поток перевода в них не входит).
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="hedge")
+        return _executor
+
+
+class Hedger:
+    """
+    Запуск одного запроса в нескольких бэкендах с подстраховкой.
+
+    Первым запрос получает бэкенд с меньшей медианой задержки (раз в
+    explore_every запросов — другой, чтобы его статистика не устаревала).
+    Подстраховка стартует, когда первый бэкенд работает дольше своего
+    перцентиля quantile (но не меньше min_delay и не больше max_delay;
+    пока замеров меньше min_samples — через default_delay) или упал
+    с ошибкой. В гистограммы попадают завершённые ответы, а у первого
+    бэкенда, проигравшего подстраховке, — время с начала гонки как нижняя
+    оценка: бэкенд, который часто проигрывает, перестаёт быть первым.
+    Проигравшая подстраховка не записывается — её время с собственного
+    запуска меньше настоящей задержки и тянуло бы порядок к медленному.
+    """
+
+    def __init__(
+        self,
+        quantile: float = 0.9,
+        default_delay: float = 0.5,
+        min_delay: float = 0.02,
+        max_delay: float = 10.0,
+        min_samples: int = 5,
+        explore_every: int = 20,
+    ):
+        self.quantile: float = quantile
+        self.default_delay: float = default_delay
+        self.min_delay: float = min_delay
+        self.max_delay: float = max_delay
+        self.min_samples: int = min_samples
+        self.explore_every: int = explore_every
+
+        self.histograms: dict[str, LatencyHistogram] = {}
+        self.requests: int = 0
+        self.hedged: int = 0
+        self.wins: dict[str, int] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def _histogram(self, name: str) -> LatencyHistogram:
+        return self.histograms.setdefault(name, LatencyHistogram())
+
+    def hedge_delay(self, name: str) -> float:
+        """
+        Сколько ждать ответа бэкенда name, прежде чем запустить подстраховку.
+        """
+        with self._lock:
+            histogram: LatencyHistogram = self._histogram(name)
+            if len(histogram.recent) < self.min_samples:
+                return self.default_delay
+            delay: float = histogram.quantile(self.quantile) or self.default_delay
+        return min(self.max_delay, max(self.min_delay, delay))
+
+    def _order(self, names: list[str]) -> list[str]:
+        """
+        Порядок запуска бэкендов: первым — самый быстрый по медиане.
+        """
+        with self._lock:
+            self.requests += 1
+            medians: dict[str, float] = {}
+            for name in names:
+                histogram: LatencyHistogram = self._histogram(name)
+                if len(histogram.recent) >= self.min_samples:
+                    medians[name] = histogram.quantile(0.5) or 0.0
+            explore: bool = self.explore_every > 0 and self.requests % self.explore_every == 0
+        # Бэкенды без статистики идут первыми (в заданном порядке), чтобы её набрать
+        order: list[str] = sorted(names, key=lambda name: medians.get(name, 0.0))
+        if explore and len(order) > 1:
+            order = order[1:] + order[:1]
+        return order
+
+    def _observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self._histogram(name).observe(seconds)
+
+    def run(
+        self,
+        attempts: dict[str, Attempt[T]],
+        cancel: CancellationToken | None = None,
+    ) -> tuple[str, T]:
+        """
+        Гонка попыток (имя бэкенда -> функция). Возвращает имя победителя
+        и его результат. Если все бэкенды упали, поднимается первая ошибка.
+        cancel — отмена всего перевода: попытки отменяются, поднимается
+        TranslationCancelled.
+        """
+        order: list[str] = self._order(list(attempts))
+        tokens: dict[str, CancellationToken] = {name: CancellationToken() for name in order}
+        running: dict[Future, str] = {}
+        started: dict[str, float] = {}
+        errors: list[Exception] = []
+        winner: str | None = None
+
+        def launch(name: str) -> None:
+            started[name] = time.perf_counter()
+            running[_get_executor().submit(attempts[name], tokens[name])] = name
+
+        launch(order[0])
+        hedge_at: float = time.perf_counter() + self.hedge_delay(order[0])
+        try:
+            while True:
+                if cancel is not None:
+                    cancel.raise_if_cancelled()
+                waiting: list[str] = [name for name in order if name not in started]
+                if waiting and (not running or time.perf_counter() >= hedge_at):
+                    # Подстраховка: следующий бэкенд получает тот же запрос
+                    with self._lock:
+                        self.hedged += 1
+                    launch(waiting[0])
+                    hedge_at = time.perf_counter() + self.hedge_delay(waiting[0])
+                    continue
+                if not running:
+                    raise errors[0] if errors else TranslationCancelled()
+
+                timeout: float = _POLL_SECONDS
+                if waiting:
+                    timeout = min(timeout, max(0.0, hedge_at - time.perf_counter()))
+                done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name: str = running.pop(future)
+                    try:
+                        result: T = future.result()
+                    except TranslationCancelled:
+                        continue
+                    except Exception as e:
+                        # Упавший бэкенд не ждём: подстраховка стартует сразу
+                        errors.append(e)
+                        hedge_at = time.perf_counter()
+                        continue
+                    winner = name
+                    self._observe(name, time.perf_counter() - started[name])
+                    with self._lock:
+                        self.wins[name] = self.wins.get(name, 0) + 1
+                    return name, result
+        finally:
+            # Проигравшие и недождавшиеся попытки отменяются
+            for future, name in running.items():
+                tokens[name].cancel()
+                future.cancel()
+                if winner is not None and name == order[0]:
+                    self._observe(name, time.perf_counter() - started[name])
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedged": self.hedged,
+                "wins": dict(self.wins),
+                "p50": {
+                    name: histogram.quantile(0.5)
+                    for name, histogram in self.histograms.items()
+                },
+                "p90": {
+                    name: histogram.quantile(0.9)
+                    for name, histogram in self.histograms.items()
+                },
+            }
+
+    def to_prometheus(self) -> str:
+        lines: list[str] = []
+        with self._lock:
+            lines.append("# TYPE translator_hedge_requests_total counter")
+            lines.append(f"translator_hedge_requests_total {self.requests}")
+            lines.append("# TYPE translator_hedge_hedged_total counter")
+            lines.append(f"translator_hedge_hedged_total {self.hedged}")
+            lines.append("# TYPE translator_hedge_wins_total counter")
+            for name, wins in sorted(self.wins.items()):
+                lines.append(f'translator_hedge_wins_total{{backend="{name}"}} {wins}')
+
+            lines.append("# TYPE translator_hedge_latency_seconds histogram")
+            for name, histogram in sorted(self.histograms.items()):
+                for bound, count in zip(LATENCY_BUCKETS, histogram.buckets):
+                    lines.append(
+                        "translator_hedge_latency_seconds_bucket"
+                        f'{{backend="{name}",le="{bound}"}} {count}'
+                    )
+                labels: str = f'backend="{name}"'
+                lines.append(
+                    "translator_hedge_latency_seconds_bucket"
+                    f'{{{labels},le="+Inf"}} {histogram.count}'
+                )
+                lines.append(f"translator_hedge_latency_seconds_sum{{{labels}}} {histogram.sum}")
+                lines.append(
+                    f"translator_hedge_latency_seconds_count{{{labels}}} {histogram.count}"
+                )
+        return "\n".join(lines) + "\n"
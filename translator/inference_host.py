@@ -0,0 +1,388 @@
+"""
+Отдельный процесс offline-инференса.
+
+GUI не загружает argostranslate, ctranslate2 и модели в свой процесс,
+а отправляет предложения долгоживущему процессу-хосту через Unix-сокет
+(в Windows — именованный канал). Хост держит модели загруженными между
+запросами и между перезапусками окна, а если он упал — клиент запускает
+его заново. Хост сам завершается, если им долго не пользуются.
+
+Запуск вручную (обычно его запускает клиент):
+    python -m translator.inference_host --idle-timeout 1800
+"""
+
+import argparse
+import getpass
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from multiprocessing.connection import (
+    AuthenticationError,
+    BufferTooShort,
+    Client,
+    Connection,
+    Listener,
+)
+from typing import Any
+
+from .paths import BASE_DIR, DATA_DIR
+
+# Включает перевод через отдельный процесс (по умолчанию модели грузятся в GUI)
+INFERENCE_HOST_ENABLED: bool = os.environ.get("TRANSLATOR_INFERENCE_HOST", "0") == "1"
+# Через сколько секунд без запросов хост завершается
+DEFAULT_IDLE_TIMEOUT: float = 30 * 60
+
+Message = tuple[dict[str, Any], list[str]]
+
+
+class HostError(Exception):
+    pass
+
+
+def _host_name() -> str:
+    # Свой хост у каждого пользователя и у каждой папки с моделями
+    digest: str = hashlib.sha1(DATA_DIR.encode("utf-8")).hexdigest()[:8]
+    return f"translator-host-{getpass.getuser()}-{digest}"
+
+
+def host_address() -> tuple[str, str]:
+    """
+    Адрес хоста и семейство соединения для multiprocessing.connection.
+    """
+    if sys.platform == "win32":
+        return rf"\\.\pipe\{_host_name()}", "AF_PIPE"
+    return os.path.join(tempfile.gettempdir(), _host_name() + ".sock"), "AF_UNIX"
+
+
+def key_path() -> str:
+    """
+    Файл с ключом доступа к хосту (читать его может только владелец).
+    """
+    return os.path.join(tempfile.gettempdir(), _host_name() + ".key")
+
+
+class _Channel:
+    """
+    Обмен сообщениями поверх Connection.
+
+    Сообщение — два кадра: JSON-заголовок с длинами текстов и один кадр
+    со всеми текстами в UTF-8 подряд. Кадр текстов принимается в
+    переиспользуемый буфер и режется через memoryview, без промежуточных
+    копий, поэтому большие тексты не дублируются в памяти.
+    """
+
+    def __init__(self, conn: Connection):
+        self.conn: Connection = conn
+        self._buffer: bytearray = bytearray(64 * 1024)
+
+    def send(self, header: dict[str, Any], texts: list[str]) -> None:
+        payloads: list[bytes] = [text.encode("utf-8") for text in texts]
+        header = {**header, "lengths": [len(payload) for payload in payloads]}
+        self.conn.send_bytes(json.dumps(header).encode("utf-8"))
+        self.conn.send_bytes(b"".join(payloads))
+
+    def receive(self) -> Message:
+        header: dict[str, Any] = json.loads(self.conn.recv_bytes())
+        try:
+            size: int = self.conn.recv_bytes_into(self._buffer)
+            view: memoryview = memoryview(self._buffer)[:size]
+        except BufferTooShort as e:
+            # Кадр больше буфера: берём его целиком, а буфер увеличиваем
+            data: bytes = e.args[0]
+            view = memoryview(data)
+            self._buffer = bytearray(len(data))
+
+        texts: list[str] = []
+        pos: int = 0
+        for length in header.pop("lengths", []):
+            texts.append(str(view[pos : pos + length], "utf-8"))
+            pos += length
+        view.release()
+        return header, texts
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+class InferenceHost:
+    """
+    Сервер процесса-хоста: каждое соединение обслуживается своим потоком,
+    модели берутся из общего пула движков процесса.
+    """
+
+    def __init__(self, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        self.idle_timeout: float = idle_timeout
+        self.address, self.family = host_address()
+
+        self._lock: threading.Lock = threading.Lock()
+        self._connections: int = 0
+        self._last_activity: float = time.monotonic()
+
+    @staticmethod
+    def _write_key(authkey: bytes) -> None:
+        fd: int = os.open(key_path(), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(authkey)
+
+    def _remove_stale_socket(self) -> bool:
+        """
+        Удаляет сокет упавшего хоста. False — другой хост ещё работает.
+        """
+        if self.family != "AF_UNIX" or not os.path.exists(self.address):
+            return True
+        try:
+            with open(key_path(), "rb") as f:
+                Client(self.address, self.family, authkey=f.read()).close()
+            return False
+        except (OSError, EOFError, AuthenticationError):
+            os.unlink(self.address)
+            return True
+
+    def _watchdog(self) -> None:
+        while True:
+            time.sleep(min(60.0, self.idle_timeout))
+            with self._lock:
+                idle: float = time.monotonic() - self._last_activity
+                if self._connections == 0 and idle >= self.idle_timeout:
+                    break
+        if self.family == "AF_UNIX" and os.path.exists(self.address):
+            os.unlink(self.address)
+        os._exit(0)
+
+    def serve_forever(self) -> int:
+        if not self._remove_stale_socket():
+            return 0
+        authkey: bytes = os.urandom(32)
+        try:
+            listener = Listener(self.address, self.family, authkey=authkey)
+        except OSError:
+            # Адрес успел занять другой хост, запущенный одновременно с нами
+            return 0
+        # Ключ публикуется только после того, как адрес наш
+        self._write_key(authkey)
+        threading.Thread(target=self._watchdog, daemon=True).start()
+        while True:
+            try:
+                conn: Connection = listener.accept()
+            except (OSError, EOFError, AuthenticationError):
+                continue
+            threading.Thread(
+                target=self._serve_connection, args=(conn,), daemon=True
+            ).start()
+
+    def _serve_connection(self, conn: Connection) -> None:
+        channel = _Channel(conn)
+        with self._lock:
+            self._connections += 1
+        try:
+            while True:
+                try:
+                    header, texts = channel.receive()
+                except (EOFError, OSError):
+                    return
+                with self._lock:
+                    self._last_activity = time.monotonic()
+                try:
+                    reply: Message = self._handle(header, texts)
+                except Exception as e:
+                    reply = ({"ok": False, "error": str(e)}, [])
+                channel.send(*reply)
+        finally:
+            channel.close()
+            with self._lock:
+                self._connections -= 1
+                self._last_activity = time.monotonic()
+
+    def _handle(self, header: dict[str, Any], texts: list[str]) -> Message:
+        from .engine import get_engine_pool
+        from .package_registry import get_package_registry
+
+        op: str = header.get("op", "")
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid()}, []
+        if op == "warm_up":
+            from .translator_offline import TranslatorOffline
+
+            TranslatorOffline.import_backends()
+            return {"ok": True}, []
+        if op == "is_installed":
+            installed: bool = get_package_registry().is_installed(
+                header["src"], header["target"]
+            )
+            return {"ok": True, "installed": installed}, []
+        if op == "invalidate":
+            # Пакет переустановлен клиентом — перечитываем список и модель
+            get_package_registry().invalidate()
+            get_engine_pool().discard(header["src"], header["target"])
+            return {"ok": True}, []
+        if op == "translate":
+            with get_engine_pool().borrow(
+                header["src"], header["target"], header.get("profile")
+            ) as engine:
+                return {"ok": True}, engine.translate_batch(texts)
+        raise HostError(f"Неизвестная операция: {op}")
+
+
+class InferenceHostClient:
+    """
+    Клиент хоста инференса. Если хост не запущен или упал, клиент
+    запускает его и повторяет запрос один раз.
+    """
+
+    def __init__(self, start_timeout: float = 30.0):
+        self.start_timeout: float = start_timeout
+        self.address, self.family = host_address()
+
+        self._lock: threading.Lock = threading.Lock()
+        # Свободные соединения (по одному на параллельный запрос)
+        self._idle: list[_Channel] = []
+        self._process: subprocess.Popen | None = None
+
+    def _host_command(self) -> list[str]:
+        if getattr(sys, "frozen", False):
+            # В собранном EXE хост запускается через main.py
+            return [sys.executable, "--inference-host"]
+        return [sys.executable, "-m", "translator.inference_host"]
+
+    def _start_host(self) -> None:
+        with self._lock:
+            # Забираем код выхода прошлого хоста, чтобы не оставить зомби
+            if self._process is not None and self._process.poll() is None:
+                return
+            options: dict[str, Any] = {}
+            if sys.platform == "win32":
+                options["creationflags"] = (
+                    subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+                )
+            else:
+                # Хост переживает закрытие окна
+                options["start_new_session"] = True
+            self._process = subprocess.Popen(
+                self._host_command(),
+                cwd=BASE_DIR,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                **options,
+            )
+
+    def _try_connect(self) -> _Channel | None:
+        try:
+            with open(key_path(), "rb") as f:
+                authkey: bytes = f.read()
+            return _Channel(Client(self.address, self.family, authkey=authkey))
+        except (OSError, EOFError, AuthenticationError):
+            return None
+
+    def _connect(self) -> _Channel:
+        channel: _Channel | None = self._try_connect()
+        if channel is not None:
+            return channel
+
+        self._start_host()
+        deadline: float = time.monotonic() + self.start_timeout
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            channel = self._try_connect()
+            if channel is not None:
+                return channel
+        raise HostError("Не удалось запустить процесс перевода.")
+
+    def call(self, header: dict[str, Any], texts: list[str] | None = None) -> Message:
+        """
+        Запрос к хосту. Ошибка перевода в хосте пробрасывается как HostError.
+        """
+        for attempt in range(2):
+            with self._lock:
+                channel: _Channel | None = self._idle.pop() if self._idle else None
+            if channel is None:
+                channel = self._connect()
+            try:
+                channel.send(header, texts or [])
+                reply, result = channel.receive()
+            except (EOFError, OSError):
+                # Хост упал посреди запроса: остальные соединения с ним тоже
+                # мертвы, а следующая попытка запустит хост заново
+                with self._lock:
+                    stale: list[_Channel] = [channel, *self._idle]
+                    self._idle.clear()
+                for dead in stale:
+                    dead.close()
+                if attempt:
+                    raise HostError("Процесс перевода завершился аварийно.")
+                continue
+
+            with self._lock:
+                self._idle.append(channel)
+            if not reply.get("ok"):
+                raise HostError(reply.get("error", "Ошибка процесса перевода."))
+            return reply, result
+        raise HostError("Процесс перевода недоступен.")
+
+    def ping(self) -> int:
+        reply, _ = self.call({"op": "ping"})
+        return reply["pid"]
+
+    def warm_up(self) -> None:
+        self.call({"op": "warm_up"})
+
+    def is_installed(self, src_lang: str, target_lang: str) -> bool:
+        reply, _ = self.call({"op": "is_installed", "src": src_lang, "target": target_lang})
+        return reply["installed"]
+
+    def invalidate(self, src_lang: str, target_lang: str) -> None:
+        self.call({"op": "invalidate", "src": src_lang, "target": target_lang})
+
+    def translate_batch(
+        self,
+        src_lang: str,
+        target_lang: str,
+        segments: list[str],
+        profile: str | None = None,
+    ) -> list[str]:
+        header: dict[str, Any] = {
+            "op": "translate",
+            "src": src_lang,
+            "target": target_lang,
+            "profile": profile,
+        }
+        return self.call(header, segments)[1]
+
+
+_client: InferenceHostClient | None = None
+_client_lock: threading.Lock = threading.Lock()
+
+
+def get_host_client() -> InferenceHostClient:
+    """
+    Возвращает общий на процесс клиент хоста инференса.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = InferenceHostClient()
+        return _client
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m translator.inference_host",
+        description="Процесс offline-инференса для GUI.",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT,
+        help="завершиться после стольких секунд без запросов",
+    )
+    args = parser.parse_args(argv)
+    return InferenceHost(args.idle_timeout).serve_forever()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,351 @@
+"""
+Локальное определение языка текста (без сети).
+
+Сначала язык сужается по письменности: иероглифы, кана, хангыль, арабское
+письмо и т.п. однозначно дают язык, а кириллица и латиница — группу
+языков. Внутри группы выбирается язык с наибольшим правдоподобием по
+частотам буквенных триграмм (таблица профилей в langid_profiles.py).
+Результаты кэшируются по хэшу текста, поэтому повторяющиеся предложения
+не разбираются заново.
+
+Таблица профилей пересобирается из папки с текстами (по файлу <код>.txt
+на язык):
+    python -m translator.langid build corpus/
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+import threading
+from collections import Counter, OrderedDict
+from collections.abc import Iterable, Iterator
+
+from .langid_profiles import FLOORS, PROFILES
+
+# Письменности и их диапазоны символов (после casefold)
+_SCRIPT_PATTERNS: dict[str, re.Pattern[str]] = {
+    "Latn": re.compile(r"[a-z\u00c0-\u024f]"),
+    "Cyrl": re.compile(r"[\u0400-\u04ff]"),
+    "Grek": re.compile(r"[\u0370-\u03ff]"),
+    "Arab": re.compile(r"[\u0600-\u06ff]"),
+    "Hebr": re.compile(r"[\u0590-\u05ff]"),
+    "Deva": re.compile(r"[\u0900-\u097f]"),
+    "Thai": re.compile(r"[\u0e00-\u0e7f]"),
+    "Hang": re.compile(r"[\uac00-\ud7af\u1100-\u11ff\u3130-\u318f]"),
+    "Kana": re.compile(r"[\u3040-\u30ff]"),
+    "Hani": re.compile(r"[\u4e00-\u9fff\u3400-\u4dbf]"),
+}
+
+# Письменности, по которым язык определяется однозначно
+SCRIPT_LANGUAGES: dict[str, str] = {
+    "Grek": "el",
+    "Arab": "ar",
+    "Hebr": "he",
+    "Deva": "hi",
+    "Thai": "th",
+    "Hang": "ko",
+    "Kana": "ja",
+    "Hani": "zh",
+}
+
+# Письменности, внутри которых язык выбирается по триграммам
+SCRIPT_GROUPS: dict[str, tuple[str, ...]] = {
+    "Latn": ("en", "de", "fr", "es", "it", "pt"),
+    "Cyrl": ("ru", "uk"),
+}
+
+# Буквы, которые внутри группы встречаются только в одном языке:
+# каждая такая буква добавляет языку вес MARKER_WEIGHT
+MARKER_LETTERS: dict[str, str] = {
+    "uk": "іїєґ",
+    "ru": "ыэъё",
+    "de": "ß",
+    "es": "ñ",
+    "pt": "ãõ",
+}
+MARKER_WEIGHT: float = 2.0
+
+# Всё, что не буква, при подсчёте триграмм превращается в пробел
+_NON_LETTER_RE: re.Pattern[str] = re.compile(r"[\W\d_]+")
+
+# Сколько первых символов текста анализируется (для длинного текста
+# дальнейшие символы уже не меняют ответ, а только тратят время)
+MAX_CHARS: int = 1000
+
+# Минимальный перевес лучшего языка над вторым (на одну триграмму),
+# при меньшем — язык неизвестен
+MIN_MARGIN: float = 0.1
+
+# Триграмм на язык в собираемой таблице профилей
+PROFILE_SIZE: int = 600
+
+
+def iter_trigrams(text: str) -> Iterator[str]:
+    """
+    Буквенные триграммы слов с пробелами по краям (" пр", "при", "ри ").
+    """
+    for word in _NON_LETTER_RE.sub(" ", text.casefold()).split():
+        padded: str = f" {word} "
+        for start in range(len(padded) - 2):
+            yield padded[start : start + 3]
+
+
+def dominant_script(text: str) -> str | None:
+    """
+    Письменность с наибольшим числом букв в тексте (или None).
+    """
+    counts: dict[str, int] = {
+        script: len(pattern.findall(text)) for script, pattern in _SCRIPT_PATTERNS.items()
+    }
+    script: str = max(counts, key=counts.__getitem__)
+    if not counts[script]:
+        return None
+    # В японском тексте иероглифов обычно больше, чем каны
+    if script == "Hani" and counts["Kana"]:
+        return "Kana"
+    return script
+
+
+class LanguageIdentifier:
+    """
+    Определитель языка по профилям триграмм.
+
+    Профили компилируются один раз в таблицу "триграмма -> веса языков
+    группы", поэтому разбор текста — один поиск в словаре на триграмму.
+    """
+
+    def __init__(
+        self,
+        profiles: dict[str, dict[str, float]] | None = None,
+        floors: dict[str, float] | None = None,
+        cache_size: int = 65536,
+    ):
+        """
+        profiles — логарифмы частот триграмм по языкам, floors — вес
+        триграммы, которой нет в профиле языка (по умолчанию — встроенная
+        таблица). cache_size — сколько результатов держать в кэше.
+        """
+        profiles = PROFILES if profiles is None else profiles
+        floors = FLOORS if floors is None else floors
+        self.cache_size: int = cache_size
+        self._cache: OrderedDict[int, str | None] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+        # Письменность -> (языки группы, триграмма -> веса языков)
+        self._tables: dict[str, tuple[tuple[str, ...], dict[str, tuple[float, ...]]]] = {}
+        for script, group in SCRIPT_GROUPS.items():
+            languages: tuple[str, ...] = tuple(lang for lang in group if lang in profiles)
+            grams: set[str] = set()
+            for lang in languages:
+                grams.update(profiles[lang])
+            table: dict[str, tuple[float, ...]] = {
+                gram: tuple(profiles[lang].get(gram, floors[lang]) for lang in languages)
+                for gram in grams
+            }
+            self._tables[script] = (languages, table)
+
+        # Буква -> номер её языка в таблице своей письменности
+        self._markers: dict[str, dict[str, int]] = {
+            script: {
+                letter: index
+                for index, lang in enumerate(languages)
+                for letter in MARKER_LETTERS.get(lang, "")
+            }
+            for script, (languages, _) in self._tables.items()
+        }
+        self._marker_patterns: dict[str, re.Pattern[str]] = {
+            script: re.compile(f"[{''.join(markers)}]")
+            for script, markers in self._markers.items()
+            if markers
+        }
+
+    @property
+    def languages(self) -> list[str]:
+        """
+        Все языки, которые может вернуть detect.
+        """
+        result: list[str] = list(SCRIPT_LANGUAGES.values())
+        for languages, _ in self._tables.values():
+            result += languages
+        return result
+
+    def _classify(self, text: str) -> str | None:
+        text = text[:MAX_CHARS].casefold()
+        script: str | None = dominant_script(text)
+        if script is None:
+            return None
+        if script in SCRIPT_LANGUAGES:
+            return SCRIPT_LANGUAGES[script]
+        if script not in self._tables:
+            return None
+
+        languages, table = self._tables[script]
+        if len(languages) < 2:
+            return languages[0] if languages else None
+        scores: list[float] = [0.0] * len(languages)
+        matched: int = 0
+        for gram in iter_trigrams(text):
+            weights: tuple[float, ...] | None = table.get(gram)
+            if weights is None:
+                continue
+            matched += 1
+            for index, weight in enumerate(weights):
+                scores[index] += weight
+        if not matched:
+            return None
+        if script in self._marker_patterns:
+            markers: dict[str, int] = self._markers[script]
+            for letter in self._marker_patterns[script].findall(text):
+                scores[markers[letter]] += MARKER_WEIGHT
+
+        ranked: list[int] = sorted(range(len(languages)), key=scores.__getitem__)
+        best, second = ranked[-1], ranked[-2]
+        if (scores[best] - scores[second]) / matched < MIN_MARGIN:
+            return None
+        return languages[best]
+
+    def detect(self, text: str) -> str | None:
+        """
+        Код языка текста или None, если текст слишком короткий
+        или неоднозначный (например, "OK" или номер).
+        """
+        key: int = hash(text)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        lang: str | None = self._classify(text)
+        with self._lock:
+            self._cache[key] = lang
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return lang
+
+    def detect_segments(
+        self,
+        segments: Iterable[str],
+        default: str | None = None,
+    ) -> list[str | None]:
+        """
+        Языки предложений смешанного текста. Предложениям, язык которых
+        не определился, достаётся самый частый язык остальных (или default,
+        если не определился ни один).
+        """
+        languages: list[str | None] = [self.detect(segment) for segment in segments]
+        counts: Counter[str] = Counter(lang for lang in languages if lang is not None)
+        fallback: str | None = counts.most_common(1)[0][0] if counts else default
+        return [lang if lang is not None else fallback for lang in languages]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+_identifier: LanguageIdentifier | None = None
+_identifier_lock: threading.Lock = threading.Lock()
+
+
+def get_language_identifier() -> LanguageIdentifier:
+    """
+    Общий определитель языка (таблица компилируется при первом вызове).
+    """
+    global _identifier
+    with _identifier_lock:
+        if _identifier is None:
+            _identifier = LanguageIdentifier()
+        return _identifier
+
+
+def build_profiles(
+    corpus_dir: str,
+    size: int = PROFILE_SIZE,
+) -> tuple[dict[str, dict[str, float]], dict[str, float]]:
+    """
+    Профили языков из текстов corpus_dir/<код>.txt: логарифмы частот
+    size самых частых триграмм и вес для остальных триграмм.
+    """
+    profiles: dict[str, dict[str, float]] = {}
+    floors: dict[str, float] = {}
+    for filename in sorted(os.listdir(corpus_dir)):
+        lang, ext = os.path.splitext(filename)
+        if ext != ".txt":
+            continue
+        with open(os.path.join(corpus_dir, filename), encoding="utf-8") as f:
+            counts: Counter[str] = Counter(iter_trigrams(f.read()))
+        total: int = sum(counts.values())
+        if not total:
+            continue
+        common: list[tuple[str, int]] = counts.most_common(size)
+        profiles[lang] = {
+            gram: round(math.log(count / total), 2) for gram, count in common
+        }
+        # Непопавшая в профиль триграмма встречается реже самой редкой из профиля
+        floors[lang] = round(math.log(common[-1][1] / total / 2), 2)
+    return profiles, floors
+
+
+def write_profiles(
+    path: str,
+    profiles: dict[str, dict[str, float]],
+    floors: dict[str, float],
+) -> None:
+    """
+    Запись таблицы профилей модулем Python (он попадает в сборку вместе
+    с остальным кодом).
+    """
+    lines: list[str] = [
+        '"""',
+        "Профили языков для translator/langid.py: логарифмы частот буквенных",
+        "триграмм. Файл создан командой python -m translator.langid build.",
+        '"""',
+        "",
+        "# Вес триграммы, которой нет в профиле языка",
+        "FLOORS: dict[str, float] = {",
+    ]
+    lines += [f"    {json.dumps(lang)}: {floor!r}," for lang, floor in floors.items()]
+    lines += ["}", "", "PROFILES: dict[str, dict[str, float]] = {"]
+    for lang, profile in profiles.items():
+        lines.append(f"    {json.dumps(lang)}: {{")
+        lines += [
+            f"        {json.dumps(gram, ensure_ascii=False)}: {weight!r},"
+            for gram, weight in profile.items()
+        ]
+        lines.append("    },")
+    lines.append("}")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Определение языка текста")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="пересобрать таблицу профилей")
+    build.add_argument("corpus_dir", help="папка с файлами <код языка>.txt")
+    build.add_argument("--size", type=int, default=PROFILE_SIZE, help="триграмм на язык")
+    detect = commands.add_parser("detect", help="определить язык строк stdin")
+    detect.add_argument("--per-line", action="store_true", help="язык каждой строки")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        profiles, floors = build_profiles(args.corpus_dir, args.size)
+        path: str = os.path.join(os.path.dirname(__file__), "langid_profiles.py")
+        write_profiles(path, profiles, floors)
+        print(f"{path}: {', '.join(profiles)}")
+        return 0
+
+    identifier: LanguageIdentifier = get_language_identifier()
+    text: str = sys.stdin.read()
+    if args.per_line:
+        lines: list[str] = text.splitlines()
+        for line, lang in zip(lines, identifier.detect_segments(lines)):
+            print(f"{lang or '-'}\t{line}")
+    else:
+        print(identifier.detect(text) or "-")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
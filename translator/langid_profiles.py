@@ -0,0 +1,4835 @@
+"""
+Профили языков для translator/langid.py: логарифмы частот буквенных
+триграмм. Файл создан командой python -m translator.langid build.
+"""
+
+# Вес триграммы, которой нет в профиле языка
+FLOORS: dict[str, float] = {
+    "de": -8.07,
+    "en": -7.95,
+    "es": -7.96,
+    "fr": -8.02,
+    "it": -7.97,
+    "pt": -7.96,
+    "ru": -7.85,
+    "uk": -7.84,
+}
+
+PROFILES: dict[str, dict[str, float]] = {
+    "de": {
+        "en ": -3.23,
+        "er ": -4.28,
+        "ie ": -4.33,
+        "die": -4.43,
+        " di": -4.48,
+        " un": -4.6,
+        "sch": -4.66,
+        " de": -4.73,
+        " si": -4.81,
+        "ben": -4.81,
+        "ten": -4.81,
+        "nd ": -4.89,
+        "ein": -4.89,
+        " be": -4.89,
+        "ich": -4.89,
+        "der": -4.97,
+        "es ": -5.07,
+        "sie": -5.07,
+        " ge": -5.17,
+        "und": -5.17,
+        " ei": -5.17,
+        "ine": -5.17,
+        "ch ": -5.17,
+        "te ": -5.29,
+        "abe": -5.29,
+        "ter": -5.29,
+        "che": -5.29,
+        "eit": -5.29,
+        " mi": -5.29,
+        " sc": -5.29,
+        "sse": -5.29,
+        "gen": -5.43,
+        " wa": -5.43,
+        "se ": -5.43,
+        "in ": -5.43,
+        "em ": -5.43,
+        "on ": -5.43,
+        "den": -5.43,
+        " da": -5.43,
+        "ere": -5.43,
+        " es": -5.58,
+        "ir ": -5.58,
+        " ha": -5.58,
+        "ese": -5.58,
+        "bei": -5.58,
+        "ite": -5.58,
+        " in": -5.58,
+        "mit": -5.58,
+        "it ": -5.58,
+        "ber": -5.58,
+        "lte": -5.58,
+        " ab": -5.58,
+        "cht": -5.58,
+        "ung": -5.58,
+        "ng ": -5.58,
+        "men": -5.58,
+        "war": -5.76,
+        "sen": -5.76,
+        "eis": -5.76,
+        "ne ": -5.76,
+        "hre": -5.76,
+        "ren": -5.76,
+        "end": -5.76,
+        "das": -5.76,
+        " vo": -5.76,
+        "ser": -5.76,
+        " we": -5.76,
+        "ies": -5.76,
+        "nge": -5.76,
+        " wi": -5.99,
+        "wir": -5.99,
+        " zu": -5.99,
+        "ebe": -5.99,
+        "fen": -5.99,
+        "ens": -5.99,
+        "nst": -5.99,
+        "ste": -5.99,
+        "ele": -5.99,
+        " me": -5.99,
+        "nen": -5.99,
+        "st ": -5.99,
+        "cho": -5.99,
+        "iel": -5.99,
+        " al": -5.99,
+        "nde": -5.99,
+        "elt": -5.99,
+        "re ": -5.99,
+        "ern": -5.99,
+        "as ": -5.99,
+        "rei": -5.99,
+        "uns": -5.99,
+        "net": -5.99,
+        "ner": -5.99,
+        "ati": -5.99,
+        "tio": -5.99,
+        "ion": -5.99,
+        "ht ": -5.99,
+        "tag": -5.99,
+        " au": -5.99,
+        "auf": -5.99,
+        "uf ": -5.99,
+        " ic": -5.99,
+        "ass": -5.99,
+        " ne": -5.99,
+        "unt": -5.99,
+        "nte": -5.99,
+        "ing": -5.99,
+        "hr ": -6.27,
+        "alt": -6.27,
+        "des": -6.27,
+        "ind": -6.27,
+        "geb": -6.27,
+        "lie": -6.27,
+        "hab": -6.27,
+        "rbe": -6.27,
+        "et ": -6.27,
+        " kl": -6.27,
+        "lei": -6.27,
+        "he ": -6.27,
+        " no": -6.27,
+        "rma": -6.27,
+        "mal": -6.27,
+        "wei": -6.27,
+        " um": -6.27,
+        "dem": -6.27,
+        "hon": -6.27,
+        "ist": -6.27,
+        "len": -6.27,
+        " sp": -6.27,
+        "vor": -6.27,
+        " so": -6.27,
+        "oll": -6.27,
+        "ft ": -6.27,
+        "nse": -6.27,
+        "ken": -6.27,
+        "ür ": -6.27,
+        "eri": -6.27,
+        "ag ": -6.27,
+        "nta": -6.27,
+        "rde": -6.27,
+        "ei ": -6.27,
+        " pr": -6.27,
+        "pro": -6.27,
+        " ni": -6.27,
+        "nic": -6.27,
+        "ges": -6.27,
+        "nn ": -6.27,
+        "hme": -6.27,
+        "ien": -6.27,
+        " an": -6.27,
+        "gt ": -6.27,
+        "hen": -6.27,
+        "och": -6.27,
+        "lle": -6.27,
+        " he": -6.68,
+        " mo": -6.68,
+        "org": -6.68,
+        "rge": -6.68,
+        "ar ": -6.68,
+        " se": -6.68,
+        "ehr": -6.68,
+        " ka": -6.68,
+        "lt ": -6.68,
+        "use": -6.68,
+        "ieb": -6.68,
+        " am": -6.68,
+        "am ": -6.68,
+        " bü": -6.68,
+        "üch": -6.68,
+        "her": -6.68,
+        "gel": -6.68,
+        "les": -6.68,
+        "mei": -6.68,
+        "ude": -6.68,
+        " ar": -6.68,
+        "arb": -6.68,
+        "tet": -6.68,
+        "nem": -6.68,
+        "kle": -6.68,
+        " nä": -6.68,
+        "ähr": -6.68,
+        "orm": -6.68,
+        "ler": -6.68,
+        "um ": -6.68,
+        " uh": -6.68,
+        "uhr": -6.68,
+        "zug": -6.68,
+        "rst": -6.68,
+        " du": -6.68,
+        "du ": -6.68,
+        " st": -6.68,
+        "sta": -6.68,
+        " vi": -6.68,
+        "vie": -6.68,
+        "art": -6.68,
+        "rte": -6.68,
+        " ih": -6.68,
+        "ihr": -6.68,
+        "rn ": -6.68,
+        "ete": -6.68,
+        "sol": -6.68,
+        "llt": -6.68,
+        "kun": -6.68,
+        "res": -6.68,
+        "nac": -6.68,
+        "ach": -6.68,
+        "nke": -6.68,
+        "wel": -6.68,
+        " fü": -6.68,
+        "für": -6.68,
+        "ene": -6.68,
+        "era": -6.68,
+        "ütz": -6.68,
+        " bi": -6.68,
+        "itt": -6.68,
+        "tte": -6.68,
+        "mir": -6.68,
+        " fr": -6.68,
+        "bes": -6.68,
+        "esp": -6.68,
+        "spr": -6.68,
+        "pre": -6.68,
+        " ve": -6.68,
+        "ver": -6.68,
+        "ers": -6.68,
+        "de ": -6.68,
+        "dan": -6.68,
+        "ank": -6.68,
+        " hi": -6.68,
+        "lfe": -6.68,
+        " hä": -6.68,
+        "esc": -6.68,
+        "neu": -6.68,
+        "eue": -6.68,
+        "ue ": -6.68,
+        "dat": -6.68,
+        "ate": -6.68,
+        " wü": -6.68,
+        "wür": -6.68,
+        "ürd": -6.68,
+        "ann": -6.68,
+        " öf": -6.68,
+        "öff": -6.68,
+        "ffn": -6.68,
+        "fne": -6.68,
+        "sic": -6.68,
+        " re": -6.68,
+        "reg": -6.68,
+        "ier": -6.68,
+        "ur ": -6.68,
+        "rne": -6.68,
+        "neh": -6.68,
+        "ehm": -6.68,
+        "ndi": -6.68,
+        " gi": -6.68,
+        "als": -6.68,
+        "ls ": -6.68,
+        "hei": -6.68,
+        "iss": -6.68,
+        "an ": -6.68,
+        "isc": -6.68,
+        "sei": -6.68,
+        " er": -6.68,
+        "nis": -6.68,
+        "hl ": -6.68,
+        "ät ": -6.68,
+        "are": -6.68,
+        "noc": -6.68,
+        "eid": -6.68,
+        " mö": -6.68,
+        "all": -6.68,
+        "tun": -6.68,
+        "ent": -6.68,
+        "üss": -6.68,
+        "heu": -7.37,
+        "eut": -7.37,
+        "ute": -7.37,
+        "mor": -7.37,
+        "seh": -7.37,
+        "kal": -7.37,
+        "esh": -7.37,
+        "sha": -7.37,
+        "hal": -7.37,
+        "alb": -7.37,
+        "lb ": -7.37,
+        "sin": -7.37,
+        "zu ": -7.37,
+        "hau": -7.37,
+        "aus": -7.37,
+        "ebl": -7.37,
+        "bli": -7.37,
+        " fe": -7.37,
+        "büc": -7.37,
+        " br": -7.37,
+        "bru": -7.37,
+        "rud": -7.37,
+        "bür": -7.37,
+        "üro": -7.37,
+        "ro ": -7.37,
+        "näh": -7.37,
+        "ähe": -7.37,
+        " ba": -7.37,
+        "bah": -7.37,
+        "ahn": -7.37,
+        "hnh": -7.37,
+        "nho": -7.37,
+        "hof": -7.37,
+        "ofs": -7.37,
+        "fs ": -7.37,
+        " fä": -7.37,
+        "fäh": -7.37,
+        "hrt": -7.37,
+        "rt ": -7.37,
+        "nor": -7.37,
+        "ale": -7.37,
+        "erw": -7.37,
+        "rwe": -7.37,
+        "ise": -7.37,
+        "ug ": -7.37,
+        "ars": -7.37,
+        "inm": -7.37,
+        "nma": -7.37,
+        "al ": -7.37,
+        "erl": -7.37,
+        "rli": -7.37,
+        "lin": -7.37,
+        " is": -7.37,
+        " gr": -7.37,
+        "gro": -7.37,
+        "ros": -7.37,
+        "oss": -7.37,
+        "tad": -7.37,
+        "adt": -7.37,
+        "dt ": -7.37,
+        " pa": -7.37,
+        "par": -7.37,
+        "ark": -7.37,
+        "rks": -7.37,
+        "ks ": -7.37,
+        " mu": -7.37,
+        "mus": -7.37,
+        "see": -7.37,
+        "een": -7.37,
+        "ebä": -7.37,
+        "bäu": -7.37,
+        "äud": -7.37,
+        " ki": -7.37,
+        "kin": -7.37,
+        "spi": -7.37,
+        "pie": -7.37,
+        " im": -7.37,
+        "im ": -7.37,
+        " ga": -7.37,
+        "gar": -7.37,
+        " wä": -7.37,
+        "wäh": -7.37,
+        " el": -7.37,
+        " kü": -7.37,
+        "küc": -7.37,
+        "ess": -7.37,
+        "orb": -7.37,
+        " üb": -7.37,
+        "übe": -7.37,
+        "zuk": -7.37,
+        "uku": -7.37,
+        "unf": -7.37,
+        "nft": -7.37,
+        " pl": -7.37,
+        "pla": -7.37,
+        "lan": -7.37,
+        "ane": -7.37,
+        " na": -7.37,
+        "chd": -7.37,
+        "hde": -7.37,
+        "enk": -7.37,
+        "umw": -7.37,
+        "mwe": -7.37,
+        "näc": -7.37,
+        "äch": -7.37,
+        "chs": -7.37,
+        "hst": -7.37,
+        "rat": -7.37,
+        "chü": -7.37,
+        "hüt": -7.37,
+        "tze": -7.37,
+        "zen": -7.37,
+        "bit": -7.37,
+        "chi": -7.37,
+        "hic": -7.37,
+        "ick": -7.37,
+        "cke": -7.37,
+        "ric": -7.37,
+        "or ": -7.37,
+        "fre": -7.37,
+        "ita": -7.37,
+        "eil": -7.37,
+        "il ": -7.37,
+        "rec": -7.37,
+        "ech": -7.37,
+        "chu": -7.37,
+        "hun": -7.37,
+        "mon": -7.37,
+        "ont": -7.37,
+        "agn": -7.37,
+        "gna": -7.37,
+        "chm": -7.37,
+        "hmi": -7.37,
+        "tta": -7.37,
+        "rsc": -7.37,
+        "hob": -7.37,
+        "obe": -7.37,
+        " wu": -7.37,
+        "wur": -7.37,
+        "urd": -7.37,
+        "nk ": -7.37,
+        "hil": -7.37,
+        "ilf": -7.37,
+        "fe ": -7.37,
+        "sem": -7.37,
+        "roj": -7.37,
+        "oje": -7.37,
+        "jek": -7.37,
+        "ekt": -7.37,
+        "kt ": -7.37,
+        " oh": -7.37,
+        "ohn": -7.37,
+        "hne": -7.37,
+        "hät": -7.37,
+        "ätt": -7.37,
+        "cha": -7.37,
+        "haf": -7.37,
+        "aff": -7.37,
+        "fft": -7.37,
+        " sa": -7.37,
+        "sag": -7.37,
+        "agt": -7.37,
+        "gte": -7.37,
+        "ss ": -7.37,
+        " up": -7.37,
+        "upd": -7.37,
+        "pda": -7.37,
+        "rob": -7.37,
+        "obl": -7.37,
+        "ble": -7.37,
+        "lem": -7.37,
+        "eme": -7.37,
+        "me ": -7.37,
+        "etz": -7.37,
+        "tzw": -7.37,
+        "zwe": -7.37,
+        "wer": -7.37,
+        "erk": -7.37,
+        "rk ": -7.37,
+        "beh": -7.37,
+        "ehe": -7.37,
+        "heb": -7.37,
+        "wan": -7.37,
+        "chä": -7.37,
+        "häf": -7.37,
+        "äft": -7.37,
+        "son": -7.37,
+        "onn": -7.37,
+        "nnt": -7.37,
+        " gl": -7.37,
+        "gla": -7.37,
+        "lau": -7.37,
+        "aub": -7.37,
+        "ube": -7.37,
+        "be ": -7.37,
+        " ze": -7.37,
+        "zeh": -7.37,
+        "ehn": -7.37,
+        "hn ": -7.37,
+        "bin": -7.37,
+        "egi": -7.37,
+        "gie": -7.37,
+        "eru": -7.37,
+        "run": -7.37,
+        "hat": -7.37,
+        "at ": -7.37,
+        " ma": -7.37,
+        "mas": -7.37,
+        "ssn": -7.37,
+        "sna": -7.37,
+        "nah": -7.37,
+        "ahm": -7.37,
+        "zur": -7.37,
+        "stü": -7.37,
+        "tüt": -7.37,
+        "tzu": -7.37,
+        "zun": -7.37,
+        " fa": -7.37,
+        "fam": -7.37,
+        "ami": -7.37,
+        "mil": -7.37,
+        "ili": -7.37,
+        "ger": -7.37,
+        "rin": -7.37,
+        "gem": -7.37,
+        "ink": -7.37,
+        "nko": -7.37,
+        "kom": -7.37,
+        "omm": -7.37,
+        "mme": -7.37,
+        "ang": -7.37,
+        "gek": -7.37,
+        "ekü": -7.37,
+        "kün": -7.37,
+        "ünd": -7.37,
+        "dig": -7.37,
+        "igt": -7.37,
+        "gib": -7.37,
+        "ibt": -7.37,
+        "bt ": -7.37,
+        "hts": -7.37,
+        "ts ": -7.37,
+        "chö": -7.37,
+        "hön": -7.37,
+        "öne": -7.37,
+        " ta": -7.37,
+        "tas": -7.37,
+        " te": -7.37,
+        "tee": -7.37,
+        "ee ": -7.37,
+        "egn": -7.37,
+        "gne": -7.37,
+        "ris": -7.37,
+        "est": -7.37,
+        "erg": -7.37,
+        "ebn": -7.37,
+        "bni": -7.37,
+        "wah": -7.37,
+        "ahl": -7.37,
+        "wen": -7.37,
+        "enn": -7.37,
+        "inf": -7.37,
+        "nfo": -7.37,
+        "for": -7.37,
+        "mat": -7.37,
+        "one": -7.37,
+        "enö": -7.37,
+        "nöt": -7.37,
+        "öti": -7.37,
+        "tig": -7.37,
+        "ige": -7.37,
+        " fi": -7.37,
+        "fin": -7.37,
+        "rer": -7.37,
+        "web": -7.37,
+        "ebs": -7.37,
+        "bse": -7.37,
+        " od": -7.37,
+        "ode": -7.37,
+        " ru": -7.37,
+        "ruf": -7.37,
+        "ufe": -7.37,
+        " ku": -7.37,
+        " ob": -7.37,
+        "obw": -7.37,
+        "bwo": -7.37,
+        "woh": -7.37,
+        "ohl": -7.37,
+        "spä": -7.37,
+        "pät": -7.37,
+        "str": -7.37,
+        "tra": -7.37,
+        "ras": -7.37,
+        "vol": -7.37,
+        "nsc": -7.37,
+        "spa": -7.37,
+        "paz": -7.37,
+        "azi": -7.37,
+        "zie": -7.37,
+        "gin": -7.37,
+        "erh": -7.37,
+        "rhi": -7.37,
+        "hie": -7.37,
+        "elc": -7.37,
+        "lch": -7.37,
+        "ide": -7.37,
+        "mög": -7.37,
+        "ögl": -7.37,
+        "gli": -7.37,
+        "lic": -7.37,
+        "chk": -7.37,
+        "hke": -7.37,
+        "kei": -7.37,
+        "bev": -7.37,
+        "evo": -7.37,
+        "orz": -7.37,
+        "rzu": -7.37,
+        "uge": -7.37,
+        "hän": -7.37,
+        "äng": -7.37,
+        "ngt": -7.37,
+        "vom": -7.37,
+        "om ": -7.37,
+        "is ": -7.37,
+        "von": -7.37,
+        " qu": -7.37,
+    },
+    "en": {
+        " th": -3.41,
+        "the": -3.65,
+        "he ": -3.79,
+        "on ": -4.55,
+        "ing": -4.86,
+        "ng ": -4.95,
+        "ed ": -4.95,
+        " an": -4.95,
+        "nd ": -4.95,
+        "re ": -4.95,
+        " we": -5.06,
+        "thi": -5.06,
+        "is ": -5.06,
+        "ion": -5.06,
+        "en ": -5.06,
+        "er ": -5.18,
+        "ld ": -5.18,
+        "and": -5.18,
+        " of": -5.18,
+        " ne": -5.18,
+        " yo": -5.18,
+        "you": -5.18,
+        " wi": -5.31,
+        "tio": -5.31,
+        "eve": -5.31,
+        "ou ": -5.31,
+        " be": -5.31,
+        " wh": -5.31,
+        "of ": -5.31,
+        "at ": -5.46,
+        " wo": -5.46,
+        " in": -5.46,
+        "ll ": -5.46,
+        "es ": -5.46,
+        " ha": -5.46,
+        " to": -5.46,
+        "to ": -5.46,
+        "wit": -5.46,
+        "ith": -5.46,
+        "ent": -5.46,
+        " pr": -5.46,
+        "oul": -5.46,
+        "uld": -5.46,
+        "for": -5.46,
+        "or ": -5.46,
+        "his": -5.65,
+        " mo": -5.65,
+        " st": -5.65,
+        "me ": -5.65,
+        "in ": -5.65,
+        " a ": -5.65,
+        "ce ": -5.65,
+        " se": -5.65,
+        " ev": -5.65,
+        "ver": -5.65,
+        " it": -5.65,
+        "it ": -5.65,
+        "th ": -5.65,
+        "ere": -5.65,
+        "ut ": -5.65,
+        "tha": -5.65,
+        " on": -5.65,
+        "her": -5.87,
+        " wa": -5.87,
+        "as ": -5.87,
+        "we ": -5.87,
+        "all": -5.87,
+        "ice": -5.87,
+        "ati": -5.87,
+        "hav": -5.87,
+        "ave": -5.87,
+        "ve ": -5.87,
+        " is": -5.87,
+        " bu": -5.87,
+        " sh": -5.87,
+        "hou": -5.87,
+        "hin": -5.87,
+        "nk ": -5.87,
+        "our": -5.87,
+        "ur ": -5.87,
+        " fo": -5.87,
+        "day": -5.87,
+        "ay ": -5.87,
+        " i ": -5.87,
+        " fi": -5.87,
+        "te ": -5.87,
+        "an ": -5.87,
+        " co": -6.16,
+        " at": -6.16,
+        "ome": -6.16,
+        " re": -6.16,
+        "ks ": -6.16,
+        "wor": -6.16,
+        "ork": -6.16,
+        "ear": -6.16,
+        " he": -6.16,
+        " ta": -6.16,
+        "ven": -6.16,
+        "bee": -6.16,
+        "een": -6.16,
+        " lo": -6.16,
+        "ty ": -6.16,
+        "ny ": -6.16,
+        "par": -6.16,
+        "wer": -6.16,
+        " pl": -6.16,
+        "le ": -6.16,
+        "are": -6.16,
+        "ts ": -6.16,
+        " di": -6.16,
+        "sho": -6.16,
+        "ure": -6.16,
+        " ou": -6.16,
+        "pro": -6.16,
+        "ect": -6.16,
+        "men": -6.16,
+        "nt ": -6.16,
+        "se ": -6.16,
+        " me": -6.16,
+        "ter": -6.16,
+        "han": -6.16,
+        " no": -6.16,
+        "not": -6.16,
+        "ot ": -6.16,
+        "hat": -6.16,
+        "wou": -6.16,
+        " ti": -6.16,
+        "tim": -6.16,
+        "ime": -6.16,
+        " do": -6.16,
+        " op": -6.16,
+        "pen": -6.16,
+        " su": -6.16,
+        " te": -6.16,
+        "nce": -6.16,
+        "nee": -6.16,
+        " ca": -6.16,
+        "sti": -6.16,
+        "who": -6.16,
+        "ho ": -6.16,
+        "kin": -6.16,
+        "was": -6.56,
+        "old": -6.56,
+        "mor": -6.56,
+        "nin": -6.56,
+        " so": -6.56,
+        "sta": -6.56,
+        " ho": -6.56,
+        "rea": -6.56,
+        "ead": -6.56,
+        "ook": -6.56,
+        "ind": -6.56,
+        "ndo": -6.56,
+        "ow ": -6.56,
+        "rot": -6.56,
+        "oth": -6.56,
+        "rks": -6.56,
+        " sm": -6.56,
+        "sma": -6.56,
+        "mal": -6.56,
+        "ar ": -6.56,
+        "tat": -6.56,
+        " us": -6.56,
+        "ual": -6.56,
+        "ake": -6.56,
+        "rai": -6.56,
+        "ain": -6.56,
+        "sev": -6.56,
+        " cl": -6.56,
+        "ond": -6.56,
+        " la": -6.56,
+        "ity": -6.56,
+        " ma": -6.56,
+        "any": -6.56,
+        " pa": -6.56,
+        "use": -6.56,
+        "ms ": -6.56,
+        "ild": -6.56,
+        "din": -6.56,
+        " ch": -6.56,
+        "hil": -6.56,
+        "ren": -6.56,
+        "pla": -6.56,
+        "whi": -6.56,
+        "pre": -6.56,
+        "rep": -6.56,
+        "ner": -6.56,
+        "ink": -6.56,
+        "out": -6.56,
+        " fu": -6.56,
+        "net": -6.56,
+        "ct ": -6.56,
+        " en": -6.56,
+        "nme": -6.56,
+        "nex": -6.56,
+        "ext": -6.56,
+        "xt ": -6.56,
+        "era": -6.56,
+        "ple": -6.56,
+        "lea": -6.56,
+        "eas": -6.56,
+        "end": -6.56,
+        "por": -6.56,
+        "ort": -6.56,
+        "rt ": -6.56,
+        "ore": -6.56,
+        "eet": -6.56,
+        "tin": -6.56,
+        "has": -6.56,
+        "ove": -6.56,
+        "nda": -6.56,
+        "ern": -6.56,
+        "ank": -6.56,
+        "hel": -6.56,
+        "elp": -6.56,
+        "fin": -6.56,
+        "she": -6.56,
+        "tho": -6.56,
+        "id ": -6.56,
+        "new": -6.56,
+        "ew ": -6.56,
+        "dat": -6.56,
+        "ate": -6.56,
+        "st ": -6.56,
+        "ble": -6.56,
+        "two": -6.56,
+        "rk ": -6.56,
+        "ope": -6.56,
+        "ns ": -6.56,
+        "but": -6.56,
+        "am ": -6.56,
+        "sur": -6.56,
+        "ced": -6.56,
+        "res": -6.56,
+        "sin": -6.56,
+        "ine": -6.56,
+        "sse": -6.56,
+        "inc": -6.56,
+        "com": -6.56,
+        " cu": -6.56,
+        "tea": -6.56,
+        "hey": -6.56,
+        "ey ": -6.56,
+        " ye": -6.56,
+        "est": -6.56,
+        "eed": -6.56,
+        "can": -6.56,
+        "ite": -6.56,
+        " or": -6.56,
+        "cus": -6.56,
+        "ser": -6.56,
+        "erv": -6.56,
+        "rvi": -6.56,
+        "vic": -6.56,
+        " al": -6.56,
+        "til": -6.56,
+        "ill": -6.56,
+        "alk": -6.56,
+        "lki": -6.56,
+        " tw": -6.56,
+        "ons": -6.56,
+        "ery": -6.56,
+        " de": -6.56,
+        " qu": -6.56,
+        "ke ": -6.56,
+        "wea": -7.26,
+        "eat": -7.26,
+        "ath": -7.26,
+        "col": -7.26,
+        "orn": -7.26,
+        "rni": -7.26,
+        "so ": -7.26,
+        "tay": -7.26,
+        "aye": -7.26,
+        "yed": -7.26,
+        "hom": -7.26,
+        "ad ": -7.26,
+        " bo": -7.26,
+        "boo": -7.26,
+        "oks": -7.26,
+        " by": -7.26,
+        "by ": -7.26,
+        "win": -7.26,
+        "dow": -7.26,
+        " my": -7.26,
+        "my ": -7.26,
+        " br": -7.26,
+        "bro": -7.26,
+        "off": -7.26,
+        "ffi": -7.26,
+        "fic": -7.26,
+        "nea": -7.26,
+        "usu": -7.26,
+        "sua": -7.26,
+        "lly": -7.26,
+        "ly ": -7.26,
+        "tak": -7.26,
+        "kes": -7.26,
+        " tr": -7.26,
+        "tra": -7.26,
+        " o ": -7.26,
+        "clo": -7.26,
+        "loc": -7.26,
+        "ock": -7.26,
+        "ck ": -7.26,
+        "lon": -7.26,
+        "don": -7.26,
+        "lar": -7.26,
+        "arg": -7.26,
+        "rge": -7.26,
+        "ge ": -7.26,
+        " ci": -7.26,
+        "cit": -7.26,
+        "man": -7.26,
+        "ark": -7.26,
+        " mu": -7.26,
+        "mus": -7.26,
+        "seu": -7.26,
+        "eum": -7.26,
+        "ums": -7.26,
+        " ol": -7.26,
+        "bui": -7.26,
+        "uil": -7.26,
+        "ldi": -7.26,
+        "ngs": -7.26,
+        "gs ": -7.26,
+        "chi": -7.26,
+        "ldr": -7.26,
+        "dre": -7.26,
+        "lay": -7.26,
+        "ayi": -7.26,
+        "yin": -7.26,
+        " ga": -7.26,
+        "gar": -7.26,
+        "ard": -7.26,
+        "rde": -7.26,
+        "den": -7.26,
+        "ile": -7.26,
+        "hei": -7.26,
+        "eir": -7.26,
+        "ir ": -7.26,
+        "nts": -7.26,
+        "epa": -7.26,
+        "red": -7.26,
+        "inn": -7.26,
+        "nne": -7.26,
+        " ki": -7.26,
+        "kit": -7.26,
+        "itc": -7.26,
+        "tch": -7.26,
+        "che": -7.26,
+        "hen": -7.26,
+        " ab": -7.26,
+        "abo": -7.26,
+        "bou": -7.26,
+        "fut": -7.26,
+        "utu": -7.26,
+        "tur": -7.26,
+        "lan": -7.26,
+        "ane": -7.26,
+        "et ": -7.26,
+        "ote": -7.26,
+        "tec": -7.26,
+        "env": -7.26,
+        "nvi": -7.26,
+        "vir": -7.26,
+        "iro": -7.26,
+        "ron": -7.26,
+        "onm": -7.26,
+        " ge": -7.26,
+        "gen": -7.26,
+        "ene": -7.26,
+        "rat": -7.26,
+        "ase": -7.26,
+        "sen": -7.26,
+        "epo": -7.26,
+        "bef": -7.26,
+        "efo": -7.26,
+        " fr": -7.26,
+        "fri": -7.26,
+        "rid": -7.26,
+        "ida": -7.26,
+        "bec": -7.26,
+        "eca": -7.26,
+        "cau": -7.26,
+        "aus": -7.26,
+        "mee": -7.26,
+        "eti": -7.26,
+        "mov": -7.26,
+        "ved": -7.26,
+        "mon": -7.26,
+        " af": -7.26,
+        "aft": -7.26,
+        "fte": -7.26,
+        "rno": -7.26,
+        "noo": -7.26,
+        "oon": -7.26,
+        "lp ": -7.26,
+        "roj": -7.26,
+        "oje": -7.26,
+        "jec": -7.26,
+        "cou": -7.26,
+        "ini": -7.26,
+        "nis": -7.26,
+        "ish": -7.26,
+        "hed": -7.26,
+        " sa": -7.26,
+        "sai": -7.26,
+        "aid": -7.26,
+        "sof": -7.26,
+        "oft": -7.26,
+        "ftw": -7.26,
+        "twa": -7.26,
+        "war": -7.26,
+        " up": -7.26,
+        "upd": -7.26,
+        "pda": -7.26,
+        "fix": -7.26,
+        "ix ": -7.26,
+        "mos": -7.26,
+        "ost": -7.26,
+        "rob": -7.26,
+        "obl": -7.26,
+        "lem": -7.26,
+        "ems": -7.26,
+        "etw": -7.26,
+        "wha": -7.26,
+        "doe": -7.26,
+        "oes": -7.26,
+        "hop": -7.26,
+        "op ": -7.26,
+        "sun": -7.26,
+        "und": -7.26,
+        "ens": -7.26,
+        "ten": -7.26,
+        " am": -7.26,
+        " go": -7.26,
+        "gov": -7.26,
+        "rnm": -7.26,
+        "ann": -7.26,
+        "nno": -7.26,
+        "nou": -7.26,
+        "oun": -7.26,
+        "unc": -7.26,
+        "mea": -7.26,
+        "asu": -7.26,
+        "sup": -7.26,
+        "upp": -7.26,
+        "ppo": -7.26,
+        "bus": -7.26,
+        "usi": -7.26,
+        "nes": -7.26,
+        "ess": -7.26,
+        "ses": -7.26,
+        " fa": -7.26,
+        "fam": -7.26,
+        "ami": -7.26,
+        "mil": -7.26,
+        "ili": -7.26,
+        "lie": -7.26,
+        "ies": -7.26,
+        "low": -7.26,
+        "nco": -7.26,
+        "bet": -7.26,
+        "ett": -7.26,
+        "tte": -7.26,
+        "cup": -7.26,
+        "up ": -7.26,
+        "hot": -7.26,
+        "ea ": -7.26,
+        " ra": -7.26,
+        "iny": -7.26,
+        "eni": -7.26,
+        "wai": -7.26,
+        "ait": -7.26,
+        "iti": -7.26,
+        "esu": -7.26,
+        "sul": -7.26,
+        "ult": -7.26,
+        "lts": -7.26,
+        " el": -7.26,
+        "ele": -7.26,
+        "lec": -7.26,
+        "cti": -7.26,
+        " si": -7.26,
+        "yes": -7.26,
+        "ste": -7.26,
+        "erd": -7.26,
+        "rda": -7.26,
+        " ni": -7.26,
+        "nig": -7.26,
+        "igh": -7.26,
+        "ght": -7.26,
+        "ht ": -7.26,
+        " if": -7.26,
+        "if ": -7.26,
+        "inf": -7.26,
+        "nfo": -7.26,
+        "orm": -7.26,
+        "rma": -7.26,
+        "mat": -7.26,
+        "web": -7.26,
+        "ebs": -7.26,
+        "bsi": -7.26,
+        "sit": -7.26,
+        "cal": -7.26,
+        "ust": -7.26,
+        "sto": -7.26,
+        "tom": -7.26,
+        "mer": -7.26,
+        "alt": -7.26,
+        "lth": -7.26,
+        "oug": -7.26,
+        "ugh": -7.26,
+        "gh ": -7.26,
+        "lat": -7.26,
+        "str": -7.26,
+        "tre": -7.26,
+        "ree": -7.26,
+        "ets": -7.26,
+        "ful": -7.26,
+        "ull": -7.26,
+        " pe": -7.26,
+        "peo": -7.26,
+        "eop": -7.26,
+        "opl": -7.26,
+        "wal": -7.26,
+        "tal": -7.26,
+        "hic": -7.26,
+        "ich": -7.26,
+        "ch ": -7.26,
+        "hes": -7.26,
+        "ese": -7.26,
+        "wo ": -7.26,
+        "opt": -7.26,
+        "pti": -7.26,
+        "ref": -7.26,
+        "efe": -7.26,
+        "fer": -7.26,
+        "ryt": -7.26,
+        "yth": -7.26,
+        "dep": -7.26,
+        "epe": -7.26,
+        "nds": -7.26,
+        "ds ": -7.26,
+        "pri": -7.26,
+        "ric": -7.26,
+        "qua": -7.26,
+        "ali": -7.26,
+        "lit": -7.26,
+        "omp": -7.26,
+        "mpa": -7.26,
+        "pan": -7.26,
+        "loo": -7.26,
+        "oki": -7.26,
+        " ex": -7.26,
+        "exp": -7.26,
+        "xpe": -7.26,
+        "per": -7.26,
+        "eri": -7.26,
+        "rie": -7.26,
+        "ien": -7.26,
+        "enc": -7.26,
+        "eng": -7.26,
+        "ngi": -7.26,
+        "gin": -7.26,
+        "eer": -7.26,
+        " da": -7.26,
+        "ata": -7.26,
+        "ta ": -7.26,
+        " wr": -7.26,
+        "wri": -7.26,
+        "rit": -7.26,
+        "cle": -7.26,
+        "doc": -7.26,
+        "ocu": -7.26,
+        "cum": -7.26,
+        "ume": -7.26,
+        "nta": -7.26,
+        " li": -7.26,
+        "lik": -7.26,
+        "ike": -7.26,
+        "ryo": -7.26,
+        "yon": -7.26,
+        "one": -7.26,
+        "ne ": -7.26,
+        "lpe": -7.26,
+        "ped": -7.26,
+        "us ": -7.26,
+        "org": -7.26,
+        "rga": -7.26,
+        "gan": -7.26,
+        "ani": -7.26,
+        "niz": -7.26,
+        "ize": -7.26,
+        "ze ": -7.26,
+        "fir": -7.26,
+        "irs": -7.26,
+        "rst": -7.26,
+        "eam": -7.26,
+    },
+    "es": {
+        "os ": -4.05,
+        " la": -4.14,
+        " de": -4.23,
+        "de ": -4.28,
+        "as ": -4.28,
+        "la ": -4.44,
+        "est": -4.56,
+        " es": -4.63,
+        "que": -4.63,
+        "na ": -4.71,
+        " qu": -4.87,
+        "es ": -4.87,
+        "ue ": -4.97,
+        " en": -4.97,
+        "el ": -4.97,
+        "en ": -5.07,
+        " a ": -5.07,
+        "ent": -5.07,
+        "ión": -5.07,
+        "ón ": -5.07,
+        "te ": -5.07,
+        " y ": -5.19,
+        " el": -5.19,
+        " pr": -5.19,
+        "sta": -5.33,
+        "ía ": -5.33,
+        "aba": -5.33,
+        " un": -5.33,
+        "una": -5.33,
+        "ció": -5.33,
+        "las": -5.33,
+        "do ": -5.33,
+        " co": -5.33,
+        "con": -5.33,
+        "ar ": -5.33,
+        "ro ": -5.33,
+        "ra ": -5.33,
+        " ha": -5.48,
+        " no": -5.48,
+        "tra": -5.48,
+        "aci": -5.48,
+        "nte": -5.48,
+        " to": -5.48,
+        "on ": -5.48,
+        "cio": -5.48,
+        "ien": -5.48,
+        "res": -5.48,
+        "ría": -5.48,
+        "ta ": -5.66,
+        "mos": -5.66,
+        "no ": -5.66,
+        " pe": -5.66,
+        "ado": -5.66,
+        " pa": -5.66,
+        "ues": -5.66,
+        " lo": -5.66,
+        "los": -5.66,
+        "pre": -5.66,
+        " nu": -5.66,
+        "nue": -5.66,
+        " po": -5.66,
+        "or ": -5.66,
+        " se": -5.66,
+        "ste": -5.66,
+        " mu": -5.88,
+        " ca": -5.88,
+        "sa ": -5.88,
+        " tr": -5.88,
+        "ici": -5.88,
+        "ina": -5.88,
+        " al": -5.88,
+        "gra": -5.88,
+        "par": -5.88,
+        " an": -5.88,
+        "an ": -5.88,
+        "ard": -5.88,
+        "ara": -5.88,
+        "pro": -5.88,
+        " me": -5.88,
+        "io ": -5.88,
+        "era": -5.88,
+        "por": -5.88,
+        " in": -5.88,
+        "del": -5.88,
+        "ier": -5.88,
+        "nes": -5.88,
+        " re": -5.88,
+        " ta": -5.88,
+        "tar": -5.88,
+        "per": -5.88,
+        " ll": -5.88,
+        "tod": -5.88,
+        " ma": -6.17,
+        "muc": -6.17,
+        "uch": -6.17,
+        "to ": -6.17,
+        " ve": -6.17,
+        "rma": -6.17,
+        "rab": -6.17,
+        "baj": -6.17,
+        "orm": -6.17,
+        "ma ": -6.17,
+        " si": -6.17,
+        "uda": -6.17,
+        "dad": -6.17,
+        "nde": -6.17,
+        "edi": -6.17,
+        "ban": -6.17,
+        "erí": -6.17,
+        "str": -6.17,
+        "gen": -6.17,
+        "lad": -6.17,
+        "al ": -6.17,
+        "rde": -6.17,
+        "ias": -6.17,
+        "da ": -6.17,
+        "abr": -6.17,
+        "ed ": -6.17,
+        "lla": -6.17,
+        "ali": -6.17,
+        "bre": -6.17,
+        "re ": -6.17,
+        " do": -6.17,
+        "ing": -6.17,
+        "ero": -6.17,
+        "nci": -6.17,
+        "esa": -6.17,
+        "cal": -6.17,
+        "dos": -6.17,
+        "ece": -6.17,
+        " pu": -6.17,
+        "enc": -6.17,
+        "ana": -6.58,
+        "cho": -6.58,
+        "nos": -6.58,
+        "ued": -6.58,
+        "amo": -6.58,
+        " ju": -6.58,
+        "nto": -6.58,
+        "ven": -6.58,
+        "nta": -6.58,
+        " mi": -6.58,
+        " he": -6.58,
+        "erm": -6.58,
+        "ano": -6.58,
+        "aja": -6.58,
+        "peq": -6.58,
+        "equ": -6.58,
+        "ueñ": -6.58,
+        "eña": -6.58,
+        "fic": -6.58,
+        "cin": -6.58,
+        " ce": -6.58,
+        "cer": -6.58,
+        "ca ": -6.58,
+        "tac": -6.58,
+        "men": -6.58,
+        "tom": -6.58,
+        "oma": -6.58,
+        "sie": -6.58,
+        "has": -6.58,
+        "tad": -6.58,
+        "ez ": -6.58,
+        "adr": -6.58,
+        "ad ": -6.58,
+        " gr": -6.58,
+        "ran": -6.58,
+        "and": -6.58,
+        "rqu": -6.58,
+        "ios": -6.58,
+        "ant": -6.58,
+        "jar": -6.58,
+        "ntr": -6.58,
+        "ras": -6.58,
+        " su": -6.58,
+        "epa": -6.58,
+        "ena": -6.58,
+        "deb": -6.58,
+        "ebe": -6.58,
+        "ber": -6.58,
+        "pen": -6.58,
+        "uro": -6.58,
+        "tro": -6.58,
+        "er ": -6.58,
+        "med": -6.58,
+        "bie": -6.58,
+        " ge": -6.58,
+        "ene": -6.58,
+        "rac": -6.58,
+        " fa": -6.58,
+        "me ": -6.58,
+        "inf": -6.58,
+        "nfo": -6.58,
+        "for": -6.58,
+        "ern": -6.58,
+        "ada": -6.58,
+        "cia": -6.58,
+        " ay": -6.58,
+        "ayu": -6.58,
+        "yud": -6.58,
+        "hab": -6.58,
+        "did": -6.58,
+        " te": -6.58,
+        "min": -6.58,
+        "arl": -6.58,
+        " us": -6.58,
+        "ust": -6.58,
+        "ted": -6.58,
+        " di": -6.58,
+        "uev": -6.58,
+        "eva": -6.58,
+        "iza": -6.58,
+        "ama": -6.58,
+        "eso": -6.58,
+        "ver": -6.58,
+        " ab": -6.58,
+        "end": -6.58,
+        "ida": -6.58,
+        " em": -6.58,
+        "emp": -6.58,
+        "mpr": -6.58,
+        "lie": -6.58,
+        "ion": -6.58,
+        "one": -6.58,
+        "ces": -6.58,
+        "pue": -6.58,
+        "mar": -6.58,
+        "ser": -6.58,
+        "erv": -6.58,
+        "rvi": -6.58,
+        "vic": -6.58,
+        "ten": -6.58,
+        " cl": -6.58,
+        "lle": -6.58,
+        "oda": -6.58,
+        "dav": -6.58,
+        "aví": -6.58,
+        "vía": -6.58,
+        "ba ": -6.58,
+        " cu": -6.58,
+        "eri": -6.58,
+        "odo": -6.58,
+        "eci": -6.58,
+        "isi": -6.58,
+        "dec": -6.58,
+        "emo": -6.58,
+        "mañ": -7.27,
+        "aña": -7.27,
+        "ñan": -7.27,
+        "hac": -7.27,
+        "ací": -7.27,
+        "cía": -7.27,
+        "ho ": -7.27,
+        " fr": -7.27,
+        "frí": -7.27,
+        "río": -7.27,
+        "ío ": -7.27,
+        " as": -7.27,
+        "así": -7.27,
+        "sí ": -7.27,
+        "eda": -7.27,
+        "dam": -7.27,
+        "cas": -7.27,
+        "asa": -7.27,
+        " le": -7.27,
+        "leí": -7.27,
+        "eím": -7.27,
+        "ímo": -7.27,
+        " li": -7.27,
+        "lib": -7.27,
+        "ibr": -7.27,
+        "bro": -7.27,
+        "ros": -7.27,
+        "jun": -7.27,
+        "unt": -7.27,
+        "tan": -7.27,
+        "mi ": -7.27,
+        "her": -7.27,
+        "man": -7.27,
+        "ja ": -7.27,
+        "ña ": -7.27,
+        " of": -7.27,
+        "ofi": -7.27,
+        "erc": -7.27,
+        "rca": -7.27,
+        "nor": -7.27,
+        "mal": -7.27,
+        "alm": -7.27,
+        "lme": -7.27,
+        "tre": -7.27,
+        "ren": -7.27,
+        "iet": -7.27,
+        "ete": -7.27,
+        "alg": -7.27,
+        "lgu": -7.27,
+        "gun": -7.27,
+        "vez": -7.27,
+        "mad": -7.27,
+        "dri": -7.27,
+        "rid": -7.27,
+        "id ": -7.27,
+        " ci": -7.27,
+        "ciu": -7.27,
+        "iud": -7.27,
+        "hos": -7.27,
+        "arq": -7.27,
+        "mus": -7.27,
+        "use": -7.27,
+        "seo": -7.27,
+        "eos": -7.27,
+        " ed": -7.27,
+        "dif": -7.27,
+        "ifi": -7.27,
+        "nti": -7.27,
+        "tig": -7.27,
+        "igu": -7.27,
+        "guo": -7.27,
+        "uos": -7.27,
+        " ni": -7.27,
+        "niñ": -7.27,
+        "iño": -7.27,
+        "ños": -7.27,
+        "jug": -7.27,
+        "uga": -7.27,
+        "gab": -7.27,
+        " ja": -7.27,
+        "rdí": -7.27,
+        "dín": -7.27,
+        "ín ": -7.27,
+        "mie": -7.27,
+        "sus": -7.27,
+        "us ": -7.27,
+        "pad": -7.27,
+        "dre": -7.27,
+        "rep": -7.27,
+        "cen": -7.27,
+        "coc": -7.27,
+        "oci": -7.27,
+        "íam": -7.27,
+        "ens": -7.27,
+        "nsa": -7.27,
+        "sar": -7.27,
+        " fu": -7.27,
+        "fut": -7.27,
+        "utu": -7.27,
+        "tur": -7.27,
+        " pl": -7.27,
+        "pla": -7.27,
+        "lan": -7.27,
+        "ane": -7.27,
+        "net": -7.27,
+        "eta": -7.27,
+        "rot": -7.27,
+        "ote": -7.27,
+        "teg": -7.27,
+        "ege": -7.27,
+        "ger": -7.27,
+        "dio": -7.27,
+        " am": -7.27,
+        "amb": -7.27,
+        "mbi": -7.27,
+        "pró": -7.27,
+        "róx": -7.27,
+        "óxi": -7.27,
+        "xim": -7.27,
+        "ima": -7.27,
+        "ner": -7.27,
+        "fav": -7.27,
+        "avo": -7.27,
+        "vor": -7.27,
+        "env": -7.27,
+        "nví": -7.27,
+        "víe": -7.27,
+        "íem": -7.27,
+        "eme": -7.27,
+        "rme": -7.27,
+        "tes": -7.27,
+        " vi": -7.27,
+        "vie": -7.27,
+        "rne": -7.27,
+        "orq": -7.27,
+        "reu": -7.27,
+        "eun": -7.27,
+        "uni": -7.27,
+        "nió": -7.27,
+        "se ": -7.27,
+        "ha ": -7.27,
+        "asl": -7.27,
+        "sla": -7.27,
+        " lu": -7.27,
+        "lun": -7.27,
+        "une": -7.27,
+        "cha": -7.27,
+        "su ": -7.27,
+        "roy": -7.27,
+        "oye": -7.27,
+        "yec": -7.27,
+        "ect": -7.27,
+        "cto": -7.27,
+        "brí": -7.27,
+        "pod": -7.27,
+        "odi": -7.27,
+        "ido": -7.27,
+        "ter": -7.27,
+        "rmi": -7.27,
+        "nar": -7.27,
+        "rlo": -7.27,
+        "lo ": -7.27,
+        "sin": -7.27,
+        "in ": -7.27,
+        "ell": -7.27,
+        "dij": -7.27,
+        "ijo": -7.27,
+        "jo ": -7.27,
+        "va ": -7.27,
+        " ac": -7.27,
+        "act": -7.27,
+        "ctu": -7.27,
+        "tua": -7.27,
+        "ual": -7.27,
+        "liz": -7.27,
+        "zac": -7.27,
+        "rog": -7.27,
+        "ogr": -7.27,
+        "ram": -7.27,
+        "sol": -7.27,
+        "olv": -7.27,
+        "lve": -7.27,
+        "may": -7.27,
+        "ayo": -7.27,
+        "yor": -7.27,
+        "orí": -7.27,
+        "rob": -7.27,
+        "obl": -7.27,
+        "ble": -7.27,
+        "lem": -7.27,
+        "ema": -7.27,
+        "mas": -7.27,
+        "red": -7.27,
+        "qué": -7.27,
+        "ué ": -7.27,
+        " ho": -7.27,
+        "hor": -7.27,
+        "ora": -7.27,
+        " ti": -7.27,
+        "tie": -7.27,
+        "nda": -7.27,
+        "dom": -7.27,
+        "omi": -7.27,
+        "ngo": -7.27,
+        "gos": -7.27,
+        " cr": -7.27,
+        "cre": -7.27,
+        "reo": -7.27,
+        "eo ": -7.27,
+        "die": -7.27,
+        "iez": -7.27,
+        "sto": -7.27,
+        "toy": -7.27,
+        "oy ": -7.27,
+        "seg": -7.27,
+        "egu": -7.27,
+        "gur": -7.27,
+        " go": -7.27,
+        "gob": -7.27,
+        "obi": -7.27,
+        "rno": -7.27,
+        "anu": -7.27,
+        "nun": -7.27,
+        "unc": -7.27,
+        "ió ": -7.27,
+        "vas": -7.27,
+        "das": -7.27,
+        " ap": -7.27,
+        "apo": -7.27,
+        "poy": -7.27,
+        "oya": -7.27,
+        "yar": -7.27,
+        "ñas": -7.27,
+        "sas": -7.27,
+        "fam": -7.27,
+        "ami": -7.27,
+        "mil": -7.27,
+        "ili": -7.27,
+        "lia": -7.27,
+        " ba": -7.27,
+        "ajo": -7.27,
+        "jos": -7.27,
+        "ngr": -7.27,
+        "gre": -7.27,
+        "sos": -7.27,
+        "hay": -7.27,
+        "ay ": -7.27,
+        " na": -7.27,
+        "nad": -7.27,
+        "mej": -7.27,
+        "ejo": -7.27,
+        "jor": -7.27,
+        "taz": -7.27,
+        "aza": -7.27,
+        "za ": -7.27,
+        " té": -7.27,
+        "té ": -7.27,
+        "llu": -7.27,
+        "luv": -7.27,
+        "uvi": -7.27,
+        "vio": -7.27,
+        "osa": -7.27,
+        "stá": -7.27,
+        "tán": -7.27,
+        "án ": -7.27,
+        "esp": -7.27,
+        "spe": -7.27,
+        "ndo": -7.27,
+        "esu": -7.27,
+        "sul": -7.27,
+        "ult": -7.27,
+        "lta": -7.27,
+        "ele": -7.27,
+        "lec": -7.27,
+        "ecc": -7.27,
+        "cci": -7.27,
+        "des": -7.27,
+        "esd": -7.27,
+        "sde": -7.27,
+        "noc": -7.27,
+        "och": -7.27,
+        "che": -7.27,
+        "he ": -7.27,
+        "si ": -7.27,
+        " ne": -7.27,
+        "nec": -7.27,
+        "esi": -7.27,
+        "sit": -7.27,
+        "ita": -7.27,
+        " má": -7.27,
+        "más": -7.27,
+        "ás ": -7.27,
+        "mac": -7.27,
+        "ede": -7.27,
+        "nco": -7.27,
+        "ont": -7.27,
+        "rar": -7.27,
+        "rla": -7.27,
+        " pá": -7.27,
+        "pág": -7.27,
+        "ági": -7.27,
+        "gin": -7.27,
+        " we": -7.27,
+        "web": -7.27,
+        "eb ": -7.27,
+        " o ": -7.27,
+        "lam": -7.27,
+        " at": -7.27,
+        "ate": -7.27,
+        "cli": -7.27,
+        " au": -7.27,
+        "aun": -7.27,
+        "unq": -7.27,
+        "nqu": -7.27,
+        " er": -7.27,
+        "all": -7.27,
+        "les": -7.27,
+        "tab": -7.27,
+        "len": -7.27,
+        "nas": -7.27,
+        "pas": -7.27,
+        "ase": -7.27,
+        "sea": -7.27,
+        "eab": -7.27,
+        "onv": -7.27,
+        "nve": -7.27,
+        "ers": -7.27,
+        "rsa": -7.27,
+        "sab": -7.27,
+        "cuá": -7.27,
+        "uál": -7.27,
+        "ál ": -7.27,
+        "tas": -7.27,
+        " op": -7.27,
+        "opc": -7.27,
+        "pci": -7.27,
+        "ref": -7.27,
+        "efe": -7.27,
+        "fer": -7.27,
+        "rir": -7.27,
+        "irí": -7.27,
+        "dep": -7.27,
+        "epe": -7.27,
+        "rec": -7.27,
+        "lid": -7.27,
+        " bu": -7.27,
+        "bus": -7.27,
+        "usc": -7.27,
+        "sca": -7.27,
+        "un ": -7.27,
+        "nge": -7.27,
+        "eni": -7.27,
+        "nie": -7.27,
+        " ex": -7.27,
+    },
+    "fr": {
+        "es ": -3.99,
+        " de": -4.15,
+        "de ": -4.44,
+        "ent": -4.44,
+        "re ": -4.55,
+        " le": -4.55,
+        "le ": -4.62,
+        "nt ": -4.62,
+        "us ": -4.69,
+        "ous": -4.84,
+        " la": -4.84,
+        " pr": -4.84,
+        " qu": -4.84,
+        " no": -4.93,
+        " à ": -4.93,
+        "la ": -4.93,
+        "ns ": -4.93,
+        "lle": -4.93,
+        "les": -4.93,
+        "er ": -4.93,
+        "et ": -5.02,
+        "is ": -5.13,
+        "ien": -5.13,
+        "ion": -5.13,
+        "nou": -5.25,
+        "on ": -5.25,
+        " et": -5.25,
+        "tre": -5.25,
+        "men": -5.25,
+        " en": -5.25,
+        "ur ": -5.25,
+        " il": -5.38,
+        " av": -5.38,
+        " un": -5.38,
+        " vo": -5.38,
+        " pa": -5.38,
+        "par": -5.38,
+        "ne ": -5.38,
+        "ouv": -5.38,
+        "il ": -5.53,
+        "ais": -5.53,
+        "it ": -5.53,
+        " ce": -5.53,
+        "ons": -5.53,
+        "end": -5.53,
+        "eur": -5.53,
+        "vou": -5.53,
+        "aie": -5.53,
+        "que": -5.53,
+        " pl": -5.53,
+        "tio": -5.53,
+        "ell": -5.53,
+        "se ": -5.53,
+        " tr": -5.72,
+        "ce ": -5.72,
+        " ma": -5.72,
+        "in ": -5.72,
+        " so": -5.72,
+        "res": -5.72,
+        "ill": -5.72,
+        "ure": -5.72,
+        "eme": -5.72,
+        "rai": -5.72,
+        " dé": -5.72,
+        "une": -5.72,
+        "ieu": -5.72,
+        "pro": -5.72,
+        " po": -5.72,
+        "té ": -5.72,
+        " di": -5.72,
+        "uve": -5.72,
+        "rès": -5.94,
+        "ès ": -5.94,
+        "ati": -5.94,
+        "dan": -5.94,
+        "ans": -5.94,
+        " pe": -5.94,
+        "eau": -5.94,
+        " se": -5.94,
+        "ave": -5.94,
+        "eux": -5.94,
+        "ux ": -5.94,
+        "ts ": -5.94,
+        "ine": -5.94,
+        " ré": -5.94,
+        "ir ": -5.94,
+        " l ": -5.94,
+        "otr": -5.94,
+        "te ": -5.94,
+        "pou": -5.94,
+        "our": -5.94,
+        "ez ": -5.94,
+        " a ": -5.94,
+        " mi": -5.94,
+        " su": -5.94,
+        "sur": -5.94,
+        " je": -5.94,
+        "je ": -5.94,
+        "ise": -5.94,
+        " du": -5.94,
+        "du ": -5.94,
+        "plu": -5.94,
+        "soi": -5.94,
+        " fa": -6.23,
+        "ait": -6.23,
+        " al": -6.23,
+        "rs ": -6.23,
+        "mes": -6.23,
+        " re": -6.23,
+        "est": -6.23,
+        "és ": -6.23,
+        "mai": -6.23,
+        "von": -6.23,
+        "des": -6.23,
+        "vre": -6.23,
+        "prè": -6.23,
+        "tra": -6.23,
+        "ava": -6.23,
+        " da": -6.23,
+        "ren": -6.23,
+        "gén": -6.23,
+        " he": -6.23,
+        "heu": -6.23,
+        "ris": -6.23,
+        " be": -6.23,
+        "nts": -6.23,
+        "ant": -6.23,
+        "pen": -6.23,
+        "ue ": -6.23,
+        "uis": -6.23,
+        "dev": -6.23,
+        "ven": -6.23,
+        "not": -6.23,
+        "nem": -6.23,
+        "di ": -6.23,
+        "erc": -6.23,
+        " n ": -6.23,
+        "as ": -6.23,
+        "cor": -6.23,
+        " ou": -6.23,
+        "che": -6.23,
+        "qu ": -6.23,
+        "en ": -6.23,
+        "pri": -6.23,
+        " ta": -6.23,
+        "ser": -6.23,
+        " cl": -6.23,
+        "qui": -6.23,
+        "ui ": -6.23,
+        "fai": -6.63,
+        "sai": -6.63,
+        " fr": -6.63,
+        "mat": -6.63,
+        "avo": -6.63,
+        " lu": -6.63,
+        "êtr": -6.63,
+        "rav": -6.63,
+        "vai": -6.63,
+        "ail": -6.63,
+        "un ": -6.63,
+        "pet": -6.63,
+        "eti": -6.63,
+        "tit": -6.63,
+        "au ": -6.63,
+        "are": -6.63,
+        "pre": -6.63,
+        "nd ": -6.63,
+        " gé": -6.63,
+        "éné": -6.63,
+        "nér": -6.63,
+        "éra": -6.63,
+        "ain": -6.63,
+        " êt": -6.63,
+        "tes": -6.63,
+        "déj": -6.63,
+        "éjà": -6.63,
+        "jà ": -6.63,
+        "all": -6.63,
+        "nde": -6.63,
+        " vi": -6.63,
+        "vec": -6.63,
+        "ec ": -6.63,
+        "bea": -6.63,
+        "auc": -6.63,
+        "uco": -6.63,
+        "cou": -6.63,
+        "oup": -6.63,
+        "up ": -6.63,
+        "arc": -6.63,
+        "ées": -6.63,
+        "vie": -6.63,
+        "ime": -6.63,
+        " jo": -6.63,
+        "jou": -6.63,
+        "ard": -6.63,
+        "urs": -6.63,
+        "pré": -6.63,
+        "ner": -6.63,
+        "isi": -6.63,
+        "sin": -6.63,
+        "evr": -6.63,
+        "réf": -6.63,
+        "eni": -6.63,
+        "nir": -6.63,
+        "pla": -6.63,
+        "ger": -6.63,
+        "env": -6.63,
+        "onn": -6.63,
+        "cha": -6.63,
+        " ve": -6.63,
+        "app": -6.63,
+        "por": -6.63,
+        "ort": -6.63,
+        "rt ": -6.63,
+        "ndr": -6.63,
+        "dre": -6.63,
+        " ét": -6.63,
+        "dép": -6.63,
+        "ée ": -6.63,
+        " ap": -6.63,
+        " me": -6.63,
+        "mer": -6.63,
+        "rci": -6.63,
+        " ai": -6.63,
+        "aid": -6.63,
+        "pas": -6.63,
+        " sa": -6.63,
+        " el": -6.63,
+        "vel": -6.63,
+        "mis": -6.63,
+        "cie": -6.63,
+        "lai": -6.63,
+        "rés": -6.63,
+        "uel": -6.63,
+        "uvr": -6.63,
+        "he ": -6.63,
+        "ens": -6.63,
+        "ix ": -6.63,
+        "ver": -6.63,
+        "out": -6.63,
+        "ten": -6.63,
+        "ite": -6.63,
+        "ntr": -6.63,
+        "rep": -6.63,
+        "epr": -6.63,
+        "ble": -6.63,
+        "rie": -6.63,
+        " ch": -6.63,
+        "oir": -6.63,
+        "tte": -6.63,
+        "tat": -6.63,
+        "ier": -6.63,
+        " si": -6.63,
+        "vez": -6.63,
+        "lus": -6.63,
+        " in": -6.63,
+        "ler": -6.63,
+        "erv": -6.63,
+        "rvi": -6.63,
+        "vic": -6.63,
+        "ice": -6.63,
+        "ues": -6.63,
+        "tai": -6.63,
+        "enc": -6.63,
+        "nco": -6.63,
+        "ore": -6.63,
+        "dis": -6.63,
+        "isc": -6.63,
+        "scu": -6.63,
+        "cut": -6.63,
+        " to": -6.63,
+        "tou": -6.63,
+        " do": -6.63,
+        "ire": -6.63,
+        "cet": -6.63,
+        "isa": -7.33,
+        "trè": -7.33,
+        "fro": -7.33,
+        "roi": -7.33,
+        "oid": -7.33,
+        "id ": -7.33,
+        "tin": -7.33,
+        "alo": -7.33,
+        "lor": -7.33,
+        "ors": -7.33,
+        "som": -7.33,
+        "omm": -7.33,
+        "mme": -7.33,
+        "sté": -7.33,
+        "tés": -7.33,
+        "iso": -7.33,
+        "son": -7.33,
+        "lu ": -7.33,
+        " li": -7.33,
+        "liv": -7.33,
+        "ivr": -7.33,
+        " fe": -7.33,
+        "fen": -7.33,
+        "enê": -7.33,
+        "nêt": -7.33,
+        " mo": -7.33,
+        "mon": -7.33,
+        "frè": -7.33,
+        "rèr": -7.33,
+        "ère": -7.33,
+        " bu": -7.33,
+        "bur": -7.33,
+        "rea": -7.33,
+        " ga": -7.33,
+        "gar": -7.33,
+        "ral": -7.33,
+        "ale": -7.33,
+        "lem": -7.33,
+        "sep": -7.33,
+        "ept": -7.33,
+        "pt ": -7.33,
+        "ête": -7.33,
+        "llé": -7.33,
+        "lé ": -7.33,
+        "ari": -7.33,
+        " c ": -7.33,
+        " es": -7.33,
+        "st ": -7.33,
+        " gr": -7.33,
+        "gra": -7.33,
+        "ran": -7.33,
+        "and": -7.33,
+        "vil": -7.33,
+        "rcs": -7.33,
+        "cs ": -7.33,
+        " mu": -7.33,
+        "mus": -7.33,
+        "usé": -7.33,
+        "sée": -7.33,
+        " bâ": -7.33,
+        "bât": -7.33,
+        "âti": -7.33,
+        "tim": -7.33,
+        "enf": -7.33,
+        "nfa": -7.33,
+        "fan": -7.33,
+        "oua": -7.33,
+        "uai": -7.33,
+        " ja": -7.33,
+        "jar": -7.33,
+        "rdi": -7.33,
+        "din": -7.33,
+        "nda": -7.33,
+        "leu": -7.33,
+        "rép": -7.33,
+        "épa": -7.33,
+        "ara": -7.33,
+        " dî": -7.33,
+        "dîn": -7.33,
+        "îne": -7.33,
+        " cu": -7.33,
+        "cui": -7.33,
+        "vri": -7.33,
+        "rio": -7.33,
+        "éfl": -7.33,
+        "flé": -7.33,
+        "léc": -7.33,
+        "éch": -7.33,
+        "chi": -7.33,
+        "hir": -7.33,
+        "lan": -7.33,
+        "anè": -7.33,
+        "nèt": -7.33,
+        "ète": -7.33,
+        "rot": -7.33,
+        "oté": -7.33,
+        "tég": -7.33,
+        "ége": -7.33,
+        "nvi": -7.33,
+        "vir": -7.33,
+        "iro": -7.33,
+        "ron": -7.33,
+        "nne": -7.33,
+        "roc": -7.33,
+        "och": -7.33,
+        "hai": -7.33,
+        "rat": -7.33,
+        "veu": -7.33,
+        "eui": -7.33,
+        "uil": -7.33,
+        "lez": -7.33,
+        " m ": -7.33,
+        "nvo": -7.33,
+        "voy": -7.33,
+        "oye": -7.33,
+        "yer": -7.33,
+        " ra": -7.33,
+        "rap": -7.33,
+        "ppo": -7.33,
+        "van": -7.33,
+        "red": -7.33,
+        "edi": -7.33,
+        "rce": -7.33,
+        "réu": -7.33,
+        "éun": -7.33,
+        "uni": -7.33,
+        "nio": -7.33,
+        "été": -7.33,
+        "épl": -7.33,
+        "lac": -7.33,
+        "acé": -7.33,
+        "cée": -7.33,
+        "lun": -7.33,
+        "und": -7.33,
+        "ndi": -7.33,
+        "apr": -7.33,
+        "mid": -7.33,
+        "idi": -7.33,
+        "ci ": -7.33,
+        "vot": -7.33,
+        "ide": -7.33,
+        "roj": -7.33,
+        "oje": -7.33,
+        "jet": -7.33,
+        " au": -7.33,
+        "aur": -7.33,
+        "ura": -7.33,
+        " pu": -7.33,
+        "pu ": -7.33,
+        " te": -7.33,
+        "ter": -7.33,
+        "erm": -7.33,
+        "rmi": -7.33,
+        "min": -7.33,
+        "san": -7.33,
+        "dit": -7.33,
+        " lo": -7.33,
+        "log": -7.33,
+        "ogi": -7.33,
+        "gic": -7.33,
+        "ici": -7.33,
+        "iel": -7.33,
+        "el ": -7.33,
+        "lla": -7.33,
+        " co": -7.33,
+        "orr": -7.33,
+        "rri": -7.33,
+        "rig": -7.33,
+        "ige": -7.33,
+        "lup": -7.33,
+        "upa": -7.33,
+        "art": -7.33,
+        "rob": -7.33,
+        "obl": -7.33,
+        "blè": -7.33,
+        "lèm": -7.33,
+        "ème": -7.33,
+        "ése": -7.33,
+        "sea": -7.33,
+        "mag": -7.33,
+        "aga": -7.33,
+        "gas": -7.33,
+        "asi": -7.33,
+        " t ": -7.33,
+        "dim": -7.33,
+        "ima": -7.33,
+        "man": -7.33,
+        "anc": -7.33,
+        "nch": -7.33,
+        "nse": -7.33,
+        "dix": -7.33,
+        "sui": -7.33,
+        " sû": -7.33,
+        "sûr": -7.33,
+        "ûr ": -7.33,
+        " go": -7.33,
+        "gou": -7.33,
+        "ern": -7.33,
+        "rne": -7.33,
+        " an": -7.33,
+        "ann": -7.33,
+        "nno": -7.33,
+        "non": -7.33,
+        "onc": -7.33,
+        "ncé": -7.33,
+        "cé ": -7.33,
+        "esu": -7.33,
+        "sou": -7.33,
+        "ute": -7.33,
+        "ses": -7.33,
+        "fam": -7.33,
+        "ami": -7.33,
+        "mil": -7.33,
+        "aib": -7.33,
+        "ibl": -7.33,
+        "rev": -7.33,
+        "eve": -7.33,
+        "enu": -7.33,
+        "nus": -7.33,
+        " y ": -7.33,
+        " ri": -7.33,
+        "mie": -7.33,
+        "tas": -7.33,
+        "ass": -7.33,
+        "sse": -7.33,
+        " th": -7.33,
+        "thé": -7.33,
+        "hé ": -7.33,
+        "hau": -7.33,
+        "aud": -7.33,
+        "ud ": -7.33,
+        "ar ": -7.33,
+        "iré": -7.33,
+        "rée": -7.33,
+        "luv": -7.33,
+        "uvi": -7.33,
+        "eus": -7.33,
+        "use": -7.33,
+        "ils": -7.33,
+        "ls ": -7.33,
+        " at": -7.33,
+        "att": -7.33,
+        "den": -7.33,
+        "ésu": -7.33,
+        "sul": -7.33,
+        "ult": -7.33,
+        "lta": -7.33,
+        "ats": -7.33,
+        " él": -7.33,
+        "éle": -7.33,
+        "lec": -7.33,
+        "ect": -7.33,
+        "cti": -7.33,
+        "dep": -7.33,
+        "epu": -7.33,
+        "pui": -7.33,
+        " hi": -7.33,
+        "hie": -7.33,
+        "si ": -7.33,
+        "bes": -7.33,
+        "eso": -7.33,
+        "oin": -7.33,
+        " d ": -7.33,
+        "inf": -7.33,
+        "nfo": -7.33,
+        "for": -7.33,
+        "orm": -7.33,
+        "rma": -7.33,
+        "tro": -7.33,
+        "rou": -7.33,
+        "sit": -7.33,
+        "ou ": -7.33,
+        "ppe": -7.33,
+        "pel": -7.33,
+        "ele": -7.33,
+        "cli": -7.33,
+        "lie": -7.33,
+        " bi": -7.33,
+        "bie": -7.33,
+        "oit": -7.33,
+        "tar": -7.33,
+        "rd ": -7.33,
+        " ru": -7.33,
+        "rue": -7.33,
+        "éta": -7.33,
+        "ple": -7.33,
+        "lei": -7.33,
+        "ein": -7.33,
+        "nes": -7.33,
+        " ge": -7.33,
+        "gen": -7.33,
+        "rom": -7.33,
+        "ome": -7.33,
+        "ena": -7.33,
+        "nai": -7.33,
+        "uta": -7.33,
+        "laq": -7.33,
+        "aqu": -7.33,
+        "ces": -7.33,
+        "deu": -7.33,
+        " op": -7.33,
+        "opt": -7.33,
+        "pti": -7.33,
+        "éfé": -7.33,
+        "fér": -7.33,
+        "ére": -7.33,
+        "rer": -7.33,
+        "eri": -7.33,
+        "iez": -7.33,
+        "ut ": -7.33,
+        "épe": -7.33,
+        "rix": -7.33,
+        "qua": -7.33,
+        "ual": -7.33,
+        "ali": -7.33,
+        "lit": -7.33,
+        "ité": -7.33,
+        "her": -7.33,
+        "rch": -7.33,
+        "ing": -7.33,
+        "ngé": -7.33,
+        "éni": -7.33,
+        "nie": -7.33,
+        " ex": -7.33,
+        "exp": -7.33,
+    },
+    "it": {
+        "to ": -4.28,
+        "re ": -4.57,
+        " di": -4.71,
+        "di ": -4.79,
+        "no ": -4.79,
+        "la ": -4.88,
+        "le ": -4.88,
+        "zio": -4.98,
+        "ion": -4.98,
+        " pr": -4.98,
+        " ch": -4.98,
+        " qu": -5.08,
+        " de": -5.08,
+        "ra ": -5.08,
+        "ne ": -5.08,
+        " se": -5.08,
+        "ent": -5.08,
+        "na ": -5.2,
+        " la": -5.2,
+        " un": -5.2,
+        "azi": -5.2,
+        "te ": -5.2,
+        "ro ": -5.2,
+        "sta": -5.33,
+        " e ": -5.33,
+        "ei ": -5.33,
+        "io ": -5.33,
+        "one": -5.33,
+        "pre": -5.33,
+        "on ": -5.33,
+        "chi": -5.33,
+        "che": -5.33,
+        "he ": -5.33,
+        " st": -5.49,
+        " ri": -5.49,
+        "ti ": -5.49,
+        " a ": -5.49,
+        " le": -5.49,
+        " al": -5.49,
+        "all": -5.49,
+        "est": -5.49,
+        " in": -5.49,
+        " il": -5.49,
+        "il ": -5.49,
+        " do": -5.49,
+        " pe": -5.49,
+        "are": -5.49,
+        " no": -5.49,
+        "ta ": -5.49,
+        "ere": -5.49,
+        "per": -5.49,
+        "era": -5.49,
+        "que": -5.49,
+        "iam": -5.67,
+        "mo ": -5.67,
+        "ett": -5.67,
+        "lla": -5.67,
+        "str": -5.67,
+        "ora": -5.67,
+        " pi": -5.67,
+        "ito": -5.67,
+        " ma": -5.67,
+        "tat": -5.67,
+        "ma ": -5.67,
+        "una": -5.67,
+        " an": -5.67,
+        "del": -5.67,
+        "ost": -5.67,
+        "tro": -5.67,
+        "pro": -5.67,
+        "ien": -5.67,
+        "ues": -5.67,
+        " ha": -5.67,
+        "ser": -5.67,
+        "olt": -5.89,
+        "do ": -5.89,
+        "amo": -5.89,
+        "tto": -5.89,
+        "ri ": -5.89,
+        "ici": -5.89,
+        " mi": -5.89,
+        "ell": -5.89,
+        "lo ": -5.89,
+        "avo": -5.89,
+        "vor": -5.89,
+        "in ": -5.89,
+        "end": -5.89,
+        "nde": -5.89,
+        "de ": -5.89,
+        "lle": -5.89,
+        "gra": -5.89,
+        " co": -5.89,
+        "con": -5.89,
+        " i ": -5.89,
+        "ni ": -5.89,
+        "gio": -5.89,
+        "ava": -5.89,
+        "men": -5.89,
+        "er ": -5.89,
+        "ene": -5.89,
+        "ner": -5.89,
+        "eri": -5.89,
+        "ggi": -5.89,
+        "se ": -5.89,
+        " da": -5.89,
+        "hia": -5.89,
+        " fa": -6.18,
+        "va ": -6.18,
+        "red": -6.18,
+        " si": -6.18,
+        "bbi": -6.18,
+        "bia": -6.18,
+        "cin": -6.18,
+        "ino": -6.18,
+        "un ": -6.18,
+        "taz": -6.18,
+        " so": -6.18,
+        "ren": -6.18,
+        "ato": -6.18,
+        " è ": -6.18,
+        "and": -6.18,
+        " pa": -6.18,
+        "par": -6.18,
+        "ci ": -6.18,
+        " gi": -6.18,
+        "ano": -6.18,
+        "iar": -6.18,
+        " me": -6.18,
+        " ge": -6.18,
+        "gen": -6.18,
+        "dov": -6.18,
+        "vre": -6.18,
+        "el ": -6.18,
+        "nos": -6.18,
+        "nte": -6.18,
+        "raz": -6.18,
+        " re": -6.18,
+        "ata": -6.18,
+        " su": -6.18,
+        "non": -6.18,
+        "ha ": -6.18,
+        "ior": -6.18,
+        "nto": -6.18,
+        "reb": -6.18,
+        "ebb": -6.18,
+        "bbe": -6.18,
+        "ove": -6.18,
+        "ver": -6.18,
+        "ann": -6.18,
+        "sso": -6.18,
+        "so ": -6.18,
+        " ta": -6.18,
+        "sul": -6.18,
+        "oni": -6.18,
+        "anc": -6.18,
+        "ama": -6.59,
+        "tti": -6.59,
+        "ina": -6.59,
+        " mo": -6.59,
+        "mol": -6.59,
+        "lto": -6.59,
+        " fr": -6.59,
+        "edd": -6.59,
+        "ndi": -6.59,
+        "ima": -6.59,
+        "sti": -6.59,
+        " ca": -6.59,
+        "sa ": -6.59,
+        " ab": -6.59,
+        "abb": -6.59,
+        "dei": -6.59,
+        " vi": -6.59,
+        "vic": -6.59,
+        " fi": -6.59,
+        "fin": -6.59,
+        "tra": -6.59,
+        "rat": -6.59,
+        "lav": -6.59,
+        "pic": -6.59,
+        "icc": -6.59,
+        "cco": -6.59,
+        "col": -6.59,
+        "olo": -6.59,
+        "fic": -6.59,
+        "sol": -6.59,
+        "lit": -6.59,
+        " tr": -6.59,
+        "tre": -6.59,
+        "sei": -6.59,
+        "ai ": -6.59,
+        " gr": -6.59,
+        "ran": -6.59,
+        " ci": -6.59,
+        "cit": -6.59,
+        "tà ": -6.59,
+        "rch": -6.59,
+        "hi ": -6.59,
+        " ed": -6.59,
+        "ant": -6.59,
+        "nti": -6.59,
+        " ba": -6.59,
+        "amb": -6.59,
+        "mbi": -6.59,
+        "ini": -6.59,
+        "van": -6.59,
+        "gia": -6.59,
+        "ard": -6.59,
+        "rdi": -6.59,
+        "ntr": -6.59,
+        "eni": -6.59,
+        "ori": -6.59,
+        "ara": -6.59,
+        "rav": -6.59,
+        " ce": -6.59,
+        "ovr": -6.59,
+        "pen": -6.59,
+        "sar": -6.59,
+        "al ": -6.59,
+        "uro": -6.59,
+        "pia": -6.59,
+        "egg": -6.59,
+        " l ": -6.59,
+        "mi ": -6.59,
+        "ven": -6.59,
+        "dì ": -6.59,
+        "erc": -6.59,
+        "riu": -6.59,
+        " po": -6.59,
+        "ome": -6.59,
+        "zie": -6.59,
+        "ie ": -6.59,
+        " ai": -6.59,
+        "aiu": -6.59,
+        "iut": -6.59,
+        "sto": -6.59,
+        "rog": -6.59,
+        " sa": -6.59,
+        "rei": -6.59,
+        "za ": -6.59,
+        " nu": -6.59,
+        "nuo": -6.59,
+        "uov": -6.59,
+        "ovo": -6.59,
+        "agg": -6.59,
+        "be ": -6.59,
+        "ris": -6.59,
+        "iso": -6.59,
+        " or": -6.59,
+        " ap": -6.59,
+        "apr": -6.59,
+        " ne": -6.59,
+        "ca ": -6.59,
+        "eci": -6.59,
+        "ve ": -6.59,
+        "isu": -6.59,
+        "ste": -6.59,
+        "gli": -6.59,
+        "lie": -6.59,
+        "ass": -6.59,
+        "zza": -6.59,
+        "tan": -6.59,
+        "nno": -6.59,
+        "spe": -6.59,
+        "ult": -6.59,
+        "ati": -6.59,
+        "da ": -6.59,
+        "ier": -6.59,
+        "lte": -6.59,
+        "ul ": -6.59,
+        "erv": -6.59,
+        "rvi": -6.59,
+        "viz": -6.59,
+        "izi": -6.59,
+        " er": -6.59,
+        "nco": -6.59,
+        "cor": -6.59,
+        "sse": -6.59,
+        "iav": -6.59,
+        "acc": -6.59,
+        "qua": -6.59,
+        "ual": -6.59,
+        " tu": -6.59,
+        "tut": -6.59,
+        "utt": -6.59,
+        "dal": -6.59,
+        "ing": -6.59,
+        " es": -6.59,
+        "ive": -6.59,
+        " vo": -6.59,
+        "ess": -6.59,
+        "vol": -6.59,
+        "tam": -7.28,
+        "mat": -7.28,
+        "att": -7.28,
+        "tin": -7.28,
+        "fac": -7.28,
+        "ace": -7.28,
+        "cev": -7.28,
+        "eva": -7.28,
+        "fre": -7.28,
+        "ddo": -7.28,
+        "qui": -7.28,
+        "uin": -7.28,
+        "ind": -7.28,
+        "sia": -7.28,
+        "rim": -7.28,
+        "mas": -7.28,
+        "ast": -7.28,
+        "cas": -7.28,
+        "asa": -7.28,
+        "let": -7.28,
+        " li": -7.28,
+        "lib": -7.28,
+        "ibr": -7.28,
+        "bri": -7.28,
+        "ine": -7.28,
+        "nes": -7.28,
+        "mio": -7.28,
+        "fra": -7.28,
+        "ate": -7.28,
+        "tel": -7.28,
+        "llo": -7.28,
+        " uf": -7.28,
+        "uff": -7.28,
+        "ffi": -7.28,
+        "cio": -7.28,
+        "oli": -7.28,
+        "eno": -7.28,
+        "set": -7.28,
+        "tte": -7.28,
+        "mai": -7.28,
+        " ro": -7.28,
+        "rom": -7.28,
+        "oma": -7.28,
+        "itt": -7.28,
+        "ttà": -7.28,
+        "lti": -7.28,
+        "arc": -7.28,
+        " mu": -7.28,
+        "mus": -7.28,
+        "use": -7.28,
+        "ed ": -7.28,
+        "edi": -7.28,
+        "dif": -7.28,
+        "ifi": -7.28,
+        "tic": -7.28,
+        "ich": -7.28,
+        "bam": -7.28,
+        "bin": -7.28,
+        "ioc": -7.28,
+        "oca": -7.28,
+        "cav": -7.28,
+        "din": -7.28,
+        " lo": -7.28,
+        "lor": -7.28,
+        "oro": -7.28,
+        "nit": -7.28,
+        "tor": -7.28,
+        "rep": -7.28,
+        "epa": -7.28,
+        "cen": -7.28,
+        "ena": -7.28,
+        " cu": -7.28,
+        "cuc": -7.28,
+        "uci": -7.28,
+        "rem": -7.28,
+        "emm": -7.28,
+        "mmo": -7.28,
+        "ens": -7.28,
+        "nsa": -7.28,
+        " fu": -7.28,
+        "fut": -7.28,
+        "utu": -7.28,
+        "tur": -7.28,
+        "ian": -7.28,
+        "ane": -7.28,
+        "net": -7.28,
+        "eta": -7.28,
+        "rot": -7.28,
+        "ote": -7.28,
+        "teg": -7.28,
+        "gge": -7.28,
+        "ger": -7.28,
+        " am": -7.28,
+        "bie": -7.28,
+        "ros": -7.28,
+        "oss": -7.28,
+        "ssi": -7.28,
+        "sim": -7.28,
+        "fav": -7.28,
+        "ore": -7.28,
+        "man": -7.28,
+        "rel": -7.28,
+        "ela": -7.28,
+        "laz": -7.28,
+        " en": -7.28,
+        " ve": -7.28,
+        "erd": -7.28,
+        "rdì": -7.28,
+        "ché": -7.28,
+        "hé ": -7.28,
+        "iun": -7.28,
+        "uni": -7.28,
+        "nio": -7.28,
+        " sp": -7.28,
+        "spo": -7.28,
+        "pos": -7.28,
+        " lu": -7.28,
+        "lun": -7.28,
+        "une": -7.28,
+        "ned": -7.28,
+        "edì": -7.28,
+        "pom": -7.28,
+        "mer": -7.28,
+        "rig": -7.28,
+        "igg": -7.28,
+        "mil": -7.28,
+        "ill": -7.28,
+        "suo": -7.28,
+        "uo ": -7.28,
+        "uto": -7.28,
+        "oge": -7.28,
+        "get": -7.28,
+        "ius": -7.28,
+        "usc": -7.28,
+        "sci": -7.28,
+        "nir": -7.28,
+        "irl": -7.28,
+        "rlo": -7.28,
+        "sen": -7.28,
+        "enz": -7.28,
+        "nza": -7.28,
+        "lei": -7.28,
+        "det": -7.28,
+        "vo ": -7.28,
+        " ag": -7.28,
+        "orn": -7.28,
+        "rna": -7.28,
+        "nam": -7.28,
+        "ame": -7.28,
+        "ogr": -7.28,
+        "ram": -7.28,
+        "amm": -7.28,
+        "mma": -7.28,
+        " av": -7.28,
+        "avr": -7.28,
+        "mag": -7.28,
+        "or ": -7.28,
+        "art": -7.28,
+        "rte": -7.28,
+        "rob": -7.28,
+        "obl": -7.28,
+        "ble": -7.28,
+        "lem": -7.28,
+        "emi": -7.28,
+        "ret": -7.28,
+        "ete": -7.28,
+        "neg": -7.28,
+        "ego": -7.28,
+        "goz": -7.28,
+        "ozi": -7.28,
+        "dom": -7.28,
+        "nic": -7.28,
+        "ica": -7.28,
+        " cr": -7.28,
+        "cre": -7.28,
+        "edo": -7.28,
+        "pra": -7.28,
+        "die": -7.28,
+        "iec": -7.28,
+        "son": -7.28,
+        "ono": -7.28,
+        "sic": -7.28,
+        "icu": -7.28,
+        "cur": -7.28,
+        " go": -7.28,
+        "gov": -7.28,
+        "ern": -7.28,
+        "rno": -7.28,
+        "nnu": -7.28,
+        "nun": -7.28,
+        "unc": -7.28,
+        "nci": -7.28,
+        "cia": -7.28,
+        "iat": -7.28,
+        "mis": -7.28,
+        "sur": -7.28,
+        "ure": -7.28,
+        "sos": -7.28,
+        "ten": -7.28,
+        "ole": -7.28,
+        " im": -7.28,
+        "imp": -7.28,
+        "mpr": -7.28,
+        "res": -7.28,
+        "ese": -7.28,
+        "fam": -7.28,
+        "ami": -7.28,
+        "mig": -7.28,
+        "igl": -7.28,
+        "ddi": -7.28,
+        "dit": -7.28,
+        "bas": -7.28,
+        " c ": -7.28,
+        " ni": -7.28,
+        "nie": -7.28,
+        "meg": -7.28,
+        "egl": -7.28,
+        "lio": -7.28,
+        "azz": -7.28,
+        " tè": -7.28,
+        "tè ": -7.28,
+        "cal": -7.28,
+        "ald": -7.28,
+        "ldo": -7.28,
+        "pio": -7.28,
+        "iov": -7.28,
+        "vos": -7.28,
+        "osa": -7.28,
+        " as": -7.28,
+        "asp": -7.28,
+        "pet": -7.28,
+        "tta": -7.28,
+        "ndo": -7.28,
+        "lta": -7.28,
+        " el": -7.28,
+        "ele": -7.28,
+        "lez": -7.28,
+        "ezi": -7.28,
+        " ie": -7.28,
+        " bi": -7.28,
+        "bis": -7.28,
+        "sog": -7.28,
+        "ogn": -7.28,
+        "gno": -7.28,
+        " ul": -7.28,
+        "ter": -7.28,
+        "rio": -7.28,
+        "inf": -7.28,
+        "nfo": -7.28,
+        "for": -7.28,
+        "orm": -7.28,
+        "rma": -7.28,
+        "maz": -7.28,
+        " pu": -7.28,
+        "può": -7.28,
+        "uò ": -7.28,
+        "rov": -7.28,
+        "ova": -7.28,
+        "var": -7.28,
+        "arl": -7.28,
+        "rle": -7.28,
+        "sit": -7.28,
+        " o ": -7.28,
+        "mar": -7.28,
+        " cl": -7.28,
+        "cli": -7.28,
+        "nch": -7.28,
+        "tar": -7.28,
+        "rad": -7.28,
+        "ade": -7.28,
+        "pie": -7.28,
+        "pas": -7.28,
+        "seg": -7.28,
+        "iac": -7.28,
+        "cch": -7.28,
+        "hie": -7.28,
+        "ale": -7.28,
+        " du": -7.28,
+        "due": -7.28,
+        "ue ": -7.28,
+        " op": -7.28,
+        "opz": -7.28,
+        "pzi": -7.28,
+        "ref": -7.28,
+        "efe": -7.28,
+        "fer": -7.28,
+        "rir": -7.28,
+        "ire": -7.28,
+        "dip": -7.28,
+        "ipe": -7.28,
+        "rez": -7.28,
+        "ezz": -7.28,
+        "zzo": -7.28,
+        "zo ": -7.28,
+        "ali": -7.28,
+        "ità": -7.28,
+        " az": -7.28,
+        "nda": -7.28,
+        "cer": -7.28,
+        "rca": -7.28,
+        "nge": -7.28,
+        "geg": -7.28,
+        "egn": -7.28,
+        "gne": -7.28,
+        "esp": -7.28,
+        "ert": -7.28,
+        "rto": -7.28,
+        "sap": -7.28,
+        "app": -7.28,
+    },
+    "pt": {
+        "as ": -4.08,
+        "os ": -4.27,
+        "de ": -4.27,
+        "ão ": -4.49,
+        "que": -4.55,
+        " de": -4.62,
+        " es": -4.7,
+        " qu": -4.7,
+        "est": -4.78,
+        "da ": -4.78,
+        " no": -4.86,
+        " pr": -4.86,
+        "te ": -4.96,
+        "ra ": -4.96,
+        "ent": -5.06,
+        " co": -5.06,
+        "ar ": -5.06,
+        " do": -5.06,
+        "do ": -5.06,
+        " a ": -5.06,
+        "ue ": -5.06,
+        "sta": -5.18,
+        " e ": -5.18,
+        " da": -5.18,
+        "ma ": -5.18,
+        "es ": -5.18,
+        "to ": -5.32,
+        " pe": -5.32,
+        " o ": -5.32,
+        "nte": -5.32,
+        " se": -5.32,
+        " pa": -5.32,
+        "pre": -5.32,
+        "ara": -5.32,
+        "ava": -5.47,
+        "io ": -5.47,
+        " em": -5.47,
+        "em ": -5.47,
+        " me": -5.47,
+        "par": -5.47,
+        "ria": -5.47,
+        "am ": -5.47,
+        "tar": -5.47,
+        " re": -5.47,
+        " nã": -5.47,
+        "não": -5.47,
+        "ta ": -5.65,
+        " ma": -5.65,
+        " en": -5.65,
+        "mos": -5.65,
+        "no ": -5.65,
+        "com": -5.65,
+        "eve": -5.65,
+        " um": -5.65,
+        "uma": -5.65,
+        " as": -5.65,
+        "vam": -5.65,
+        "pro": -5.65,
+        " po": -5.65,
+        " el": -5.65,
+        "ver": -5.65,
+        "dos": -5.65,
+        " ch": -5.65,
+        " mu": -5.88,
+        "sa ": -5.88,
+        "per": -5.88,
+        "ela": -5.88,
+        "açã": -5.88,
+        "ção": -5.88,
+        " vo": -5.88,
+        "voc": -5.88,
+        "ocê": -5.88,
+        "cê ": -5.88,
+        "dad": -5.88,
+        "ade": -5.88,
+        "om ": -5.88,
+        "ant": -5.88,
+        "ard": -5.88,
+        "nos": -5.88,
+        "oss": -5.88,
+        "sso": -5.88,
+        "er ": -5.88,
+        "ado": -5.88,
+        "ia ": -5.88,
+        "res": -5.88,
+        "ele": -5.88,
+        "mui": -6.16,
+        "uit": -6.16,
+        "ito": -6.16,
+        "rio": -6.16,
+        "tão": -6.16,
+        " li": -6.16,
+        "ert": -6.16,
+        " ja": -6.16,
+        "la ": -6.16,
+        "ha ": -6.16,
+        "uen": -6.16,
+        "men": -6.16,
+        " ap": -6.16,
+        " ho": -6.16,
+        "hor": -6.16,
+        "ora": -6.16,
+        "ste": -6.16,
+        "ida": -6.16,
+        "gra": -6.16,
+        "nde": -6.16,
+        " an": -6.16,
+        "gos": -6.16,
+        "qua": -6.16,
+        "nto": -6.16,
+        "so ": -6.16,
+        "ien": -6.16,
+        "por": -6.16,
+        "or ": -6.16,
+        "eir": -6.16,
+        "nda": -6.16,
+        " à ": -6.16,
+        " ta": -6.16,
+        "rde": -6.16,
+        " te": -6.16,
+        "eri": -6.16,
+        "con": -6.16,
+        "sse": -6.16,
+        "se ": -6.16,
+        "ual": -6.16,
+        "mas": -6.16,
+        "re ": -6.16,
+        " ao": -6.16,
+        "ou ": -6.16,
+        "esa": -6.16,
+        "ias": -6.16,
+        "çõe": -6.16,
+        "ões": -6.16,
+        "eci": -6.16,
+        "cis": -6.16,
+        "ço ": -6.16,
+        "anh": -6.57,
+        "tav": -6.57,
+        "va ": -6.57,
+        "amo": -6.57,
+        "lem": -6.57,
+        "emo": -6.57,
+        "rto": -6.57,
+        "jan": -6.57,
+        "ane": -6.57,
+        " tr": -6.57,
+        "tra": -6.57,
+        "rab": -6.57,
+        "aba": -6.57,
+        "bal": -6.57,
+        "alh": -6.57,
+        "lha": -6.57,
+        " nu": -6.57,
+        "num": -6.57,
+        "um ": -6.57,
+        "peq": -6.57,
+        "equ": -6.57,
+        "esc": -6.57,
+        "scr": -6.57,
+        "cri": -6.57,
+        "tór": -6.57,
+        "óri": -6.57,
+        "taç": -6.57,
+        "orm": -6.57,
+        "rma": -6.57,
+        "nha": -6.57,
+        "mbo": -6.57,
+        "oio": -6.57,
+        " às": -6.57,
+        "às ": -6.57,
+        "ras": -6.57,
+        " já": -6.57,
+        "já ": -6.57,
+        " é ": -6.57,
+        " ci": -6.57,
+        "tos": -6.57,
+        "rqu": -6.57,
+        "ues": -6.57,
+        "edi": -6.57,
+        "cio": -6.57,
+        "bri": -6.57,
+        "dim": -6.57,
+        "ais": -6.57,
+        "is ": -6.57,
+        "nta": -6.57,
+        " na": -6.57,
+        "na ": -6.57,
+        "dev": -6.57,
+        "vem": -6.57,
+        "pen": -6.57,
+        "sar": -6.57,
+        "ro ": -6.57,
+        "ger": -6.57,
+        "ima": -6.57,
+        "era": -6.57,
+        " fa": -6.57,
+        " fe": -6.57,
+        "fei": -6.57,
+        "ira": -6.57,
+        " fo": -6.57,
+        "ada": -6.57,
+        "seg": -6.57,
+        "egu": -6.57,
+        "iga": -6.57,
+        " aj": -6.57,
+        "aju": -6.57,
+        "jud": -6.57,
+        "uda": -6.57,
+        "oje": -6.57,
+        "ter": -6.57,
+        "min": -6.57,
+        " lo": -6.57,
+        " di": -6.57,
+        "dis": -6.57,
+        "nov": -6.57,
+        "ova": -6.57,
+        "ali": -6.57,
+        "iza": -6.57,
+        "ram": -6.57,
+        "mai": -6.57,
+        " ab": -6.57,
+        "abr": -6.57,
+        "bre": -6.57,
+        "ho ": -6.57,
+        "enh": -6.57,
+        "cer": -6.57,
+        " go": -6.57,
+        "das": -6.57,
+        "apo": -6.57,
+        "poi": -6.57,
+        "ena": -6.57,
+        "emp": -6.57,
+        "mpr": -6.57,
+        "end": -6.57,
+        "há ": -6.57,
+        "chá": -6.57,
+        "ven": -6.57,
+        "stã": -6.57,
+        "des": -6.57,
+        " on": -6.57,
+        "ont": -6.57,
+        "ite": -6.57,
+        "rec": -6.57,
+        "isa": -6.57,
+        "pod": -6.57,
+        "ode": -6.57,
+        " la": -6.57,
+        "ser": -6.57,
+        "erv": -6.57,
+        "rvi": -6.57,
+        "viç": -6.57,
+        "iço": -6.57,
+        "ao ": -6.57,
+        " cl": -6.57,
+        "uas": -6.57,
+        " ai": -6.57,
+        "ain": -6.57,
+        "ind": -6.57,
+        "hei": -6.57,
+        "ocu": -6.57,
+        "dec": -6.57,
+        " to": -6.57,
+        " ve": -6.57,
+        "le ": -6.57,
+        "man": -7.26,
+        "nhã": -7.26,
+        "hã ": -7.26,
+        " fr": -7.26,
+        "fri": -7.26,
+        "ntã": -7.26,
+        " fi": -7.26,
+        "fic": -7.26,
+        "ica": -7.26,
+        "cam": -7.26,
+        " ca": -7.26,
+        "cas": -7.26,
+        "asa": -7.26,
+        " le": -7.26,
+        "liv": -7.26,
+        "ivr": -7.26,
+        "vro": -7.26,
+        "ros": -7.26,
+        "nel": -7.26,
+        "meu": -7.26,
+        "eu ": -7.26,
+        " ir": -7.26,
+        "irm": -7.26,
+        "rmã": -7.26,
+        "mão": -7.26,
+        "eno": -7.26,
+        "rit": -7.26,
+        "itó": -7.26,
+        "nor": -7.26,
+        "mal": -7.26,
+        "alm": -7.26,
+        "lme": -7.26,
+        "apa": -7.26,
+        "pan": -7.26,
+        "omb": -7.26,
+        "boi": -7.26,
+        "set": -7.26,
+        "ete": -7.26,
+        "tev": -7.26,
+        "ve ": -7.26,
+        "lis": -7.26,
+        "isb": -7.26,
+        "sbo": -7.26,
+        "boa": -7.26,
+        "oa ": -7.26,
+        "cid": -7.26,
+        " gr": -7.26,
+        "ran": -7.26,
+        "and": -7.26,
+        "arq": -7.26,
+        "mus": -7.26,
+        "use": -7.26,
+        "seu": -7.26,
+        "eus": -7.26,
+        "us ": -7.26,
+        " ed": -7.26,
+        "dif": -7.26,
+        "ifí": -7.26,
+        "fíc": -7.26,
+        "íci": -7.26,
+        "ios": -7.26,
+        "nti": -7.26,
+        "tig": -7.26,
+        "igo": -7.26,
+        " cr": -7.26,
+        "ian": -7.26,
+        "anç": -7.26,
+        "nça": -7.26,
+        "ças": -7.26,
+        " br": -7.26,
+        "rin": -7.26,
+        "inc": -7.26,
+        "nca": -7.26,
+        "cav": -7.26,
+        "jar": -7.26,
+        "rdi": -7.26,
+        "im ": -7.26,
+        "enq": -7.26,
+        "nqu": -7.26,
+        "uan": -7.26,
+        " os": -7.26,
+        "pai": -7.26,
+        "rep": -7.26,
+        "epa": -7.26,
+        "rav": -7.26,
+        "coz": -7.26,
+        "ozi": -7.26,
+        "zin": -7.26,
+        "inh": -7.26,
+        "ens": -7.26,
+        "nsa": -7.26,
+        " fu": -7.26,
+        "fut": -7.26,
+        "utu": -7.26,
+        "tur": -7.26,
+        "uro": -7.26,
+        " pl": -7.26,
+        "pla": -7.26,
+        "lan": -7.26,
+        "net": -7.26,
+        "eta": -7.26,
+        "rot": -7.26,
+        "ote": -7.26,
+        "teg": -7.26,
+        "ege": -7.26,
+        "mei": -7.26,
+        "eio": -7.26,
+        " am": -7.26,
+        "amb": -7.26,
+        "mbi": -7.26,
+        "bie": -7.26,
+        "pró": -7.26,
+        "róx": -7.26,
+        "óxi": -7.26,
+        "xim": -7.26,
+        " ge": -7.26,
+        "raç": -7.26,
+        "fav": -7.26,
+        "avo": -7.26,
+        "vor": -7.26,
+        "env": -7.26,
+        "nvi": -7.26,
+        "vie": -7.26,
+        "ie ": -7.26,
+        "me ": -7.26,
+        "rel": -7.26,
+        "lat": -7.26,
+        "ató": -7.26,
+        "tes": -7.26,
+        "sex": -7.26,
+        "ext": -7.26,
+        "xta": -7.26,
+        "orq": -7.26,
+        "reu": -7.26,
+        "eun": -7.26,
+        "uni": -7.26,
+        "niã": -7.26,
+        "ião": -7.26,
+        "foi": -7.26,
+        "oi ": -7.26,
+        " ad": -7.26,
+        "adi": -7.26,
+        "dia": -7.26,
+        "iad": -7.26,
+        "gun": -7.26,
+        "und": -7.26,
+        " ob": -7.26,
+        "obr": -7.26,
+        "rig": -7.26,
+        "gad": -7.26,
+        "pel": -7.26,
+        " su": -7.26,
+        "sua": -7.26,
+        "ua ": -7.26,
+        "roj": -7.26,
+        "jet": -7.26,
+        "eto": -7.26,
+        "ons": -7.26,
+        "nse": -7.26,
+        "gui": -7.26,
+        "uid": -7.26,
+        "ido": -7.26,
+        "erm": -7.26,
+        "rmi": -7.26,
+        "iná": -7.26,
+        "ná ": -7.26,
+        "lo ": -7.26,
+        "sem": -7.26,
+        "iss": -7.26,
+        " at": -7.26,
+        "atu": -7.26,
+        "tua": -7.26,
+        "liz": -7.26,
+        "zaç": -7.26,
+        "rog": -7.26,
+        "ogr": -7.26,
+        "ama": -7.26,
+        "eso": -7.26,
+        "sol": -7.26,
+        "olv": -7.26,
+        "lve": -7.26,
+        "aio": -7.26,
+        "ior": -7.26,
+        "ori": -7.26,
+        "rob": -7.26,
+        "obl": -7.26,
+        "ble": -7.26,
+        "ema": -7.26,
+        "red": -7.26,
+        "ede": -7.26,
+        "loj": -7.26,
+        "oja": -7.26,
+        "ja ": -7.26,
+        "aos": -7.26,
+        "dom": -7.26,
+        "omi": -7.26,
+        "ing": -7.26,
+        "ngo": -7.26,
+        " ac": -7.26,
+        "ach": -7.26,
+        "cho": -7.26,
+        "dez": -7.26,
+        "ez ": -7.26,
+        "ten": -7.26,
+        "nho": -7.26,
+        " ce": -7.26,
+        "rte": -7.26,
+        "tez": -7.26,
+        "eza": -7.26,
+        "za ": -7.26,
+        "gov": -7.26,
+        "ove": -7.26,
+        "ern": -7.26,
+        "rno": -7.26,
+        "anu": -7.26,
+        "nun": -7.26,
+        "unc": -7.26,
+        "nci": -7.26,
+        "iou": -7.26,
+        "vas": -7.26,
+        "med": -7.26,
+        "did": -7.26,
+        "oia": -7.26,
+        "iar": -7.26,
+        "nas": -7.26,
+        "sas": -7.26,
+        "fam": -7.26,
+        "amí": -7.26,
+        "míl": -7.26,
+        "íli": -7.26,
+        "lia": -7.26,
+        " ba": -7.26,
+        "bai": -7.26,
+        "aix": -7.26,
+        "ixo": -7.26,
+        "xos": -7.26,
+        "ren": -7.26,
+        "ndi": -7.26,
+        "ime": -7.26,
+        " há": -7.26,
+        "nad": -7.26,
+        "mel": -7.26,
+        "elh": -7.26,
+        "lho": -7.26,
+        "háv": -7.26,
+        "áve": -7.26,
+        "chu": -7.26,
+        "huv": -7.26,
+        "uvo": -7.26,
+        "vos": -7.26,
+        "osa": -7.26,
+        "les": -7.26,
+        "esp": -7.26,
+        "spe": -7.26,
+        "esu": -7.26,
+        "sul": -7.26,
+        "ult": -7.26,
+        "lta": -7.26,
+        "tad": -7.26,
+        "lei": -7.26,
+        "eiç": -7.26,
+        "içõ": -7.26,
+        "esd": -7.26,
+        "sde": -7.26,
+        "tem": -7.26,
+        "noi": -7.26,
+        "oit": -7.26,
+        " in": -7.26,
+        "inf": -7.26,
+        "nfo": -7.26,
+        "for": -7.26,
+        "maç": -7.26,
+        "açõ": -7.26,
+        "enc": -7.26,
+        "nco": -7.26,
+        "ntr": -7.26,
+        "trá": -7.26,
+        "rá ": -7.26,
+        "las": -7.26,
+        " si": -7.26,
+        "sit": -7.26,
+        " ou": -7.26,
+        "lig": -7.26,
+        "gar": -7.26,
+        "cli": -7.26,
+        "lie": -7.26,
+        "emb": -7.26,
+        "bor": -7.26,
+        "fos": -7.26,
+        " ru": -7.26,
+        "rua": -7.26,
+        "che": -7.26,
+        "eia": -7.26,
+        "pes": -7.26,
+        "ess": -7.26,
+        "soa": -7.26,
+        "oas": -7.26,
+        "pas": -7.26,
+        "ass": -7.26,
+        "sea": -7.26,
+        "eav": -7.26,
+        "onv": -7.26,
+        "nve": -7.26,
+        "ers": -7.26,
+        "rsa": -7.26,
+        "sav": -7.26,
+        "al ": -7.26,
+        "tas": -7.26,
+        " du": -7.26,
+        "dua": -7.26,
+        " op": -7.26,
+        "opç": -7.26,
+        "pçõ": -7.26,
+        "ref": -7.26,
+        "efe": -7.26,
+        "fer": -7.26,
+        "ere": -7.26,
+        " tu": -7.26,
+        "tud": -7.26,
+        "udo": -7.26,
+        "dep": -7.26,
+        "epe": -7.26,
+        "reç": -7.26,
+        "eço": -7.26,
+        "lid": -7.26,
+        "roc": -7.26,
+        "cur": -7.26,
+        "ura": -7.26,
+        "eng": -7.26,
+        "nge": -7.26,
+        "gen": -7.26,
+        "nhe": -7.26,
+        "iro": -7.26,
+        " ex": -7.26,
+        "exp": -7.26,
+        "xpe": -7.26,
+    },
+    "ru": {
+        " по": -4.27,
+        "ли ": -4.67,
+        " на": -4.85,
+        "ть ": -4.85,
+        "ом ": -5.08,
+        " бы": -5.08,
+        " до": -5.08,
+        " и ": -5.08,
+        "на ": -5.08,
+        " в ": -5.08,
+        " с ": -5.21,
+        "го ": -5.21,
+        " пр": -5.21,
+        "его": -5.36,
+        "но ": -5.36,
+        "оль": -5.36,
+        " об": -5.36,
+        "то ": -5.36,
+        "али": -5.55,
+        "ет ": -5.55,
+        " не": -5.55,
+        "ов ": -5.55,
+        " эт": -5.55,
+        "ани": -5.55,
+        "ать": -5.55,
+        " се": -5.77,
+        "был": -5.77,
+        "это": -5.77,
+        "мы ": -5.77,
+        "дом": -5.77,
+        " ра": -5.77,
+        "бол": -5.77,
+        "льш": -5.77,
+        " во": -5.77,
+        " ко": -5.77,
+        "ств": -5.77,
+        "ите": -5.77,
+        "тел": -5.77,
+        "ото": -5.77,
+        "не ": -5.77,
+        "ны ": -5.77,
+        " за": -5.77,
+        "ия ": -5.77,
+        "ие ": -5.77,
+        " ва": -5.77,
+        "про": -5.77,
+        " но": -5.77,
+        "ера": -5.77,
+        " вс": -5.77,
+        "ло ": -6.06,
+        " хо": -6.06,
+        "том": -6.06,
+        " мы": -6.06,
+        "ста": -6.06,
+        " мо": -6.06,
+        "ой ": -6.06,
+        "ает": -6.06,
+        "ьшо": -6.06,
+        " ча": -6.06,
+        "ты ": -6.06,
+        "да ": -6.06,
+        " ни": -6.06,
+        " бо": -6.06,
+        " го": -6.06,
+        "тво": -6.06,
+        "тов": -6.06,
+        " уж": -6.06,
+        "ем ": -6.06,
+        "ей ": -6.06,
+        "кол": -6.06,
+        "ени": -6.06,
+        "ния": -6.06,
+        "при": -6.06,
+        "те ": -6.06,
+        " от": -6.06,
+        " чт": -6.06,
+        "что": -6.06,
+        "ние": -6.06,
+        "нес": -6.06,
+        "ель": -6.06,
+        " я ": -6.06,
+        "бы ": -6.06,
+        " он": -6.06,
+        "нов": -6.06,
+        "ави": -6.06,
+        "во ": -6.06,
+        "ки ": -6.06,
+        "чер": -6.06,
+        "они": -6.06,
+        " вы": -6.06,
+        "ам ": -6.06,
+        "пол": -6.06,
+        "всё": -6.06,
+        "сё ": -6.06,
+        "ари": -6.06,
+        "год": -6.46,
+        "одн": -6.46,
+        "ыло": -6.46,
+        "ень": -6.46,
+        "оло": -6.46,
+        "дно": -6.46,
+        "ому": -6.46,
+        "му ": -6.46,
+        "тал": -6.46,
+        " ок": -6.46,
+        "раб": -6.46,
+        "або": -6.46,
+        "бот": -6.46,
+        "ота": -6.46,
+        " ря": -6.46,
+        "ряд": -6.46,
+        "ядо": -6.46,
+        "зал": -6.46,
+        "ало": -6.46,
+        "сем": -6.46,
+        "сов": -6.46,
+        " ты": -6.46,
+        "буд": -6.46,
+        "оск": -6.46,
+        "гор": -6.46,
+        "оро": -6.46,
+        "род": -6.46,
+        " мн": -6.46,
+        "оже": -6.46,
+        "ест": -6.46,
+        " ст": -6.46,
+        "ых ": -6.46,
+        "дан": -6.46,
+        " де": -6.46,
+        "ти ": -6.46,
+        "гра": -6.46,
+        " са": -6.46,
+        "ду ": -6.46,
+        "пок": -6.46,
+        "их ": -6.46,
+        "вил": -6.46,
+        "или": -6.46,
+        "ужи": -6.46,
+        "ин ": -6.46,
+        " ку": -6.46,
+        "дол": -6.46,
+        "олж": -6.46,
+        "лжн": -6.46,
+        "жны": -6.46,
+        " ду": -6.46,
+        "дум": -6.46,
+        "ума": -6.46,
+        " о ": -6.46,
+        "наш": -6.46,
+        "аше": -6.46,
+        "нет": -6.46,
+        "ую ": -6.46,
+        "ред": -6.46,
+        "еду": -6.46,
+        " сл": -6.46,
+        "сле": -6.46,
+        "оле": -6.46,
+        "лен": -6.46,
+        "ятн": -6.46,
+        "ицы": -6.46,
+        "цы ": -6.46,
+        " со": -6.46,
+        "ере": -6.46,
+        "рен": -6.46,
+        "ене": -6.46,
+        "есл": -6.46,
+        "сли": -6.46,
+        "пон": -6.46,
+        "льн": -6.46,
+        "ле ": -6.46,
+        "ое ": -6.46,
+        "пом": -6.46,
+        "омо": -6.46,
+        "эти": -6.46,
+        "им ": -6.46,
+        "кто": -6.46,
+        "ако": -6.46,
+        "ил ": -6.46,
+        " ск": -6.46,
+        "пра": -6.46,
+        "рав": -6.46,
+        "вит": -6.46,
+        "ит ": -6.46,
+        "обл": -6.46,
+        "ью ": -6.46,
+        "ско": -6.46,
+        "льк": -6.46,
+        "ько": -6.46,
+        "ко ": -6.46,
+        " ма": -6.46,
+        "ять": -6.46,
+        "вер": -6.46,
+        " ме": -6.46,
+        "мер": -6.46,
+        "под": -6.46,
+        "одд": -6.46,
+        "дде": -6.46,
+        "дер": -6.46,
+        "ерж": -6.46,
+        "ржк": -6.46,
+        "жки": -6.46,
+        "ого": -6.46,
+        "низ": -6.46,
+        "чег": -6.46,
+        "ая ": -6.46,
+        "ый ": -6.46,
+        " ве": -6.46,
+        "веч": -6.46,
+        "ече": -6.46,
+        "ни ": -6.46,
+        " ре": -6.46,
+        "тат": -6.46,
+        "ра ": -6.46,
+        " ну": -6.46,
+        "нуж": -6.46,
+        "ужн": -6.46,
+        "олн": -6.46,
+        "нит": -6.46,
+        " ин": -6.46,
+        "аци": -6.46,
+        "вы ": -6.46,
+        "айт": -6.46,
+        "поз": -6.46,
+        "ить": -6.46,
+        "слу": -6.46,
+        "луж": -6.46,
+        "хот": -6.46,
+        "уже": -6.46,
+        "же ": -6.46,
+        " ещ": -6.46,
+        "ещё": -6.46,
+        "щё ": -6.46,
+        "кот": -6.46,
+        "тор": -6.46,
+        "оры": -6.46,
+        "раз": -6.46,
+        "ова": -6.46,
+        "вар": -6.46,
+        "ива": -6.46,
+        " ка": -6.46,
+        " дв": -6.46,
+        "от ": -6.46,
+        "обс": -6.46,
+        "уме": -6.46,
+        "нят": -6.46,
+        "нам": -6.46,
+        "опр": -6.46,
+        "сег": -7.16,
+        "дня": -7.16,
+        "ня ": -7.16,
+        " ут": -7.16,
+        "утр": -7.16,
+        "тро": -7.16,
+        "ром": -7.16,
+        " оч": -7.16,
+        "оче": -7.16,
+        "чен": -7.16,
+        "нь ": -7.16,
+        "хол": -7.16,
+        "лод": -7.16,
+        "поэ": -7.16,
+        "оэт": -7.16,
+        " ос": -7.16,
+        "ост": -7.16,
+        "лис": -7.16,
+        "ись": -7.16,
+        "сь ": -7.16,
+        "ома": -7.16,
+        "ма ": -7.16,
+        " чи": -7.16,
+        "чит": -7.16,
+        "ита": -7.16,
+        " кн": -7.16,
+        "кни": -7.16,
+        "ниг": -7.16,
+        "иги": -7.16,
+        "ги ": -7.16,
+        " у ": -7.16,
+        "окн": -7.16,
+        "кна": -7.16,
+        "мой": -7.16,
+        " бр": -7.16,
+        "бра": -7.16,
+        "рат": -7.16,
+        "ат ": -7.16,
+        "тае": -7.16,
+        "неб": -7.16,
+        "ебо": -7.16,
+        "шом": -7.16,
+        " оф": -7.16,
+        "офи": -7.16,
+        "фис": -7.16,
+        "исе": -7.16,
+        "се ": -7.16,
+        "вок": -7.16,
+        "окз": -7.16,
+        "кза": -7.16,
+        "лом": -7.16,
+        "обы": -7.16,
+        "быч": -7.16,
+        "ычн": -7.16,
+        "чно": -7.16,
+        " уе": -7.16,
+        "уез": -7.16,
+        "езж": -7.16,
+        "зжа": -7.16,
+        "жае": -7.16,
+        "пое": -7.16,
+        "оез": -7.16,
+        "езд": -7.16,
+        "зде": -7.16,
+        "де ": -7.16,
+        "емь": -7.16,
+        "мь ": -7.16,
+        "час": -7.16,
+        "асо": -7.16,
+        "ког": -7.16,
+        "огд": -7.16,
+        "гда": -7.16,
+        "ниб": -7.16,
+        "ибу": -7.16,
+        "удь": -7.16,
+        "дь ": -7.16,
+        "ыл ": -7.16,
+        "мос": -7.16,
+        "скв": -7.16,
+        "кве": -7.16,
+        "ве ": -7.16,
+        "шой": -7.16,
+        "од ": -7.16,
+        "мно": -7.16,
+        "нож": -7.16,
+        "жес": -7.16,
+        "вом": -7.16,
+        " па": -7.16,
+        "пар": -7.16,
+        "арк": -7.16,
+        "рко": -7.16,
+        "ков": -7.16,
+        " му": -7.16,
+        "муз": -7.16,
+        "узе": -7.16,
+        "зее": -7.16,
+        "еев": -7.16,
+        "ев ": -7.16,
+        "тар": -7.16,
+        "ары": -7.16,
+        "рых": -7.16,
+        " зд": -7.16,
+        "зда": -7.16,
+        "ний": -7.16,
+        "ий ": -7.16,
+        "дет": -7.16,
+        "ети": -7.16,
+        " иг": -7.16,
+        "игр": -7.16,
+        "рал": -7.16,
+        "сад": -7.16,
+        "аду": -7.16,
+        "ока": -7.16,
+        "ка ": -7.16,
+        " их": -7.16,
+        " ро": -7.16,
+        "оди": -7.16,
+        "дит": -7.16,
+        "ели": -7.16,
+        "гот": -7.16,
+        "ови": -7.16,
+        "жин": -7.16,
+        "кух": -7.16,
+        "ухн": -7.16,
+        "хне": -7.16,
+        "мат": -7.16,
+        " бу": -7.16,
+        "уду": -7.16,
+        "дущ": -7.16,
+        "уще": -7.16,
+        "щем": -7.16,
+        "шей": -7.16,
+        " пл": -7.16,
+        "пла": -7.16,
+        "лан": -7.16,
+        "ане": -7.16,
+        "еты": -7.16,
+        "защ": -7.16,
+        "ащи": -7.16,
+        "щищ": -7.16,
+        "ища": -7.16,
+        "щат": -7.16,
+        "окр": -7.16,
+        "кру": -7.16,
+        "руж": -7.16,
+        "ужа": -7.16,
+        "жаю": -7.16,
+        "ающ": -7.16,
+        "ющу": -7.16,
+        "щую": -7.16,
+        " ср": -7.16,
+        "сре": -7.16,
+        " дл": -7.16,
+        "для": -7.16,
+        "ля ": -7.16,
+        "лед": -7.16,
+        "дую": -7.16,
+        "ующ": -7.16,
+        "юще": -7.16,
+        "щег": -7.16,
+        "око": -7.16,
+        "пож": -7.16,
+        "ожа": -7.16,
+        "жал": -7.16,
+        "алу": -7.16,
+        "луй": -7.16,
+        "уйс": -7.16,
+        "йст": -7.16,
+        "та ": -7.16,
+        "риш": -7.16,
+        "ишл": -7.16,
+        "шли": -7.16,
+        "лит": -7.16,
+        "мне": -7.16,
+        "отч": -7.16,
+        "тчё": -7.16,
+        "чёт": -7.16,
+        "ёт ": -7.16,
+        "до ": -7.16,
+        " пя": -7.16,
+        "пят": -7.16,
+        "тни": -7.16,
+        "ниц": -7.16,
+        "пот": -7.16,
+        "ове": -7.16,
+        "вещ": -7.16,
+        "еща": -7.16,
+        "щан": -7.16,
+        " пе": -7.16,
+        "пер": -7.16,
+        "оне": -7.16,
+        "нед": -7.16,
+        "еде": -7.16,
+        "дел": -7.16,
+        "ьни": -7.16,
+        "ник": -7.16,
+        "ик ": -7.16,
+        "пос": -7.16,
+        "осл": -7.16,
+        "обе": -7.16,
+        "бед": -7.16,
+        "еда": -7.16,
+        "шое": -7.16,
+        " сп": -7.16,
+        "спа": -7.16,
+        "пас": -7.16,
+        "аси": -7.16,
+        "сиб": -7.16,
+        "ибо": -7.16,
+        "бо ": -7.16,
+        "за ": -7.16,
+        "ваш": -7.16,
+        "ашу": -7.16,
+        "шу ": -7.16,
+        "мощ": -7.16,
+        "ощь": -7.16,
+        "щь ": -7.16,
+        "тим": -7.16,
+        "рое": -7.16,
+        "оек": -7.16,
+        "ект": -7.16,
+        " бе": -7.16,
+        "без": -7.16,
+        "ез ": -7.16,
+        "вас": -7.16,
+        "ас ": -7.16,
+        " ег": -7.16,
+        "зак": -7.16,
+        "кон": -7.16,
+        "онч": -7.16,
+        "нчи": -7.16,
+        "чил": -7.16,
+        "она": -7.16,
+        "ска": -7.16,
+        "каз": -7.16,
+        "аза": -7.16,
+        "ала": -7.16,
+        "ла ": -7.16,
+        "ово": -7.16,
+        "вое": -7.16,
+        "обн": -7.16,
+        "бно": -7.16,
+        "овл": -7.16,
+        "вле": -7.16,
+        "рог": -7.16,
+        "огр": -7.16,
+        "рам": -7.16,
+        "амм": -7.16,
+        "ммы": -7.16,
+        " ис": -7.16,
+        "исп": -7.16,
+        "спр": -7.16,
+        "ьши": -7.16,
+        "шин": -7.16,
+        "инс": -7.16,
+        "нст": -7.16,
+        "роб": -7.16,
+        "бле": -7.16,
+        "лем": -7.16,
+        "сет": -7.16,
+        "еть": -7.16,
+        "тью": -7.16,
+        "отк": -7.16,
+        "ткр": -7.16,
+        "кры": -7.16,
+        "рыв": -7.16,
+        "ыва": -7.16,
+        "вае": -7.16,
+        "етс": -7.16,
+        "тся": -7.16,
+        "ся ": -7.16,
+        "маг": -7.16,
+        "ага": -7.16,
+        "газ": -7.16,
+        "ази": -7.16,
+        "зин": -7.16,
+        "вос": -7.16,
+        "скр": -7.16,
+        "кре": -7.16,
+        "рес": -7.16,
+        "есе": -7.16,
+        "сен": -7.16,
+        "нье": -7.16,
+        "ье ": -7.16,
+        "маю": -7.16,
+        "аю ": -7.16,
+        "дес": -7.16,
+        "еся": -7.16,
+        "сят": -7.16,
+        " ув": -7.16,
+        "уве": -7.16,
+        "ен ": -7.16,
+        "льс": -7.16,
+        "ьст": -7.16,
+        "объ": -7.16,
+        "бъя": -7.16,
+        "ъяв": -7.16,
+        "яви": -7.16,
+        "ило": -7.16,
+        "овы": -7.16,
+        "вых": -7.16,
+        "рах": -7.16,
+        "ах ": -7.16,
+        "мал": -7.16,
+        "лог": -7.16,
+        " би": -7.16,
+        "биз": -7.16,
+        "изн": -7.16,
+        "зне": -7.16,
+        "еса": -7.16,
+        "са ": -7.16,
+        "еме": -7.16,
+        "мей": -7.16,
+        "изк": -7.16,
+        "зки": -7.16,
+        "ким": -7.16,
+        "дох": -7.16,
+        "охо": -7.16,
+        "ход": -7.16,
+        "одо": -7.16,
+        "нич": -7.16,
+        "иче": -7.16,
+        " лу": -7.16,
+        "луч": -7.16,
+        "учш": -7.16,
+        "чше": -7.16,
+        "ше ": -7.16,
+        "чаш": -7.16,
+        "ашк": -7.16,
+        "шки": -7.16,
+        "оря": -7.16,
+        "ряч": -7.16,
+        "яче": -7.16,
+        "чая": -7.16,
+        "дож": -7.16,
+        "ожд": -7.16,
+        "ждл": -7.16,
+        "дли": -7.16,
+        "лив": -7.16,
+        "ивы": -7.16,
+        "вый": -7.16,
+        "ер ": -7.16,
+        " жд": -7.16,
+        "жду": -7.16,
+        "дут": -7.16,
+        "ут ": -7.16,
+        "рез": -7.16,
+        "езу": -7.16,
+        "зул": -7.16,
+        "уль": -7.16,
+        "льт": -7.16,
+        "ьта": -7.16,
+        "ато": -7.16,
+    },
+    "uk": {
+        "ти ": -4.44,
+        " на": -4.66,
+        "ого": -4.75,
+        " за": -4.84,
+        " по": -4.84,
+        " до": -4.84,
+        "ми ": -4.95,
+        "го ": -4.95,
+        "ли ": -5.06,
+        "на ": -5.06,
+        "ати": -5.06,
+        "ні ": -5.2,
+        " бу": -5.2,
+        "али": -5.2,
+        " пр": -5.2,
+        "ть ": -5.35,
+        " і ": -5.53,
+        "ки ": -5.53,
+        "ля ": -5.53,
+        " не": -5.53,
+        " із": -5.53,
+        "із ": -5.53,
+        "ува": -5.53,
+        "про": -5.53,
+        "ння": -5.53,
+        "ня ": -5.53,
+        " як": -5.53,
+        " ду": -5.76,
+        "же ": -5.76,
+        "ому": -5.76,
+        "му ": -5.76,
+        "зал": -5.76,
+        " бі": -5.76,
+        "ій ": -5.76,
+        " во": -5.76,
+        "ом ": -5.76,
+        " ве": -5.76,
+        " ма": -5.76,
+        "що ": -5.76,
+        " пі": -5.76,
+        " об": -5.76,
+        " ва": -5.76,
+        " ви": -5.76,
+        "ів ": -5.76,
+        "ват": -5.76,
+        "ці ": -6.05,
+        "бул": -6.05,
+        " хо": -6.05,
+        "том": -6.05,
+        " ми": -6.05,
+        "лис": -6.05,
+        "ся ": -6.05,
+        "біл": -6.05,
+        " ві": -6.05,
+        "пра": -6.05,
+        " о ": -6.05,
+        "оди": -6.05,
+        " ко": -6.05,
+        " це": -6.05,
+        " з ": -6.05,
+        " та": -6.05,
+        "та ": -6.05,
+        "рим": -6.05,
+        "ду ": -6.05,
+        "пок": -6.05,
+        "вал": -6.05,
+        "веч": -6.05,
+        "зах": -6.05,
+        " що": -6.05,
+        "ере": -6.05,
+        " я ": -6.05,
+        "вон": -6.05,
+        "нов": -6.05,
+        "від": -6.05,
+        "але": -6.05,
+        "ий ": -6.05,
+        "чор": -6.05,
+        "ора": -6.05,
+        "ра ": -6.05,
+        "ни ": -6.05,
+        "ам ": -6.05,
+        "се ": -6.05,
+        "ей ": -6.05,
+        " сь": -6.45,
+        "сьо": -6.45,
+        "ьог": -6.45,
+        "год": -6.45,
+        "одн": -6.45,
+        "уло": -6.45,
+        "ло ": -6.45,
+        "дуж": -6.45,
+        "уже": -6.45,
+        "оло": -6.45,
+        "но ": -6.45,
+        " то": -6.45,
+        "ися": -6.45,
+        "дом": -6.45,
+        "ма ": -6.45,
+        "ита": -6.45,
+        "іля": -6.45,
+        " мі": -6.45,
+        "мій": -6.45,
+        "бра": -6.45,
+        "рац": -6.45,
+        "ацю": -6.45,
+        " в ": -6.45,
+        "вел": -6.45,
+        "ели": -6.45,
+        "лик": -6.45,
+        "ком": -6.45,
+        "ало": -6.45,
+        "пот": -6.45,
+        "омі": -6.45,
+        " го": -6.45,
+        "дин": -6.45,
+        " ти": -6.45,
+        "кол": -6.45,
+        " у ": -6.45,
+        "ві ": -6.45,
+        "це ": -6.45,
+        "іст": -6.45,
+        "сто": -6.45,
+        "то ": -6.45,
+        " ба": -6.45,
+        "ага": -6.45,
+        "ать": -6.45,
+        "ами": -6.45,
+        "ями": -6.45,
+        " ст": -6.45,
+        "ими": -6.45,
+        "буд": -6.45,
+        "вля": -6.45,
+        "гра": -6.45,
+        "рал": -6.45,
+        " са": -6.45,
+        "аду": -6.45,
+        "хні": -6.45,
+        "ьки": -6.45,
+        " ку": -6.45,
+        "пов": -6.45,
+        "дум": -6.45,
+        "ума": -6.45,
+        "ро ": -6.45,
+        "бут": -6.45,
+        "наш": -6.45,
+        "ашо": -6.45,
+        "кіл": -6.45,
+        "ног": -6.45,
+        "олі": -6.45,
+        "ска": -6.45,
+        "ка ": -6.45,
+        " ме": -6.45,
+        "мен": -6.45,
+        "до ": -6.45,
+        "иці": -6.45,
+        "ене": -6.45,
+        "нес": -6.45,
+        "нед": -6.45,
+        "еді": -6.45,
+        "діл": -6.45,
+        "дяк": -6.45,
+        "яку": -6.45,
+        "за ": -6.45,
+        "доп": -6.45,
+        "опо": -6.45,
+        "пом": -6.45,
+        " ци": -6.45,
+        "им ": -6.45,
+        " б ": -6.45,
+        "не ": -6.45,
+        "ив ": -6.45,
+        " но": -6.45,
+        "овл": -6.45,
+        "енн": -6.45,
+        "ить": -6.45,
+        "іль": -6.45,
+        "отр": -6.45,
+        "трі": -6.45,
+        "ин ": -6.45,
+        "маю": -6.45,
+        "аю ": -6.45,
+        " ал": -6.45,
+        "ле ": -6.45,
+        "ход": -6.45,
+        "ди ": -6.45,
+        "під": -6.45,
+        "ідт": -6.45,
+        "дтр": -6.45,
+        "три": -6.45,
+        "имк": -6.45,
+        "мки": -6.45,
+        "ізн": -6.45,
+        " ро": -6.45,
+        "ає ": -6.45,
+        "чог": -6.45,
+        " ча": -6.45,
+        "ово": -6.45,
+        "ечо": -6.45,
+        "они": -6.45,
+        "ают": -6.45,
+        "ють": -6.45,
+        " ін": -6.45,
+        "аці": -6.45,
+        "ія ": -6.45,
+        "ви ": -6.45,
+        "айт": -6.45,
+        "ті ": -6.45,
+        "слу": -6.45,
+        "би ": -6.45,
+        " вж": -6.45,
+        "вже": -6.45,
+        "ули": -6.45,
+        " вс": -6.45,
+        " ще": -6.45,
+        "ще ": -6.45,
+        "лял": -6.45,
+        "яли": -6.45,
+        "роз": -6.45,
+        "яки": -6.45,
+        "кий": -6.45,
+        " дв": -6.45,
+        "тів": -6.45,
+        " ус": -6.45,
+        "усе": -6.45,
+        "ід ": -6.45,
+        "гов": -6.45,
+        "анн": -6.45,
+        "ані": -6.45,
+        "юва": -6.45,
+        " пи": -6.45,
+        "нам": -6.45,
+        "дні": -7.14,
+        " вр": -7.14,
+        "вра": -7.14,
+        "ран": -7.14,
+        "анц": -7.14,
+        "нці": -7.14,
+        "хол": -7.14,
+        "лод": -7.14,
+        "дно": -7.14,
+        "лиш": -7.14,
+        "иши": -7.14,
+        "шил": -7.14,
+        "или": -7.14,
+        " вд": -7.14,
+        "вдо": -7.14,
+        "ома": -7.14,
+        " чи": -7.14,
+        "чит": -7.14,
+        "тал": -7.14,
+        " кн": -7.14,
+        "кни": -7.14,
+        "ниж": -7.14,
+        "ижк": -7.14,
+        "жки": -7.14,
+        "вік": -7.14,
+        "ікн": -7.14,
+        "кна": -7.14,
+        " бр": -7.14,
+        "рат": -7.14,
+        "ат ": -7.14,
+        "цює": -7.14,
+        "ює ": -7.14,
+        "нев": -7.14,
+        "еве": -7.14,
+        "ико": -7.14,
+        " оф": -7.14,
+        "офі": -7.14,
+        "фіс": -7.14,
+        "ісі": -7.14,
+        "сі ": -7.14,
+        "пор": -7.14,
+        "ору": -7.14,
+        "руч": -7.14,
+        "уч ": -7.14,
+        "вок": -7.14,
+        "окз": -7.14,
+        "кза": -7.14,
+        "лом": -7.14,
+        "заз": -7.14,
+        "азв": -7.14,
+        "зви": -7.14,
+        "вич": -7.14,
+        "ича": -7.14,
+        "чай": -7.14,
+        "ай ": -7.14,
+        " їд": -7.14,
+        "їде": -7.14,
+        "де ": -7.14,
+        "отя": -7.14,
+        "тяг": -7.14,
+        "яго": -7.14,
+        "гом": -7.14,
+        "ьом": -7.14,
+        "ині": -7.14,
+        "оли": -7.14,
+        "ись": -7.14,
+        "сь ": -7.14,
+        "був": -7.14,
+        "ув ": -7.14,
+        " ки": -7.14,
+        "киє": -7.14,
+        "иєв": -7.14,
+        "єві": -7.14,
+        "ике": -7.14,
+        "ке ": -7.14,
+        "міс": -7.14,
+        "баг": -7.14,
+        "гат": -7.14,
+        "тьм": -7.14,
+        "ьма": -7.14,
+        " па": -7.14,
+        "пар": -7.14,
+        "арк": -7.14,
+        "рка": -7.14,
+        "кам": -7.14,
+        " му": -7.14,
+        "муз": -7.14,
+        "узе": -7.14,
+        "зея": -7.14,
+        "еям": -7.14,
+        "ста": -7.14,
+        "тар": -7.14,
+        "ари": -7.14,
+        "уді": -7.14,
+        "дів": -7.14,
+        "івл": -7.14,
+        "лям": -7.14,
+        " ді": -7.14,
+        "діт": -7.14,
+        "іти": -7.14,
+        " гр": -7.14,
+        "сад": -7.14,
+        "оки": -7.14,
+        " їх": -7.14,
+        "їхн": -7.14,
+        "бат": -7.14,
+        "тьк": -7.14,
+        "гот": -7.14,
+        "оту": -7.14,
+        "тув": -7.14,
+        "ече": -7.14,
+        "чер": -7.14,
+        "ерю": -7.14,
+        "рю ": -7.14,
+        "кух": -7.14,
+        "ухн": -7.14,
+        "ови": -7.14,
+        "вин": -7.14,
+        "инн": -7.14,
+        "нні": -7.14,
+        "мат": -7.14,
+        "май": -7.14,
+        "айб": -7.14,
+        "йбу": -7.14,
+        "утн": -7.14,
+        "тнє": -7.14,
+        "нє ": -7.14,
+        "шої": -7.14,
+        "ої ": -7.14,
+        " пл": -7.14,
+        "пла": -7.14,
+        "лан": -7.14,
+        "ане": -7.14,
+        "нет": -7.14,
+        "ети": -7.14,
+        "ахи": -7.14,
+        "хищ": -7.14,
+        "ища": -7.14,
+        "щат": -7.14,
+        "дов": -7.14,
+        "овк": -7.14,
+        "вкі": -7.14,
+        "ілл": -7.14,
+        "лля": -7.14,
+        " дл": -7.14,
+        "для": -7.14,
+        "нас": -7.14,
+        "аст": -7.14,
+        "сту": -7.14,
+        "туп": -7.14,
+        "упн": -7.14,
+        "пно": -7.14,
+        "око": -7.14,
+        "лін": -7.14,
+        "інн": -7.14,
+        "удь": -7.14,
+        "дь ": -7.14,
+        " ла": -7.14,
+        "лас": -7.14,
+        "аск": -7.14,
+        "над": -7.14,
+        "аді": -7.14,
+        "діш": -7.14,
+        "ішл": -7.14,
+        "шлі": -7.14,
+        "літ": -7.14,
+        "іть": -7.14,
+        "ені": -7.14,
+        " зв": -7.14,
+        "зві": -7.14,
+        "віт": -7.14,
+        "іт ": -7.14,
+        " п ": -7.14,
+        " ят": -7.14,
+        "ятн": -7.14,
+        "тни": -7.14,
+        "ниц": -7.14,
+        "нар": -7.14,
+        "ара": -7.14,
+        "рад": -7.14,
+        " пе": -7.14,
+        "пер": -7.14,
+        "рен": -7.14,
+        "есл": -7.14,
+        "сли": -7.14,
+        "пон": -7.14,
+        "оне": -7.14,
+        "іло": -7.14,
+        "лок": -7.14,
+        "ок ": -7.14,
+        "піс": -7.14,
+        "ісл": -7.14,
+        "сля": -7.14,
+        "обі": -7.14,
+        "бід": -7.14,
+        "іду": -7.14,
+        " дя": -7.14,
+        "кую": -7.14,
+        "ую ": -7.14,
+        "ваш": -7.14,
+        "ашу": -7.14,
+        "шу ": -7.14,
+        "омо": -7.14,
+        "мог": -7.14,
+        "огу": -7.14,
+        "гу ": -7.14,
+        "цим": -7.14,
+        "роє": -7.14,
+        "оєк": -7.14,
+        "єкт": -7.14,
+        "кто": -7.14,
+        " бе": -7.14,
+        "без": -7.14,
+        "ез ": -7.14,
+        "вас": -7.14,
+        "ас ": -7.14,
+        " йо": -7.14,
+        "йог": -7.14,
+        "зак": -7.14,
+        "акі": -7.14,
+        "кін": -7.14,
+        "інч": -7.14,
+        "нчи": -7.14,
+        "чив": -7.14,
+        "она": -7.14,
+        " ск": -7.14,
+        "каз": -7.14,
+        "аза": -7.14,
+        "ала": -7.14,
+        "ла ": -7.14,
+        "ове": -7.14,
+        "ве ": -7.14,
+        " он": -7.14,
+        "оно": -7.14,
+        "вле": -7.14,
+        "лен": -7.14,
+        "рог": -7.14,
+        "огр": -7.14,
+        "рам": -7.14,
+        "вип": -7.14,
+        "ипр": -7.14,
+        "рав": -7.14,
+        "ави": -7.14,
+        "вит": -7.14,
+        "льш": -7.14,
+        "ьші": -7.14,
+        "шіс": -7.14,
+        "сть": -7.14,
+        "роб": -7.14,
+        "обл": -7.14,
+        "бле": -7.14,
+        "лем": -7.14,
+        "ем ": -7.14,
+        "мер": -7.14,
+        "реж": -7.14,
+        "еже": -7.14,
+        "жею": -7.14,
+        "ею ": -7.14,
+        "кот": -7.14,
+        "рій": -7.14,
+        "ідк": -7.14,
+        "дкр": -7.14,
+        "кри": -7.14,
+        "рив": -7.14,
+        "ива": -7.14,
+        "ває": -7.14,
+        "аєт": -7.14,
+        "єть": -7.14,
+        "тьс": -7.14,
+        "ься": -7.14,
+        "маг": -7.14,
+        "газ": -7.14,
+        "ази": -7.14,
+        "зин": -7.14,
+        "ілю": -7.14,
+        "лю ": -7.14,
+        " де": -7.14,
+        "дес": -7.14,
+        "еся": -7.14,
+        "сят": -7.14,
+        "яті": -7.14,
+        "тій": -7.14,
+        " вп": -7.14,
+        "впе": -7.14,
+        "пев": -7.14,
+        "евн": -7.14,
+        "вне": -7.14,
+        "нен": -7.14,
+        "ени": -7.14,
+        "ний": -7.14,
+        " ур": -7.14,
+        "уря": -7.14,
+        "ряд": -7.14,
+        "яд ": -7.14,
+        " ог": -7.14,
+        "гол": -7.14,
+        "лос": -7.14,
+        "оси": -7.14,
+        "сив": -7.14,
+        "ові": -7.14,
+        "ахо": -7.14,
+        "мал": -7.14,
+        "лог": -7.14,
+        "біз": -7.14,
+        "зне": -7.14,
+        "есу": -7.14,
+        "су ": -7.14,
+        "род": -7.14,
+        " ни": -7.14,
+        "низ": -7.14,
+        "изь": -7.14,
+        "зьк": -7.14,
+        "ким": -7.14,
+        "дох": -7.14,
+        "охо": -7.14,
+        "одо": -7.14,
+        "нем": -7.14,
+        "ема": -7.14,
+        "має": -7.14,
+        " ні": -7.14,
+        "ніч": -7.14,
+        "ічо": -7.14,
+        " кр": -7.14,
+        "кра": -7.14,
+        "ращ": -7.14,
+        "ащо": -7.14,
+        "щог": -7.14,
+        "чаш": -7.14,
+        "ашк": -7.14,
+        "шку": -7.14,
+        "ку ": -7.14,
+        " га": -7.14,
+        "гар": -7.14,
+        "аря": -7.14,
+        "ряч": -7.14,
+        "ячо": -7.14,
+        "чаю": -7.14,
+        "дощ": -7.14,
+        "ощо": -7.14,
+        "щов": -7.14,
+        "вог": -7.14,
+        " че": -7.14,
+        "чек": -7.14,
+        "ека": -7.14,
+        "каю": -7.14,
+        " ре": -7.14,
+        "рез": -7.14,
+        "езу": -7.14,
+        "зул": -7.14,
+        "уль": -7.14,
+        "льт": -7.14,
+        "ьта": -7.14,
+        "тат": -7.14,
+        "виб": -7.14,
+        "ибо": -7.14,
+        "бор": -7.14,
+        "орі": -7.14,
+        "рів": -7.14,
+        " уч": -7.14,
+        "учо": -7.14,
+        "раш": -7.14,
+        "ашн": -7.14,
+        "шнь": -7.14,
+        "ньо": -7.14,
+        "якщ": -7.14,
+        "кщо": -7.14,
+        "вам": -7.14,
+        "ріб": -7.14,
+        "ібн": -7.14,
+    },
+}
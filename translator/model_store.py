@@ -0,0 +1,442 @@
+"""
+Хранилище файлов языковых пакетов по содержимому.
+
+Пакеты argostranslate разных пар содержат одинаковые файлы (модели
+sentencepiece, ресурсы stanza), а каждая установка распаковывает их
+заново. Здесь крупные файлы пакета хранятся один раз — в файлах
+blob-<sha256> в папке данных, — а в папки пакетов попадают жёсткие
+ссылки на них. Одинаковые файлы разных пар — это один файл на диске
+и одна копия в кэше страниц ОС.
+
+Папка модели ctranslate2 (model/) при установке не распаковывается:
+архив пакета остаётся рядом (lazy-<пакет>.argosmodel, это та же жёсткая
+ссылка на скачанный файл), а модель извлекается при первой загрузке
+движка (ensure_extracted).
+
+В папке данных хранилище создаёт только файлы, не папки:
+argostranslate считает пакетом любую вложенную папку.
+
+Обслуживание:
+    python -m translator.model_store stats
+    python -m translator.model_store dedupe   # уже установленные пакеты
+    python -m translator.model_store gc       # файлы удалённых пакетов
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import sys
+import threading
+import uuid
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+from .paths import DATA_DIR
+
+# TRANSLATOR_MODEL_STORE=0 — устанавливать пакеты средствами argostranslate
+MODEL_STORE_ENABLED: bool = os.environ.get("TRANSLATOR_MODEL_STORE", "1") != "0"
+
+# Файлы меньше этого размера распаковываются как есть (экономии нет)
+BLOB_MIN_BYTES: int = 64 * 1024
+
+BLOB_PREFIX: str = "blob-"
+LAZY_PREFIX: str = "lazy-"
+# Индекс "crc32-размер -> sha256" файлов в архивах: совпавший файл
+# ссылается на готовый blob без распаковки и хэширования
+INDEX_NAME: str = "blobs.json"
+# Файл в папке пакета: какие файлы ещё лежат только в архиве
+LAZY_MARKER: str = ".lazy.json"
+# Папки пакета, которые распаковываются при первом использовании
+LAZY_DIRS: tuple[str, ...] = ("model/",)
+
+_CHUNK_BYTES: int = 1 << 20
+
+# Распаковка отложенных моделей (внутри процесса — по одной)
+_extract_lock: threading.Lock = threading.Lock()
+
+
+def _member_key(info: zipfile.ZipInfo) -> str:
+    return f"{info.CRC:08x}-{info.file_size}"
+
+
+def _temp_path(path: Path) -> Path:
+    # Временный файл рядом с целевым: os.replace в пределах одной папки атомарен
+    return path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+
+
+def hash_file(path: str | Path) -> str:
+    """
+    sha256 файла через mmap (без чтения файла в память Python).
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                digest.update(data)
+    return digest.hexdigest()
+
+
+class ModelStore:
+    """
+    Файлы пакетов по содержимому в папке данных data_dir.
+
+    Индекс на диске — только ускорение: blob-файл ищется по sha256
+    в имени, а потерянный индекс строится заново при установке.
+    """
+
+    def __init__(self, data_dir: str | Path = DATA_DIR):
+        self.data_dir: Path = Path(data_dir)
+        self._lock: threading.RLock = threading.RLock()
+        self._index: dict[str, str] | None = None
+
+    # ------------------------------------------------------------------
+    # Blob-файлы
+    # ------------------------------------------------------------------
+
+    def blob_path(self, digest: str) -> Path:
+        return self.data_dir / f"{BLOB_PREFIX}{digest}"
+
+    def _load_index(self) -> dict[str, str]:
+        if self._index is None:
+            try:
+                self._index = json.loads(
+                    (self.data_dir / INDEX_NAME).read_text(encoding="utf-8")
+                )
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def _save_index(self) -> None:
+        path: Path = self.data_dir / INDEX_NAME
+        tmp_path: Path = _temp_path(path)
+        tmp_path.write_text(json.dumps(self._load_index()), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _link(blob: Path, target: Path) -> None:
+        """
+        Жёсткая ссылка target на blob (атомарно заменяет target).
+        На файловых системах без жёстких ссылок файл копируется.
+        """
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path: Path = _temp_path(target)
+        try:
+            os.link(blob, tmp_path)
+        except OSError:
+            shutil.copyfile(blob, tmp_path)
+        os.replace(tmp_path, target)
+
+    def _store_member(
+        self,
+        archive: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        target: Path,
+    ) -> None:
+        """
+        Файл архива в blob (если такого содержимого ещё нет) и ссылка на него.
+        """
+        with self._lock:
+            key: str = _member_key(info)
+            digest: str | None = self._load_index().get(key)
+            if digest is not None and self.blob_path(digest).exists():
+                self._link(self.blob_path(digest), target)
+                return
+
+        # Распаковка во временный файл с подсчётом sha256 на лету
+        tmp_path: Path = _temp_path(self.data_dir / BLOB_PREFIX)
+        sha = hashlib.sha256()
+        try:
+            with archive.open(info) as src, open(tmp_path, "wb") as dst:
+                while chunk := src.read(_CHUNK_BYTES):
+                    sha.update(chunk)
+                    dst.write(chunk)
+            blob: Path = self.blob_path(sha.hexdigest())
+            if blob.exists():
+                os.remove(tmp_path)
+            else:
+                os.replace(tmp_path, blob)
+        except BaseException:
+            if tmp_path.exists():
+                os.remove(tmp_path)
+            raise
+        with self._lock:
+            self._load_index()[key] = sha.hexdigest()
+        self._link(blob, target)
+
+    def _extract_member(
+        self,
+        archive: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        target: Path,
+    ) -> None:
+        """
+        Крупный файл — через blob, мелкий — распаковка как есть.
+        """
+        if info.file_size >= BLOB_MIN_BYTES:
+            self._store_member(archive, info, target)
+            return
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with archive.open(info) as src, open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst, _CHUNK_BYTES)
+
+    # ------------------------------------------------------------------
+    # Установка пакетов
+    # ------------------------------------------------------------------
+
+    def install(self, path: str | Path, lazy: bool = True) -> Path:
+        """
+        Установка пакета argostranslate (zip-архива) в папку данных,
+        как argostranslate.package.install_from_path, но с общими
+        blob-файлами. С lazy модель извлекается при первом использовании.
+        Возвращает папку пакета.
+        """
+        path = Path(path)
+        if not zipfile.is_zipfile(path):
+            raise ValueError(f"{path}: это не пакет argostranslate (нужен zip-архив).")
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+
+        with zipfile.ZipFile(path) as archive:
+            members: list[zipfile.ZipInfo] = [
+                info for info in archive.infolist() if not info.is_dir()
+            ]
+            parts: list[tuple[str, ...]] = [
+                PurePosixPath(info.filename).parts for info in members
+            ]
+            roots: set[str] = {item[0] for item in parts}
+            if len(roots) != 1 or any(
+                len(item) < 2 or ".." in item or item[0].startswith("/") for item in parts
+            ):
+                raise ValueError(f"{path}: неожиданная структура пакета.")
+            root: str = roots.pop()
+            package_dir: Path = self.data_dir / root
+            if not any(item[1:] == ("metadata.json",) for item in parts):
+                raise ValueError(f"{path}: в пакете нет metadata.json.")
+
+            # Переустановка: старые файлы (и недораспакованная модель) не нужны
+            if package_dir.exists():
+                shutil.rmtree(package_dir)
+            self._remove_lazy_archive(root)
+
+            pending: dict[str, dict[str, Any]] = {}
+            metadata: zipfile.ZipInfo | None = None
+            for info, item in zip(members, parts):
+                relative: str = "/".join(item[1:])
+                target: Path = package_dir.joinpath(*item[1:])
+                if relative == "metadata.json":
+                    # Последним: без него argostranslate не видит пакет
+                    metadata = info
+                    continue
+                deferred: bool = lazy and relative.startswith(LAZY_DIRS)
+                if deferred and info.file_size >= BLOB_MIN_BYTES:
+                    with self._lock:
+                        digest: str | None = self._load_index().get(_member_key(info))
+                    if digest is not None and self.blob_path(digest).exists():
+                        # Такой файл уже есть: ссылка дешевле отложенной распаковки
+                        self._link(self.blob_path(digest), target)
+                    else:
+                        pending[relative] = {
+                            "name": info.filename,
+                            "size": info.file_size,
+                        }
+                else:
+                    self._extract_member(archive, info, target)
+
+            if pending and not self._keep_archive(path, root):
+                # Архив не удалось оставить рядом — распаковываем сразу
+                for relative, member in pending.items():
+                    self._extract_member(
+                        archive,
+                        archive.getinfo(member["name"]),
+                        package_dir / relative,
+                    )
+                pending = {}
+            if pending:
+                (package_dir / LAZY_MARKER).write_text(
+                    json.dumps(
+                        {"archive": f"{LAZY_PREFIX}{root}.argosmodel", "members": pending}
+                    ),
+                    encoding="utf-8",
+                )
+
+            assert metadata is not None
+            package_dir.mkdir(parents=True, exist_ok=True)
+            self._extract_member(archive, metadata, package_dir / "metadata.json")
+
+        with self._lock:
+            self._save_index()
+        return package_dir
+
+    def _keep_archive(self, path: Path, root: str) -> bool:
+        """
+        Жёсткая ссылка на архив пакета для отложенной распаковки:
+        вызывающий может удалить свой файл, ссылка останется.
+        """
+        try:
+            os.link(path, self.data_dir / f"{LAZY_PREFIX}{root}.argosmodel")
+        except OSError:
+            return False
+        return True
+
+    def _remove_lazy_archive(self, root: str) -> None:
+        try:
+            os.remove(self.data_dir / f"{LAZY_PREFIX}{root}.argosmodel")
+        except FileNotFoundError:
+            pass
+
+    def is_pending(self, package_dir: str | Path) -> bool:
+        """
+        Есть ли у пакета ещё не распакованные файлы.
+        """
+        return (Path(package_dir) / LAZY_MARKER).exists()
+
+    def ensure_extracted(self, package_dir: str | Path) -> None:
+        """
+        Распаковка отложенных файлов пакета (модели ctranslate2) перед
+        первой загрузкой. Для готового пакета — одна проверка stat.
+        """
+        package_dir = Path(package_dir)
+        marker: Path = package_dir / LAZY_MARKER
+        if not marker.exists():
+            return
+        with _extract_lock:
+            try:
+                pending: dict[str, Any] = json.loads(marker.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                # Уже распаковал другой поток или процесс
+                return
+            archive_path: Path = self.data_dir / pending["archive"]
+            with zipfile.ZipFile(archive_path) as archive:
+                for relative, member in pending["members"].items():
+                    target: Path = package_dir / relative
+                    if target.exists() and target.stat().st_size == member["size"]:
+                        continue
+                    self._extract_member(archive, archive.getinfo(member["name"]), target)
+            with self._lock:
+                self._save_index()
+            # Сначала метка, потом архив: прерванная распаковка продолжится
+            try:
+                os.remove(marker)
+            except FileNotFoundError:
+                pass
+            self._remove_lazy_archive(package_dir.name)
+
+    # ------------------------------------------------------------------
+    # Обслуживание
+    # ------------------------------------------------------------------
+
+    def _package_dirs(self) -> list[Path]:
+        if not self.data_dir.exists():
+            return []
+        return [path for path in self.data_dir.iterdir() if path.is_dir()]
+
+    def dedupe(self) -> int:
+        """
+        Перевод уже установленных (в том числе самим argostranslate)
+        пакетов на общие blob-файлы. Возвращает освобождённые байты.
+        """
+        freed: int = 0
+        for package_dir in self._package_dirs():
+            for path in package_dir.rglob("*"):
+                if not path.is_file() or path.is_symlink():
+                    continue
+                stat: os.stat_result = path.stat()
+                # Ссылки на blob уже разделены; мелкие файлы не стоят того
+                if stat.st_size < BLOB_MIN_BYTES or stat.st_nlink > 1:
+                    continue
+                blob: Path = self.blob_path(hash_file(path))
+                if blob.exists():
+                    self._link(blob, path)
+                    freed += stat.st_size
+                else:
+                    try:
+                        os.link(path, blob)
+                    except OSError:
+                        # Без жёстких ссылок разделять нечего
+                        return freed
+        return freed
+
+    def collect_garbage(self) -> int:
+        """
+        Удаление blob-файлов без ссылок из пакетов и архивов удалённых
+        пакетов. Возвращает освобождённые байты.
+        """
+        freed: int = 0
+        if not self.data_dir.exists():
+            return freed
+        with self._lock:
+            for path in self.data_dir.iterdir():
+                if not path.is_file():
+                    continue
+                orphan: bool = False
+                if path.name.startswith(BLOB_PREFIX):
+                    orphan = path.stat().st_nlink <= 1
+                elif path.name.startswith(LAZY_PREFIX):
+                    root: str = path.name[len(LAZY_PREFIX) :].removesuffix(".argosmodel")
+                    orphan = not (self.data_dir / root / LAZY_MARKER).exists()
+                if orphan:
+                    freed += path.stat().st_size
+                    os.remove(path)
+
+            index: dict[str, str] = self._load_index()
+            for key, digest in list(index.items()):
+                if not self.blob_path(digest).exists():
+                    del index[key]
+            self._save_index()
+        return freed
+
+    def stats(self) -> dict[str, int]:
+        """
+        Число и объём blob-файлов, сколько места заняли бы их копии
+        без хранилища и сколько пакетов ждут распаковки модели.
+        """
+        blobs: int = 0
+        blob_bytes: int = 0
+        saved_bytes: int = 0
+        if self.data_dir.exists():
+            for path in self.data_dir.glob(f"{BLOB_PREFIX}*"):
+                stat: os.stat_result = path.stat()
+                blobs += 1
+                blob_bytes += stat.st_size
+                # Сам blob и первая ссылка из пакета — один файл,
+                # каждая следующая ссылка — сэкономленная копия
+                saved_bytes += stat.st_size * max(0, stat.st_nlink - 2)
+        return {
+            "blobs": blobs,
+            "blob_bytes": blob_bytes,
+            "saved_bytes": saved_bytes,
+            "lazy_packages": sum(
+                self.is_pending(package_dir) for package_dir in self._package_dirs()
+            ),
+        }
+
+
+def ensure_extracted(package_dir: str | Path) -> None:
+    """
+    Распаковка отложенной модели пакета (хранилище — родительская папка).
+    """
+    package_dir = Path(package_dir)
+    if (package_dir / LAZY_MARKER).exists():
+        ModelStore(package_dir.parent).ensure_extracted(package_dir)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Хранилище файлов языковых пакетов")
+    parser.add_argument("command", choices=["stats", "dedupe", "gc"])
+    parser.add_argument("--data-dir", default=DATA_DIR, help="папка данных")
+    args = parser.parse_args(argv)
+
+    store: ModelStore = ModelStore(args.data_dir)
+    if args.command == "dedupe":
+        print(f"Освобождено: {store.dedupe() / 2**20:.1f} МБ")
+    elif args.command == "gc":
+        print(f"Освобождено: {store.collect_garbage() / 2**20:.1f} МБ")
+    print(json.dumps(store.stats(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .backends import import_argos
+from .model_store import MODEL_STORE_ENABLED, ModelStore
+from .paths import DATA_DIR
+
+if TYPE_CHECKING:
+    from argostranslate.package import AvailablePackage, Package
+
+PackageKey = tuple[str, str]
+
+# Сколько секунд индекс пакетов с сервера считается свежим
+INDEX_TTL: float = 24 * 60 * 60
+
+
+class PackageRegistry:
+    """
+    Кэш установленных и доступных языковых пакетов.
+
+    Установленные пакеты сканируются один раз и хранятся в словаре
+    по ключу (from_code, to_code). Повторное сканирование происходит только
+    после установки/удаления пакета или если изменился набор пакетов:
+    подпапки и время изменения их metadata.json (один listdir и stat
+    на пакет). mtime самой папки не годится — в ней же лежат кэш
+    переводов, недокачанные архивы, глоссарии и общие файлы моделей.
+
+    Индекс пакетов с сервера хранится на диске и обновляется не чаще
+    раза в INDEX_TTL секунд, с проверкой ETag (ответ 304 не качает индекс заново).
+    """
+
+    def __init__(self, packages_dir: str = DATA_DIR, index_ttl: float = INDEX_TTL):
+        self.packages_dir: str = packages_dir
+        self.index_ttl: float = index_ttl
+        # Общие для пакетов файлы и отложенная распаковка моделей
+        self.store: ModelStore = ModelStore(packages_dir)
+
+        self._lock: threading.RLock = threading.RLock()
+        self._installed: dict[PackageKey, "Package"] | None = None
+        self._installed_signature: frozenset[tuple[str, int]] | None = None
+        self._available: dict[PackageKey, "AvailablePackage"] | None = None
+
+    # ------------------------------------------------------------------
+    # Установленные пакеты
+    # ------------------------------------------------------------------
+
+    def _packages_signature(self) -> frozenset[tuple[str, int]]:
+        """
+        Подпапки пакетов и mtime их metadata.json. Файлы в папке данных
+        (кэш, .part, glossary-*.bin, blob-*) на подпись не влияют.
+        """
+        signature: set[tuple[str, int]] = set()
+        try:
+            entries = list(os.scandir(self.packages_dir))
+        except FileNotFoundError:
+            return frozenset()
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            try:
+                mtime: int = os.stat(os.path.join(entry.path, "metadata.json")).st_mtime_ns
+            except OSError:
+                continue
+            signature.add((entry.name, mtime))
+        return frozenset(signature)
+
+    def _load_installed(self) -> dict[PackageKey, "Package"]:
+        signature: frozenset[tuple[str, int]] = self._packages_signature()
+        if self._installed is None or signature != self._installed_signature:
+            argostranslate = import_argos()
+            self._installed = {
+                (pkg.from_code, pkg.to_code): pkg
+                for pkg in argostranslate.package.get_installed_packages()
+            }
+            self._installed_signature = signature
+        return self._installed
+
+    def get_installed(self, src_lang: str, target_lang: str) -> "Package | None":
+        with self._lock:
+            return self._load_installed().get((src_lang, target_lang))
+
+    def is_installed(self, src_lang: str, target_lang: str) -> bool:
+        return self.get_installed(src_lang, target_lang) is not None
+
+    def installed_pairs(self) -> list[PackageKey]:
+        with self._lock:
+            return list(self._load_installed())
+
+    def invalidate(self) -> None:
+        """
+        Сброс списка установленных пакетов (перечитается при следующем запросе).
+        """
+        with self._lock:
+            self._installed = None
+
+    def install_from_path(self, path: str | Path) -> None:
+        """
+        Установка пакета из архива. Одинаковые файлы разных пакетов
+        хранятся один раз, модель распаковывается при первой загрузке
+        (см. model_store.py).
+        """
+        with self._lock:
+            if MODEL_STORE_ENABLED:
+                self.store.install(path)
+            else:
+                import_argos().package.install_from_path(path)
+            self._installed = None
+
+    def uninstall(self, src_lang: str, target_lang: str) -> None:
+        argostranslate = import_argos()
+        with self._lock:
+            pkg = self.get_installed(src_lang, target_lang)
+            if pkg is not None:
+                argostranslate.package.uninstall(pkg)
+                # Общие файлы, на которые больше никто не ссылается
+                self.store.collect_garbage()
+            self._installed = None
+
+    # ------------------------------------------------------------------
+    # Индекс пакетов на сервере
+    # ------------------------------------------------------------------
+
+    def _index_paths(self) -> tuple[Path, Path, str]:
+        settings: Any = import_argos().settings
+        index_path = Path(settings.local_package_index)
+        meta_path: Path = index_path.with_name(index_path.name + ".meta")
+        return index_path, meta_path, settings.remote_package_index
+
+    def update_index(self, force: bool = False) -> bool:
+        """
+        Обновление индекса пакетов с учётом TTL и ETag.
+        Возвращает True, если индекс на диске изменился.
+        """
+        import requests
+
+        index_path, meta_path, remote_url = self._index_paths()
+        meta: dict[str, Any] = {}
+        if meta_path.exists():
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            except ValueError:
+                meta = {}
+
+        fresh: bool = time.time() - meta.get("fetched_at", 0) < self.index_ttl
+        if index_path.exists() and fresh and not force:
+            return False
+
+        headers: dict[str, str] = {}
+        if index_path.exists() and meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+
+        response = requests.get(remote_url, headers=headers, timeout=(5, 30))
+        changed: bool = response.status_code != 304
+        if changed:
+            response.raise_for_status()
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path: Path = index_path.with_name(index_path.name + ".tmp")
+            tmp_path.write_bytes(response.content)
+            os.replace(tmp_path, index_path)
+            meta["etag"] = response.headers.get("ETag", "")
+
+        meta["fetched_at"] = time.time()
+        meta_path.write_text(json.dumps(meta), encoding="utf-8")
+
+        if changed:
+            with self._lock:
+                self._available = None
+        return changed
+
+    def find_available(
+        self,
+        src_lang: str,
+        target_lang: str,
+    ) -> "AvailablePackage | None":
+        """
+        Поиск пакета для пары языков в индексе (индекс при необходимости обновляется).
+        """
+        self.update_index()
+        with self._lock:
+            if self._available is None:
+                argostranslate = import_argos()
+                self._available = {
+                    (pkg.from_code, pkg.to_code): pkg
+                    for pkg in argostranslate.package.get_available_packages()
+                }
+            return self._available.get((src_lang, target_lang))
+
+
+_registry: PackageRegistry | None = None
+_registry_lock: threading.Lock = threading.Lock()
+
+
+def get_package_registry() -> PackageRegistry:
+    """
+    Возвращает общий на процесс реестр пакетов.
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = PackageRegistry()
+        return _registry
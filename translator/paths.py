@@ -0,0 +1,32 @@
+import os
+import sys
+from pathlib import Path
+
+# 1. Получаем абсолютный путь к папке, где лежит этот скрипт или EXE
+if getattr(sys, "frozen", False):
+    BASE_DIR: str = os.path.dirname(sys.executable)
+else:
+    BASE_DIR: str = Path(os.path.dirname(os.path.abspath(__file__))).parent.as_posix()
+
+# 2. Формируем путь к папке "translation_data" рядом со скриптом.
+# Именно здесь будут храниться гигабайты нейросетевых моделей.
+DATA_DIR: str = os.path.join(BASE_DIR, "translation_data")
+
+
+def ensure_data_dir() -> str:
+    """
+    Создаёт папку DATA_DIR, если её ещё нет, и возвращает путь к ней.
+    """
+    os.makedirs(DATA_DIR, exist_ok=True)
+    return DATA_DIR
+
+
+def configure_argos() -> str:
+    """
+    Направляет argostranslate в DATA_DIR.
+    Вызывать ДО импорта argostranslate: он читает переменные окружения
+    в момент инициализации.
+    """
+    ensure_data_dir()
+    os.environ["ARGOS_PACKAGES_DIR"] = DATA_DIR
+    return DATA_DIR
@@ -0,0 +1,59 @@
+import threading
+from collections import OrderedDict
+
+SegmentKey = tuple[str, str, str]
+
+
+class SegmentMemory:
+    """
+    Память переводов отдельных предложений для одного переводчика.
+
+    Хранит соответствие "предложение -> перевод" для каждой пары языков,
+    чтобы при повторном переводе отредактированного текста отправлять
+    в модель только изменившиеся предложения.
+    """
+
+    def __init__(self, max_segments: int = 20_000):
+        self.max_segments: int = max_segments
+        self._items: OrderedDict[SegmentKey, str] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def lookup(
+        self,
+        src_lang: str,
+        target_lang: str,
+        segments: list[str],
+    ) -> dict[str, str]:
+        """
+        Возвращает известные переводы для переданных предложений.
+        """
+        found: dict[str, str] = {}
+        with self._lock:
+            for segment in segments:
+                key: SegmentKey = (src_lang, target_lang, segment)
+                translation: str | None = self._items.get(key)
+                if translation is not None:
+                    self._items.move_to_end(key)
+                    found[segment] = translation
+        return found
+
+    def update(
+        self,
+        src_lang: str,
+        target_lang: str,
+        translations: dict[str, str],
+    ) -> None:
+        """
+        Запоминает переводы предложений, вытесняя самые старые записи.
+        """
+        with self._lock:
+            for segment, translation in translations.items():
+                key: SegmentKey = (src_lang, target_lang, segment)
+                self._items[key] = translation
+                self._items.move_to_end(key)
+            while len(self._items) > self.max_segments:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
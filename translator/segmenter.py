@@ -0,0 +1,254 @@
+"""
+Разбиение текста на предложения.
+
+По умолчанию используется быстрый сегментатор на регулярных выражениях
+с правилами для каждого языка (сокращения, инициалы, знаки конца
+предложения в китайском и японском). Правила компилируются один раз на
+язык. Сегментатор stanza точнее, но его загрузка занимает секунды и
+сотни МБ памяти, поэтому он включается только явно:
+TRANSLATOR_SEGMENTER=stanza. Если stanza или её модели для языка нет,
+используется регулярный сегментатор.
+"""
+
+import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from typing import Any
+
+# Сегмент — пара (текст предложения, разделитель после него).
+# Склеив все пары подряд, получаем исходный текст без изменений.
+Segment = tuple[str, str]
+
+SEGMENTER_MODES: tuple[str, ...] = ("regex", "stanza")
+# Переменная окружения с сегментатором по умолчанию (читается при каждом
+# вызове, чтобы её могли задать CLI и процессы пула)
+SEGMENTER_ENV: str = "TRANSLATOR_SEGMENTER"
+
+# Перевод строки — граница сегмента при любом сегментаторе
+_NEWLINE_PATTERN: str = r"[ \t]*\n\s*"
+_NEWLINE_RE: re.Pattern[str] = re.compile(_NEWLINE_PATTERN)
+
+# Граница сегмента: перевод строки или пробелы после конца предложения
+# (в том числе после закрывающей кавычки или скобки).
+_SEPARATOR_PATTERN: str = (
+    _NEWLINE_PATTERN
+    + r"|(?<=[.!?…])[ \t]+"
+    + r"|(?<=[.!?…][\"'»”)\]])[ \t]+"
+)
+# В китайском и японском предложения не разделяются пробелами
+_CJK_SEPARATOR_PATTERN: str = (
+    _SEPARATOR_PATTERN
+    + r"|(?<=[。！？])(?![」』”）])[ \t]*"
+    + r"|(?<=[。！？][」』”）])[ \t]*"
+)
+_CJK_LANGUAGES: frozenset[str] = frozenset({"zh", "zt", "ja"})
+
+# Сокращения, после точки в которых предложение не заканчивается
+# (в нижнем регистре, без последней точки)
+_ABBREVIATIONS: dict[str, str] = {
+    "en": "mr mrs ms dr prof sr jr st mt vs etc e.g i.e cf al approx inc ltd "
+    "co corp dept fig vol jan feb mar apr jun jul aug sep sept oct nov dec",
+    "ru": "г гг в вв т.е т.д т.п т.к т.н др пр им ул д кв стр см рис табл "
+    "проф акад доц тыс млн млрд руб коп напр",
+    "de": "z.b usw bzw d.h u.a vgl nr str ca dr prof hr fr evtl ggf",
+    "fr": "m mm mme mlle dr p.ex etc cf av env",
+    "es": "sr sra srta dr dra ud uds etc p.ej",
+    "it": "sig sigg dott ecc es",
+    "pt": "sr sra dr dra etc ex",
+}
+# Символы перед сокращением, которые к нему не относятся
+_OPENING_CHARS: str = "\"'«“([„"
+
+
+class Segmenter(ABC):
+    """
+    Разбиение текста на сегменты (предложение + разделитель после него).
+    """
+
+    # Имя сегментатора (для замеров и ключа кэша)
+    name: str = ""
+
+    @abstractmethod
+    def split(self, text: str) -> list[Segment]:
+        pass
+
+
+def _split_at(text: str, spans: list[tuple[int, int]]) -> list[Segment]:
+    """
+    Сегменты по отсортированным непересекающимся позициям разделителей.
+    """
+    segments: list[Segment] = []
+    pos: int = 0
+    for start, end in spans:
+        segments.append((text[pos:start], text[start:end]))
+        pos = end
+    if pos < len(text) or not segments:
+        segments.append((text[pos:], ""))
+    return segments
+
+
+class RegexSegmenter(Segmenter):
+    """
+    Сегментатор на регулярных выражениях с правилами языка.
+
+    Точка не считается концом предложения после известного сокращения,
+    после инициала ("А. С. Пушкин") и если следующее слово начинается
+    со строчной буквы.
+    """
+
+    name = "regex"
+
+    def __init__(self, lang: str | None = None):
+        self.lang: str | None = lang
+        self._separator_re: re.Pattern[str] = re.compile(
+            _CJK_SEPARATOR_PATTERN if lang in _CJK_LANGUAGES else _SEPARATOR_PATTERN
+        )
+        self._abbreviations: frozenset[str] = frozenset(
+            _ABBREVIATIONS.get(lang or "", "").split()
+        )
+
+    def _is_boundary(self, text: str, start: int, end: int, pos: int) -> bool:
+        """
+        Настоящий ли конец предложения у разделителя text[start:end].
+        """
+        if start == end or "\n" in text[start:end] or end == len(text):
+            return True
+        last: str = text[start - 1]
+        if last not in ".…":
+            return True
+        # Продолжение со строчной буквы — это не новое предложение
+        if text[end].islower():
+            return False
+        if last != ".":
+            return True
+
+        word_start: int = start - 1
+        while word_start > pos and not text[word_start - 1].isspace():
+            word_start -= 1
+        word: str = text[word_start : start - 1].lstrip(_OPENING_CHARS)
+        if len(word) == 1 and word.isalpha() and word.isupper():
+            return False
+        return word.lower() not in self._abbreviations
+
+    def split(self, text: str) -> list[Segment]:
+        spans: list[tuple[int, int]] = []
+        pos: int = 0
+        for match in self._separator_re.finditer(text):
+            start, end = match.span()
+            if self._is_boundary(text, start, end, pos):
+                spans.append((start, end))
+                pos = end
+        return _split_at(text, spans)
+
+
+class StanzaSegmenter(Segmenter):
+    """
+    Сегментатор на модели stanza из установленного пакета argostranslate
+    (так же разбивает текст сам argostranslate). Точнее регулярного,
+    но загружается секунды и занимает сотни МБ.
+    """
+
+    name = "stanza"
+
+    def __init__(self, lang: str):
+        import stanza
+
+        self.lang: str = lang
+        self._pipeline: Any = stanza.Pipeline(
+            lang=lang,
+            dir=self._model_dir(lang),
+            processors="tokenize",
+            use_gpu=False,
+            logging_level="WARNING",
+        )
+        # Один конвейер stanza не рассчитан на вызовы из нескольких потоков
+        self._lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def _model_dir(lang: str) -> str:
+        from .package_registry import get_package_registry
+
+        registry = get_package_registry()
+        for src_lang, target_lang in registry.installed_pairs():
+            if src_lang != lang:
+                continue
+            pkg = registry.get_installed(src_lang, target_lang)
+            model_dir: str = os.path.join(str(pkg.package_path), "stanza")
+            if os.path.isdir(model_dir):
+                return model_dir
+        raise FileNotFoundError(f"Нет модели stanza для языка {lang}.")
+
+    def split(self, text: str) -> list[Segment]:
+        with self._lock:
+            document = self._pipeline(text)
+
+        # Промежутки между предложениями и переводы строк внутри них
+        spans: list[tuple[int, int]] = []
+        pos: int = 0
+        for sentence in document.sentences:
+            start: int = sentence.tokens[0].start_char
+            if start > pos or (pos and start == pos):
+                spans.append((pos, start))
+            pos = sentence.tokens[-1].end_char
+        if pos < len(text):
+            spans.append((pos, len(text)))
+        spans.extend(match.span() for match in _NEWLINE_RE.finditer(text))
+        spans.sort()
+
+        merged: list[tuple[int, int]] = []
+        for start, end in spans:
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return _split_at(text, merged)
+
+
+_segmenters: dict[tuple[str | None, str], Segmenter] = {}
+_segmenters_lock: threading.Lock = threading.Lock()
+
+
+def get_segmenter(lang: str | None = None, mode: str | None = None) -> Segmenter:
+    """
+    Сегментатор для языка (создаётся один раз на процесс).
+    mode — "regex" или "stanza" (по умолчанию из TRANSLATOR_SEGMENTER).
+    """
+    mode = mode or os.environ.get(SEGMENTER_ENV) or "regex"
+    if mode not in SEGMENTER_MODES:
+        raise ValueError(f"Неизвестный сегментатор: {mode}")
+    if lang == "auto":
+        lang = None
+    key: tuple[str | None, str] = (lang, mode)
+    segmenter: Segmenter | None = _segmenters.get(key)
+    if segmenter is not None:
+        return segmenter
+
+    with _segmenters_lock:
+        segmenter = _segmenters.get(key)
+        if segmenter is None:
+            if mode == "stanza" and lang is not None:
+                try:
+                    segmenter = StanzaSegmenter(lang)
+                except (ImportError, FileNotFoundError):
+                    segmenter = None
+            if segmenter is None:
+                segmenter = _segmenters.get((lang, "regex")) or RegexSegmenter(lang)
+                _segmenters[(lang, "regex")] = segmenter
+            _segmenters[key] = segmenter
+        return segmenter
+
+
+def split_segments(text: str, lang: str | None = None) -> list[Segment]:
+    """
+    Разбиение текста на предложения с сохранением разделителей.
+    lang — исходный язык (правила сегментатора зависят от языка).
+    """
+    return get_segmenter(lang).split(text)
+
+
+def join_segments(segments: list[Segment]) -> str:
+    """
+    Обратная операция к split_segments.
+    """
+    return "".join(body + separator for body, separator in segments)
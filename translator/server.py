@@ -0,0 +1,420 @@
+"""
+Локальный HTTP-сервис перевода (JSON API).
+
+Запуск:
+    python -m translator.server --host 127.0.0.1 --port 8080
+
+Запросы:
+    POST /translate  {"text": "...", "src": "en", "target": "ru", "mode": "offline"}
+                     {"texts": ["...", "..."], ...}
+    GET  /health
+    GET  /metrics    (формат Prometheus)
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from .engine import AutoEngine, TranslatorEngine, get_engine_pool, load_engine
+from .stage_timing import StageTimer, get_stage_metrics
+
+BatchKey = tuple[str, str, str]
+EngineFactory = Callable[[str, str, str], TranslatorEngine]
+
+# Максимальный размер тела запроса (байт)
+MAX_BODY_SIZE: int = 1024 * 1024
+
+_REASONS: dict[int, str] = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class _PooledOfflineEngine(TranslatorEngine):
+    """
+    Offline-движок, который на каждый пакет одалживается из общего пула.
+    """
+
+    def __init__(self, src_lang: str, target_lang: str):
+        self.src: str = src_lang
+        self.target: str = target_lang
+
+    def translate_batch(self, segments: list[str]) -> list[str]:
+        with get_engine_pool().borrow(self.src, self.target) as engine:
+            return engine.translate_batch(segments)
+
+
+def default_engine_factory(
+    mode: str,
+    src_lang: str,
+    target_lang: str,
+) -> TranslatorEngine:
+    if mode == "offline":
+        if src_lang == "auto":
+            return AutoEngine(
+                target_lang, lambda lang: _PooledOfflineEngine(lang, target_lang)
+            )
+        return _PooledOfflineEngine(src_lang, target_lang)
+    return load_engine(mode, src_lang, target_lang)
+
+
+class ServerMetrics:
+    """
+    Счётчики сервиса для /metrics.
+    """
+
+    def __init__(self):
+        self.requests: int = 0
+        self.texts: int = 0
+        self.deduplicated: int = 0
+        self.rejected: int = 0
+        self.errors: int = 0
+        self.batches: int = 0
+        self.batched_texts: int = 0
+        self.latency_seconds: float = 0.0
+        self.in_flight: int = 0
+
+    def to_prometheus(self) -> str:
+        lines: list[str] = []
+        for name, kind, value in (
+            ("requests_total", "counter", self.requests),
+            ("texts_total", "counter", self.texts),
+            ("deduplicated_total", "counter", self.deduplicated),
+            ("rejected_total", "counter", self.rejected),
+            ("errors_total", "counter", self.errors),
+            ("batches_total", "counter", self.batches),
+            ("batched_texts_total", "counter", self.batched_texts),
+            ("request_latency_seconds_sum", "counter", self.latency_seconds),
+            ("in_flight_texts", "gauge", self.in_flight),
+        ):
+            lines.append(f"# TYPE translator_{name} {kind}")
+            lines.append(f"translator_{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+class MicroBatcher:
+    """
+    Собирает тексты одновременных запросов одной пары языков в один пакет.
+
+    Первый текст открывает окно длиной window секунд; всё, что пришло за
+    это время (но не больше max_batch текстов), переводится одним вызовом
+    движка. Одинаковые тексты, уже находящиеся в работе, не дублируются.
+    """
+
+    def __init__(
+        self,
+        engine_factory: EngineFactory,
+        executor: ThreadPoolExecutor,
+        metrics: ServerMetrics,
+        window: float = 0.01,
+        max_batch: int = 64,
+    ):
+        self.engine_factory: EngineFactory = engine_factory
+        self.executor: ThreadPoolExecutor = executor
+        self.metrics: ServerMetrics = metrics
+        self.window: float = window
+        self.max_batch: int = max_batch
+
+        self._engines: dict[BatchKey, TranslatorEngine] = {}
+        self._engines_lock: threading.Lock = threading.Lock()
+        self._queues: dict[BatchKey, list[str]] = {}
+        self._in_flight: dict[tuple[BatchKey, str], asyncio.Future[str]] = {}
+        self._flush_tasks: dict[BatchKey, asyncio.Task[None]] = {}
+        # Цикл событий хранит на задачи лишь слабые ссылки
+        self._batch_tasks: set[asyncio.Task[None]] = set()
+
+    def _get_engine(self, key: BatchKey) -> TranslatorEngine:
+        # Вызывается из потоков пула: движок создаётся один раз на пару
+        with self._engines_lock:
+            engine = self._engines.get(key)
+            if engine is None:
+                engine = self.engine_factory(*key)
+                self._engines[key] = engine
+            return engine
+
+    def submit(self, key: BatchKey, text: str) -> asyncio.Future[str]:
+        future = self._in_flight.get((key, text))
+        if future is not None:
+            self.metrics.deduplicated += 1
+            return future
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[(key, text)] = future
+        queue: list[str] = self._queues.setdefault(key, [])
+        queue.append(text)
+
+        if len(queue) >= self.max_batch:
+            # Пакет полон: забираем его сразу, следующие тексты (даже
+            # из того же запроса) открывают новый пакет
+            task = self._flush_tasks.pop(key, None)
+            if task is not None:
+                task.cancel()
+            batch_task = asyncio.ensure_future(self._run_batch(key, self._queues.pop(key)))
+            self._batch_tasks.add(batch_task)
+            batch_task.add_done_callback(self._batch_tasks.discard)
+        elif key not in self._flush_tasks:
+            self._flush_tasks[key] = asyncio.ensure_future(self._flush(key))
+        return future
+
+    def _translate(self, key: BatchKey, texts: list[str]) -> list[str]:
+        """
+        Перевод пакета в потоке пула с замером стадий (см. /metrics).
+        """
+        timer = StageTimer("server", mode=key[0], src=key[1], target=key[2])
+        try:
+            with timer.span("model_load"):
+                engine: TranslatorEngine = self._get_engine(key)
+            return engine.translate_texts(texts, timer)
+        finally:
+            get_stage_metrics().record(timer)
+
+    async def _flush(self, key: BatchKey) -> None:
+        """
+        Перевод пакета по окончании окна сбора.
+        """
+        await asyncio.sleep(self.window)
+        self._flush_tasks.pop(key, None)
+        texts: list[str] = self._queues.pop(key, [])
+        if texts:
+            await self._run_batch(key, texts)
+
+    async def _run_batch(self, key: BatchKey, texts: list[str]) -> None:
+        self.metrics.batches += 1
+        self.metrics.batched_texts += len(texts)
+        loop = asyncio.get_running_loop()
+        try:
+            translations: list[str] = await loop.run_in_executor(
+                self.executor,
+                lambda: self._translate(key, texts),
+            )
+        except Exception as e:
+            for text in texts:
+                future = self._in_flight.pop((key, text))
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for text, translation in zip(texts, translations):
+            future = self._in_flight.pop((key, text))
+            if not future.done():
+                future.set_result(translation)
+
+
+class TranslationServer:
+    """
+    asyncio HTTP-сервер поверх движков перевода.
+    """
+
+    def __init__(
+        self,
+        engine_factory: EngineFactory = default_engine_factory,
+        window: float = 0.01,
+        max_batch: int = 64,
+        max_pending: int = 1024,
+        threads: int = 2,
+    ):
+        """
+        max_pending — сколько текстов может ждать перевода одновременно;
+        сверх этого новые запросы получают 503 (backpressure), а запрос,
+        в котором текстов больше max_pending, — 413 (его не пропустят никогда).
+        """
+        self.max_pending: int = max_pending
+        self.metrics: ServerMetrics = ServerMetrics()
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=threads)
+        self.batcher: MicroBatcher = MicroBatcher(
+            engine_factory, self.executor, self.metrics, window, max_batch
+        )
+
+    async def translate(self, payload: dict) -> tuple[int, dict]:
+        texts: list[str] | None
+        if isinstance(payload.get("texts"), list):
+            texts = payload["texts"]
+        elif isinstance(payload.get("text"), str):
+            texts = [payload["text"]]
+        else:
+            texts = None
+        if texts is None or not all(isinstance(text, str) for text in texts):
+            return 400, {"error": "Ожидается поле text (строка) или texts (список строк)"}
+
+        key: BatchKey = (
+            str(payload.get("mode", "offline")).lower(),
+            str(payload.get("src", "en")),
+            str(payload.get("target", "ru")),
+        )
+        if key[0] not in ("offline", "online"):
+            return 400, {"error": f"Неизвестный режим перевода: {key[0]}"}
+
+        if len(texts) > self.max_pending:
+            self.metrics.rejected += 1
+            return 413, {
+                "error": f"Слишком много текстов в запросе (не больше {self.max_pending})"
+            }
+        if self.metrics.in_flight + len(texts) > self.max_pending:
+            self.metrics.rejected += 1
+            return 503, {"error": "Сервис перегружен, повторите запрос позже"}
+
+        self.metrics.texts += len(texts)
+        self.metrics.in_flight += len(texts)
+        try:
+            translations: list[str] = await asyncio.gather(
+                *(self.batcher.submit(key, text) for text in texts)
+            )
+        except Exception as e:
+            self.metrics.errors += 1
+            return 500, {"error": str(e)}
+        finally:
+            self.metrics.in_flight -= len(texts)
+
+        if "texts" in payload:
+            return 200, {"translations": translations}
+        return 200, {"translation": translations[0]}
+
+    async def _handle_request(
+        self,
+        method: str,
+        path: str,
+        body: bytes,
+    ) -> tuple[int, str, bytes]:
+        if path == "/health":
+            return 200, "application/json", b'{"status": "ok"}'
+        if path == "/metrics":
+            text: str = self.metrics.to_prometheus() + get_stage_metrics().to_prometheus()
+            return 200, "text/plain; version=0.0.4", text.encode()
+        if path != "/translate":
+            return 404, "application/json", b'{"error": "not found"}'
+        if method != "POST":
+            return 405, "application/json", b'{"error": "method not allowed"}'
+
+        try:
+            payload = json.loads(body or b"{}")
+            if not isinstance(payload, dict):
+                raise ValueError
+        except ValueError:
+            return 400, "application/json", b'{"error": "invalid json"}'
+
+        started: float = time.perf_counter()
+        self.metrics.requests += 1
+        status, response = await self.translate(payload)
+        self.metrics.latency_seconds += time.perf_counter() - started
+        return status, "application/json", json.dumps(response, ensure_ascii=False).encode()
+
+    async def handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """
+        Обработка одного соединения (поддерживается keep-alive).
+        """
+        try:
+            while True:
+                request_line: bytes = await reader.readline()
+                if not request_line:
+                    break
+                parts: list[str] = request_line.decode("latin-1").split()
+                if len(parts) != 3:
+                    break
+                method, path, _ = parts
+
+                headers: dict[str, str] = {}
+                while True:
+                    line: bytes = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive: bool = headers.get("connection", "").lower() != "close"
+                try:
+                    length: int = int(headers.get("content-length", "0") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    # Где кончается тело, неизвестно — соединение закрываем
+                    status, content_type, body = (
+                        400, "application/json", b'{"error": "invalid content-length"}'
+                    )
+                    keep_alive = False
+                elif length > MAX_BODY_SIZE:
+                    status, content_type, body = (
+                        413, "application/json", b'{"error": "payload too large"}'
+                    )
+                    keep_alive = False
+                else:
+                    request_body: bytes = await reader.readexactly(length) if length else b""
+                    try:
+                        status, content_type, body = await self._handle_request(
+                            method.upper(), path.split("?", 1)[0], request_body
+                        )
+                    except Exception as e:
+                        self.metrics.errors += 1
+                        status, content_type = 500, "application/json"
+                        body = json.dumps({"error": str(e)}, ensure_ascii=False).encode()
+
+                head: list[str] = [
+                    f"HTTP/1.1 {status} {_REASONS.get(status, '')}",
+                    f"Content-Type: {content_type}; charset=utf-8",
+                    f"Content-Length: {len(body)}",
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}",
+                ]
+                if status == 503:
+                    head.append("Retry-After: 1")
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str, port: int) -> asyncio.Server:
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    async def serve_forever(self, host: str, port: int) -> None:
+        server: asyncio.Server = await self.start(host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m translator.server",
+        description="Локальный HTTP-сервис перевода.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--window", type=float, default=0.01, help="окно сбора пакета (секунды)"
+    )
+    parser.add_argument("--max-batch", type=int, default=64)
+    parser.add_argument("--max-pending", type=int, default=1024)
+    parser.add_argument("--threads", type=int, default=2, help="потоков инференса")
+    args = parser.parse_args(argv)
+
+    server = TranslationServer(
+        window=args.window,
+        max_batch=args.max_batch,
+        max_pending=args.max_pending,
+        threads=args.threads,
+    )
+    print(f"Сервис перевода: http://{args.host}:{args.port}", file=sys.stderr)
+    try:
+        asyncio.run(server.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+# Файл, в который дописывается JSON-строка на каждый перевод (пусто — не пишем)
+TIMING_LOG_ENV: str = "TRANSLATOR_TIMING_LOG"
+# Файл метрик в формате Prometheus, записываемый при закрытии программы
+TIMING_PROMETHEUS_ENV: str = "TRANSLATOR_TIMING_PROM"
+
+# Названия стадий для строки состояния
+STAGE_TITLES: dict[str, str] = {
+    "package_check": "проверка пакета",
+    "index_update": "индекс пакетов",
+    "download": "скачивание",
+    "install": "установка",
+    "model_load": "загрузка модели",
+    "split": "разбиение",
+    "langid": "определение языка",
+    "memory_lookup": "память",
+    "fuzzy_lookup": "память переводов",
+    "glossary": "глоссарий",
+    "inference": "нейросеть",
+    "http": "Google",
+    "hedge_online": "гонка: Google",
+    "hedge_offline": "гонка: нейросеть",
+    "join": "сборка",
+}
+
+
+class Span:
+    """
+    Замер одной стадии: длительность и объём обработанного текста.
+    """
+
+    def __init__(self, name: str, chars: int = 0, segments: int = 0):
+        self.name: str = name
+        self.chars: int = chars
+        self.segments: int = segments
+        self.seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "stage": self.name,
+            "seconds": self.seconds,
+            "chars": self.chars,
+            "segments": self.segments,
+        }
+
+
+class StageTimer:
+    """
+    Замеры стадий одного перевода (проверка пакета, загрузка модели,
+    разбиение, инференс, запрос к Google и т.д.).
+
+    Одна стадия может встречаться несколько раз (например, инференс
+    каждого пакета предложений) — в сводке такие замеры складываются.
+    Замеры пишутся из одного потока, поэтому блокировки не нужны.
+    """
+
+    def __init__(self, operation: str = "translate", **labels: str):
+        self.operation: str = operation
+        self.labels: dict[str, str] = labels
+        self.spans: list[Span] = []
+        self.started: float = time.time()
+        self._started_perf: float = time.perf_counter()
+        self.total_seconds: float = 0.0
+
+    @contextmanager
+    def span(self, name: str, chars: int = 0, segments: int = 0) -> Iterator[Span]:
+        """
+        Замер стадии. Счётчики можно дописать в span внутри блока.
+        """
+        span = Span(name, chars, segments)
+        started: float = time.perf_counter()
+        try:
+            yield span
+        finally:
+            span.seconds = time.perf_counter() - started
+            self.spans.append(span)
+
+    def stop(self) -> None:
+        """
+        Фиксация общего времени перевода.
+        """
+        self.total_seconds = time.perf_counter() - self._started_perf
+
+    def totals(self) -> "OrderedDict[str, Span]":
+        """
+        Замеры, сложенные по стадиям (в порядке первого появления).
+        """
+        totals: OrderedDict[str, Span] = OrderedDict()
+        for span in self.spans:
+            total: Span | None = totals.get(span.name)
+            if total is None:
+                total = totals[span.name] = Span(span.name)
+            total.seconds += span.seconds
+            total.chars += span.chars
+            total.segments += span.segments
+        return totals
+
+    def summary(self, limit: int = 3) -> str:
+        """
+        Короткая строка для строки состояния: общее время и самые долгие стадии.
+        """
+        slowest: list[Span] = sorted(
+            self.totals().values(), key=lambda span: span.seconds, reverse=True
+        )[:limit]
+        stages: str = ", ".join(
+            f"{STAGE_TITLES.get(span.name, span.name)} {span.seconds:.2f}"
+            for span in slowest
+            if span.seconds >= 0.005
+        )
+        text: str = f"{self.total_seconds:.2f} с"
+        return f"{text} ({stages})" if stages else text
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "operation": self.operation,
+            "labels": self.labels,
+            "started": self.started,
+            "total_seconds": self.total_seconds,
+            "spans": [span.to_dict() for span in self.spans],
+        }
+
+
+class StageMetrics:
+    """
+    Сводка замеров стадий по всем переводам процесса.
+
+    Суммы хранятся по (операция, стадия) и выгружаются в формате
+    Prometheus; последние переводы целиком можно выгрузить JSON-строками.
+    Если задан log_path, каждый перевод сразу дописывается в этот файл.
+    """
+
+    def __init__(self, log_path: str | None = None, keep_recent: int = 1000):
+        self.log_path: str | None = log_path
+        self.recent: deque[dict[str, Any]] = deque(maxlen=keep_recent)
+
+        self._lock: threading.Lock = threading.Lock()
+        self._operations: dict[str, list[float]] = {}
+        # (операция, стадия) -> [число замеров, секунды, символы, предложения]
+        self._stages: dict[tuple[str, str], list[float]] = {}
+
+    def record(self, timer: StageTimer) -> None:
+        if not timer.total_seconds:
+            timer.stop()
+        data: dict[str, Any] = timer.to_dict()
+        with self._lock:
+            self.recent.append(data)
+            operation: list[float] = self._operations.setdefault(
+                timer.operation, [0, 0.0]
+            )
+            operation[0] += 1
+            operation[1] += timer.total_seconds
+            for span in timer.totals().values():
+                stage: list[float] = self._stages.setdefault(
+                    (timer.operation, span.name), [0, 0.0, 0, 0]
+                )
+                stage[0] += 1
+                stage[1] += span.seconds
+                stage[2] += span.chars
+                stage[3] += span.segments
+            if self.log_path:
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(data, ensure_ascii=False) + "\n")
+
+    def export_jsonl(self, path: str) -> int:
+        """
+        Запись последних переводов JSON-строками. Возвращает их число.
+        """
+        with self._lock:
+            lines: list[str] = [
+                json.dumps(data, ensure_ascii=False) for data in self.recent
+            ]
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(line + "\n" for line in lines)
+        return len(lines)
+
+    def to_prometheus(self) -> str:
+        lines: list[str] = []
+        with self._lock:
+            lines.append("# TYPE translator_operation_seconds summary")
+            for name, (count, seconds) in sorted(self._operations.items()):
+                labels: str = f'operation="{name}"'
+                lines.append(f"translator_operation_seconds_count{{{labels}}} {count}")
+                lines.append(f"translator_operation_seconds_sum{{{labels}}} {seconds}")
+
+            lines.append("# TYPE translator_stage_seconds summary")
+            for (operation, stage), (count, seconds, _, _) in sorted(
+                self._stages.items()
+            ):
+                labels = f'operation="{operation}",stage="{stage}"'
+                lines.append(f"translator_stage_seconds_count{{{labels}}} {count}")
+                lines.append(f"translator_stage_seconds_sum{{{labels}}} {seconds}")
+
+            for index, metric in ((2, "chars"), (3, "segments")):
+                lines.append(f"# TYPE translator_stage_{metric}_total counter")
+                for (operation, stage), values in sorted(self._stages.items()):
+                    if values[index]:
+                        labels = f'operation="{operation}",stage="{stage}"'
+                        lines.append(
+                            f"translator_stage_{metric}_total{{{labels}}} {values[index]}"
+                        )
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str, extra: str = "") -> None:
+        """
+        Запись в текстовый файл (для textfile-коллектора node_exporter).
+        extra — дополнительные метрики, дописываемые после сводки стадий.
+        """
+        tmp_path: str = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus() + extra)
+        os.replace(tmp_path, path)
+
+
+_metrics: StageMetrics | None = None
+_metrics_lock: threading.Lock = threading.Lock()
+
+
+def get_stage_metrics() -> StageMetrics:
+    """
+    Возвращает общую на процесс сводку замеров.
+    Путь к JSONL-журналу берётся из переменной окружения TRANSLATOR_TIMING_LOG.
+    """
+    global _metrics
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = StageMetrics(os.environ.get(TIMING_LOG_ENV) or None)
+        return _metrics
@@ -0,0 +1,213 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+from .paths import DATA_DIR, ensure_data_dir
+
+# Имя файла базы кэша внутри DATA_DIR
+CACHE_DB_NAME: str = "translation_cache.sqlite3"
+
+
+def normalize_text(text: str) -> str:
+    """
+    Нормализация текста перед хэшированием: одинаковые по смыслу строки
+    (разные переводы строк, пробелы по краям, формы Unicode) дают один ключ.
+    """
+    text = unicodedata.normalize("NFC", text)
+    return text.replace("\r\n", "\n").replace("\r", "\n").strip()
+
+
+def restore_edges(text: str, translation: str) -> str:
+    """
+    Перевод из кэша с пробелами и переводами строк по краям text: в ключе
+    кэша края не учитываются, а в результате должны быть как у запроса.
+    """
+    if not text.strip():
+        return text
+    leading: str = text[: len(text) - len(text.lstrip())]
+    trailing: str = text[len(text.rstrip()) :]
+    return leading + translation.strip() + trailing
+
+
+def make_cache_key(
+    translator_name: str,
+    src_lang: str,
+    target_lang: str,
+    text: str,
+) -> str:
+    """
+    Ключ кэша: (имя переводчика, исходный язык, целевой язык, хэш текста).
+    """
+    digest: str = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+    return f"{translator_name}|{src_lang}|{target_lang}|{digest}"
+
+
+class TranslationCache:
+    """
+    Двухуровневый кэш готовых переводов.
+
+    Первый уровень — ограниченный LRU-словарь в памяти.
+    Второй — SQLite-база в DATA_DIR, которая переживает перезапуск программы.
+    Для каждой записи хранится время создания, чтобы поддерживать TTL
+    (нужен online-переводу, где результат со временем может измениться).
+    """
+
+    def __init__(
+        self,
+        db_path: str | None = None,
+        memory_size: int = 512,
+        disk_max_entries: int = 100_000,
+    ):
+        """
+        db_path — путь к базе (None — только кэш в памяти).
+        memory_size — сколько записей держать в памяти.
+        disk_max_entries — сколько записей держать в базе.
+        """
+        self.memory_size: int = memory_size
+        self.disk_max_entries: int = disk_max_entries
+        self.hits: int = 0
+        self.misses: int = 0
+
+        self._memory: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+        self._puts_since_prune: int = 0
+
+        self._db: sqlite3.Connection | None = None
+        if db_path is not None:
+            # Запись результата идёт из рабочего потока, чтение — из GUI
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            # В WAL чтение из GUI не ждёт, пока рабочий поток допишет
+            # результат, а запись не ждёт читающих
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                " key TEXT PRIMARY KEY,"
+                " translation TEXT NOT NULL,"
+                " created REAL NOT NULL,"
+                " accessed REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_translations_accessed"
+                " ON translations (accessed)"
+            )
+            self._db.commit()
+
+    def _remember(self, key: str, translation: str, created: float) -> None:
+        self._memory[key] = (translation, created)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str, ttl: float | None = None) -> str | None:
+        """
+        Поиск перевода по ключу. Устаревшие (старше ttl секунд) записи удаляются.
+        """
+        now: float = time.time()
+        with self._lock:
+            item: tuple[str, float] | None = self._memory.get(key)
+            if item is not None:
+                self._memory.move_to_end(key)
+            elif self._db is not None:
+                row = self._db.execute(
+                    "SELECT translation, created FROM translations WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None:
+                    item = (row[0], row[1])
+                    self._db.execute(
+                        "UPDATE translations SET accessed = ? WHERE key = ?",
+                        (now, key),
+                    )
+                    self._db.commit()
+                    self._remember(key, *item)
+
+            if item is not None and ttl is not None and now - item[1] > ttl:
+                self._delete(key)
+                item = None
+
+            if item is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return item[0]
+
+    def put(self, key: str, translation: str) -> None:
+        """
+        Сохранение перевода в память и в базу.
+        """
+        now: float = time.time()
+        with self._lock:
+            self._remember(key, translation, now)
+            if self._db is None:
+                return
+            self._db.execute(
+                "INSERT OR REPLACE INTO translations"
+                " (key, translation, created, accessed) VALUES (?, ?, ?, ?)",
+                (key, translation, now, now),
+            )
+            self._db.commit()
+
+            # Чистим базу не на каждую запись, а пачками
+            self._puts_since_prune += 1
+            if self._puts_since_prune >= 100:
+                self._puts_since_prune = 0
+                self._prune()
+
+    def _delete(self, key: str) -> None:
+        self._memory.pop(key, None)
+        if self._db is not None:
+            self._db.execute("DELETE FROM translations WHERE key = ?", (key,))
+            self._db.commit()
+
+    def _prune(self) -> None:
+        """
+        Удаление давно не использованных записей сверх лимита базы.
+        """
+        assert self._db is not None
+        (count,) = self._db.execute("SELECT COUNT(*) FROM translations").fetchone()
+        excess: int = count - self.disk_max_entries
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM translations WHERE key IN ("
+                " SELECT key FROM translations ORDER BY accessed LIMIT ?)",
+                (excess,),
+            )
+            self._db.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM translations")
+                self._db.commit()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Счётчики попаданий и промахов.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "memory_entries": len(self._memory),
+            }
+
+
+_cache: TranslationCache | None = None
+_cache_lock: threading.Lock = threading.Lock()
+
+
+def get_translation_cache() -> TranslationCache:
+    """
+    Возвращает общий кэш переводов (база создаётся в DATA_DIR при первом обращении).
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            ensure_data_dir()
+            _cache = TranslationCache(os.path.join(DATA_DIR, CACHE_DB_NAME))
+        return _cache
@@ -1,20 +1,146 @@
 from abc import ABC, abstractmethod
 
+from .glossary import Glossary, default_glossary, load_glossary
+from .segment_memory import SegmentMemory
+from .translation_cache import (
+    TranslationCache,
+    get_translation_cache,
+    make_cache_key,
+    restore_edges,
+)
 from .worker import TranslatorWorker
 
 
 class Translator(ABC):
-    def __init__(self, name: str, languages: dict[str, str]):
+    # Время жизни записи в кэше (секунды), None — бессрочно
+    cache_ttl: float | None = None
+
+    def __init__(
+        self,
+        name: str,
+        languages: dict[str, str],
+        cache: TranslationCache | None = None,
+    ):
         self.source_index: int = 0
         self.target_index: int = 0
         self.languages: dict[str, str] = languages
         self.name: str = name
+        self.cache: TranslationCache = (
+            cache if cache is not None else get_translation_cache()
+        )
+        # Переводы отдельных предложений для инкрементального перевода
+        self.segment_memory: SegmentMemory = SegmentMemory()
+        # Глоссарий терминов (по умолчанию — из TRANSLATOR_GLOSSARY)
+        self.glossary: Glossary | None = default_glossary()
+
+    def warm_up(self) -> None:
+        """
+        Подготовка переводчика в фоне (импорт библиотек, загрузка моделей).
+        Вызывается из WarmupWorker после показа окна.
+        """
+        pass
+
+    def to_prometheus(self) -> str:
+        """
+        Собственные метрики переводчика в формате Prometheus (если есть).
+        """
+        return ""
+
+    @property
+    def cache_name(self) -> str:
+        """
+        Имя переводчика в ключах кэша (переводы разных настроек не смешиваются).
+        """
+        return self.name
+
+    def set_glossary(self, path: str | None) -> None:
+        """
+        Глоссарий для следующих переводов (None — без глоссария).
+        Автомат строится один раз и кэшируется на диске.
+        """
+        self.glossary = load_glossary(path) if path else None
+
+    def _cache_key(self, text: str, src_lang: str, target_lang: str) -> str:
+        name: str = self.cache_name
+        if self.glossary is not None:
+            name += f"+{self.glossary.digest[:16]}"
+        return make_cache_key(name, src_lang, target_lang, text)
+
+    def _new_worker(self, text: str, src_lang: str, target_lang: str) -> TranslatorWorker:
+        worker: TranslatorWorker = self._create_worker(text, src_lang, target_lang)
+        worker.glossary = self.glossary
+        return worker
+
+    def get_cached(
+        self,
+        text: str,
+        src_lang: str,
+        target_lang: str,
+    ) -> str | None:
+        """
+        Готовый перевод из кэша или None, если его там нет.
+        Пробелы и переводы строк по краям берутся из text.
+        """
+        key: str = self._cache_key(text, src_lang, target_lang)
+        cached: str | None = self.cache.get(key, self.cache_ttl)
+        return restore_edges(text, cached) if cached is not None else None
 
-    @abstractmethod
     def run_translator_worker(
         self,
         text: str,
         src_lang: str,
         target_lang: str,
+        live: bool = False,
+    ) -> TranslatorWorker:
+        """
+        Создаёт поток перевода. Успешный результат попадёт в кэш.
+        live — перевод при вводе: текст ещё набирается, поэтому результат
+        не кэшируется, а последнее незаконченное предложение не запоминается.
+        """
+        worker: TranslatorWorker = self._new_worker(text, src_lang, target_lang)
+        if live:
+            worker.memorize_tail = False
+        else:
+            key: str = self._cache_key(text, src_lang, target_lang)
+            worker.finished.connect(lambda result: self.cache.put(key, result))
+        return worker
+
+    def run_document_worker(
+        self,
+        input_path: str,
+        output_path: str,
+        src_lang: str,
+        target_lang: str,
+    ) -> TranslatorWorker:
+        """
+        Создаёт поток перевода файла документа (HTML, SRT, Markdown).
+        Сигнал finished получит путь к переведённому файлу; в кэш текстов
+        результат не попадает, но переводы предложений запоминаются.
+        """
+        worker: TranslatorWorker = self._new_worker("", src_lang, target_lang)
+        worker.document = (input_path, output_path)
+        return worker
+
+    def run_text_file_worker(
+        self,
+        path: str,
+        src_lang: str,
+        target_lang: str,
+    ) -> TranslatorWorker:
+        """
+        Создаёт поток перевода большого текстового файла, загруженного
+        в поле ввода. Поток читает сам файл (а не копию текста из поля),
+        перевод приходит только сигналами partial и в кэш не попадает.
+        """
+        worker: TranslatorWorker = self._new_worker("", src_lang, target_lang)
+        worker.text_path = path
+        return worker
+
+    @abstractmethod
+    def _create_worker(
+        self,
+        text: str,
+        src_lang: str,
+        target_lang: str,
     ) -> TranslatorWorker:
         pass
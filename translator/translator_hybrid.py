@@ -0,0 +1,56 @@
+from .hedging import Hedger
+from .translator_offline import TranslatorOffline
+from .translator_online import TranslatorOnline
+from .worker import (
+    TranslatorWorker,
+    TranslatorWorkerHybrid,
+)
+
+
+class TranslatorHybrid(TranslatorOffline):
+    """
+    Online и offline наперегонки: запрос уходит в бэкенд, который сейчас
+    быстрее, а если он не ответил за p90 своих последних ответов — ещё
+    и во второй. Языки и профили — как у offline-переводчика.
+    """
+
+    # В результатах может быть перевод Google, поэтому срок — как у online
+    cache_ttl: float | None = TranslatorOnline.cache_ttl
+
+    def __init__(self, online_url: str | None = None):
+        """
+        online_url — адрес сервера online-перевода (None — Google),
+        например локальная заглушка для замеров.
+        """
+        super().__init__(name="Hybrid")
+        self.online_url: str | None = online_url
+        # Статистика задержек общая для всех переводов этого переводчика
+        self.hedger: Hedger = Hedger()
+
+    def warm_up(self) -> None:
+        """
+        Подготовка обоих бэкендов.
+        """
+        super().warm_up()
+        from .engine.online_engine import get_http_session
+
+        get_http_session()
+
+    def to_prometheus(self) -> str:
+        return self.hedger.to_prometheus()
+
+    def _create_worker(
+        self,
+        text: str,
+        src_lang: str,
+        target_lang: str,
+    ) -> TranslatorWorker:
+        return TranslatorWorkerHybrid(
+            text,
+            src_lang,
+            target_lang,
+            segment_memory=self.segment_memory,
+            profile=self.profile,
+            hedger=self.hedger,
+            online_url=self.online_url,
+        )
@@ -1,4 +1,8 @@
 from . import Translator
+from .backends import import_argos
+from .engine.offline_profiles import DEFAULT_PROFILE
+from .inference_host import INFERENCE_HOST_ENABLED, get_host_client
+from .segment_memory import SegmentMemory
 from .worker import (
     TranslatorWorker,
     TranslatorWorkerOffline,
@@ -6,19 +10,61 @@ from .worker import (
 
 
 class TranslatorOffline(Translator):
-    def __init__(self):
+    def __init__(self, name: str = "Offline"):
         super().__init__(
-            name="Offline",
+            name=name,
+            # Автоопределение — локальное, по каждому предложению (см. langid)
             languages={
+                "Автоопределение": "auto",
                 "Английский": "en",
                 "Русский": "ru",
             },
         )
+        # Профиль offline-движка (fast, quality, ...) и память предложений
+        # для каждого профиля: переводы разного качества не смешиваются
+        self.profile: str = DEFAULT_PROFILE
+        self._memories: dict[str, SegmentMemory] = {self.profile: self.segment_memory}
 
-    def run_translator_worker(
+    @property
+    def cache_name(self) -> str:
+        return f"{self.name}:{self.profile}"
+
+    def set_profile(self, profile: str) -> None:
+        """
+        Смена профиля offline-движка для следующих переводов.
+        """
+        self.profile = profile
+        self.segment_memory = self._memories.setdefault(profile, SegmentMemory())
+
+    @staticmethod
+    def import_backends() -> None:
+        """
+        Импорт argostranslate и ctranslate2 (самая долгая часть первого перевода).
+        """
+        import_argos()
+        import ctranslate2  # noqa: F401
+        import sentencepiece  # noqa: F401
+
+    def warm_up(self) -> None:
+        """
+        Подготовка offline-перевода: в отдельном процессе, если он включён,
+        иначе — в процессе GUI.
+        """
+        if INFERENCE_HOST_ENABLED:
+            get_host_client().warm_up()
+        else:
+            self.import_backends()
+
+    def _create_worker(
         self,
         text: str,
         src_lang: str,
         target_lang: str,
     ) -> TranslatorWorker:
-        return TranslatorWorkerOffline(text, src_lang, target_lang)
+        return TranslatorWorkerOffline(
+            text,
+            src_lang,
+            target_lang,
+            segment_memory=self.segment_memory,
+            profile=self.profile,
+        )
@@ -6,6 +6,9 @@ from .worker import (
 
 
 class TranslatorOnline(Translator):
+    # Google может обновить перевод, поэтому online-кэш живёт неделю
+    cache_ttl: float | None = 7 * 24 * 60 * 60
+
     def __init__(self):
         super().__init__(
             name="Online",
@@ -20,10 +23,23 @@ class TranslatorOnline(Translator):
             },
         )
 
-    def run_translator_worker(
+    def warm_up(self) -> None:
+        """
+        Импорт requests/bs4 и создание keep-alive сессии.
+        """
+        from .engine.online_engine import get_http_session
+
+        get_http_session()
+
+    def _create_worker(
         self,
         text: str,
         src_lang: str,
         target_lang: str,
     ) -> TranslatorWorker:
-        return TranslatorWorkerOnline(text, src_lang, target_lang)
+        return TranslatorWorkerOnline(
+            text,
+            src_lang,
+            target_lang,
+            segment_memory=self.segment_memory,
+        )
@@ -1,9 +1,19 @@
+from .cancellation import CancellationToken, TranslationCancelled
+from .translation_scheduler import TranslationScheduler, get_scheduler
 from .translator_worker import TranslatorWorker
+from .translator_worker_hybrid import TranslatorWorkerHybrid
 from .translator_worker_offline import TranslatorWorkerOffline
 from .translator_worker_online import TranslatorWorkerOnline
+from .warmup_worker import WarmupWorker
 
 __all__ = [
+    "CancellationToken",
+    "TranslationCancelled",
+    "TranslationScheduler",
     "TranslatorWorker",
+    "TranslatorWorkerHybrid",
     "TranslatorWorkerOnline",
     "TranslatorWorkerOffline",
+    "WarmupWorker",
+    "get_scheduler",
 ]
@@ -0,0 +1,30 @@
+import threading
+
+
+class TranslationCancelled(Exception):
+    """
+    Перевод отменён (пользователем или более новым запросом).
+    """
+
+    pass
+
+
+class CancellationToken:
+    """
+    Флаг кооперативной отмены: рабочий поток сам проверяет его
+    между пакетами предложений и прекращает работу.
+    """
+
+    def __init__(self):
+        self._event: threading.Event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise TranslationCancelled()
@@ -0,0 +1,110 @@
+import threading
+
+from PySide6.QtCore import QRunnable, QThreadPool
+
+from .translator_worker import TranslatorWorker
+
+# Вид (окно, панель), к которому относится задание, если не указан явно
+DEFAULT_VIEW: str = "main"
+
+
+class _WorkerRunnable(QRunnable):
+    def __init__(self, scheduler: "TranslationScheduler", worker: TranslatorWorker):
+        super().__init__()
+        self.scheduler: "TranslationScheduler" = scheduler
+        self.worker: TranslatorWorker = worker
+
+    def run(self) -> None:
+        try:
+            self.worker.run()
+        finally:
+            self.scheduler._on_done(self)
+
+
+class TranslationScheduler:
+    """
+    Планировщик заданий перевода поверх переиспользуемого пула потоков.
+
+    Для каждого вида (view) актуально только последнее задание:
+    новое задание отменяет предыдущее (latest-request-wins), а отменённое
+    задание прекращает работу на ближайшей проверке CancellationToken.
+    Завершённые задания сразу убираются из планировщика, поэтому за долгую
+    сессию не накапливаются потоки и объекты.
+    """
+
+    def __init__(self, max_threads: int = 2):
+        self.pool: QThreadPool = QThreadPool()
+        self.pool.setMaxThreadCount(max_threads)
+
+        self._lock: threading.Lock = threading.Lock()
+        self._latest: dict[str, TranslatorWorker] = {}
+        # Держим ссылки на задания, пока они в пуле
+        self._running: set[_WorkerRunnable] = set()
+
+    def submit(
+        self,
+        worker: TranslatorWorker,
+        view: str = DEFAULT_VIEW,
+    ) -> TranslatorWorker:
+        """
+        Постановка задания в очередь. Предыдущее задание того же вида отменяется.
+        """
+        runnable = _WorkerRunnable(self, worker)
+        with self._lock:
+            previous: TranslatorWorker | None = self._latest.get(view)
+            if previous is not None:
+                previous.cancel()
+            self._latest[view] = worker
+            self._running.add(runnable)
+        self.pool.start(runnable)
+        return worker
+
+    def cancel(self, view: str = DEFAULT_VIEW) -> None:
+        """
+        Отмена текущего задания вида.
+        """
+        with self._lock:
+            worker: TranslatorWorker | None = self._latest.pop(view, None)
+        if worker is not None:
+            worker.cancel()
+
+    def current(self, view: str = DEFAULT_VIEW) -> TranslatorWorker | None:
+        with self._lock:
+            return self._latest.get(view)
+
+    def active_count(self) -> int:
+        with self._lock:
+            return len(self._running)
+
+    def _on_done(self, runnable: _WorkerRunnable) -> None:
+        with self._lock:
+            self._running.discard(runnable)
+            for view, worker in list(self._latest.items()):
+                if worker is runnable.worker:
+                    del self._latest[view]
+
+    def shutdown(self, timeout_ms: int = 5000) -> bool:
+        """
+        Отмена всех заданий и ожидание их завершения (при закрытии окна).
+        """
+        with self._lock:
+            workers: list[TranslatorWorker] = [r.worker for r in self._running]
+            self._latest.clear()
+        for worker in workers:
+            worker.cancel()
+        return self.pool.waitForDone(timeout_ms)
+
+
+_scheduler: TranslationScheduler | None = None
+_scheduler_lock: threading.Lock = threading.Lock()
+
+
+def get_scheduler() -> TranslationScheduler:
+    """
+    Возвращает общий планировщик заданий перевода.
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = TranslationScheduler()
+        return _scheduler
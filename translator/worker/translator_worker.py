@@ -1,64 +1,459 @@
-# Библиотека для выполнения HTTP-запросов (нужна для скачивания моделей)
-# Импортируем базовые классы для многопоточности в Qt
-from PySide6.QtCore import QThread, Signal
+import mmap
+import os
+from collections import Counter
+from collections.abc import Callable, Iterator
 
+# Импортируем базовые классы для связи с GUI через сигналы Qt
+from PySide6.QtCore import QObject, Signal
 
-class TranslatorWorker(QThread):
+from ..fuzzy_memory import FuzzyMemory, get_fuzzy_memory
+from ..glossary import Glossary, ProtectedBatch
+from ..langid import get_language_identifier
+from ..segment_memory import SegmentMemory
+from ..segmenter import Segment, join_segments, split_segments
+from ..stage_timing import StageTimer, get_stage_metrics
+from .cancellation import CancellationToken, TranslationCancelled
+
+
+class TranslatorWorker(QObject):
     """
     Класс-рабочий (Worker), который выполняется в отдельном потоке.
 
     Зачем это нужно:
     Если выполнять перевод в основном потоке,
     интерфейс программы "зависнет" и перестанет отвечать на клики.
-    QThread позволяет выполнять тяжелые задачи фоном.
+    Задание запускается в общем пуле потоков (см. TranslationScheduler),
+    а результат возвращается в GUI через сигналы.
     """
 
+    # Сколько предложений переводится между проверками отмены
+    segments_per_batch: int = 32
+    # Размер первого пакета: маленький, чтобы начало перевода появилось
+    # сразу; следующие пакеты растут вдвое до segments_per_batch
+    first_batch_segments: int = 4
+
+    # Размер части текстового файла, переводимой за раз (байты)
+    file_chunk_bytes: int = 1 << 20
+
+    # Запоминать ли перевод последнего, незаконченного предложения.
+    # В режиме перевода при вводе оно меняется с каждой буквой и только
+    # засоряло бы память предложений
+    memorize_tail: bool = True
+
     # Сигналы (Signals) — это способ связи фонового потока с главным окном.
     finished = Signal(str)  # Отправляет готовый текст перевода
     error = Signal(str)  # Отправляет текст ошибки, если она случилась
     status = Signal(str)  # Отправляет статус (например, "Скачивание...")
     progress_val = Signal(int)  # Отправляет процент загрузки (0-100)
     progress_visible = Signal(bool)  # Говорит, нужно ли показывать полосу загрузки
+    cancelled = Signal()  # Задание отменено, результата не будет
+    # Готовый кусок перевода: индекс предложения и его перевод с разделителем.
+    # Приходят строго по порядку, склейка всех кусков равна результату finished
+    partial = Signal(int, str)
 
     def __init__(
         self,
         text: str,
         src_lang: str,
         target_lang: str,
+        segment_memory: SegmentMemory | None = None,
     ):
         """
         Инициализация потока. Принимает параметры для перевода.
+        segment_memory — память уже переведённых предложений (общая для
+        всех запусков одного переводчика).
         """
         super().__init__()
         self.text = text
         self.src = src_lang
         self.target = target_lang
+        self.segment_memory = (
+            segment_memory if segment_memory is not None else SegmentMemory()
+        )
+        self.token: CancellationToken = CancellationToken()
+        # Подготовка (установка пакетов) уже выполнена
+        self._prepared: bool = False
+        # Перевод файла документа вместо текста: (входной файл, выходной файл)
+        self.document: tuple[str, str] | None = None
+        # Перевод текстового файла (большого документа) вместо text:
+        # файл читается частями через mmap, перевод приходит только
+        # сигналами partial, а finished получает пустую строку
+        self.text_path: str | None = None
+        # Термины, которые не переводятся или переводятся фиксированно
+        self.glossary: Glossary | None = None
+        # Нечёткая память переводов (None — общая, см. get_fuzzy_memory)
+        self.fuzzy_memory: FuzzyMemory | None = None
+        # Самый частый язык уже переведённых предложений (для "auto")
+        self.main_language: str | None = None
+        # Счётчики последнего перевода документа (тексты, уникальные)
+        self.document_stats: dict[str, int] = {}
+        # Время стадий перевода (для строки состояния и метрик)
+        self.timer: StageTimer = StageTimer(
+            type(self).__name__, src=src_lang, target=target_lang
+        )
 
-    def _translate(self) -> str:
+    @property
+    def memory_target(self) -> str:
+        """
+        Целевой язык в ключах памяти предложений: переводы с глоссарием
+        и без него (или с другим глоссарием) не смешиваются.
+        """
+        if self.glossary is None:
+            return self.target
+        return f"{self.target}+{self.glossary.digest[:16]}"
+
+    def cancel(self) -> None:
+        """
+        Просьба прекратить перевод. Поток остановится на ближайшей проверке.
+        """
+        self.token.cancel()
+
+    def start(self) -> None:
+        """
+        Запуск задания в общем планировщике.
+        """
+        from .translation_scheduler import get_scheduler
+
+        get_scheduler().submit(self)
+
+    def _prepare(self) -> None:
+        """
+        Подготовка перед переводом (например, установка пакетов).
+        Вызывается один раз, только если есть что переводить.
+        """
+        pass
+
+    def _translate_segments(self, segments: list[str]) -> list[str]:
+        """
+        Перевод списка предложений. Реализуется в наследниках.
+        Возвращает переводы в том же порядке.
+        """
+        return ["" for _ in segments]
+
+    def _translate_glossary(self, segments: list[str]) -> list[str]:
+        """
+        Перевод пакета предложений с защитой терминов глоссария:
+        термины заменяются метками до перевода и переводами после.
+        """
+        if self.glossary is None:
+            return self._translate_segments(segments)
+        with self.timer.span("glossary", chars=sum(map(len, segments))) as span:
+            batch: ProtectedBatch = self.glossary.protect_batch(segments)
+            span.segments = sum(map(len, batch.replacements))
+        # Предложения только из терминов в модель не отправляются
+        translations: list[str] = (
+            self._translate_segments(batch.texts) if batch.texts else []
+        )
+        with self.timer.span("glossary"):
+            return batch.restore(translations)
+
+    def _translate_by_language(
+        self,
+        segments: list[str],
+        translate_group: Callable[[str | None, list[str]], list[str]],
+    ) -> list[str]:
+        """
+        Перевод предложений смешанного текста (исходный язык "auto"):
+        язык каждого предложения определяется локально, и каждая группа
+        предложений одного языка переводится отдельным вызовом
+        translate_group(язык, предложения); None — язык не определился.
+        Предложения уже на языке перевода остаются как есть.
+        """
+        with self.timer.span(
+            "langid",
+            chars=sum(len(segment) for segment in segments),
+            segments=len(segments),
+        ):
+            # Короткие предложения без явного языка (например, "OK.")
+            # относятся к основному языку текста
+            languages: list[str | None] = get_language_identifier().detect_segments(
+                segments, default=self.main_language
+            )
+        if any(languages):
+            self.main_language = Counter(filter(None, languages)).most_common(1)[0][0]
+        groups: dict[str | None, list[str]] = {}
+        for segment, lang in zip(segments, languages):
+            groups.setdefault(lang, []).append(segment)
+
+        translations: dict[str, str] = {}
+        for lang, group in groups.items():
+            self.token.raise_if_cancelled()
+            if lang == self.target:
+                translations.update(zip(group, group))
+            else:
+                translations.update(zip(group, translate_group(lang, group)))
+        return [translations[segment] for segment in segments]
+
+    def _emit_ready(
+        self,
+        segments: list[Segment],
+        known: dict[str, str],
+        next_index: int,
+        first_index: int = 0,
+    ) -> int:
+        """
+        Отправка в GUI всех готовых предложений, начиная с next_index,
+        до первого ещё не переведённого. Возвращает индекс этого предложения.
+        first_index — номер первого предложения segments во всём тексте.
+        """
+        while next_index < len(segments):
+            body, separator = segments[next_index]
+            if body.strip() and body not in known:
+                break
+            self.partial.emit(first_index + next_index, known.get(body, body) + separator)
+            next_index += 1
+        return next_index
+
+    def _translate_missing(
+        self,
+        missing: list[str],
+        known: dict[str, str],
+        tail: str | None = None,
+        on_batch: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        Перевод предложений, которых нет в памяти, пакетами (по порядку
+        появления в тексте) с проверкой отмены между ними. Сначала
+        предложения ищутся в нечёткой памяти переводов, в модель уходят
+        только ненайденные. Переводы дописываются в known и в память
+        предложений (кроме tail).
+        """
+        if not missing:
+            return
+
+        fuzzy: FuzzyMemory = (
+            self.fuzzy_memory if self.fuzzy_memory is not None else get_fuzzy_memory()
+        )
+        if fuzzy.enabled:
+            # segments стадии — число предложений, не отправленных в модель
+            with self.timer.span("fuzzy_lookup", chars=sum(map(len, missing))) as span:
+                reused: dict[str, str] = fuzzy.lookup(
+                    self.src, self.memory_target, missing
+                )
+                span.segments = len(reused)
+            if reused:
+                self.segment_memory.update(
+                    self.src,
+                    self.memory_target,
+                    {body: value for body, value in reused.items() if body != tail},
+                )
+                known.update(reused)
+                missing = [body for body in missing if body not in reused]
+                if on_batch is not None:
+                    on_batch()
+            if not missing:
+                return
+
+        if not self._prepared:
+            self._prepare()
+            self._prepared = True
+
+        start: int = 0
+        batch_size: int = min(self.first_batch_segments, self.segments_per_batch)
+        while start < len(missing):
+            self.token.raise_if_cancelled()
+            batch: list[str] = missing[start : start + batch_size]
+            fresh: dict[str, str] = dict(zip(batch, self._translate_glossary(batch)))
+            memorized: dict[str, str] = {
+                body: value for body, value in fresh.items() if body != tail
+            }
+            self.segment_memory.update(self.src, self.memory_target, memorized)
+            fuzzy.add(self.src, self.memory_target, memorized)
+            known.update(fresh)
+            if on_batch is not None:
+                on_batch()
+
+            start += len(batch)
+            batch_size = min(batch_size * 2, self.segments_per_batch)
+
+    def _translate_texts(self, texts: list[str]) -> list[str]:
+        """
+        Перевод нескольких текстов (узлов документа) через память
+        предложений и пакеты модели; разделители сохраняются.
+        """
+        with self.timer.span("split", chars=sum(len(text) for text in texts)) as span:
+            split: list[list[Segment]] = [
+                split_segments(text, self.src) for text in texts
+            ]
+            bodies: list[str] = list(
+                dict.fromkeys(
+                    body for segments in split for body, _ in segments if body.strip()
+                )
+            )
+            span.segments = len(bodies)
+
+        with self.timer.span("memory_lookup", segments=len(bodies)):
+            known: dict[str, str] = self.segment_memory.lookup(
+                self.src, self.memory_target, bodies
+            )
+        self._translate_missing([body for body in bodies if body not in known], known)
+
+        with self.timer.span("join"):
+            return [
+                join_segments(
+                    [(known.get(body, body), separator) for body, separator in segments]
+                )
+                for segments in split
+            ]
+
+    def _translate_document(self) -> str:
+        """
+        Перевод файла документа с сохранением разметки.
+        Возвращает путь к переведённому файлу.
+        """
+        from ..documents import DocumentTranslator, translate_file
+
+        input_path, output_path = self.document  # type: ignore[misc]
+        self.status.emit("Перевод документа...")
+        translator = DocumentTranslator(self._translate_texts)
+
+        def progress(percent: int) -> None:
+            self.progress_visible.emit(True)
+            self.progress_val.emit(percent)
+
+        stats: dict[str, int] = translate_file(
+            input_path, output_path, translator, progress=progress
+        )
+        self.timer.labels["document"] = os.path.basename(input_path)
+        self.document_stats = stats
+        return output_path
+
+    def _read_text_file(self) -> Iterator[tuple[str, int]]:
+        """
+        Части текстового файла (по границам строк) и доля прочитанного
+        в процентах. Файл отображается в память, поэтому целиком в виде
+        строки Python он никогда не копируется.
+        """
+        size: int = os.path.getsize(self.text_path)  # type: ignore[arg-type]
+        if not size:
+            return
+        with (
+            open(self.text_path, "rb") as f,  # type: ignore[arg-type]
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data,
+        ):
+            pos: int = 0
+            while pos < size:
+                end: int = min(size, pos + self.file_chunk_bytes)
+                if end < size:
+                    newline: int = data.rfind(b"\n", pos, end)
+                    if newline >= pos:
+                        end = newline + 1
+                    else:
+                        # Строка длиннее части: режем, не разрывая символ UTF-8
+                        while end > pos + 1 and data[end] & 0xC0 == 0x80:
+                            end -= 1
+                chunk: str = data[pos:end].decode("utf-8", errors="replace")
+                pos = end
+                # Как при чтении в текстовом режиме (поле ввода)
+                yield chunk.replace("\r\n", "\n"), pos * 100 // size
+
+    def _translate_text_file(self) -> str:
+        """
+        Перевод большого текстового файла по частям: в памяти держится
+        только текущая часть, готовые предложения сразу уходят в partial.
+        """
+        self.timer.labels["document"] = os.path.basename(self.text_path or "")
+        first_index: int = 0
+        for chunk, percent in self._read_text_file():
+            self.token.raise_if_cancelled()
+            first_index += len(self._translate_part(chunk, first_index))
+            self.progress_visible.emit(True)
+            self.progress_val.emit(percent)
         return ""
 
+    def _translate(self) -> str:
+        """
+        Инкрементальный перевод: текст режется на предложения,
+        в модель уходят только те, которых ещё нет в памяти,
+        после чего результат собирается в исходном порядке.
+        Готовое начало текста отправляется сигналом partial после
+        каждого пакета, не дожидаясь конца перевода.
+        """
+        if self.document is not None:
+            return self._translate_document()
+        if self.text_path is not None:
+            return self._translate_text_file()
+        segments: list[Segment] = self._translate_part(self.text)
+        with self.timer.span("join"):
+            return join_segments(segments)
+
+    def _translate_part(self, text: str, first_index: int = 0) -> list[Segment]:
+        """
+        Перевод текста (или части файла), first_index — номер его первого
+        предложения для сигналов partial. Возвращает переведённые сегменты.
+        """
+        with self.timer.span("split", chars=len(text)) as span:
+            segments: list[Segment] = split_segments(text, self.src)
+            # Уникальные непустые предложения, сохраняя порядок
+            bodies: list[str] = list(
+                dict.fromkeys(body for body, _ in segments if body.strip())
+            )
+            span.segments = len(bodies)
+
+        with self.timer.span("memory_lookup", segments=len(bodies)):
+            known: dict[str, str] = self.segment_memory.lookup(
+                self.src, self.memory_target, bodies
+            )
+            missing: list[str] = [body for body in bodies if body not in known]
+
+        # Незаконченное последнее предложение (без разделителя после него)
+        tail: str | None = None
+        if not self.memorize_tail and segments[-1][1] == "":
+            tail = segments[-1][0]
+
+        # Предложения из памяти в начале текста показываем сразу
+        ready: int = self._emit_ready(segments, known, 0, first_index)
+
+        def on_batch() -> None:
+            nonlocal ready
+            ready = self._emit_ready(segments, known, ready, first_index)
+
+        self._translate_missing(missing, known, tail, on_batch)
+        return [(known.get(body, body), separator) for body, separator in segments]
+
     def run(self) -> None:
         """
-        Основной метод потока. Запускается автоматически при вызове .start().
+        Основной метод задания. Вызывается в потоке пула планировщиком.
         Здесь происходит вся "тяжелая" логика.
         """
+        # Задание могли отменить, пока оно ждало свободный поток
+        if self.token.cancelled:
+            self.cancelled.emit()
+            return
+
         # Скрываем прогресс-бар в начале работы
         self.progress_visible.emit(False)
 
         # Проверка на пустой текст
-        if not self.text.strip():
+        if self.document is None and self.text_path is None and not self.text.strip():
             self.finished.emit("")
             return
 
         try:
             result: str = self._translate()
-            # Отправляем результат в GUI
+            self.token.raise_if_cancelled()
+            self.timer.stop()
+            # Отправляем результат в GUI (после статуса: обработчик
+            # результата может показать в строке состояния своё сообщение)
+            status: str = f"Готово: {self.timer.summary()}"
+            saved: int = sum(
+                span.segments for span in self.timer.spans if span.name == "fuzzy_lookup"
+            )
+            if saved:
+                status += f", из памяти переводов: {saved}"
+            self.status.emit(status)
             self.finished.emit(result)
-            self.status.emit("Готово")
+            self.timer.labels["result"] = "ok"
+        except TranslationCancelled:
+            self.timer.labels["result"] = "cancelled"
+            self.cancelled.emit()
+            self.status.emit("Перевод отменён")
         except Exception as e:
             # Ловим любые ошибки (нет интернета, сбой диска и т.д.)
+            self.timer.labels["result"] = "error"
             self.error.emit(str(e))
             self.status.emit("Ошибка")
         finally:
             # В любом случае скрываем прогресс-бар в конце
             self.progress_visible.emit(False)
+            get_stage_metrics().record(self.timer)
@@ -0,0 +1,145 @@
+from ..engine import get_engine_pool
+from ..hedging import Hedger
+from ..inference_host import INFERENCE_HOST_ENABLED, get_host_client
+from ..segment_memory import SegmentMemory
+from .cancellation import CancellationToken
+from .translator_worker_offline import TranslatorWorkerOffline
+
+
+class TranslatorWorkerHybrid(TranslatorWorkerOffline):
+    """
+    Гибридный перевод: каждый пакет предложений уходит в online- и
+    offline-бэкенд наперегонки (см. Hedger), берётся первый ответ.
+
+    Пакеты не скачиваются: если offline-пакета пары нет, перевод идёт
+    только online (с обычными повторами запросов). При автоопределении
+    гонка идёт отдельно для предложений каждого языка.
+    """
+
+    # Сколько предложений offline-попытка переводит между проверками отмены:
+    # проигравшая гонку нейросеть быстро освобождает модель
+    offline_step: int = 8
+
+    def __init__(
+        self,
+        text: str,
+        src_lang: str,
+        target_lang: str,
+        segment_memory: SegmentMemory | None = None,
+        profile: str | None = None,
+        hedger: Hedger | None = None,
+        online_url: str | None = None,
+    ):
+        """
+        hedger — общая для переводчика статистика гонок.
+        online_url — адрес сервера online-перевода (None — Google).
+        """
+        super().__init__(text, src_lang, target_lang, segment_memory, profile)
+        self.hedger: Hedger = hedger if hedger is not None else Hedger()
+        self.online_url: str | None = online_url
+
+    def _prepare(self) -> None:
+        if self.src == "auto":
+            self.status.emit("Гибридный перевод...")
+            return
+        if self._is_offline_ready(self.src):
+            self.status.emit("Гибридный перевод...")
+        else:
+            self.status.emit("Offline-пакета нет, онлайн перевод...")
+
+    def _is_offline_ready(self, src_lang: str) -> bool:
+        """
+        Установлен ли offline-пакет (проверяется один раз на язык).
+        """
+        if src_lang not in self._pairs:
+            self._pairs[src_lang] = self._is_installed(src_lang)
+        return self._pairs[src_lang]
+
+    def _translate_online(
+        self,
+        src_lang: str,
+        segments: list[str],
+        token: CancellationToken,
+        retries: int = 3,
+    ) -> list[str]:
+        """
+        Попытка online. Уже отправленный HTTP-запрос не прерывается:
+        ответ проигравшей попытки просто отбрасывается.
+        """
+        from ..engine.online_engine import GOOGLE_TRANSLATE_URL, OnlineEngine
+
+        token.raise_if_cancelled()
+        engine = OnlineEngine(
+            src_lang,
+            self.target,
+            base_url=self.online_url or GOOGLE_TRANSLATE_URL,
+            retries=retries,
+        )
+        return engine.translate_batch(segments)
+
+    def _translate_offline(
+        self,
+        src_lang: str,
+        segments: list[str],
+        token: CancellationToken,
+    ) -> list[str]:
+        """
+        Попытка offline частями по offline_step с проверкой отмены.
+        """
+        results: list[str] = []
+        if INFERENCE_HOST_ENABLED:
+            for start in range(0, len(segments), self.offline_step):
+                token.raise_if_cancelled()
+                results += get_host_client().translate_batch(
+                    src_lang,
+                    self.target,
+                    segments[start : start + self.offline_step],
+                    self.profile,
+                )
+            return results
+
+        with get_engine_pool().borrow(src_lang, self.target, self.profile) as engine:
+            for start in range(0, len(segments), self.offline_step):
+                token.raise_if_cancelled()
+                results += engine.translate_batch(segments[start : start + self.offline_step])
+        return results
+
+    def _translate_hedged(self, src_lang: str | None, segments: list[str]) -> list[str]:
+        """
+        Перевод предложений одного языка (None — не определился) гонкой
+        бэкендов или, если offline-пакета нет, только online.
+        """
+        if src_lang is None or not self._is_offline_ready(src_lang):
+            with self.timer.span(
+                "http",
+                chars=sum(len(segment) for segment in segments),
+                segments=len(segments),
+            ):
+                return self._translate_online(src_lang or "auto", segments, self.token)
+
+        # Попытки идут в других потоках, поэтому замер — один на всю гонку,
+        # а стадия называется по победителю
+        with self.timer.span(
+            "hedge",
+            chars=sum(len(segment) for segment in segments),
+            segments=len(segments),
+        ) as span:
+            winner, result = self.hedger.run(
+                {
+                    # Повторы не нужны: при ошибке гонку продолжит offline-бэкенд
+                    "online": lambda token: self._translate_online(
+                        src_lang, segments, token, retries=0
+                    ),
+                    "offline": lambda token: self._translate_offline(
+                        src_lang, segments, token
+                    ),
+                },
+                cancel=self.token,
+            )
+            span.name = f"hedge_{winner}"
+        return result
+
+    def _translate_segments(self, segments: list[str]) -> list[str]:
+        if self.src == "auto":
+            return self._translate_by_language(segments, self._translate_hedged)
+        return self._translate_hedged(self.src, segments)
@@ -1,98 +1,76 @@
 import os
-import sys
-import tempfile
+from contextlib import ExitStack
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import requests
-
+from ..engine import get_engine_pool
+from ..inference_host import INFERENCE_HOST_ENABLED, get_host_client
+from ..package_registry import get_package_registry
+from ..paths import DATA_DIR
+from ..segment_memory import SegmentMemory
 from .translator_worker import TranslatorWorker
 
-# Импортируем базовые классы для многопоточности в Qt
-
-# ==========================================================================
-# НАСТРОЙКА ПОРТАТИВНОСТИ (Portable Mode)
-# ==========================================================================
-# Мы должны настроить пути ДО импорта библиотеки argostranslate,
-# потому что она считывает переменные окружения в момент инициализации.
-
-# 1. Получаем абсолютный путь к папке, где лежит этот скрипт или EXE
-if getattr(sys, "frozen", False):
-    BASE_DIR: str = os.path.dirname(sys.executable)
-else:
-    BASE_DIR: str = Path(
-        os.path.dirname(os.path.abspath(__file__))
-    ).parent.parent.as_posix()
-
-# 2. Формируем путь к папке "translation_data" рядом со скриптом.
-# Именно здесь будут храниться гигабайты нейросетевых моделей.
-DATA_DIR: str = os.path.join(BASE_DIR, "translation_data")
-
-# 3. Если папки нет — создаем её.
-if not os.path.exists(DATA_DIR):
-    os.makedirs(DATA_DIR)
-
-# 4. Устанавливаем переменную окружения.
-# Теперь argostranslate будет думать, что это системная папка для данных.
-os.environ["ARGOS_PACKAGES_DIR"] = DATA_DIR
-print(f"Путь к базе данных перевода: {DATA_DIR}")
-
-# ==========================================================================
+if TYPE_CHECKING:
+    from argostranslate.package import AvailablePackage
 
-# Импорт библиотек перевода (оборачиваем в try-except для красивой ошибки)
-try:
-    import argostranslate.package
-    import argostranslate.translate
-    from argostranslate.package import AvailablePackage, Package
-except ImportError:
-    raise ImportError(
-        "Ошибка: Не установлены библиотеки! Выполните:\npip install torch --index-url https://download.pytorch.org/whl/cpu\npip install pyside6 requests argostranslate"
-    )
+# argostranslate (а вместе с ним torch, stanza и spacy) импортируется
+# лениво (см. translator/backends.py), чтобы окно программы открывалось сразу.
 
 
 class TranslatorWorkerOffline(TranslatorWorker):
-    def _install_package(self) -> None:
+    def __init__(
+        self,
+        text: str,
+        src_lang: str,
+        target_lang: str,
+        segment_memory: SegmentMemory | None = None,
+        profile: str | None = None,
+    ):
+        """
+        profile — профиль offline-движка (None — профиль по умолчанию).
+        """
+        super().__init__(text, src_lang, target_lang, segment_memory)
+        self.profile: str | None = profile
+        # Автоопределение: исходный язык -> есть ли (установлен ли) пакет
+        self._pairs: dict[str, bool] = {}
+
+    def _is_installed(self, src_lang: str) -> bool:
+        # Реестр сканирует нашу папку DATA_DIR только при её изменении
+        with self.timer.span("package_check"):
+            if INFERENCE_HOST_ENABLED:
+                # Модели и argostranslate живут в процессе-хосте
+                return get_host_client().is_installed(src_lang, self.target)
+            return get_package_registry().is_installed(src_lang, self.target)
+
+    def _install_package(self, src_lang: str) -> None:
         """
         Установка языковых пакетов.
         """
         self.status.emit("Проверка наличия языков...")
 
         # 1. Проверяем, есть ли нужный пакет уже на диске.
-        # Функция get_installed_packages сама посмотрит в нашу папку DATA_DIR
-        installed_packages: list[Package] = (
-            argostranslate.package.get_installed_packages()
-        )
-        is_installed: bool = any(
-            pkg.from_code == self.src and pkg.to_code == self.target
-            for pkg in installed_packages
-        )
-        if not is_installed:
-            self._download_package()
-
-    def _download_package(self) -> None:
+        if not self._is_installed(src_lang):
+            self._download_package(src_lang)
+            if INFERENCE_HOST_ENABLED:
+                get_host_client().invalidate(src_lang, self.target)
+
+    def _find_package(self, src_lang: str) -> "AvailablePackage | None":
+        # Ищем нужную пару языков в индексе (список всех существующих пакетов
+        # с сервера); индекс скачивается заново только когда устарел
+        with self.timer.span("index_update"):
+            return get_package_registry().find_available(src_lang, self.target)
+
+    def _download_package(self, src_lang: str) -> None:
         """
         Скачивание языковых пакетов.
         """
         self.status.emit("Пакет не найден локально. Поиск в сети...")
 
-        # Обновляем индекс (список всех существующих пакетов с сервера)
-        argostranslate.package.update_package_index()
-        available_packages: list[AvailablePackage] = (
-            argostranslate.package.get_available_packages()
-        )
-
-        # Ищем нужную пару языков в списке доступных
-        pkg_to_install: AvailablePackage | None = next(
-            filter(
-                lambda x: x.from_code == self.src and x.to_code == self.target,
-                available_packages,
-            ),
-            None,
-        )
-
+        pkg_to_install: "AvailablePackage | None" = self._find_package(src_lang)
         if pkg_to_install:
             # Получаем ссылку на zip-файл модели
             download_url: str = pkg_to_install.links[0]
-            self._download_process(download_url)
+            self._download_process(download_url, src_lang)
         else:
             # Если такой языковой пары вообще не существует в Argos
             msg: str = "Не удалось найти пакет для этой пары языков."
@@ -100,54 +78,43 @@ class TranslatorWorkerOffline(TranslatorWorker):
             self.status.emit(msg)
             raise FileNotFoundError(msg)
 
-    def _download_process(self, download_url: str) -> None:
+    def _download_process(self, download_url: str, src_lang: str) -> None:
         """
         Скачивание данных по указанной ссылке.
         """
-        self.status.emit(f"Скачивание {self.src}->{self.target} в локальную папку...")
+        import requests
+
+        from ..downloader import Downloader
+
+        self.status.emit(f"Скачивание {src_lang}->{self.target} в локальную папку...")
         self.progress_visible.emit(True)
 
-        # Создаем путь к временному файлу в системной папке Temp
-        temp_dir: str = tempfile.gettempdir()
-        filename: Path = Path(
-            os.path.join(temp_dir, f"pkg_{self.src}_{self.target}.argosmodel")
-        )
+        # Файл качается прямо в DATA_DIR: недокачанная часть (.part) остаётся
+        # на диске, и следующая попытка продолжит загрузку с места обрыва
+        filename: Path = Path(DATA_DIR) / f"pkg_{src_lang}_{self.target}.argosmodel"
 
-        # --- РУЧНОЕ СКАЧИВАНИЕ (ЧТОБЫ БЫЛ ПРОГРЕСС-БАР) ---
         try:
-            # stream=True позволяет качать файл кусками
-            # timeout=(5, 10) означает:
-            # 5 секунд ждем установки соединения
-            # 10 секунд ждем каждый новый кусок данных (chunk) внутри цикла
-            response: requests.Response = requests.get(
-                download_url,
-                stream=True,
-                timeout=(5, 10),
-            )
-            total_content_length: str | None = response.headers.get("content-length")
-
-            if total_content_length is None:
-                # Если сервер не сказал размер файла, просто качаем
-                with open(filename, "wb") as f:
-                    f.write(response.content)
-            else:
-                # Если размер известен, считаем проценты
-                downloaded_length: int = 0
-                total_length: int = int(total_content_length)
-                with open(filename, "wb") as f:
-                    for data in response.iter_content(chunk_size=4096):
-                        downloaded_length += len(data)
-                        f.write(data)
-                        # Математика процента
-                        percent = int((downloaded_length / total_length) * 100)
-                        self.progress_val.emit(percent)
+            # Несколько Range-запросов параллельно, прогресс — не чаще 4 раз в секунду
+            with self.timer.span("download"):
+                Downloader().download(
+                    download_url,
+                    filename,
+                    progress=self.progress_val.emit,
+                )
 
             self.status.emit("Распаковка и установка...")
             self.progress_visible.emit(False)
             self.progress_val.emit(0)
 
             # Устанавливаем скачанный файл (он распакуется в DATA_DIR)
-            argostranslate.package.install_from_path(filename)
+            with self.timer.span("install"):
+                get_package_registry().install_from_path(filename)
+            # Сбрасываем устаревший движок этой пары, если он был в пуле
+            get_engine_pool().discard(src_lang, self.target)
+
+            # Установленный архив больше не нужен
+            if os.path.exists(filename):
+                os.remove(filename)
 
         except requests.exceptions.ReadTimeout:
             raise Exception(
@@ -158,16 +125,81 @@ class TranslatorWorkerOffline(TranslatorWorker):
         except requests.exceptions.RequestException as e:
             raise Exception(f"Ошибка скачивания: {e}")
 
-        finally:
-            # Обязательно удаляем мусор (временный файл) за собой
-            if os.path.exists(filename):
-                os.remove(filename)
-
-    def _translate(self) -> str:
+    def _ensure_pair(self, src_lang: str) -> bool:
+        """
+        Пакет для найденного автоопределением языка: установленный или
+        скачанный. Если пакета нет (или нет сети), предложения этого языка
+        остаются без перевода, а весь перевод не прерывается.
+        """
+        if src_lang not in self._pairs:
+            ready: bool = self._is_installed(src_lang)
+            if not ready:
+                try:
+                    package: "AvailablePackage | None" = self._find_package(src_lang)
+                    if package:
+                        self._download_process(package.links[0], src_lang)
+                        if INFERENCE_HOST_ENABLED:
+                            get_host_client().invalidate(src_lang, self.target)
+                        ready = True
+                except Exception:
+                    ready = False
+                if not ready:
+                    self.status.emit(
+                        f"Нет пакета {src_lang}->{self.target}, "
+                        "эти предложения оставлены без перевода"
+                    )
+            self._pairs[src_lang] = ready
+        return self._pairs[src_lang]
+
+    def _prepare(self) -> None:
         """
-        Перевод offline, с использованием нейросети.
         Если нет нужных пакетов, тогда они скачаются автоматически.
+        При автоопределении пакеты проверяются по мере того, как
+        встречаются предложения на новых языках.
         """
-        self._install_package()
+        if self.src != "auto":
+            self._install_package(self.src)
         self.status.emit("Перевод нейросетью...")
-        return argostranslate.translate.translate(self.text, self.src, self.target)
+
+    def _translate_pair(self, src_lang: str, segments: list[str]) -> list[str]:
+        if INFERENCE_HOST_ENABLED:
+            # Модель загружена в процессе-хосте и остаётся там между переводами
+            with self.timer.span(
+                "inference",
+                chars=sum(len(segment) for segment in segments),
+                segments=len(segments),
+            ):
+                return get_host_client().translate_batch(
+                    src_lang, self.target, segments, self.profile
+                )
+
+        with ExitStack() as stack:
+            # Берём уже загруженную модель из общего пула, чтобы не грузить её
+            # заново (если модели в пуле нет, здесь она и загружается)
+            with self.timer.span("model_load"):
+                engine = stack.enter_context(
+                    get_engine_pool().borrow(src_lang, self.target, self.profile)
+                )
+            with self.timer.span(
+                "inference",
+                chars=sum(len(segment) for segment in segments),
+                segments=len(segments),
+            ):
+                return engine.translate_batch(segments)
+
+    def _translate_detected(self, src_lang: str | None, segments: list[str]) -> list[str]:
+        """
+        Перевод группы предложений одного (определённого) языка.
+        """
+        if src_lang is None or not self._ensure_pair(src_lang):
+            return segments
+        return self._translate_pair(src_lang, segments)
+
+    def _translate_segments(self, segments: list[str]) -> list[str]:
+        """
+        Перевод offline, с использованием нейросети. При автоопределении
+        каждое предложение уходит в пакет своего языка.
+        """
+        if self.src == "auto":
+            return self._translate_by_language(segments, self._translate_detected)
+        return self._translate_pair(self.src, segments)
@@ -1,20 +1,34 @@
 from .translator_worker import TranslatorWorker
 
-try:
-    from deep_translator import GoogleTranslator
-except ImportError:
-    raise ImportError(
-        "Ошибка: Не установлены библиотеки! Выполните:\npip install pyside6 deep-translator"
-    )
-
 
 class TranslatorWorkerOnline(TranslatorWorker):
-    def _translate(self) -> str:
-        """
-        Перевод online, с использованием GoogleTranslator.
-        """
+    # Пакет побольше: движок сам режет его на куски и шлёт их параллельно
+    segments_per_batch: int = 256
+
+    def _prepare(self) -> None:
         self.status.emit("Онлайн перевод...")
 
-        # Используем deep_translator для запроса к Google API
-        translator = GoogleTranslator(source=self.src, target=self.target)
-        return translator.translate(self.text)
+    def _translate_pair(self, src_lang: str, segments: list[str]) -> list[str]:
+        # requests и bs4 импортируются только при первом online-переводе
+        from ..engine import OnlineEngine
+
+        with self.timer.span(
+            "http",
+            chars=sum(len(segment) for segment in segments),
+            segments=len(segments),
+        ):
+            return OnlineEngine(src_lang, self.target).translate_batch(segments)
+
+    def _translate_segments(self, segments: list[str]) -> list[str]:
+        """
+        Перевод online, с использованием Google Translate.
+        При автоопределении язык предложений определяется локально:
+        предложения на языке перевода не отправляются, а смешанный текст
+        уходит запросами по языкам (неопознанные — с "auto").
+        """
+        if self.src == "auto":
+            return self._translate_by_language(
+                segments,
+                lambda lang, group: self._translate_pair(lang or "auto", group),
+            )
+        return self._translate_pair(self.src, segments)
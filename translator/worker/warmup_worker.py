@@ -0,0 +1,33 @@
+from typing import TYPE_CHECKING
+
+from PySide6.QtCore import QThread, Signal
+
+if TYPE_CHECKING:
+    from ..translator import Translator
+
+
+class WarmupWorker(QThread):
+    """
+    Фоновый прогрев переводчиков после показа окна.
+
+    Тяжёлые библиотеки (argostranslate, torch, ctranslate2) импортируются
+    здесь, пока пользователь набирает текст, а не при старте программы.
+    """
+
+    ready = Signal(str)  # Имя переводчика, который готов к работе
+    failed = Signal(str, str)  # Имя переводчика и текст ошибки
+
+    def __init__(self, translators: list["Translator"]):
+        super().__init__()
+        self.translators: list["Translator"] = translators
+
+    def run(self) -> None:
+        for translator in self.translators:
+            # Окно закрывается: остальные переводчики не прогреваем
+            if self.isInterruptionRequested():
+                return
+            try:
+                translator.warm_up()
+                self.ready.emit(translator.name)
+            except Exception as e:
+                self.failed.emit(translator.name, str(e))